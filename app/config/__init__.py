@@ -9,6 +9,10 @@ class Settings(BaseSettings):
 
     # env variables
     LOG_LEVEL: str
+    # one JSON object per log line instead of the text format
+    LOG_JSON: bool = False
+    # fraction of the successful uvicorn access logs that are kept, errors are always logged
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0
 
     # mongodb
     MONGODB_HOST: str
@@ -17,6 +21,27 @@ class Settings(BaseSettings):
     MONGODB_USERNAME: Optional[str] = None
     MONGODB_PASSWORD: Optional[str] = None
     MONGODB_EXPOSE_PORT: Optional[int] = None
+    # connections of the async (motor) client, bounds the concurrency of the async endpoints
+    MONGODB_MAX_POOL_SIZE: int = 100
+    # commands slower than this are kept in the slow query report, 0 to disable the profiler
+    SLOW_QUERY_THRESHOLD_MS: int = 100
+    # explain (executionStats) the first slow command of each shape, in a background thread
+    SLOW_QUERY_EXPLAIN: bool = False
+    SLOW_QUERY_MAX_SHAPES: int = 500
+    # audit logs a `search` (unindexed substring) may scan, narrow the filters beyond
+    AUDIT_LOG_SCAN_LIMIT: int = 50000
+    # audit logs waiting to be written, beyond that new ones are dropped
+    AUDIT_LOG_BUFFER_SIZE: int = 10000
+    # audit logs written by the buffer in one insert_many, at least every interval (seconds)
+    AUDIT_LOG_BATCH_SIZE: int = 200
+    AUDIT_LOG_FLUSH_INTERVAL: float = 1.0
+    # days audit logs stay in `Logs` before being moved to the compressed archive, 0 to keep them
+    AUDIT_LOG_HOT_DAYS: int = 365
+    AUDIT_LOG_ARCHIVE_BATCH_SIZE: int = 1000
+    # days after their creation archived audit logs are deleted, 0 to keep them
+    AUDIT_LOG_RETENTION_DAYS: int = 0
+    # seconds without progress after which a running student import is reported as failed
+    IMPORT_JOB_STALE_AFTER: int = 600
 
     @field_validator("MONGODB_USERNAME", "MONGODB_PASSWORD", "MONGODB_EXPOSE_PORT", mode="before")
     def allow_none(cls, v):
@@ -30,6 +55,28 @@ class Settings(BaseSettings):
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE: int = 1
     JWT_TOKEN_PREFIX: str
+    # seconds an authenticated admin/student is kept in memory, 0 to disable
+    PRINCIPAL_CACHE_TTL: int = 30
+    # seconds between two checks of the accounts version, an invalidation is seen by every process
+    PRINCIPAL_CACHE_POLL_INTERVAL: float = 1
+    # seconds between two checks of the current season version, see VersionedCache
+    SEASON_CACHE_POLL_INTERVAL: int = 5
+    # seconds between two checks of the forms version, an open/close is seen by every process
+    MANAGE_FORM_CACHE_POLL_INTERVAL: float = 1
+    # seconds subjects, lecturers and evaluation questions are kept in memory at most, 0 to disable
+    ENTITY_CACHE_TTL: int = 60
+    # seconds between two checks of the entities versions, a write is seen by every process
+    ENTITY_CACHE_POLL_INTERVAL: float = 1
+    ENTITY_CACHE_MAXSIZE: int = 2048
+    # processes hashing the passwords (bcrypt), 0 for one per core
+    PASSWORD_HASH_WORKERS: int = 0
+    # hashes waiting for a process, beyond that or after the max wait (seconds) it's a 429
+    PASSWORD_HASH_QUEUE_SIZE: int = 64
+    PASSWORD_HASH_MAX_WAIT: float = 5
+    # failed logins of an email / a client ip before a 429, until a window (seconds) without any
+    LOGIN_MAX_FAILURES_PER_EMAIL: int = 5
+    LOGIN_MAX_FAILURES_PER_IP: int = 30
+    LOGIN_THROTTLE_WINDOW: int = 300
 
     UPLOAD_DIR: str = "/uploads"
     # project config
@@ -58,6 +105,10 @@ class Settings(BaseSettings):
 
     BREVO_API_KEY: str
     YSOF_EMAIL_SENDER: str
+    # recipients per Brevo API call, a failed batch is retried with exponential backoff
+    BREVO_BATCH_SIZE: int = 100
+    BREVO_BATCH_MAX_RETRIES: int = 5
+    BREVO_BATCH_RETRY_BACKOFF: int = 30
 
     SMTP_MAIL_HOST: str
     SMTP_MAIL_PORT: str
@@ -78,7 +129,12 @@ class Settings(BaseSettings):
     RABBITMQ_HOST: str
     RABBITMQ_PORT: int
 
+    # bearer token of the prometheus scrapes of /metrics, empty to disable the endpoint
+    METRICS_TOKEN: str = ""
+
     CELERY_TIMEZONE: str
+    # port of the /metrics http server of the Celery worker, 0 to disable
+    CELERY_METRICS_PORT: int = 0
 
 
 # init settings instance
@@ -1,8 +1,23 @@
 """Database Module"""
 
+import asyncio
+from typing import Any, Optional
+
 from mongoengine import connect as mongo_engine_connect, disconnect_all
+from mongoengine.connection import get_connection, get_db
+from pymongo import MongoClient
 
 from app.config import settings
+from app.infra.metrics.mongo import register_command_listener
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+except ImportError:  # the async repositories fall back to the sync driver
+    AsyncIOMotorClient = None
+
+# motor client of the running event loop, see get_async_database
+_async_client: Optional[Any] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
 
 def connect() -> None:
@@ -11,30 +26,60 @@ def connect() -> None:
     :return: None
     """
     print(settings.ENVIRONMENT)
+    register_command_listener()
     if settings.ENVIRONMENT == "testing":
         return mongo_engine_connect(
             settings.MONGODB_DATABASE, host=settings.MONGODB_HOST, port=settings.MONGODB_PORT
         )
     else:
-        config = dict(
-            host=settings.MONGODB_HOST,
-            port=settings.MONGODB_PORT,
-        )
-        if settings.MONGODB_USERNAME and settings.MONGODB_PASSWORD:
-            config["username"] = settings.MONGODB_USERNAME
-            config["password"] = settings.MONGODB_PASSWORD
-            config["authentication_source"] = settings.MONGODB_DATABASE
-
         return mongo_engine_connect(
             settings.MONGODB_DATABASE,
-            **config,
+            **_connection_config(),
             alias="default",
         )
 
 
+def get_async_database() -> Optional[Any]:
+    """
+    Motor database of the default connection, created on first use in the running event loop
+    :return: None when motor isn't installed or the default connection isn't a real MongoClient
+    (mongomock in tests)
+    """
+    global _async_client, _async_client_loop
+
+    if AsyncIOMotorClient is None or not isinstance(get_connection(), MongoClient):
+        return None
+
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        config = _connection_config()
+        if "authentication_source" in config:
+            config["authSource"] = config.pop("authentication_source")
+        _async_client = AsyncIOMotorClient(**config, maxPoolSize=settings.MONGODB_MAX_POOL_SIZE)
+        _async_client_loop = loop
+    return _async_client[get_db().name]
+
+
 def disconnect() -> None:
     """
     Disconnect database
     :return:
     """
+    global _async_client, _async_client_loop
+
+    if _async_client is not None:
+        _async_client.close()
+        _async_client = _async_client_loop = None
     disconnect_all()
+
+
+def _connection_config() -> dict[str, Any]:
+    config = dict(
+        host=settings.MONGODB_HOST,
+        port=settings.MONGODB_PORT,
+    )
+    if settings.MONGODB_USERNAME and settings.MONGODB_PASSWORD:
+        config["username"] = settings.MONGODB_USERNAME
+        config["password"] = settings.MONGODB_PASSWORD
+        config["authentication_source"] = settings.MONGODB_DATABASE
+    return config
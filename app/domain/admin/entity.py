@@ -1,5 +1,5 @@
 from datetime import datetime, date, timezone
-from typing import Optional, List
+from typing import Any, Optional, List, Mapping
 from pydantic import ConfigDict, EmailStr, field_validator
 
 from app.domain.shared.enum import AdminRole, AccountStatus
@@ -50,9 +50,29 @@ class AdminInDB(IDModelMixin, DateTimeModelMixin, AdminBase):
         Returns:
             _type_: bool
         """
-        return AdminRole.ADMIN in self.roles or (
-            (not self.disabled()) and self.latest_season == get_current_season_value()
+        return is_admin_active(self)
+
+
+# stored fields `is_admin_active` reads
+ADMIN_ACTIVE_FIELDS = ("roles", "status", "latest_season")
+
+
+def is_admin_active(admin: Any) -> bool:
+    """
+    `AdminInDB.active` of an admin entity, mongoengine document or raw mongo document,
+    without validating it
+    """
+    if isinstance(admin, Mapping):
+        roles, status, latest_season = (
+            admin.get("roles"),
+            admin.get("status"),
+            admin.get("latest_season"),
         )
+    else:
+        roles, status, latest_season = admin.roles, admin.status, admin.latest_season
+    return AdminRole.ADMIN in (roles or []) or (
+        status != AccountStatus.INACTIVE and latest_season == get_current_season_value()
+    )
 
 
 class AdminInCreate(BaseEntity):
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Optional, List
+
+from app.domain.shared.entity import BaseEntity
+
+
+class SlowQuery(BaseEntity):
+    # `METHOD /route/{template}` that sent the command, empty outside of a request
+    endpoint: str
+    # `Repository.method` that sent the command
+    operation: str
+    collection: str
+    command: str
+    # command with its values replaced by `?`
+    shape: str
+    count: int
+    total_ms: float
+    avg_ms: float
+    max_ms: float
+    docs_returned: Optional[int] = None
+    # from the explain plan, when SLOW_QUERY_EXPLAIN is enabled
+    docs_examined: Optional[int] = None
+    keys_examined: Optional[int] = None
+    indexes: Optional[List[str]] = None
+    last_seen: Optional[datetime] = None
+
+
+class SlowQueriesReport(BaseEntity):
+    threshold_ms: int
+    # slow commands not recorded because the report is full
+    dropped: int
+    data: List[SlowQuery]
@@ -55,6 +55,8 @@ class Pagination(BaseModel):
     total: Optional[int] = 0
     page_index: Optional[int] = 1
     total_pages: Optional[int] = None
+    # keyset pagination only, pass it as `cursor` to get the next page
+    next_cursor: Optional[str] = None
 
 
 class SearchRequest(BaseModel):
@@ -19,3 +19,8 @@ class AdminRole(str, ExtendedEnum):
 class Sort(str, ExtendedEnum):
     ASCE = "ascend"
     DESC = "descend"
+
+
+class EmailDeliveryStatus(str, ExtendedEnum):
+    SENT = "sent"
+    FAILED = "failed"
@@ -1,10 +1,11 @@
-from datetime import date
+from datetime import date, datetime
 from typing import Optional, List
 from pydantic import ConfigDict, EmailStr, field_validator
 
 from app.domain.shared.enum import AccountStatus
 from app.domain.shared.entity import BaseEntity, IDModelMixin, DateTimeModelMixin, Pagination
-from app.domain.student.enum import SexEnum
+from app.domain.student.enum import ImportJobStatus, SexEnum
+from app.domain.admin.field import PydanticAdminType
 from app.shared.utils.general import (
     convert_valid_date,
     get_current_season_value,
@@ -85,6 +86,8 @@ class Student(StudentBase, DateTimeModelMixin):
     status: AccountStatus = AccountStatus.ACTIVE
     seasons_info: list[StudentSeason]
 
+    _convert_valid_name = field_validator("full_name", mode="before")(validate_name)
+
 
 class ManyStudentsInResponse(BaseEntity):
     pagination: Optional[Pagination] = None
@@ -100,6 +103,7 @@ class BaseStudentInStudentRequestResponse(BaseEntity):
     diocese: Optional[str] = None
     phone_number: Optional[str] = None
     avatar: Optional[str] = None
+    _convert_valid_name = field_validator("full_name", mode="before")(validate_name)
     _mask_email = field_validator("email", mode="before")(mask_email)
     _mask_phone_number = field_validator("phone_number", mode="before")(mask_phone_number)
 
@@ -157,6 +161,32 @@ class ImportSpreadsheetsInResponse(BaseEntity):
     attentions: list[AttentionImport]
 
 
+class ImportJobBase(BaseEntity):
+    url: str
+    sheet_name: str | None = "main"
+    season: int
+    status: ImportJobStatus = ImportJobStatus.PENDING
+    total_rows: int = 0
+    processed: int = 0
+    inserted: int = 0
+    updated: int = 0
+    errors: int = 0
+    # why the job failed, e.g. the spreadsheet can't be read
+    detail: str | None = None
+    result: ImportSpreadsheetsInResponse | None = None
+    started_at: datetime | None = None
+    heartbeat_at: datetime | None = None
+
+
+class ImportJobInDB(IDModelMixin, DateTimeModelMixin, ImportJobBase):
+    model_config = ConfigDict(from_attributes=True)
+    author: PydanticAdminType | None = None
+
+
+class ImportJob(ImportJobBase, DateTimeModelMixin):
+    id: str
+
+
 class ResetPasswordResponse(BaseEntity):
     email: str
     password: str
@@ -25,3 +25,10 @@ class FieldStudentEnum(str, ExtendedEnum):
     job = "Nghề nghiệp"
 
     note = "Ghi chú"
+
+
+class ImportJobStatus(str, ExtendedEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
@@ -11,6 +11,7 @@ from app.domain.subject.field import PydanticSubjectType
 from app.domain.subject.enum import StatusSubjectEnum
 from app.domain.document.field import PydanticDocumentType
 from app.domain.document.entity import Document, DocumentInStudent
+from app.shared.utils.general import validate_name
 
 
 class Zoom(BaseEntity):
@@ -132,6 +133,8 @@ class StudentInSubject(BaseEntity):
     email: str
     id: str
 
+    _convert_valid_name = field_validator("full_name", mode="before")(validate_name)
+
 
 class _SubjectRegistrationInResponse(BaseEntity):
     student: StudentInSubject
@@ -1,11 +1,12 @@
 from datetime import datetime, timezone
-from pydantic import ConfigDict
+from pydantic import ConfigDict, field_validator
 
 from app.domain.shared.entity import BaseEntity, DateTimeModelMixin, IDModelMixin, Pagination
 from app.domain.student.entity import StudentSeason
 from app.domain.student.field import PydanticStudentType
 from app.domain.subject.field import PydanticSubjectType
 from app.domain.subject.subject_evaluation.enum import QualityValueEnum, TypeQuestionEnum
+from app.shared.utils.general import validate_name
 
 
 class Quality(BaseEntity):
@@ -60,6 +61,8 @@ class StudentInEvaluation(BaseEntity):
     full_name: str
     email: str
 
+    _convert_valid_name = field_validator("full_name", mode="before")(validate_name)
+
 
 class SubjectEvaluationStudent(SubjectEvaluationBase, DateTimeModelMixin):
     id: str
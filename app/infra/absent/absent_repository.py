@@ -4,8 +4,10 @@ from typing import Optional, Dict, Union, List, Any
 from bson import ObjectId
 from app.domain.absent.entity import AbsentInDB, AbsentInUpdateTime
 from app.models.absent import AbsentModel
+from app.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class AbsentRepository:
     def __init__(self):
         pass
@@ -23,9 +25,13 @@ class AbsentRepository:
 
         return new_doc
 
-    def find_one(self, conditions: list[str, str | bool | ObjectId]) -> AbsentModel | None:
+    def find_one(
+        self,
+        conditions: list[str, str | bool | ObjectId],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> AbsentModel | None:
         try:
-            doc = AbsentModel._get_collection().find_one(conditions)
+            doc = AbsentModel._get_collection().find_one(conditions, projection)
             return AbsentModel.from_mongo(doc) if doc else None
         except Exception:
             return None
@@ -50,6 +56,7 @@ class AbsentRepository:
         self,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[AbsentModel]:
         pipeline = [
             {"$sort": sort if sort else {"id": 1}},
@@ -58,6 +65,8 @@ class AbsentRepository:
         if match_pipeline is not None:
             pipeline.append({"$match": match_pipeline})
 
+        if projection:
+            pipeline.append({"$project": projection})
         try:
             docs = AbsentModel.objects().aggregate(pipeline)
             return [AbsentModel.from_mongo(doc) for doc in docs] if docs else []
@@ -0,0 +1,37 @@
+"""Async absent repository module"""
+
+from typing import Any
+
+from bson import ObjectId
+
+from app.domain.absent.entity import AbsentInDB
+from app.infra.shared.async_collection import get_async_collection, insert_document
+from app.models.absent import AbsentModel
+from app.infra.metrics import instrument_repository
+
+
+@instrument_repository
+class AsyncAbsentRepository:
+    """
+    `AbsentRepository` of the async endpoints, reads and writes go through motor
+    """
+
+    def __init__(self):
+        pass
+
+    async def create(self, doc: AbsentInDB) -> AbsentModel:
+        """
+        Create new doc in db
+        :param doc:
+        :return:
+        """
+        return await insert_document(AbsentModel(**doc.model_dump()))
+
+    async def find_one(
+        self, conditions: list[str, str | bool | ObjectId], projection: dict[str, Any] | None = None
+    ) -> AbsentModel | None:
+        try:
+            doc = await get_async_collection(AbsentModel).find_one(conditions, projection)
+            return AbsentModel.from_mongo(doc) if doc else None
+        except Exception:
+            return None
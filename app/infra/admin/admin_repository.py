@@ -1,13 +1,17 @@
 """Admin repository module"""
 
-from typing import Optional, Dict, Union, List, Any
+from typing import Optional, Dict, Union, List, Any, Tuple
 from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
 
+from app.infra.shared.records import Record, to_records
+from app.infra.shared.pagination import CountMode, paginate
 from app.models.admin import AdminModel
 from app.domain.admin.entity import AdminInDB, AdminInUpdateTime
+from app.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class AdminRepository:
     def __init__(self):
         pass
@@ -60,7 +64,9 @@ class AdminRepository:
             data = (
                 data.model_dump(exclude_none=True) if isinstance(data, AdminInUpdateTime) else data
             )
-            AdminModel.objects(id=id).update_one(**data, upsert=False)
+            AdminModel.objects(id=id).update_one(
+                **data, **AdminModel.search_update(id, data), upsert=False
+            )
             return True
         except Exception:
             return False
@@ -77,6 +83,7 @@ class AdminRepository:
         page_size: int = 20,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[AdminModel]:
         pipeline = []
 
@@ -93,6 +100,8 @@ class AdminRepository:
             ]
         )
 
+        if projection:
+            pipeline.append({"$project": projection})
         try:
             docs = AdminModel.objects().aggregate(pipeline)
             return [AdminModel.from_mongo(doc) for doc in docs] if docs else []
@@ -115,3 +124,34 @@ class AdminRepository:
             return list(docs)[0]["document_count"]
         except Exception:
             return 0
+
+    def list_paginated(
+        self,
+        page_index: int = 1,
+        page_size: int | None = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None]:
+        """
+        Page of admins and total of matched admins in one round trip
+        :param projection: `$project` specification of the returned documents
+        :return: (raw admins, total)
+        """
+        match_pipe = {"roles": {"$ne": "admin"}}
+        if match_pipeline is not None:
+            match_pipe = {**match_pipeline, **match_pipe}
+        try:
+            docs, total = paginate(
+                AdminModel._get_collection(),
+                match_pipeline=match_pipe,
+                sort=sort if sort else {"created_at": -1},
+                page_index=page_index,
+                page_size=page_size,
+                count_mode=count_mode,
+                projection=projection,
+            )
+            return to_records(AdminModel, docs), total
+        except Exception:
+            return [], 0
@@ -0,0 +1,159 @@
+"""Archived log repository module"""
+
+from datetime import datetime
+from typing import Optional, Dict, List, Any, Tuple
+from pymongo.errors import BulkWriteError
+
+from app.infra.shared.records import Record, to_records
+from app.infra.shared.pagination import (
+    CountMode,
+    InvalidCursorError,
+    paginate,
+    paginate_by_cursor,
+)
+from app.models.audit_log import AuditLogArchiveModel, AuditLogModel
+from app.infra.metrics import instrument_repository
+
+# duplicate key, the audit log was archived by an interrupted run
+DUPLICATE_KEY_ERROR = 11000
+
+
+@instrument_repository
+class AuditLogArchiveRepository:
+    """
+    Audit logs of `LogsArchive`, their records have the same fields as the ones of `Logs`:
+    the description is decompressed when it is projected
+    """
+
+    def __init__(self):
+        pass
+
+    def archive(self, before: datetime, batch_size: int = 1000) -> int:
+        """
+        Move the audit logs created before `before` from `Logs` to `LogsArchive`, oldest first.
+        A batch is deleted from `Logs` once inserted in the archive, an interrupted run is
+        resumed by the next one.
+        :return: number of archived audit logs
+        """
+        logs = AuditLogModel._get_collection()
+        archive = AuditLogArchiveModel._get_collection()
+        archived = 0
+        while True:
+            docs = list(
+                logs.find({"created_at": {"$lt": before}})
+                .sort([("created_at", 1), ("_id", 1)])
+                .limit(batch_size)
+            )
+            if not docs:
+                return archived
+            try:
+                archive.insert_many(
+                    [AuditLogArchiveModel.from_audit_log(doc) for doc in docs], ordered=False
+                )
+            except BulkWriteError as e:
+                if any(
+                    error.get("code") != DUPLICATE_KEY_ERROR
+                    for error in e.details.get("writeErrors", [])
+                ):
+                    raise
+            logs.delete_many({"_id": {"$in": [doc["_id"] for doc in docs]}})
+            archived += len(docs)
+
+    def expire(self, before: datetime) -> int:
+        """
+        Delete the archived audit logs created before `before`
+        :return: number of deleted audit logs
+        """
+        result = AuditLogArchiveModel._get_collection().delete_many({"created_at": {"$lt": before}})
+        return result.deleted_count
+
+    def count_up_to(self, conditions: Dict[str, Any], limit: int) -> int:
+        """
+        Number of archived audit logs matching `conditions`, counting stops after `limit`
+        :return: `limit + 1` when more than `limit` audit logs match
+        """
+        collection = AuditLogArchiveModel._get_collection()
+        try:
+            if not conditions:
+                return min(collection.estimated_document_count(), limit + 1)
+            return collection.count_documents(conditions, limit=limit + 1)
+        except Exception:
+            # unknown, as if too many
+            return limit + 1
+
+    def list_paginated(
+        self,
+        page_index: int = 1,
+        page_size: int | None = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+        skip: Optional[int] = None,
+    ) -> Tuple[List[Record], int | None]:
+        """
+        Page of archived audit logs and total of matched audit logs in one round trip
+        :param projection: `$project` specification of the returned documents
+        :param skip: audit logs before the page, instead of page_index
+        :return: (raw audit logs, total)
+        """
+        try:
+            docs, total = paginate(
+                AuditLogArchiveModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"created_at": -1},
+                page_index=page_index,
+                page_size=page_size,
+                count_mode=count_mode,
+                projection=self._archived_projection(projection),
+                skip=skip,
+            )
+            return self._to_records(docs), total
+        except Exception:
+            return [], 0
+
+    def list_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None, str | None]:
+        """
+        Page of archived audit logs after `cursor` (keyset pagination)
+        :param projection: `$project` specification of the returned documents
+        :return: (raw audit_logs, total, next_cursor)
+        :raises InvalidCursorError: cursor is malformed or was built for another sort
+        """
+        try:
+            docs, total, next_cursor = paginate_by_cursor(
+                AuditLogArchiveModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"created_at": -1},
+                page_size=page_size,
+                cursor=cursor,
+                count_mode=count_mode,
+                projection=self._archived_projection(projection),
+            )
+            return self._to_records(docs), total, next_cursor
+        except InvalidCursorError:
+            raise
+        except Exception:
+            return [], 0, None
+
+    @staticmethod
+    def _archived_projection(projection: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if not projection or "description" not in projection:
+            return projection
+        archived = {key: value for key, value in projection.items() if key != "description"}
+        archived["description_z"] = projection["description"]
+        return archived
+
+    @staticmethod
+    def _to_records(docs: List[Dict[str, Any]]) -> List[Record]:
+        for doc in docs:
+            if "description_z" in doc:
+                doc["description"] = AuditLogArchiveModel.decompress(doc.pop("description_z"))
+        return to_records(AuditLogArchiveModel, docs)
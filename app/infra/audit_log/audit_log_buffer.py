@@ -0,0 +1,118 @@
+"""In-process buffer of the audit logs, written in batches by a single thread"""
+
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, Deque, Dict, List, Optional
+
+from app.domain.audit_log.entity import AuditLogInDB
+from app.infra.logging import get_logger
+from app.infra.metrics import AUDIT_LOGS_DROPPED, AUDIT_LOGS_QUEUED, AUDIT_LOGS_WRITTEN
+
+logger = get_logger()
+
+
+class AuditLogBuffer:
+    """
+    `put` queues an audit log without waiting for Mongo, a writer thread inserts the queue in
+    batches of `batch_size`, as soon as a batch is full or every `flush_interval` seconds.
+
+    Audit logs are dropped (and counted) when `max_size` are already waiting. Until `start` and
+    after `stop` (tests, scripts, Celery tasks) `put` writes the audit log right away.
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[List[AuditLogInDB]], int],
+        max_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+    ):
+        self.writer = writer
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.dropped = 0
+        self._queue: Deque[AuditLogInDB] = deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def put(self, audit_log: AuditLogInDB) -> bool:
+        """:return: False if the audit log was dropped"""
+        if audit_log.created_at is None:
+            # time of the event, not of the insert
+            audit_log.created_at = datetime.now(timezone.utc)
+        with self._condition:
+            if self._thread is not None:
+                if len(self._queue) >= self.max_size:
+                    self.dropped += 1
+                    AUDIT_LOGS_DROPPED.labels("full").inc()
+                    return False
+                self._queue.append(audit_log)
+                AUDIT_LOGS_QUEUED.inc()
+                if len(self._queue) >= self.batch_size:
+                    self._condition.notify()
+                return True
+        return self._write([audit_log])
+
+    def start(self) -> None:
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """write the queued audit logs and stop the writer thread"""
+        with self._condition:
+            thread = self._thread
+            if thread is None:
+                return
+            self._stopping = True
+            self._condition.notify()
+        thread.join(timeout)
+        with self._condition:
+            self._thread = None
+        stats = self.stats()
+        logger.info(
+            f"Audit log buffer stopped: {stats['written']} written, {stats['dropped']} dropped, "
+            f"{stats['queued']} left"
+        )
+
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {"queued": len(self._queue), "written": self.written, "dropped": self.dropped}
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._stopping or len(self._queue) >= self.batch_size,
+                    timeout=self.flush_interval,
+                )
+                batch = [
+                    self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))
+                ]
+                done = self._stopping and not self._queue
+            if batch:
+                AUDIT_LOGS_QUEUED.dec(len(batch))
+                self._write(batch)
+            if done:
+                return
+
+    def _write(self, batch: List[AuditLogInDB]) -> bool:
+        try:
+            written = self.writer(batch)
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} audit logs: {e}")
+            written = 0
+        with self._condition:
+            self.written += written
+            self.dropped += len(batch) - written
+        AUDIT_LOGS_WRITTEN.inc(written)
+        if written < len(batch):
+            AUDIT_LOGS_DROPPED.labels("error").inc(len(batch) - written)
+        return written == len(batch)
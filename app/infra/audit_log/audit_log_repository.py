@@ -1,13 +1,25 @@
 """Log repository module"""
 
-from typing import Optional, Dict, Union, List, Any
+from typing import Optional, Dict, Union, List, Any, Tuple
 from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
-
+from pymongo.errors import BulkWriteError
+
+from app.infra.shared.records import Record, to_records
+from app.infra.shared.pagination import (
+    CountMode,
+    InvalidCursorError,
+    paginate,
+    paginate_by_cursor,
+)
 from app.models.audit_log import AuditLogModel
 from app.domain.audit_log.entity import AuditLogInDB
+from app.config import settings
+from app.infra.audit_log.audit_log_buffer import AuditLogBuffer
+from app.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class AuditLogRepository:
     def __init__(self):
         pass
@@ -25,6 +37,27 @@ class AuditLogRepository:
 
         return new_doc
 
+    def create_many(self, audit_logs: List[AuditLogInDB]) -> int:
+        """
+        Create audit_logs in db in one insert_many
+        :param audit_logs:
+        :return: number of created audit_logs
+        """
+        docs = [AuditLogModel(**audit_log.model_dump()).to_mongo() for audit_log in audit_logs]
+        try:
+            result = AuditLogModel._get_collection().insert_many(docs, ordered=False)
+            return len(result.inserted_ids)
+        except BulkWriteError as e:
+            return e.details.get("nInserted", 0)
+
+    def enqueue(self, audit_log: AuditLogInDB) -> bool:
+        """
+        Create audit_log in db later, in a batch of the audit log buffer
+        :param audit_log:
+        :return: False if the buffer is full and the audit_log is dropped
+        """
+        return audit_log_buffer.put(audit_log)
+
     def get_by_id(self, document_id: Union[str, ObjectId]) -> Optional[AuditLogModel]:
         """
         Get audit_log in db from id
@@ -46,12 +79,27 @@ class AuditLogRepository:
         except Exception:
             return 0
 
+    def count_up_to(self, conditions: Dict[str, Any], limit: int) -> int:
+        """
+        Number of audit logs matching `conditions`, counting stops after `limit`
+        :return: `limit + 1` when more than `limit` audit logs match
+        """
+        collection = AuditLogModel._get_collection()
+        try:
+            if not conditions:
+                return min(collection.estimated_document_count(), limit + 1)
+            return collection.count_documents(conditions, limit=limit + 1)
+        except Exception:
+            # unknown, as if too many
+            return limit + 1
+
     def list(
         self,
         page_index: int = 1,
         page_size: int = 20,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[AuditLogModel]:
         pipeline = []
 
@@ -66,6 +114,8 @@ class AuditLogRepository:
             ]
         )
 
+        if projection:
+            pipeline.append({"$project": projection})
         try:
             docs = AuditLogModel.objects().aggregate(pipeline)
             return [AuditLogModel.from_mongo(doc) for doc in docs] if docs else []
@@ -88,9 +138,79 @@ class AuditLogRepository:
         except Exception:
             return 0
 
+    def list_paginated(
+        self,
+        page_index: int = 1,
+        page_size: int | None = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+        skip: Optional[int] = None,
+    ) -> Tuple[List[Record], int | None]:
+        """
+        Page of audit logs and total of matched audit logs in one round trip
+        :param projection: `$project` specification of the returned documents
+        :param skip: audit logs before the page, instead of page_index
+        :return: (raw audit logs, total)
+        """
+        try:
+            docs, total = paginate(
+                AuditLogModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"created_at": -1},
+                page_index=page_index,
+                page_size=page_size,
+                count_mode=count_mode,
+                projection=projection,
+                skip=skip,
+            )
+            return to_records(AuditLogModel, docs), total
+        except Exception:
+            return [], 0
+
+    def list_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None, str | None]:
+        """
+        Page of audit logs after `cursor` (keyset pagination)
+        :param projection: `$project` specification of the returned documents
+        :return: (raw audit_logs, total, next_cursor)
+        :raises InvalidCursorError: cursor is malformed or was built for another sort
+        """
+        try:
+            docs, total, next_cursor = paginate_by_cursor(
+                AuditLogModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"created_at": -1},
+                page_size=page_size,
+                cursor=cursor,
+                count_mode=count_mode,
+                projection=projection,
+            )
+            return to_records(AuditLogModel, docs), total, next_cursor
+        except InvalidCursorError:
+            raise
+        except Exception:
+            return [], 0, None
+
     def delete(self, id: ObjectId) -> bool:
         try:
             AuditLogModel.objects(id=id).delete()
             return True
         except Exception:
             return False
+
+
+audit_log_buffer = AuditLogBuffer(
+    writer=AuditLogRepository().create_many,
+    max_size=settings.AUDIT_LOG_BUFFER_SIZE,
+    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+    flush_interval=settings.AUDIT_LOG_FLUSH_INTERVAL,
+)
@@ -1,13 +1,22 @@
 """Document repository module"""
 
-from typing import Optional, Dict, Union, List, Any
+from typing import Optional, Dict, Union, List, Any, Tuple
 from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
 
+from app.infra.shared.records import Record, to_records
+from app.infra.shared.pagination import (
+    CountMode,
+    InvalidCursorError,
+    paginate,
+    paginate_by_cursor,
+)
 from app.models.document import DocumentModel
 from app.domain.document.entity import DocumentInDB, DocumentInUpdateTime
+from app.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class DocumentRepository:
     def __init__(self):
         pass
@@ -64,6 +73,7 @@ class DocumentRepository:
         page_size: int = 20,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[DocumentModel]:
         pipeline = []
         if match_pipeline is not None:
@@ -77,6 +87,8 @@ class DocumentRepository:
             ]
         )
 
+        if projection:
+            pipeline.append({"$project": projection})
         try:
             docs = DocumentModel.objects().aggregate(pipeline)
             return [DocumentModel.from_mongo(doc) for doc in docs] if docs else []
@@ -99,6 +111,65 @@ class DocumentRepository:
         except Exception:
             return 0
 
+    def list_paginated(
+        self,
+        page_index: int = 1,
+        page_size: int | None = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None]:
+        """
+        Page of documents and total of matched documents in one round trip
+        :param projection: `$project` specification of the returned documents
+        :return: (raw documents, total)
+        """
+        try:
+            docs, total = paginate(
+                DocumentModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"created_at": -1},
+                page_index=page_index,
+                page_size=page_size,
+                count_mode=count_mode,
+                projection=projection,
+            )
+            return to_records(DocumentModel, docs), total
+        except Exception:
+            return [], 0
+
+    def list_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None, str | None]:
+        """
+        Page of documents after `cursor` (keyset pagination)
+        :param projection: `$project` specification of the returned documents
+        :return: (raw documents, total, next_cursor)
+        :raises InvalidCursorError: cursor is malformed or was built for another sort
+        """
+        try:
+            docs, total, next_cursor = paginate_by_cursor(
+                DocumentModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"created_at": -1},
+                page_size=page_size,
+                cursor=cursor,
+                count_mode=count_mode,
+                projection=projection,
+            )
+            return to_records(DocumentModel, docs), total, next_cursor
+        except InvalidCursorError:
+            raise
+        except Exception:
+            return [], 0, None
+
     def delete(self, id: ObjectId) -> bool:
         try:
             DocumentModel.objects(id=id).delete()
@@ -5,10 +5,18 @@ from pydantic import EmailStr
 from app.config import settings
 
 from app.infra.logging import get_logger
+from app.infra.metrics import track_external
 
 logger = get_logger()
 
 
+def is_retryable_error(ex: Exception) -> bool:
+    """Network errors, rate limiting and server errors are worth retrying, bad requests aren't"""
+    if isinstance(ex, ApiException):
+        return not ex.status or ex.status == 429 or ex.status >= 500
+    return True
+
+
 class BrevoService:
     def __init__(self):
         configuration = sib_api_v3_sdk.Configuration()
@@ -58,32 +66,47 @@ class BrevoService:
                 params=params,
                 reply_to={"email": settings.YSOF_EMAIL_SENDER},
             )
-            api_response = self.api_instance.send_transac_email(send_smtp_email)
+            with track_external("brevo", "send_transac_email"):
+                api_response = self.api_instance.send_transac_email(send_smtp_email)
             return api_response
         except ApiException as ex:
             raise ex
 
-    def send_student_notification_subject(self, email_to: str, params: dict) -> Any:
-        try:
-            resp = self._send(
-                emails_to=email_to,
-                template_id=settings.STUDENT_NOTIFICATION_SUBJECT,
-                params=params,
-            )
-            return resp
-        except Exception as ex:
-            raise ex
+    def send_batch(
+        self,
+        emails_to: List[str],
+        template_id: int,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Send a template to many recipients with a single API call. Every recipient gets its own
+        message (a `messageVersion`), so addresses aren't disclosed to each other.
+        :return: message id of every recipient
+        """
+        if len(emails_to) == 0:
+            raise Exception("Must have email to")
 
-    def send_student_evaluation_subject(self, email_to: str, params: dict) -> Any:
-        try:
-            resp = self._send(
-                emails_to=email_to,
-                template_id=settings.STUDENT_SUBJECT_EVALUATION_TEMPLATE,
-                params=params,
+        message_versions = [
+            sib_api_v3_sdk.SendSmtpEmailMessageVersions(
+                to=[sib_api_v3_sdk.SendSmtpEmailTo1(email=email)]
             )
-            return resp
-        except Exception as ex:
-            raise ex
+            for email in emails_to
+        ]
+        send_smtp_email = sib_api_v3_sdk.SendSmtpEmail(
+            template_id=template_id,
+            params=params,
+            message_versions=message_versions,
+            reply_to={"email": settings.YSOF_EMAIL_SENDER},
+        )
+        with track_external("brevo", "send_transac_email"):
+            api_response = self.api_instance.send_transac_email(send_smtp_email)
+
+        # message ids are returned in the order of the message versions
+        message_ids = (api_response.message_ids if api_response else None) or []
+        return {
+            email: message_ids[i] if i < len(message_ids) else None
+            for i, email in enumerate(emails_to)
+        }
 
     def send_register_email(self, mail_to: EmailStr, password: str) -> Any:
         try:
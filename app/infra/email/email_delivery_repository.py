@@ -0,0 +1,51 @@
+"""Email delivery repository module"""
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from app.domain.shared.enum import EmailDeliveryStatus
+from app.infra.metrics import instrument_repository
+from app.models.email_delivery import EmailDeliveryModel
+
+
+@instrument_repository
+class EmailDeliveryRepository:
+    def __init__(self):
+        pass
+
+    def record(
+        self,
+        template_id: int,
+        sent: Dict[str, Optional[str]],
+        failed: List[str],
+        error: Optional[str] = None,
+        attempts: int = 1,
+        task_id: Optional[str] = None,
+    ) -> int:
+        """
+        Save the status of every recipient of a batch with one insert
+        :param sent: message id of every delivered recipient
+        :param failed: recipients not delivered, because of `error`
+        :return: number of saved deliveries
+        """
+        now = datetime.now(timezone.utc)
+        common = dict(template_id=template_id, attempts=attempts, task_id=task_id, created_at=now)
+        docs = [
+            EmailDeliveryModel(
+                email=email, status=EmailDeliveryStatus.SENT, message_id=message_id, **common
+            ).to_mongo()
+            for email, message_id in sent.items()
+        ]
+        docs.extend(
+            EmailDeliveryModel(
+                email=email, status=EmailDeliveryStatus.FAILED, error=error, **common
+            ).to_mongo()
+            for email in failed
+        )
+        if not docs:
+            return 0
+        try:
+            EmailDeliveryModel._get_collection().insert_many(docs, ordered=False)
+            return len(docs)
+        except Exception:
+            return 0
@@ -0,0 +1,136 @@
+"""Persistent, authenticated SMTP session shared by the senders of a process"""
+
+import logging
+import os
+import smtplib
+import threading
+import time
+from email.message import Message
+from typing import Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SMTPConnectionManager:
+    """
+    Keep one authenticated SMTP session per process and reuse it for every message, instead of
+    paying the connection, STARTTLS and LOGIN for each email.
+
+    The session is reopened when the server dropped it (`SMTPServerDisconnected`), when it has
+    been idle longer than `max_idle_secs` (most servers time out idle clients) or after
+    `max_messages` messages. A forked process (Celery prefork worker) never reuses the socket
+    of its parent.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        max_idle_secs: int = 60,
+        max_messages: int = 200,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.max_idle_secs = max_idle_secs
+        self.max_messages = max_messages
+
+        self._lock = threading.Lock()
+        self._conn: Optional[smtplib.SMTP] = None
+        self._pid: Optional[int] = None
+        self._last_used = 0.0
+        self._messages_on_conn = 0
+        self._stats = {
+            "messages_sent": 0,
+            "messages_failed": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "reconnects": 0,
+        }
+
+    def send(self, msg: Message) -> Dict[str, tuple]:
+        """
+        :return: refused recipients, see `smtplib.SMTP.send_message`
+        """
+        with self._lock:
+            return self._send(msg)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _send(self, msg: Message) -> Dict[str, tuple]:
+        # a session dropped by the server is only noticed when using it: reconnect once
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                res = conn.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self._conn = None
+                if attempt:
+                    self._stats["messages_failed"] += 1
+                    raise
+                self._stats["reconnects"] += 1
+                continue
+            except Exception:
+                self._stats["messages_failed"] += 1
+                raise
+
+            self._last_used = time.monotonic()
+            self._messages_on_conn += 1
+            self._stats["messages_sent"] += 1
+            return res
+
+    def _connection(self) -> smtplib.SMTP:
+        if self._pid != os.getpid():
+            # inherited from the parent process, the socket isn't ours
+            self._conn = None
+            self._pid = os.getpid()
+
+        if self._conn is not None and (
+            time.monotonic() - self._last_used > self.max_idle_secs
+            or self._messages_on_conn >= self.max_messages
+        ):
+            self._close()
+
+        if self._conn is not None:
+            self._stats["connections_reused"] += 1
+            return self._conn
+
+        conn = smtplib.SMTP(host=self.host, port=self.port)
+        try:
+            conn.starttls()
+            conn.login(user=self.user, password=self.password)
+        except Exception:
+            conn.close()
+            raise
+        self._conn = conn
+        self._messages_on_conn = 0
+        self._stats["connections_opened"] += 1
+        return conn
+
+    def _close(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.quit()
+        except Exception:
+            self._conn.close()
+        self._conn = None
+
+
+smtp_connection_manager = SMTPConnectionManager(
+    host=settings.SMTP_MAIL_HOST,
+    port=int(settings.SMTP_MAIL_PORT),
+    user=settings.SMTP_MAIL_USER,
+    password=settings.SMTP_MAIL_PASSWORD,
+)
@@ -1,13 +1,22 @@
 """GeneralTask repository module"""
 
-from typing import Optional, Dict, Union, List, Any
+from typing import Optional, Dict, Union, List, Any, Tuple
 from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
 
+from app.infra.shared.records import Record, to_records
+from app.infra.shared.pagination import (
+    CountMode,
+    InvalidCursorError,
+    paginate,
+    paginate_by_cursor,
+)
 from app.models.general_task import GeneralTaskModel
 from app.domain.general_task.entity import GeneralTaskInDB, GeneralTaskInUpdateTime
+from app.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class GeneralTaskRepository:
     def __init__(self):
         pass
@@ -70,6 +79,7 @@ class GeneralTaskRepository:
         page_size: int = 20,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[GeneralTaskModel]:
         pipeline = []
         if match_pipeline is not None:
@@ -83,6 +93,8 @@ class GeneralTaskRepository:
             ]
         )
 
+        if projection:
+            pipeline.append({"$project": projection})
         try:
             docs = GeneralTaskModel.objects().aggregate(pipeline)
             return [GeneralTaskModel.from_mongo(doc) for doc in docs] if docs else []
@@ -105,6 +117,65 @@ class GeneralTaskRepository:
         except Exception:
             return 0
 
+    def list_paginated(
+        self,
+        page_index: int = 1,
+        page_size: int | None = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None]:
+        """
+        Page of general tasks and total of matched general tasks in one round trip
+        :param projection: `$project` specification of the returned documents
+        :return: (raw general tasks, total)
+        """
+        try:
+            docs, total = paginate(
+                GeneralTaskModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"created_at": -1},
+                page_index=page_index,
+                page_size=page_size,
+                count_mode=count_mode,
+                projection=projection,
+            )
+            return to_records(GeneralTaskModel, docs), total
+        except Exception:
+            return [], 0
+
+    def list_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None, str | None]:
+        """
+        Page of general tasks after `cursor` (keyset pagination)
+        :param projection: `$project` specification of the returned documents
+        :return: (raw general_tasks, total, next_cursor)
+        :raises InvalidCursorError: cursor is malformed or was built for another sort
+        """
+        try:
+            docs, total, next_cursor = paginate_by_cursor(
+                GeneralTaskModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"created_at": -1},
+                page_size=page_size,
+                cursor=cursor,
+                count_mode=count_mode,
+                projection=projection,
+            )
+            return to_records(GeneralTaskModel, docs), total, next_cursor
+        except InvalidCursorError:
+            raise
+        except Exception:
+            return [], 0, None
+
     def delete(self, id: ObjectId) -> bool:
         try:
             GeneralTaskModel.objects(id=id).delete()
@@ -113,10 +184,12 @@ class GeneralTaskRepository:
             return False
 
     def find_one(
-        self, conditions: Dict[str, Union[str, bool, ObjectId]]
+        self,
+        conditions: Dict[str, Union[str, bool, ObjectId]],
+        projection: Optional[Dict[str, Any]] = None,
     ) -> Optional[GeneralTaskModel]:
         try:
-            doc = GeneralTaskModel._get_collection().find_one(conditions)
+            doc = GeneralTaskModel._get_collection().find_one(conditions, projection)
             return GeneralTaskModel.from_mongo(doc) if doc else None
         except Exception:
             return None
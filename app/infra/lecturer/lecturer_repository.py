@@ -1,13 +1,18 @@
 """Lecturer repository module"""
 
-from typing import Optional, Dict, Union, List, Any
+from typing import Optional, Dict, Union, List, Any, Tuple
 from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
 
+from app.infra.shared.entity_cache import entity_cache
+from app.infra.shared.records import Record, to_records
+from app.infra.shared.pagination import CountMode, paginate
 from app.models.lecturer import LecturerModel
 from app.domain.lecturer.entity import LecturerInDB, LecturerInUpdateTime
+from app.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class LecturerRepository:
     def __init__(self):
         pass
@@ -47,7 +52,10 @@ class LecturerRepository:
                 if isinstance(data, LecturerInUpdateTime)
                 else data
             )
-            LecturerModel.objects(id=id).update_one(**data, upsert=False)
+            LecturerModel.objects(id=id).update_one(
+                **data, **LecturerModel.search_update(id, data), upsert=False
+            )
+            entity_cache.invalidate(LecturerModel, id)
             return True
         except Exception:
             return False
@@ -64,6 +72,7 @@ class LecturerRepository:
         page_size: int = 20,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[LecturerModel]:
         pipeline = []
         if match_pipeline is not None:
@@ -77,6 +86,8 @@ class LecturerRepository:
             ]
         )
 
+        if projection:
+            pipeline.append({"$project": projection})
         try:
             docs = LecturerModel.objects().aggregate(pipeline)
             return [LecturerModel.from_mongo(doc) for doc in docs] if docs else []
@@ -99,18 +110,49 @@ class LecturerRepository:
         except Exception:
             return 0
 
+    def list_paginated(
+        self,
+        page_index: int = 1,
+        page_size: int | None = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None]:
+        """
+        Page of lecturers and total of matched lecturers in one round trip
+        :param projection: `$project` specification of the returned documents
+        :return: (raw lecturers, total)
+        """
+        try:
+            docs, total = paginate(
+                LecturerModel._get_collection(),
+                match_pipeline=match_pipeline.get("$match") if match_pipeline else None,
+                sort=sort if sort else {"created_at": -1},
+                page_index=page_index,
+                page_size=page_size,
+                count_mode=count_mode,
+                projection=projection,
+            )
+            return to_records(LecturerModel, docs), total
+        except Exception:
+            return [], 0
+
     def delete(self, id: ObjectId) -> bool:
         try:
             LecturerModel.objects(id=id).delete()
+            entity_cache.invalidate(LecturerModel, id)
             return True
         except Exception:
             return False
 
     def find_one(
-        self, conditions: Dict[str, Union[str, bool, ObjectId]]
+        self,
+        conditions: Dict[str, Union[str, bool, ObjectId]],
+        projection: Optional[Dict[str, Any]] = None,
     ) -> Optional[LecturerModel]:
         try:
-            doc = LecturerModel._get_collection().find_one(conditions)
+            doc = LecturerModel._get_collection().find_one(conditions, projection)
             return LecturerModel.from_mongo(doc) if doc else None
         except Exception:
             return None
@@ -1,10 +1,20 @@
 import logging
+import os
+import queue
+import random
 import sys
+import threading
+import traceback
+import weakref
+from logging.handlers import QueueListener, TimedRotatingFileHandler
 from pprint import pformat
 import json
+
+import orjson
 from loguru import logger
 from loguru._defaults import LOGURU_FORMAT
 from app.config import settings
+from app.infra.logging.context import request_id_var, trace_id_var
 
 
 class InterceptHandler(logging.Handler):
@@ -30,29 +40,132 @@ class InterceptHandler(logging.Handler):
             level = self.loglevel_mapping[record.levelno]
 
         # Find caller from where originated the logged message
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
+        frame, depth = sys._getframe(), 0
+        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
             frame = frame.f_back
             depth += 1
 
-        log = logger.bind(request_id="app")
-        log.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
+
+class AccessLogSampler(logging.Filter):
+    """
+    Keep a `rate` fraction of the uvicorn access logs, errors (status >= 400) are always kept
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1:
+            return True
+        # uvicorn access log args: (client_addr, method, full_path, http_version, status_code)
+        args = record.args
+        if isinstance(args, tuple) and len(args) == 5 and isinstance(args[4], int):
+            if args[4] >= 400:
+                return True
+        return random.random() < self.rate
+
+
+class QueueSink:
+    """
+    Loguru sink of the process, formatted messages are put on a queue and written to stdout
+    and the log file by the single thread of a `QueueListener`, so logging never blocks the
+    caller on I/O.
+
+    A forked child (the Celery prefork pool) inherits the queue but not the writer thread:
+    it gets its own queue and thread, the records queued before the fork are left to the parent.
+    """
+
+    def __init__(self, handlers: list, as_json: bool = False):
+        self.handlers = handlers
+        self.as_json = as_json
+        self.started = False
+        self._open()
+        sink = weakref.ref(self)
+        os.register_at_fork(after_in_child=lambda: sink() and sink()._after_fork())
+
+    def start(self) -> None:
+        self.listener.start()
+        self.started = True
+
+    def stop(self) -> None:
+        """flush the queued records and stop the writer thread"""
+        if self.started:
+            self.listener.stop()
+            self.started = False
+
+    def _open(self) -> None:
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.listener = QueueListener(self.queue, *self.handlers, respect_handler_level=False)
+
+    def _after_fork(self) -> None:
+        started = self.started
+        self._open()
+        self.started = False
+        if started:
+            self.start()
+
+    def __call__(self, message) -> None:
+        text = self.to_json(message.record) if self.as_json else str(message).rstrip("\n")
+        self.queue.put_nowait(logging.makeLogRecord({"msg": text, "levelno": logging.INFO}))
+
+    @staticmethod
+    def to_json(record: dict) -> str:
+        extra = dict(record["extra"])
+        entry = {
+            "time": record["time"].isoformat(),
+            "level": record["level"].name,
+            "message": record["message"],
+            "name": record["name"],
+            "function": record["function"],
+            "line": record["line"],
+            "request_id": extra.pop("request_id", None),
+            "trace_id": extra.pop("trace_id", None),
+        }
+        if extra:
+            entry["extra"] = extra
+        if record["exception"] is not None:
+            entry["exception"] = "".join(traceback.format_exception(*record["exception"]))
+        return orjson.dumps(entry, default=repr).decode()
 
 
 class CustomizeLogger:
+    _lock = threading.Lock()
+    _sink: QueueSink | None = None
+    _sink_id: int | None = None
+
     @classmethod
     def make_logger(cls):
-        config = cls.load_logging_config()
-        logging_config = config.get("logger")
-
-        logger = cls.customize_logging(
-            level=logging_config.get("level") if settings.ENVIRONMENT != "testing" else "debug",
-            retention=logging_config.get("retention"),
-            rotation=logging_config.get("rotation"),
-            format=logging_config.get("format"),
-        )
+        """configure loguru once per process, next calls return the configured logger"""
+        with cls._lock:
+            if cls._sink is None:
+                config = cls.load_logging_config()
+                logging_config = config.get("logger")
+
+                cls.customize_logging(
+                    level=logging_config.get("level")
+                    if settings.ENVIRONMENT != "testing"
+                    else "debug",
+                    retention=logging_config.get("retention"),
+                    rotation=logging_config.get("rotation"),
+                    format=logging_config.get("format"),
+                )
         return logger
 
+    @classmethod
+    def shutdown(cls):
+        """flush the queued records and stop the writer thread"""
+        with cls._lock:
+            if cls._sink is None:
+                return
+            logger.remove(cls._sink_id)
+            cls._sink.stop()
+            for handler in cls._sink.handlers:
+                handler.close()
+            cls._sink = cls._sink_id = None
+
     @classmethod
     def format_record(cls, record: dict) -> str:
         """
@@ -70,6 +183,9 @@ class CustomizeLogger:
         """
         format_string = LOGURU_FORMAT
 
+        if record["extra"].get("request_id") is not None:
+            format_string += " <dim>[{extra[request_id]}]</dim>"
+
         if record["extra"].get("payload") is not None:
             record["extra"]["payload"] = pformat(
                 record["extra"]["payload"], indent=4, compact=True, width=88
@@ -79,36 +195,59 @@ class CustomizeLogger:
         format_string += "{exception}\n"
         return format_string
 
+    @staticmethod
+    def bind_context(record: dict) -> None:
+        """loguru patcher, add the request context of the current task to the record"""
+        record["extra"]["request_id"] = request_id_var.get()
+        record["extra"]["trace_id"] = trace_id_var.get()
+
+    @staticmethod
+    def days(value: str) -> int:
+        """number of days of a loguru-like duration of logging_config.json, e.g. `2 days`"""
+        count, _, unit = value.strip().partition(" ")
+        if not unit.startswith(("day", "week")):
+            raise ValueError(f"Unsupported log duration: {value}")
+        return int(count) * (7 if unit.startswith("week") else 1)
+
     @classmethod
     def customize_logging(cls, level: str, rotation: str, retention: str, format: str):
-        logger.remove()
-        logger.add(
-            sys.stdout,
-            enqueue=True,
-            backtrace=True,
-            level=level.upper(),
-            format=cls.format_record,
-        )
-
+        log_dir = "{dir}/logs".format(dir=settings.ROOT_DIR)
+        os.makedirs(log_dir, exist_ok=True)
         filename = f"api_{settings.ENVIRONMENT}.log"
 
-        logger.add(
-            "{dir}/logs/{filename}".format(dir=settings.ROOT_DIR, filename=filename),
-            rotation=rotation,
-            retention=retention,
-            enqueue=True,
+        interval = cls.days(rotation)
+        file_handler = TimedRotatingFileHandler(
+            f"{log_dir}/{filename}",
+            when="D",
+            interval=interval,
+            backupCount=-(-cls.days(retention) // interval),
+            encoding="utf-8",
+        )
+        cls._sink = QueueSink(
+            [logging.StreamHandler(sys.stdout), file_handler], as_json=settings.LOG_JSON
+        )
+        cls._sink.start()
+
+        logger.remove()
+        logger.configure(patcher=cls.bind_context)
+        cls._sink_id = logger.add(
+            cls._sink,
             backtrace=True,
+            colorize=False,
             level=level.upper(),
-            format=cls.format_record,
+            format="{message}" if settings.LOG_JSON else cls.format_record,
         )
 
-        logging.basicConfig(handlers=[InterceptHandler()], level=0)
-        logging.getLogger("uvicorn.access").handlers = [InterceptHandler()]
-        for _log in ["uvicorn", "uvicorn.error", "fastapi"]:
+        logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+        access_logger = logging.getLogger("uvicorn.access")
+        access_logger.filters = [AccessLogSampler(settings.ACCESS_LOG_SAMPLE_RATE)]
+        for _log in ["uvicorn", "uvicorn.error", "uvicorn.access", "fastapi"]:
             _logger = logging.getLogger(_log)
             _logger.handlers = [InterceptHandler()]
+            # the root logger intercepts them too, don't log the records twice
+            _logger.propagate = False
 
-        return logger.bind(request_id=None, method=None)
+        return logger
 
     @classmethod
     def load_logging_config(cls):
@@ -121,6 +260,8 @@ class CustomizeLogger:
 
 
 def get_logger():
-    logger = logging.getLogger(__name__)
-    logger = CustomizeLogger.make_logger()
-    return logger
+    return CustomizeLogger.make_logger()
+
+
+def shutdown_logging():
+    CustomizeLogger.shutdown()
@@ -0,0 +1,63 @@
+"""Request context of the log records, propagated with contextvars"""
+
+import re
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_ID_HEADER = "x-request-id"
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+trace_id_var: ContextVar[Optional[str]] = ContextVar("trace_id", default=None)
+
+# W3C trace context: version-trace_id-parent_id-flags
+_TRACEPARENT = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-[0-9a-f]{16}-[0-9a-f]{2}$")
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[str]:
+    """trace id of a `traceparent` header, None if the header is missing or invalid"""
+    if not value:
+        return None
+    match = _TRACEPARENT.match(value.strip().lower())
+    if not match or match.group(1) == "0" * 32:
+        return None
+    return match.group(1)
+
+
+class RequestContextMiddleware:
+    """
+    Bind the request id (`X-Request-ID` header, generated when missing) and the trace id
+    (`traceparent` header) of each request to the log records, the request id is echoed in
+    the response headers.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        request_id = headers.get(REQUEST_ID_HEADER.encode(), b"").decode("latin-1")[:128]
+        request_id = request_id or uuid.uuid4().hex
+        trace_id = parse_traceparent(headers.get(b"traceparent", b"").decode("latin-1"))
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (REQUEST_ID_HEADER.encode(), request_id.encode("latin-1")),
+                ]
+            await send(message)
+
+        request_token = request_id_var.set(request_id)
+        trace_token = trace_id_var.set(trace_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(request_token)
+            trace_id_var.reset(trace_token)
@@ -0,0 +1,41 @@
+from typing import Any
+
+from bson import ObjectId
+
+from app.infra.shared.async_collection import get_async_collection
+from app.domain.manage_form.enum import FormType
+from app.infra.manage_form.manage_form_cache import manage_form_cache
+from app.models.manage_form import ManageFormModel
+from app.infra.metrics import instrument_repository
+
+
+@instrument_repository
+class AsyncManageFormRepository:
+    """
+    `ManageFormRepository` of the async endpoints, reads go through motor
+    """
+
+    def __init__(self):
+        pass
+
+    async def find_one(
+        self, conditions: dict[str, str | bool | ObjectId], projection: dict[str, Any] | None = None
+    ) -> ManageFormModel | None:
+        try:
+            doc = await get_async_collection(ManageFormModel).find_one(conditions, projection)
+            return ManageFormModel.from_mongo(doc) if doc else None
+        except Exception:
+            return None
+
+    async def find_by_type(self, type: FormType) -> ManageFormModel | None:
+        """
+        Form of `type`, from the cache of the process
+        """
+        try:
+            doc = await manage_form_cache.get_async(
+                type.value,
+                lambda: get_async_collection(ManageFormModel).find_one({"type": type}),
+            )
+            return manage_form_cache.to_model(doc)
+        except Exception:
+            return None
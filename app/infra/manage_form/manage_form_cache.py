@@ -0,0 +1,32 @@
+"""Forms by type, read on every student submission"""
+
+import copy
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.domain.manage_form.enum import FormType
+from app.infra.shared.versioned_cache import VersionedCache
+from app.models.manage_form import ManageFormModel
+
+
+class ManageFormCache(VersionedCache):
+    """
+    Raw form document of each `FormType` (None when the form doesn't exist yet), dropped in
+    every process as soon as any process saves a form, see `VersionedCache`
+    """
+
+    name = "manage_form"
+
+    @staticmethod
+    def to_model(doc: Optional[Dict[str, Any]]) -> Optional[ManageFormModel]:
+        # the cached document is shared, `from_mongo` pops its `_id`
+        return ManageFormModel.from_mongo(copy.deepcopy(doc)) if doc else None
+
+    def warm_up(self) -> None:
+        """load every form, so the first submissions don't wait for mongo"""
+        docs = {doc["type"]: doc for doc in ManageFormModel._get_collection().find()}
+        for form_type in FormType:
+            self.get(form_type.value, lambda: docs.get(form_type.value))
+
+
+manage_form_cache = ManageFormCache(poll_interval=settings.MANAGE_FORM_CACHE_POLL_INTERVAL)
@@ -2,8 +2,12 @@ from bson import ObjectId
 from typing import Any
 from app.models.manage_form import ManageFormModel
 from app.domain.manage_form.entity import ManageFormUpdateWithTime, ManageFormInDB
+from app.domain.manage_form.enum import FormType
+from app.infra.manage_form.manage_form_cache import manage_form_cache
+from app.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class ManageFormRepository:
     def __init__(self):
         pass
@@ -18,6 +22,7 @@ class ManageFormRepository:
         new_doc = ManageFormModel(**doc.model_dump())
         # and save it to db
         new_doc.save()
+        manage_form_cache.invalidate()
         return new_doc
 
     def update(self, id: ObjectId, data: ManageFormUpdateWithTime | dict[str, Any]) -> bool:
@@ -28,13 +33,28 @@ class ManageFormRepository:
                 else data
             )
             ManageFormModel.objects(id=id).update_one(**data, upsert=False)
+            manage_form_cache.invalidate()
             return True
         except Exception:
             return False
 
-    def find_one(self, conditions: dict[str, str | bool | ObjectId]) -> ManageFormModel | None:
+    def find_one(
+        self, conditions: dict[str, str | bool | ObjectId], projection: dict[str, Any] | None = None
+    ) -> ManageFormModel | None:
         try:
-            doc = ManageFormModel._get_collection().find_one(conditions)
+            doc = ManageFormModel._get_collection().find_one(conditions, projection)
             return ManageFormModel.from_mongo(doc) if doc else None
         except Exception:
             return None
+
+    def find_by_type(self, type: FormType) -> ManageFormModel | None:
+        """
+        Form of `type`, from the cache of the process
+        """
+        try:
+            doc = manage_form_cache.get(
+                type.value, lambda: ManageFormModel._get_collection().find_one({"type": type})
+            )
+            return manage_form_cache.to_model(doc)
+        except Exception:
+            return None
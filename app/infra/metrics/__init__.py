@@ -0,0 +1,191 @@
+"""Prometheus metrics of the API, the repositories, the external services and the Celery tasks"""
+
+import functools
+import inspect
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple, Type, TypeVar
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+T = TypeVar("T")
+
+# `Repository.method` being executed, the label of the Mongo commands it sends
+repository_method_var: ContextVar[str] = ContextVar("repository_method", default="")
+# ASGI scope of the request being served, its route is set once the request is matched
+http_scope_var: ContextVar[Optional[Dict[str, Any]]] = ContextVar("http_scope", default=None)
+
+# seconds, from a cached lookup to a bulk import
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Latency of the HTTP requests by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+REPOSITORY_DURATION = Histogram(
+    "repository_operation_duration_seconds",
+    "Duration of the repository methods",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+MONGO_COMMAND_DURATION = Histogram(
+    "mongo_command_duration_seconds",
+    "Duration of the Mongo commands, by the repository method that sent them",
+    ["command", "collection", "operation", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+EXTERNAL_CALL_DURATION = Histogram(
+    "external_call_duration_seconds",
+    "Duration of the calls to Brevo, the SMTP server and the Google APIs",
+    ["service", "operation", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+CELERY_TASK_RUNTIME = Histogram(
+    "celery_task_runtime_seconds",
+    "Runtime of the Celery tasks",
+    ["task", "state"],
+    buckets=LATENCY_BUCKETS + (120, 300, 600),
+)
+CELERY_TASK_QUEUE_WAIT = Histogram(
+    "celery_task_queue_wait_seconds",
+    "Time between the publication of a Celery task and its start on a worker",
+    ["task"],
+    buckets=LATENCY_BUCKETS + (120, 300, 600),
+)
+AUDIT_LOGS_QUEUED = Gauge(
+    "audit_logs_queued",
+    "Audit logs waiting in the buffer to be written",
+    multiprocess_mode="livesum",
+)
+AUDIT_LOGS_WRITTEN = Counter("audit_logs_written", "Audit logs written by the buffer")
+AUDIT_LOGS_DROPPED = Counter(
+    "audit_logs_dropped",
+    "Audit logs lost, the buffer was full or their batch failed to be written",
+    ["reason"],
+)
+ENTITY_CACHE_REQUESTS = Counter(
+    "entity_cache_requests",
+    "Lookups of the entity cache by entity, `hit` or `miss`",
+    ["entity", "result"],
+)
+PASSWORD_HASHES_PENDING = Gauge(
+    "password_hashes_pending",
+    "Password hashes queued or running in the hashing processes",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASHES_REJECTED = Counter(
+    "password_hashes_rejected",
+    "Password hashes refused by the admission queue, `full` or `timeout`",
+    ["reason"],
+)
+LOGINS_THROTTLED = Counter(
+    "logins_throttled",
+    "Logins refused after too many failures of the `email` or the client `ip`",
+    ["key"],
+)
+
+
+def current_endpoint() -> str:
+    """`METHOD /route/{template}` of the request being served, empty outside of a request"""
+    scope = http_scope_var.get()
+    if scope is None:
+        return ""
+    return f"{scope['method']} {getattr(scope.get('route'), 'path', 'unmatched')}"
+
+
+@contextmanager
+def track_external(service: str, operation: str) -> Iterator[None]:
+    """observe the duration of a call to an external service, `outcome` is `error` if it raised"""
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "success"
+    finally:
+        EXTERNAL_CALL_DURATION.labels(service, operation, outcome).observe(
+            time.perf_counter() - start
+        )
+
+
+def instrument_repository(cls: Type[T]) -> Type[T]:
+    """
+    Class decorator of the repositories, time every public method and label the Mongo commands
+    sent from it with `Repository.method`
+    """
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(method):
+            continue
+        setattr(cls, name, _instrument(method, f"{cls.__name__}.{name}"))
+    return cls
+
+
+def _instrument(method, operation: str):
+    histogram = REPOSITORY_DURATION.labels(operation)
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(*args, **kwargs):
+            token = repository_method_var.set(operation)
+            start = time.perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+                repository_method_var.reset(token)
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        token = repository_method_var.set(operation)
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - start)
+            repository_method_var.reset(token)
+
+    return wrapper
+
+
+def registry() -> CollectorRegistry:
+    """
+    Registry to export, the metrics of every worker process are aggregated when
+    `PROMETHEUS_MULTIPROC_DIR` is set (several uvicorn workers, prefork Celery pool)
+    """
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+    collector_registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(collector_registry)
+    return collector_registry
+
+
+def latest_metrics() -> Tuple[bytes, str]:
+    """:return: exposition of the metrics and its content type"""
+    return generate_latest(registry()), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: Optional[int] = None) -> None:
+    """drop the live gauges of an exited worker process, in multiprocess mode"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid or os.getpid())
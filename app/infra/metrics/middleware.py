@@ -0,0 +1,46 @@
+"""ASGI middleware of the HTTP metrics"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infra.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT, http_scope_var
+
+
+class PrometheusMiddleware:
+    """
+    Observe the latency of each request by route template (`/students/{id}`, not the actual
+    path, to bound the label values) and count the requests in flight
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        token = http_scope_var.set(scope)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_scope_var.reset(token)
+            in_flight.dec()
+            # set by the router on the scope once the request is matched
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method, getattr(route, "path", "unmatched"), str(status)
+            ).observe(time.perf_counter() - start)
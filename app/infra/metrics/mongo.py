@@ -0,0 +1,57 @@
+"""Timings of the Mongo commands, from pymongo command monitoring"""
+
+import threading
+from typing import Dict, Tuple
+
+from pymongo import monitoring
+
+from app.config import settings
+from app.infra.metrics import MONGO_COMMAND_DURATION, repository_method_var
+from app.infra.metrics.slow_queries import slow_query_profiler
+
+_registered = False
+_lock = threading.Lock()
+
+
+class MongoCommandListener(monitoring.CommandListener):
+    """
+    Label each command with its collection and the repository method that sent it, the
+    durations are the ones measured by the driver
+    """
+
+    def __init__(self):
+        self._pending: Dict[Tuple[int, object], Tuple[str, str, str]] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        name = event.command_name
+        target = event.command.get("collection" if name == "getMore" else name)
+        self._pending[(event.request_id, event.connection_id)] = (
+            name,
+            target if isinstance(target, str) else "",
+            # motor runs the commands in its executor threads, without the caller's context
+            repository_method_var.get(),
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._observe(event, "success")
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._observe(event, "error")
+
+    def _observe(self, event, outcome: str) -> None:
+        labels = self._pending.pop((event.request_id, event.connection_id), None)
+        if labels is not None:
+            MONGO_COMMAND_DURATION.labels(*labels, outcome).observe(event.duration_micros / 1e6)
+
+
+def register_command_listener() -> None:
+    """
+    register the listeners once, before the clients are created (they apply to new clients)
+    """
+    global _registered
+    with _lock:
+        if not _registered:
+            monitoring.register(MongoCommandListener())
+            if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+                monitoring.register(slow_query_profiler)
+            _registered = True
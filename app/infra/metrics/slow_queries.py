@@ -0,0 +1,228 @@
+"""Slow Mongo commands of the process, grouped by shape, with their explain plan"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from bson import SON
+from mongoengine.connection import get_connection
+from pymongo import monitoring
+
+from app.config import settings
+from app.infra.logging import get_logger
+from app.infra.metrics import current_endpoint, repository_method_var
+
+logger = get_logger()
+
+# commands the profiler records, the ones `explain` supports
+PROFILED_COMMANDS = {"find", "aggregate", "count", "distinct", "findAndModify", "update", "delete"}
+
+# keys of a command that don't change how the server runs it
+_SESSION_KEYS = {
+    "lsid",
+    "$db",
+    "$clusterTime",
+    "$readPreference",
+    "txnNumber",
+    "signature",
+    "apiVersion",
+    "apiStrict",
+    "apiDeprecationErrors",
+    "readConcern",
+    "writeConcern",
+}
+_NOT_SHAPE_KEYS = _SESSION_KEYS | {"cursor", "batchSize", "comment", "maxTimeMS"}
+
+
+def command_shape(value: Any) -> Any:
+    """
+    Shape of a command: values are replaced by `?` (`?regex` for a regex) and the lists of
+    values by `[?]`, the keys, operators and pipeline stages are kept
+    """
+    if isinstance(value, dict):
+        return {
+            key: command_shape(item) for key, item in value.items() if key not in _NOT_SHAPE_KEYS
+        }
+    if isinstance(value, (list, tuple)):
+        if any(isinstance(item, (dict, list, tuple)) for item in value):
+            return [command_shape(item) for item in value]
+        return ["?"]
+    if hasattr(value, "pattern") and hasattr(value, "flags"):
+        return "?regex"
+    return "?"
+
+
+def explain_summary(explain: Dict[str, Any]) -> Dict[str, Any]:
+    """docs/keys examined, docs returned and indexes used from an `executionStats` explain"""
+    stats = {"docs_examined": 0, "keys_examined": 0, "docs_returned": None}
+    indexes: List[str] = []
+
+    def walk(node: Any) -> None:
+        if isinstance(node, dict):
+            execution_stats = node.get("executionStats")
+            if isinstance(execution_stats, dict) and "totalDocsExamined" in execution_stats:
+                stats["docs_examined"] += execution_stats.get("totalDocsExamined", 0)
+                stats["keys_examined"] += execution_stats.get("totalKeysExamined", 0)
+                if stats["docs_returned"] is None:
+                    stats["docs_returned"] = execution_stats.get("nReturned")
+            if node.get("stage") == "COLLSCAN":
+                indexes.append("COLLSCAN")
+            elif isinstance(node.get("indexName"), str):
+                indexes.append(node["indexName"])
+            for name, item in node.items():
+                if name not in ("rejectedPlans", "allPlansExecution"):
+                    walk(item)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    walk(explain)
+    return {**stats, "indexes": sorted(set(indexes))}
+
+
+class SlowQueryProfiler(monitoring.CommandListener):
+    """
+    Record the commands slower than `threshold_ms`, grouped by endpoint, collection and
+    command shape. With `explain`, the first command of each group is explained in a
+    background thread (`executionStats`) to tell index scans from collection scans.
+
+    The report is the one of the current process.
+    """
+
+    def __init__(self, threshold_ms: int, explain: bool = False, max_shapes: int = 500):
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self.max_shapes = max_shapes
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[int, Any], Tuple[Any, ...]] = {}
+        self._entries: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name not in PROFILED_COMMANDS:
+            return
+        self._pending[(event.request_id, event.connection_id)] = (
+            event.command,
+            event.database_name,
+            current_endpoint(),
+            repository_method_var.get(),
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pending = self._pending.pop((event.request_id, event.connection_id), None)
+        if pending is not None and event.duration_micros >= self.threshold_ms * 1000:
+            self.record(event.command_name, *pending, event.duration_micros / 1000, event.reply)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._pending.pop((event.request_id, event.connection_id), None)
+
+    def record(
+        self,
+        command_name: str,
+        command: Dict[str, Any],
+        database: str,
+        endpoint: str,
+        operation: str,
+        duration_ms: float,
+        reply: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        collection = command.get(command_name)
+        shape = orjson.dumps(command_shape(command), option=orjson.OPT_NON_STR_KEYS).decode()
+        key = (endpoint, operation, database, str(collection), shape)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if len(self._entries) >= self.max_shapes:
+                    self.dropped += 1
+                    return
+                entry = self._entries[key] = {
+                    "endpoint": endpoint,
+                    "operation": operation,
+                    "collection": str(collection),
+                    "command": command_name,
+                    "shape": shape,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "docs_returned": None,
+                    "docs_examined": None,
+                    "keys_examined": None,
+                    "indexes": None,
+                    "last_seen": None,
+                }
+                explain = self.explain
+            else:
+                explain = False
+            entry["count"] += 1
+            entry["total_ms"] += duration_ms
+            entry["max_ms"] = max(entry["max_ms"], duration_ms)
+            entry["last_seen"] = datetime.now(timezone.utc)
+            returned = self._docs_returned(reply)
+            if returned is not None:
+                entry["docs_returned"] = returned
+        if explain:
+            self._explain_later(key, command, database)
+
+    def report(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """groups ranked by total time spent, slowest first"""
+        with self._lock:
+            entries = [
+                {**entry, "avg_ms": entry["total_ms"] / entry["count"]}
+                for entry in self._entries.values()
+            ]
+        entries.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return entries[:limit] if limit else entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.dropped = 0
+
+    def _explain_later(self, key: Tuple[str, ...], command: Dict[str, Any], database: str) -> None:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="slow-query-explain"
+                    )
+        explained = SON((k, v) for k, v in command.items() if k not in _SESSION_KEYS)
+        self._executor.submit(self._explain, key, explained, database)
+
+    def _explain(self, key: Tuple[str, ...], command: SON, database: str) -> None:
+        try:
+            explain = get_connection()[database].command(
+                SON([("explain", command), ("verbosity", "executionStats")])
+            )
+        except Exception as e:
+            logger.warning(f"Failed to explain a slow {key[3]} query: {e}")
+            return
+        summary = explain_summary(explain)
+        docs_returned = summary.pop("docs_returned")
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.update(summary)
+                if docs_returned is not None:
+                    entry["docs_returned"] = docs_returned
+
+    @staticmethod
+    def _docs_returned(reply: Optional[Dict[str, Any]]) -> Optional[int]:
+        if not reply:
+            return None
+        cursor = reply.get("cursor")
+        if isinstance(cursor, dict) and isinstance(cursor.get("firstBatch"), list):
+            return len(cursor["firstBatch"])
+        if isinstance(reply.get("values"), list):
+            return len(reply["values"])
+        n = reply.get("n")
+        return n if isinstance(n, int) else None
+
+
+slow_query_profiler = SlowQueryProfiler(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    explain=settings.SLOW_QUERY_EXPLAIN,
+    max_shapes=settings.SLOW_QUERY_MAX_SHAPES,
+)
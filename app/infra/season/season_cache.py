@@ -0,0 +1,16 @@
+"""Current season cache shared by the api and celery processes"""
+
+from app.config import settings
+from app.infra.shared.versioned_cache import VersionedCache
+
+
+class SeasonCache(VersionedCache):
+    """
+    Current season and its detail, dropped in every process as soon as any process switches
+    season, see `VersionedCache`
+    """
+
+    name = "season"
+
+
+season_cache = SeasonCache(poll_interval=settings.SEASON_CACHE_POLL_INTERVAL)
@@ -1,15 +1,19 @@
 """Season repository module"""
 
-from typing import Optional, Dict, Union, List, Any
+from typing import Optional, Dict, Union, List, Any, Tuple
 from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
 import pymongo
 from fastapi import HTTPException
 
+from app.infra.shared.records import Record, to_records
+from app.infra.shared.pagination import CountMode, paginate
 from app.models.season import SeasonModel
 from app.domain.season.entity import SeasonInDB, SeasonInUpdate, SeasonInUpdateTime
+from app.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class SeasonRepository:
     def __init__(self):
         pass
@@ -62,6 +66,7 @@ class SeasonRepository:
         page_size: int | None = None,
         match_pipeline: Optional[List[Dict[str, Any]]] = None,
         sort: Optional[Dict[str, int]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[SeasonModel]:
         pipeline = []
         if match_pipeline is not None:
@@ -72,6 +77,8 @@ class SeasonRepository:
         )
         if page_index is not None and page_size is not None:
             pipeline.append({"$skip": page_size * (page_index - 1)}, {"$limit": page_size})
+        if projection:
+            pipeline.append({"$project": projection})
         try:
             docs = SeasonModel.objects().aggregate(pipeline)
             return [SeasonModel.from_mongo(doc) for doc in docs] if docs else []
@@ -94,6 +101,34 @@ class SeasonRepository:
         except Exception:
             return 0
 
+    def list_paginated(
+        self,
+        page_index: int = 1,
+        page_size: int | None = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None]:
+        """
+        Page of seasons and total of matched seasons in one round trip
+        :param projection: `$project` specification of the returned documents
+        :return: (raw seasons, total)
+        """
+        try:
+            docs, total = paginate(
+                SeasonModel._get_collection(),
+                match_pipeline=match_pipeline.get("$match") if match_pipeline else None,
+                sort=sort if sort else {"season": 1},
+                page_index=page_index,
+                page_size=page_size,
+                count_mode=count_mode,
+                projection=projection,
+            )
+            return to_records(SeasonModel, docs), total
+        except Exception:
+            return [], 0
+
     def delete(self, id: ObjectId) -> bool:
         try:
             SeasonModel.objects(id=id).delete()
@@ -135,9 +170,13 @@ class SeasonRepository:
         except Exception:
             return False
 
-    def find_one(self, conditions: Dict[str, Union[str, bool, ObjectId]]) -> Optional[SeasonModel]:
+    def find_one(
+        self,
+        conditions: Dict[str, Union[str, bool, ObjectId]],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Optional[SeasonModel]:
         try:
-            doc = SeasonModel._get_collection().find_one(conditions)
+            doc = SeasonModel._get_collection().find_one(conditions, projection)
             return SeasonModel.from_mongo(doc) if doc else None
         except Exception:
             return None
@@ -0,0 +1,76 @@
+"""Throttling of the failed logins by email and by client ip"""
+
+import threading
+from typing import Optional
+
+from cachetools import TTLCache
+
+from app.config import settings
+from app.infra.metrics import LOGINS_THROTTLED
+
+
+class LoginThrottle:
+    """
+    Count the failed logins of every email and client ip, an email with `max_email_failures`
+    or an ip with `max_ip_failures` is refused before its password is hashed, until `window`
+    seconds passed without a new failure. A successful login resets the count of its email.
+
+    Counts are kept by each process. A window of 0 disables the throttling.
+    """
+
+    def __init__(
+        self,
+        window: int,
+        max_email_failures: int = 5,
+        max_ip_failures: int = 30,
+        maxsize: int = 65536,
+    ):
+        self.window = window
+        self.max_email_failures = max_email_failures
+        self.max_ip_failures = max_ip_failures
+        self._lock = threading.Lock()
+        self._failures: TTLCache | None = (
+            TTLCache(maxsize=maxsize, ttl=window) if window > 0 else None
+        )
+
+    def blocked(self, email: str, client_ip: Optional[str] = None) -> bool:
+        if self._failures is None:
+            return False
+        with self._lock:
+            email_failures = self._failures.get(("email", email.lower()), 0)
+            ip_failures = self._failures.get(("ip", client_ip), 0) if client_ip else 0
+        if email_failures >= self.max_email_failures:
+            LOGINS_THROTTLED.labels("email").inc()
+            return True
+        if ip_failures >= self.max_ip_failures:
+            LOGINS_THROTTLED.labels("ip").inc()
+            return True
+        return False
+
+    def failed(self, email: str, client_ip: Optional[str] = None) -> None:
+        if self._failures is None:
+            return
+        keys = [("email", email.lower())] + ([("ip", client_ip)] if client_ip else [])
+        with self._lock:
+            for key in keys:
+                # setting the key again restarts its window
+                self._failures[key] = self._failures.get(key, 0) + 1
+
+    def succeeded(self, email: str) -> None:
+        if self._failures is None:
+            return
+        with self._lock:
+            self._failures.pop(("email", email.lower()), None)
+
+    def clear(self) -> None:
+        if self._failures is None:
+            return
+        with self._lock:
+            self._failures.clear()
+
+
+login_throttle = LoginThrottle(
+    window=settings.LOGIN_THROTTLE_WINDOW if settings.ENVIRONMENT != "testing" else 0,
+    max_email_failures=settings.LOGIN_MAX_FAILURES_PER_EMAIL,
+    max_ip_failures=settings.LOGIN_MAX_FAILURES_PER_IP,
+)
@@ -0,0 +1,149 @@
+"""Bcrypt hashing in a pool of worker processes, behind a bounded admission queue"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
+
+from app.infra.metrics import PASSWORD_HASHES_PENDING, PASSWORD_HASHES_REJECTED
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+# run in the worker processes, module level functions to be picklable
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+class PasswordHasherBusyError(Exception):
+    """The hash was not admitted, or not done within the max wait"""
+
+
+class PasswordHasher:
+    """
+    Run the cpu bound bcrypt hashes in `workers` processes (one per core by default), so a burst
+    of logins doesn't hold the GIL and the threadpool the other endpoints are served from.
+
+    At most `workers + queue_size` hashes are pending, a hash beyond that is rejected right away
+    and one not done after `max_wait` seconds is cancelled: both raise `PasswordHasherBusyError`.
+    Until `start` and after `stop` (tests, scripts, Celery tasks) hashes run in the caller.
+
+    A pool broken by a dead worker (e.g. OOM killed) is replaced by a new one, the hashes it
+    failed run in their caller.
+    """
+
+    def __init__(self, workers: int = 0, queue_size: int = 64, max_wait: float = 5):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = self.workers + queue_size
+        self.max_wait = max_wait
+        self.pending = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run(_verify, plain_password, hashed_password)
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """`verify` of the async endpoints, no thread waits for the worker process"""
+        future = self._submit(_verify, plain_password, hashed_password)
+        if future is None:
+            return await run_in_threadpool(_verify, plain_password, hashed_password)
+        try:
+            # cancelling the wrapper cancels the hash if it's still queued
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.max_wait)
+        except asyncio.TimeoutError:
+            raise self._rejected("timeout")
+        except BrokenProcessPool:
+            return await run_in_threadpool(_verify, plain_password, hashed_password)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                return
+            self._executor = self._new_executor()
+
+    def stop(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"workers": self.workers, "pending": self.pending, "rejected": self.rejected}
+
+    def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        future = self._submit(fn, *args)
+        if future is None:
+            return fn(*args)
+        try:
+            return future.result(timeout=self.max_wait)
+        except FutureTimeoutError:
+            future.cancel()
+            raise self._rejected("timeout")
+        except BrokenProcessPool:
+            return fn(*args)
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Optional[Future]:
+        """:return: None when not started or the pool is broken, the caller hashes itself"""
+        with self._lock:
+            executor = self._executor
+            if executor is None:
+                return None
+            full = self.pending >= self.max_pending
+            if not full:
+                try:
+                    future = executor.submit(fn, *args)
+                except BrokenProcessPool:
+                    self._replace(executor)
+                    return None
+                self.pending += 1
+        if full:
+            raise self._rejected("full")
+        PASSWORD_HASHES_PENDING.inc()
+        future.add_done_callback(partial(self._done, executor))
+        return future
+
+    def _done(self, executor: ProcessPoolExecutor, future: Future) -> None:
+        # done, failed or cancelled
+        broken = not future.cancelled() and isinstance(future.exception(), BrokenProcessPool)
+        with self._lock:
+            self.pending -= 1
+            if broken:
+                self._replace(executor)
+        PASSWORD_HASHES_PENDING.dec()
+
+    def _replace(self, broken: ProcessPoolExecutor) -> None:
+        """start a new pool in place of `broken`, unless it was replaced or stopped already"""
+        if self._executor is not broken:
+            return
+        self._executor = self._new_executor()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # spawned, forking a process running the event loop and the writer threads is unsafe
+        return ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _rejected(self, reason: str) -> PasswordHasherBusyError:
+        with self._lock:
+            self.rejected += 1
+        PASSWORD_HASHES_REJECTED.labels(reason).inc()
+        return PasswordHasherBusyError(f"Password hashing {reason}")
@@ -0,0 +1,83 @@
+"""Short-lived cache of authenticated principals (admins / students)"""
+
+import copy
+from typing import Any, Awaitable, Callable, Dict, Optional, Type
+
+from cachetools import TTLCache
+from mongoengine import Document
+
+from app.config import settings
+from app.infra.shared.versioned_cache import VersionedCache
+
+
+class PrincipalCache(VersionedCache):
+    """
+    Keep the raw mongo document of recently authenticated accounts for a few seconds, so
+    consecutive requests of the same session don't hit mongo again.
+
+    `invalidate` drops the cached accounts of every process (api and celery), see
+    `VersionedCache`: a deactivated, deleted or reset account is refused everywhere within
+    `poll_interval` seconds. Every hit builds a fresh model instance, requests never share a
+    mutable document. A ttl of 0 disables the cache.
+    """
+
+    name = "principal"
+
+    def __init__(self, ttl: int, poll_interval: float, maxsize: int = 4096):
+        super().__init__(poll_interval)
+        self.ttl = ttl
+        if ttl > 0:
+            self._values = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def load(
+        self, model: Type[Document], email: str, loader: Callable[[], Optional[Document]]
+    ) -> Optional[Document]:
+        """:param loader: account of `email`, called on a miss"""
+        if self.ttl <= 0:
+            return loader()
+        son = self.get(self._key(model, email), lambda: self._to_son(loader()))
+        return model._from_son(copy.deepcopy(son)) if son else None
+
+    async def load_async(
+        self,
+        model: Type[Document],
+        email: str,
+        loader: Callable[[], Awaitable[Optional[Document]]],
+    ) -> Optional[Document]:
+        """`load` of the async endpoints, the version is read through motor"""
+        if self.ttl <= 0:
+            return await loader()
+
+        async def load_son() -> Optional[Dict[str, Any]]:
+            return self._to_son(await loader())
+
+        son = await self.get_async(self._key(model, email), load_son)
+        return model._from_son(copy.deepcopy(son)) if son else None
+
+    def invalidate(self, model: Type[Document], *emails: str | None) -> None:
+        """
+        Drop the cached accounts of every process once the accounts of `emails` are saved,
+        not only theirs
+        """
+        if self.ttl <= 0 or not any(emails):
+            return
+        super().invalidate()
+
+    def _set(self, key: Any, value: Any, generation: int) -> None:
+        # unknown accounts are not cached, a new account can log in right away
+        if value is not None:
+            super()._set(key, value, generation)
+
+    @staticmethod
+    def _to_son(doc: Optional[Document]) -> Optional[Dict[str, Any]]:
+        return doc.to_mongo().to_dict() if doc is not None else None
+
+    @staticmethod
+    def _key(model: Type[Document], email: str) -> tuple[str, str]:
+        return (model.__name__, email)
+
+
+principal_cache = PrincipalCache(
+    ttl=settings.PRINCIPAL_CACHE_TTL if settings.ENVIRONMENT != "testing" else 0,
+    poll_interval=settings.PRINCIPAL_CACHE_POLL_INTERVAL,
+)
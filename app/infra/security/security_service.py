@@ -6,7 +6,6 @@ from typing import Optional
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from app.config import settings
 from app.domain.admin.entity import AdminInDB
@@ -16,10 +15,17 @@ from app.infra.admin.admin_repository import AdminRepository
 from app.models.admin import AdminModel
 from app.shared.common_exception import forbidden_exception
 from app.infra.student.student_repository import StudentRepository
+from app.infra.student.async_student_repository import AsyncStudentRepository
 from app.models.student import StudentModel
 from app.domain.student.entity import StudentInDB
+from app.infra.security.principal_cache import principal_cache
+from app.infra.security.password_hasher import PasswordHasher, PasswordHasherBusyError
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+    max_wait=settings.PASSWORD_HASH_MAX_WAIT,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/admin/auth/login")
 
 credentials_exception = HTTPException(
@@ -28,9 +34,25 @@ credentials_exception = HTTPException(
     headers={"WWW-Authenticate": "Bearer"},
 )
 
+password_hasher_busy_exception = HTTPException(
+    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+    detail="Hệ thống đang bận, vui lòng thử lại sau",
+    headers={"Retry-After": "1"},
+)
+
 
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return password_hasher.verify(plain_password, hashed_password)
+    except PasswordHasherBusyError:
+        raise password_hasher_busy_exception
+
+
+async def verify_password_async(plain_password, hashed_password):
+    try:
+        return await password_hasher.verify_async(plain_password, hashed_password)
+    except PasswordHasherBusyError:
+        raise password_hasher_busy_exception
 
 
 def verify_token(token: str) -> Optional[TokenData]:
@@ -46,7 +68,10 @@ def verify_token(token: str) -> Optional[TokenData]:
 
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    try:
+        return password_hasher.hash(password)
+    except PasswordHasherBusyError:
+        raise password_hasher_busy_exception
 
 
 def _get_current_admin(
@@ -54,7 +79,9 @@ def _get_current_admin(
     admin_repository: AdminRepository = Depends(AdminRepository),
 ) -> AdminModel:
     token_data = verify_token(token=token)
-    admin: AdminModel = admin_repository.get_by_email(email=token_data.email)
+    admin: AdminModel | None = principal_cache.load(
+        AdminModel, token_data.email, lambda: admin_repository.get_by_email(email=token_data.email)
+    )
     if admin is None:
         raise credentials_exception
     return admin
@@ -83,7 +110,11 @@ def _get_current_student(
     student_repository: StudentRepository = Depends(StudentRepository),
 ) -> StudentModel:
     token_data = verify_token(token=token)
-    student: StudentModel = student_repository.get_by_email(email=token_data.email)
+    student: StudentModel | None = principal_cache.load(
+        StudentModel,
+        token_data.email,
+        lambda: student_repository.get_by_email(email=token_data.email),
+    )
     if student is None:
         raise credentials_exception
     return student
@@ -107,6 +138,35 @@ def get_current_student(
     return student
 
 
+async def _get_current_student_async(
+    token: str = Depends(oauth2_scheme),
+    student_repository: AsyncStudentRepository = Depends(AsyncStudentRepository),
+) -> StudentModel:
+    token_data = verify_token(token=token)
+    student: StudentModel | None = await principal_cache.load_async(
+        StudentModel,
+        token_data.email,
+        lambda: student_repository.get_by_email(email=token_data.email),
+    )
+    if student is None:
+        raise credentials_exception
+    return student
+
+
+async def get_current_active_student_async(
+    student: StudentModel = Depends(_get_current_student_async),
+) -> StudentModel:
+    """`get_current_active_student` of the async endpoints, never takes a threadpool slot"""
+    return get_current_active_student(student)
+
+
+async def get_current_student_async(
+    student: StudentModel = Depends(_get_current_student_async),
+) -> StudentModel:
+    """`get_current_student` of the async endpoints, never takes a threadpool slot"""
+    return get_current_student(student)
+
+
 def create_access_token(data: TokenData, expires_delta: timedelta = None) -> str:
     to_encode = data.model_dump()
 
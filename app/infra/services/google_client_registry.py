@@ -0,0 +1,164 @@
+"""Process-wide registry for Google API clients"""
+
+import json
+import threading
+from urllib.parse import urlsplit
+from datetime import datetime, timedelta, timezone
+
+import google.auth
+import google_auth_httplib2
+import httplib2
+from fastapi import HTTPException
+from google.auth.transport.requests import Request
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+import logging
+
+from app.config import settings
+from app.infra.metrics import track_external
+
+logger = logging.getLogger(__name__)
+
+
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/documents",
+    "https://www.googleapis.com/auth/drive",
+    "https://www.googleapis.com/auth/drive.file",
+]
+
+# api name -> version of every Google API used by the app
+GOOGLE_APIS = {"drive": "v3", "sheets": "v4", "docs": "v1"}
+
+# refresh the access token this long before it actually expires
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+HTTP_TIMEOUT_SECS = 60
+
+
+def google_api_of(uri: str) -> str:
+    """`drive`, `upload`, `sheets`, `docs`... from the uri of a Google API request"""
+    parts = urlsplit(uri)
+    if parts.hostname == "www.googleapis.com":
+        return parts.path.strip("/").split("/", 1)[0]
+    return (parts.hostname or "").split(".", 1)[0]
+
+
+class TimedAuthorizedHttp(google_auth_httplib2.AuthorizedHttp):
+    """Authorized transport observing the duration of every Google API request"""
+
+    def request(self, uri, method="GET", *args, **kwargs):
+        if kwargs.get("_credential_refresh_attempt"):
+            # retry after a 401, already timed by the original request
+            return super().request(uri, method, *args, **kwargs)
+        with track_external("google", f"{google_api_of(uri)} {method}"):
+            return super().request(uri, method, *args, **kwargs)
+
+
+class GoogleAPIClientRegistry:
+    """
+    Load credentials once per process and hand out ready-to-use discovery services.
+
+    Credentials and parsed discovery documents are shared by every thread. httplib2 is not
+    thread-safe, so each thread gets its own authorized transport (and the services built on
+    top of it) which is then reused for every later request served by that thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._creds = None
+        self._documents: dict[tuple[str, str], dict] = {}
+        self._local = threading.local()
+
+    def get_credentials(self):
+        with self._lock:
+            if self._creds is None:
+                self._creds = self._load_credentials()
+            if self._need_refresh(self._creds):
+                self._refresh(self._creds)
+            return self._creds
+
+    def get_service(self, api_name: str, version: str):
+        services: dict = self._thread_services()
+        key = (api_name, version)
+        if key not in services:
+            services[key] = build_from_document(
+                self._get_document(api_name, version), http=self.http()
+            )
+        return services[key]
+
+    def http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Authorized transport of the current thread"""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = TimedAuthorizedHttp(
+                self.get_credentials(), http=httplib2.Http(timeout=HTTP_TIMEOUT_SECS)
+            )
+            self._local.http = http
+        elif self._need_refresh(http.credentials):
+            self.get_credentials()
+        return http
+
+    def warm_up(self) -> None:
+        """Load credentials and discovery documents ahead of the first request"""
+        try:
+            self.get_credentials()
+            for api_name, version in GOOGLE_APIS.items():
+                self._get_document(api_name, version)
+        except Exception as e:
+            logger.warning(f"Google API clients warm-up failed: {e}")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._creds = None
+            self._documents = {}
+            self._local = threading.local()
+
+    def _thread_services(self) -> dict:
+        services = getattr(self._local, "services", None)
+        if services is None:
+            services = self._local.services = {}
+        return services
+
+    def _get_document(self, api_name: str, version: str) -> dict:
+        key = (api_name, version)
+        if key not in self._documents:
+            with self._lock:
+                if key not in self._documents:
+                    content = get_static_doc(api_name, version)
+                    if content is None:
+                        raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
+                    self._documents[key] = json.loads(content)
+        return self._documents[key]
+
+    def _load_credentials(self):
+        creds = None
+        try:
+            creds, _ = google.auth.load_credentials_from_file(
+                settings.KEY_PATH_GCLOUD, scopes=SCOPES
+            )
+        except Exception:
+            logger.error("Failed to retrieve default credentials gcloud.")
+            raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
+
+        if creds is None:
+            raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
+        return creds
+
+    def _need_refresh(self, creds) -> bool:
+        if not creds.token:
+            return True
+        if creds.expiry is None:
+            return False
+        # google-auth keeps expiry as a naive UTC datetime
+        expiry = creds.expiry.replace(tzinfo=timezone.utc)
+        return expiry - TOKEN_REFRESH_MARGIN <= datetime.now(timezone.utc)
+
+    def _refresh(self, creds) -> None:
+        try:
+            with track_external("google", "token refresh"):
+                creds.refresh(Request())
+        except Exception as e:
+            logger.error(f"Failed to refresh gcloud access token: {e}")
+
+
+google_api_client_registry = GoogleAPIClientRegistry()
@@ -1,7 +1,7 @@
 from fastapi import Depends, HTTPException, BackgroundTasks
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from app.infra.services.google_drive_api import GoogleDriveAPIService
+from app.infra.services.google_client_registry import google_api_client_registry
 import logging
 from app.domain.upload.enum import RolePermissionGoogleEnum, TypePermissionGoogleEnum
 from app.domain.upload.entity import AddPermissionDriveFile, GoogleDriveAPIRes
@@ -17,7 +17,10 @@ class GoogleDocumentAPIService:
     ):
         self.google_drive_api_service = google_drive_api_service
         self.background_tasks = background_tasks
-        self.service = build("docs", "v1", credentials=self.google_drive_api_service._creds)
+
+    @property
+    def service(self):
+        return google_api_client_registry.get_service("docs", "v1")
 
     def create(self, name: str, email_owner: str):
         try:
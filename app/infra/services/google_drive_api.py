@@ -1,46 +1,29 @@
 from typing import Optional
 
-import google.auth
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaIoBaseUpload
 import io
-from fastapi import HTTPException, UploadFile
+from fastapi import UploadFile, HTTPException
 import logging
 
 from app.config import settings
 from app.domain.upload.entity import AddPermissionDriveFile, GoogleDriveAPIRes
 from app.domain.upload.enum import RolePermissionGoogleEnum, TypePermissionGoogleEnum
+from app.infra.services.google_client_registry import google_api_client_registry
 
 logger = logging.getLogger(__name__)
 
 
-SCOPES = [
-    "https://www.googleapis.com/auth/spreadsheets",
-    "https://www.googleapis.com/auth/documents",
-    "https://www.googleapis.com/auth/drive",
-    "https://www.googleapis.com/auth/drive.file",
-]
-
-
 class GoogleDriveAPIService:
     def __init__(self):
         self._creds = self._get_oauth_token()
-        self.service = build("drive", "v3", credentials=self._creds)
 
-    def _get_oauth_token(self):
-        creds = None
-        try:
-            creds, _ = google.auth.load_credentials_from_file(
-                settings.KEY_PATH_GCLOUD, scopes=SCOPES
-            )
-        except Exception:
-            logger.error("Failed to retrieve default credentials gcloud.")
-            raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
+    @property
+    def service(self):
+        return google_api_client_registry.get_service("drive", "v3")
 
-        if creds is None:
-            raise HTTPException(status_code=400, detail="Hệ thống Cloud bị lỗi.")
-        return creds
+    def _get_oauth_token(self):
+        return google_api_client_registry.get_credentials()
 
     def create(self, file: UploadFile, name: Optional[str] = None) -> GoogleDriveAPIRes:
         try:
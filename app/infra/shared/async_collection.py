@@ -0,0 +1,113 @@
+"""Awaitable access to the collection of a mongoengine model"""
+
+import asyncio
+import functools
+import itertools
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Type
+
+import anyio
+from mongoengine import Document, NotUniqueError
+from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError
+
+from app.config import settings
+from app.config.database import get_async_database
+
+_limiters: Dict[asyncio.AbstractEventLoop, anyio.CapacityLimiter] = {}
+
+
+def get_async_collection(model: Type[Document]) -> Any:
+    """
+    Motor collection of the model, with the same awaitable api (`find_one`, `find().to_list`,
+    `aggregate().to_list`, `insert_one`, `update_one`, ...).
+
+    Without motor (or on mongomock) the sync collection is wrapped in a `ThreadedCollection`.
+    """
+    collection: Collection = model._get_collection()
+    database = get_async_database()
+    if database is not None:
+        return database[collection.name]
+    return ThreadedCollection(collection, _limiter())
+
+
+def _limiter() -> anyio.CapacityLimiter:
+    # a limiter is bound to the event loop it was created in
+    loop = asyncio.get_running_loop()
+    if loop not in _limiters:
+        _limiters.clear()
+        _limiters[loop] = anyio.CapacityLimiter(settings.MONGODB_MAX_POOL_SIZE)
+    return _limiters[loop]
+
+
+class ThreadedCursor:
+    def __init__(self, collection: "ThreadedCollection", open_cursor: Callable[[], Any]):
+        self._collection = collection
+        self._open_cursor = open_cursor
+
+    async def to_list(self, length: Optional[int] = None) -> List[Dict[str, Any]]:
+        def fetch() -> List[Dict[str, Any]]:
+            cursor = self._open_cursor()
+            return list(cursor) if length is None else list(itertools.islice(cursor, length))
+
+        return await self._collection.run(fetch)
+
+
+class ThreadedCollection:
+    """
+    Sync pymongo collection behind the subset of the motor api used by the async repositories.
+    Calls run in worker threads, at most `MONGODB_MAX_POOL_SIZE` at a time, so they don't take
+    the slots of Starlette's threadpool.
+    """
+
+    def __init__(self, collection: Collection, limiter: anyio.CapacityLimiter):
+        self._collection = collection
+        self._limiter = limiter
+
+    @property
+    def name(self) -> str:
+        return self._collection.name
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        return await anyio.to_thread.run_sync(
+            functools.partial(func, *args, **kwargs), limiter=self._limiter
+        )
+
+    async def find_one(self, *args, **kwargs) -> Optional[Dict[str, Any]]:
+        return await self.run(self._collection.find_one, *args, **kwargs)
+
+    async def insert_one(self, *args, **kwargs) -> Any:
+        return await self.run(self._collection.insert_one, *args, **kwargs)
+
+    async def update_one(self, *args, **kwargs) -> Any:
+        return await self.run(self._collection.update_one, *args, **kwargs)
+
+    async def find_one_and_update(self, *args, **kwargs) -> Optional[Dict[str, Any]]:
+        return await self.run(self._collection.find_one_and_update, *args, **kwargs)
+
+    async def count_documents(self, *args, **kwargs) -> int:
+        return await self.run(self._collection.count_documents, *args, **kwargs)
+
+    def find(self, *args, **kwargs) -> ThreadedCursor:
+        return ThreadedCursor(self, lambda: self._collection.find(*args, **kwargs))
+
+    def aggregate(self, pipeline: List[Dict[str, Any]], **kwargs) -> ThreadedCursor:
+        return ThreadedCursor(self, lambda: self._collection.aggregate(pipeline, **kwargs))
+
+
+async def insert_document(doc: Document) -> Document:
+    """
+    Validate and insert a new document, like `Document.save` of the sync repositories
+    :raise NotUniqueError: a unique index is violated
+    """
+    now = datetime.now(timezone.utc)
+    for field in ("created_at", "updated_at"):
+        if field in doc._fields and not getattr(doc, field):
+            setattr(doc, field, now)
+    doc.validate()
+    try:
+        result = await get_async_collection(type(doc)).insert_one(doc.to_mongo())
+    except DuplicateKeyError as e:
+        raise NotUniqueError(f"Tried to save duplicate unique keys ({e})")
+    doc.id = result.inserted_id
+    return doc
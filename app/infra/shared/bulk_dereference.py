@@ -0,0 +1,263 @@
+"""Bulk dereferencing of ReferenceField values for a page of documents"""
+
+from collections import defaultdict
+from typing import Any, Iterable, Optional, Type
+
+from bson import DBRef, ObjectId
+from mongoengine import Document, ListField, ReferenceField
+
+from app.infra.shared.async_collection import get_async_collection
+from app.infra.shared.entity_cache import entity_cache
+from app.infra.shared.records import Record, to_records
+from app.models.lecturer import LecturerModel
+from app.models.subject import SubjectModel
+
+
+class BulkDereferencer:
+    """
+    Replace lazy references of already loaded documents with the referenced documents, fetching
+    every referenced collection with a single `$in` query instead of one query per access.
+
+    Loaded documents are kept in an identity map, so the same admin / lecturer / subject is only
+    loaded once. Inject it with `Depends(BulkDereferencer)`: FastAPI caches dependencies per
+    request, so every use case of a request shares the same identity map.
+
+    Example:
+    >>> dereferencer.dereference(general_tasks, "author", "attachments.author")
+    >>> dereferencer.dereference(subject_evaluations, "student", "subject.lecturer")
+    >>> dereferencer.dereference_records(GeneralTaskModel, records, "attachments.author")
+    """
+
+    # models first looked up in the `entity_cache`, none: admin reads stay uncached
+    cached_models: tuple[Type[Document], ...] = ()
+
+    def __init__(self):
+        self._identity_map: dict[tuple[Type[Document], Any], Document | None] = {}
+        # raw documents by (model, projection) and id
+        self._records: dict[tuple[Any, Any], Record | None] = {}
+
+    def dereference(self, docs: Iterable[Document], *paths: str) -> list[Document]:
+        """
+        :param docs: documents of the same model
+        :param paths: dotted paths of reference fields, e.g. "subject.lecturer"
+        :return: docs, with the references hydrated in place
+        """
+        docs = [doc for doc in docs if doc is not None]
+        for path in paths:
+            current = docs
+            for name in path.split("."):
+                current = self._dereference_field(current, name)
+        return docs
+
+    def dereference_records(
+        self,
+        model: Type[Document],
+        records: Iterable[Record],
+        *paths: str,
+        projections: Optional[dict[str, dict[str, Any]]] = None,
+    ) -> list[Record]:
+        """
+        Same as `dereference` for the raw documents of the read only queries (`to_records`):
+        references are replaced with the raw referenced documents.
+
+        :param model: model of the records
+        :param records: raw documents
+        :param paths: dotted paths of reference fields, e.g. "subject.lecturer"
+        :param projections: `$project` specification of the referenced documents by path, e.g.
+            {"subject": projection_of(SubjectInEvaluation)}, the whole documents otherwise
+        :return: records, with the references hydrated in place
+        """
+        records = [record for record in records if record is not None]
+        for path in paths:
+            current_model, current = model, records
+            names = path.split(".")
+            for depth, name in enumerate(names):
+                if not current:
+                    break
+                ref_model = self._field_reference_model(current_model, name)
+                projection = (projections or {}).get(".".join(names[: depth + 1]))
+                # documents loaded with another projection are loaded again
+                source = (ref_model, tuple(projection.items()) if projection else None)
+                ids = {
+                    id
+                    for record in current
+                    for id in self._ref_ids(record.get(name))
+                    if (source, id) not in self._records
+                }
+                if ids:
+                    self._load_records(source, ids, projection)
+                current = self._hydrate_records(current, name, source)
+                current_model = ref_model
+        return records
+
+    def get(self, model: Type[Document], id: ObjectId | str) -> Document | None:
+        """Referenced document already loaded by this dereferencer"""
+        return self._identity_map.get((model, self._to_id(id)))
+
+    def _dereference_field(self, docs: list[Document], name: str) -> list[Document]:
+        if not docs:
+            return []
+
+        for model, ids in self._pending(docs, name).items():
+            self._load(model, ids)
+        return self._hydrate(docs, name)
+
+    def _pending(self, docs: list[Document], name: str) -> dict[Type[Document], set]:
+        """Every id not yet in the identity map, grouped by referenced model"""
+        pending: dict[Type[Document], set] = defaultdict(set)
+        for doc in docs:
+            model = self._reference_model(doc, name)
+            for ref in self._as_list(doc._data.get(name)):
+                if isinstance(ref, (DBRef, ObjectId)):
+                    id = self._to_id(ref)
+                    if (model, id) not in self._identity_map:
+                        pending[model].add(id)
+        return pending
+
+    def _hydrate(self, docs: list[Document], name: str) -> list[Document]:
+        """Hydrate the field and return the referenced documents for the next path segment"""
+        children: list[Document] = []
+        for doc in docs:
+            model = self._reference_model(doc, name)
+            value = doc._data.get(name)
+            if isinstance(value, list):
+                # like mongoengine, a dangling reference is left as is in a list
+                hydrated = [self._resolve(model, ref) or ref for ref in value]
+                children.extend(ref for ref in hydrated if isinstance(ref, Document))
+            else:
+                hydrated = self._resolve(model, value)
+                if hydrated is not None:
+                    children.append(hydrated)
+            doc._data[name] = hydrated
+        return children
+
+    def _hydrate_records(self, records: list[Record], name: str, source: Any) -> list[Record]:
+        children: list[Record] = []
+        for record in records:
+            value = record.get(name)
+            if isinstance(value, list):
+                hydrated = [self._resolve_record(source, ref) or ref for ref in value]
+                children.extend(ref for ref in hydrated if isinstance(ref, dict))
+            else:
+                hydrated = self._resolve_record(source, value)
+                if hydrated is not None:
+                    children.append(hydrated)
+            record[name] = hydrated
+        return children
+
+    def _load_records(
+        self, source: Any, ids: set, projection: Optional[dict[str, Any]] = None
+    ) -> None:
+        model: Type[Document] = source[0]
+        sons = model._get_collection().find({"_id": {"$in": list(ids)}}, projection)
+        for record in to_records(model, sons):
+            self._records[(source, record["_id"])] = record
+        for id in ids:
+            self._records.setdefault((source, id), None)
+
+    def _resolve_record(self, source: Any, ref: Any) -> Record | None:
+        if isinstance(ref, (DBRef, ObjectId)):
+            return self._records.get((source, self._to_id(ref)))
+        return ref
+
+    def _ref_ids(self, value: Any) -> list[ObjectId]:
+        return [
+            self._to_id(ref) for ref in self._as_list(value) if isinstance(ref, (DBRef, ObjectId))
+        ]
+
+    def _load(self, model: Type[Document], ids: set) -> None:
+        generation = 0
+        if model in self.cached_models:
+            cached, generation = entity_cache.get_many(model, ids)
+            ids = self._remember_cached(model, ids, cached)
+        if not ids:
+            return
+        sons = list(model._get_collection().find({"_id": {"$in": list(ids)}}))
+        self._cache(model, sons, generation)
+        self._remember(model, ids, sons)
+
+    def _remember_cached(self, model: Type[Document], ids: set, cached: dict) -> set:
+        """
+        Remember the cached documents of `ids`
+        :return: ids left to load
+        """
+        self._remember(model, set(), cached.values())
+        return ids - cached.keys()
+
+    def _cache(self, model: Type[Document], sons: list[dict], generation: int) -> None:
+        if model in self.cached_models:
+            entity_cache.set_many(model, sons, generation)
+
+    def _remember(self, model: Type[Document], ids: set, sons: Iterable[dict]) -> None:
+        for son in sons:
+            self._identity_map[(model, son["_id"])] = model._from_son(son)
+        # remember missing documents too, so they're not fetched again
+        for id in ids:
+            self._identity_map.setdefault((model, id), None)
+
+    def _resolve(self, model: Type[Document], ref: Any) -> Document | None:
+        if isinstance(ref, (DBRef, ObjectId)):
+            return self._identity_map.get((model, self._to_id(ref)))
+        return ref
+
+    def _reference_model(self, doc: Document, name: str) -> Type[Document]:
+        return self._field_reference_model(type(doc), name)
+
+    def _field_reference_model(self, model: Type[Document], name: str) -> Type[Document]:
+        field = model._fields.get(name)
+        if isinstance(field, ListField):
+            field = field.field
+        if not isinstance(field, ReferenceField):
+            raise ValueError(f"{model.__name__}.{name} is not a reference field")
+        return field.document_type
+
+    def _as_list(self, value: Any) -> list:
+        if value is None:
+            return []
+        return value if isinstance(value, list) else [value]
+
+    def _to_id(self, ref: DBRef | ObjectId | str) -> ObjectId:
+        if isinstance(ref, DBRef):
+            return ref.id
+        return ref if isinstance(ref, ObjectId) else ObjectId(ref)
+
+
+class CachedBulkDereferencer(BulkDereferencer):
+    """
+    `BulkDereferencer` of the student endpoints, lecturers and subjects are first looked up in
+    the `entity_cache`: a lecturer or subject saved by another process (another api worker, a
+    Celery task) may be served until the next version check, ENTITY_CACHE_POLL_INTERVAL seconds.
+    """
+
+    cached_models = (LecturerModel, SubjectModel)
+
+
+class AsyncBulkDereferencer(CachedBulkDereferencer):
+    """
+    `CachedBulkDereferencer` of the async (student) endpoints: referenced collections are read
+    with `get_async_collection`, so the event loop is never blocked by a lazy dereference.
+    """
+
+    async def dereference(self, docs: Iterable[Document], *paths: str) -> list[Document]:
+        docs = [doc for doc in docs if doc is not None]
+        for path in paths:
+            current = docs
+            for name in path.split("."):
+                if not current:
+                    break
+                for model, ids in self._pending(current, name).items():
+                    generation = 0
+                    if model in self.cached_models:
+                        cached, generation = await entity_cache.get_many_async(model, ids)
+                        ids = self._remember_cached(model, ids, cached)
+                    if not ids:
+                        continue
+                    sons = (
+                        await get_async_collection(model)
+                        .find({"_id": {"$in": list(ids)}})
+                        .to_list(length=None)
+                    )
+                    self._cache(model, sons, generation)
+                    self._remember(model, ids, sons)
+                current = self._hydrate(current, name)
+        return docs
@@ -0,0 +1,176 @@
+"""Read-through cache of the entities read on every student submission"""
+
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple, Type
+
+from cachetools import TTLCache
+from mongoengine import Document
+
+from app.config import settings
+from app.infra.metrics import ENTITY_CACHE_REQUESTS
+from app.infra.shared.versioned_cache import VersionedCache
+
+Son = Dict[str, Any]
+
+
+class _ModelCache(VersionedCache):
+    """Raw documents of one model, keyed by str(_id), under their own version document"""
+
+    def __init__(self, model: Type[Document], ttl: int, poll_interval: float, maxsize: int):
+        super().__init__(poll_interval)
+        self.name = f"entity:{model.__name__}"
+        self._values = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get_many(self, keys: Iterable[str]) -> Tuple[Dict[str, Son], int]:
+        """:return: cached documents of `keys` and the generation they were read at"""
+        with self._lock:
+            if self._must_check():
+                self._sync(self._read_version())
+            return self._found(keys), self._generation
+
+    async def get_many_async(self, keys: Iterable[str]) -> Tuple[Dict[str, Son], int]:
+        with self._lock:
+            must_check = self._must_check()
+        if must_check:
+            version = await self._read_version_async()
+            with self._lock:
+                self._sync(version)
+        with self._lock:
+            return self._found(keys), self._generation
+
+    def set_many(self, sons: Dict[str, Son], generation: int) -> None:
+        with self._lock:
+            # dropped meanwhile, the documents may already be stale
+            if generation == self._generation:
+                self._values.update(sons)
+
+    def _found(self, keys: Iterable[str]) -> Dict[str, Son]:
+        found: Dict[str, Son] = {}
+        for key in keys:
+            # read once, a document may expire between two reads
+            son = self._values.get(key)
+            if son is not None:
+                found[key] = son
+        return found
+
+
+class EntityCache:
+    """
+    Keep the raw mongo documents of subjects, lecturers and evaluation questions, least recently
+    used ones are evicted beyond `maxsize` and every document expires after `ttl` seconds.
+
+    Every model has its own version document, see `VersionedCache`: a write through the
+    repositories drops the cached documents of that model in every process (api and celery)
+    within `poll_interval` seconds, the ttl only bounds how long a write made outside of the
+    repositories is missed. Missing documents are not cached. Every hit builds a fresh model
+    instance, requests never share a mutable document. A ttl of 0 disables the cache.
+    """
+
+    def __init__(self, ttl: int, poll_interval: float, maxsize: int = 2048):
+        self.ttl = ttl
+        self.poll_interval = poll_interval
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._models: Dict[str, _ModelCache] = {}
+
+    def get(
+        self, model: Type[Document], key: Any, loader: Callable[[], Optional[Son]]
+    ) -> Optional[Document]:
+        """:param loader: raw document of `key`, called on a miss"""
+        if self.ttl <= 0:
+            son = loader()
+            return model._from_son(son) if son else None
+        found, generation = self.get_many(model, [key])
+        if key in found:
+            return model._from_son(found[key])
+        son = loader()
+        self.set_many(model, [son] if son else [], generation)
+        return model._from_son(son) if son else None
+
+    async def get_async(
+        self, model: Type[Document], key: Any, loader: Callable[[], Awaitable[Optional[Son]]]
+    ) -> Optional[Document]:
+        """`get` of the async endpoints, the version is read through motor"""
+        if self.ttl <= 0:
+            son = await loader()
+            return model._from_son(son) if son else None
+        found, generation = await self.get_many_async(model, [key])
+        if key in found:
+            return model._from_son(found[key])
+        son = await loader()
+        self.set_many(model, [son] if son else [], generation)
+        return model._from_son(son) if son else None
+
+    def get_many(self, model: Type[Document], keys: Iterable[Any]) -> Tuple[Dict[Any, Son], int]:
+        """
+        Raw documents of the cached keys, for the dereferencers
+        :return: the documents and the generation to pass to `set_many`
+        """
+        if self.ttl <= 0:
+            return {}, 0
+        keys = list(keys)
+        cached, generation = self._cache(model).get_many(str(key) for key in keys)
+        return self._hits(model, keys, cached), generation
+
+    async def get_many_async(
+        self, model: Type[Document], keys: Iterable[Any]
+    ) -> Tuple[Dict[Any, Son], int]:
+        if self.ttl <= 0:
+            return {}, 0
+        keys = list(keys)
+        cached, generation = await self._cache(model).get_many_async(str(key) for key in keys)
+        return self._hits(model, keys, cached), generation
+
+    def set_many(self, model: Type[Document], sons: Iterable[Son], generation: int) -> None:
+        """
+        Cache `sons` unless `model` was invalidated since `get_many` returned `generation`
+        """
+        if self.ttl <= 0:
+            return
+        # deep copied, the caller builds models from `sons`
+        sons = {str(son["_id"]): copy.deepcopy(son) for son in sons if son}
+        if sons:
+            self._cache(model).set_many(sons, generation)
+
+    def invalidate(self, model: Type[Document], *keys: Any) -> None:
+        """
+        Drop the cached documents of `model` in every process once `keys` are saved, not only
+        theirs
+        """
+        if self.ttl <= 0:
+            return
+        self._cache(model).invalidate()
+
+    def clear(self) -> None:
+        """
+        Drop the documents of this process only
+        """
+        with self._lock:
+            caches = list(self._models.values())
+        for cache in caches:
+            cache.clear()
+
+    def _cache(self, model: Type[Document]) -> _ModelCache:
+        with self._lock:
+            cache = self._models.get(model.__name__)
+            if cache is None:
+                cache = _ModelCache(model, self.ttl, self.poll_interval, self.maxsize)
+                self._models[model.__name__] = cache
+            return cache
+
+    def _hits(self, model: Type[Document], keys: list, cached: Dict[str, Son]) -> Dict[Any, Son]:
+        found: Dict[Any, Son] = {}
+        for key in keys:
+            son = cached.get(str(key))
+            ENTITY_CACHE_REQUESTS.labels(model.__name__, "hit" if son is not None else "miss").inc()
+            if son is not None:
+                found[key] = copy.deepcopy(son)
+        return found
+
+
+entity_cache = EntityCache(
+    ttl=settings.ENTITY_CACHE_TTL if settings.ENVIRONMENT != "testing" else 0,
+    poll_interval=settings.ENTITY_CACHE_POLL_INTERVAL,
+    maxsize=settings.ENTITY_CACHE_MAXSIZE,
+)
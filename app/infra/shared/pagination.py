@@ -0,0 +1,238 @@
+"""Single round trip page + total queries and keyset (cursor) pagination"""
+
+import base64
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import json_util
+from pymongo.collection import Collection
+
+
+class CountMode(str, Enum):
+    # count matched documents in the same aggregation as the page
+    EXACT = "exact"
+    # collection metadata count when nothing is filtered, exact count otherwise
+    ESTIMATED = "estimated"
+    # don't count, total is None
+    NONE = "none"
+
+
+def paginate(
+    collection: Collection,
+    match_pipeline: Optional[Dict[str, Any]] = None,
+    sort: Optional[Dict[str, int]] = None,
+    page_index: int = 1,
+    page_size: int | None = None,
+    count_mode: CountMode = CountMode.EXACT,
+    page_stages: Optional[List[Dict[str, Any]]] = None,
+    projection: Optional[Dict[str, Any]] = None,
+    skip: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], int | None]:
+    """
+    Return the raw documents of a page and the total of matched documents with one `$facet`
+    aggregation instead of running the same `$match` twice.
+
+    :param collection: pymongo collection, e.g. StudentModel._get_collection()
+    :param match_pipeline: `$match` filter
+    :param sort: `$sort` specification, applied before paging so it can use an index
+    :param page_index: 1-based page index
+    :param page_size: None returns every matched document
+    :param count_mode: how the total is computed
+    :param page_stages: stages only run on the documents of the page, e.g. a `$lookup`
+    :param projection: `$project` specification of the returned documents
+    :param skip: documents before the page, `page_size * (page_index - 1)` by default
+    :return: (documents, total)
+    """
+    pipeline: List[Dict[str, Any]] = []
+    if match_pipeline:
+        pipeline.append({"$match": match_pipeline})
+    if sort:
+        pipeline.append({"$sort": sort})
+
+    data_stages: List[Dict[str, Any]] = []
+    if isinstance(page_size, int):
+        if skip is None:
+            skip = page_size * (page_index - 1)
+        data_stages.extend([{"$skip": skip}, {"$limit": page_size}])
+    if page_stages:
+        data_stages.extend(page_stages)
+    if projection:
+        data_stages.append({"$project": projection})
+
+    use_estimated = count_mode is CountMode.ESTIMATED and not match_pipeline
+    if count_mode is CountMode.NONE or use_estimated:
+        docs = list(collection.aggregate([*pipeline, *data_stages]))
+        total = collection.estimated_document_count() if use_estimated else None
+        return docs, total
+
+    facet = {
+        # $facet requires a non-empty sub-pipeline
+        "data": data_stages if data_stages else [{"$match": {}}],
+        "total": [{"$count": "count"}],
+    }
+    result = list(collection.aggregate([*pipeline, {"$facet": facet}]))
+    if not result:
+        return [], 0
+
+    total = result[0]["total"][0]["count"] if result[0]["total"] else 0
+    return result[0]["data"], total
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(doc: Dict[str, Any], sort: Dict[str, int]) -> str:
+    """Opaque cursor holding the sort key values and `_id` of the last document of a page"""
+    payload = {"s": list(sort.keys()), "v": [_get_value(doc, key) for key in sort]}
+    raw = json_util.dumps(payload, json_options=json_util.CANONICAL_JSON_OPTIONS)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: Dict[str, int]) -> List[Any]:
+    """Sort key values of a cursor built by `encode_cursor` with the same sort"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        payload = json_util.loads(raw)
+        keys, values = payload["s"], payload["v"]
+    except Exception as e:
+        raise InvalidCursorError("malformed cursor") from e
+    if keys != list(sort.keys()) or len(values) != len(keys):
+        raise InvalidCursorError("cursor doesn't match the sort of the request")
+    return values
+
+
+def keyset_sort(sort: Optional[Dict[str, int]]) -> Dict[str, int]:
+    """Sort with `_id` as the last key, so that every document has a unique position"""
+    keyset: Dict[str, int] = {}
+    for key, direction in (sort or {}).items():
+        keyset["_id" if key == "id" else key] = direction
+    if "_id" not in keyset:
+        keyset["_id"] = list(keyset.values())[-1] if keyset else 1
+    return keyset
+
+
+def keyset_match(sort: Dict[str, int], values: List[Any]) -> Dict[str, Any]:
+    """
+    Filter of the documents placed after `values` in `sort` order:
+    (k1 > v1) or (k1 == v1 and k2 > v2) or ...
+    """
+    branches: List[Dict[str, Any]] = []
+    for i, (key, direction) in enumerate(sort.items()):
+        branch = {prev_key: values[j] for j, prev_key in enumerate(list(sort)[:i])}
+        value = values[i]
+        if value is None:
+            # null sorts first, so only non null values come after it in ascending order
+            if direction < 0:
+                continue
+            branch[key] = {"$ne": None}
+        elif direction > 0:
+            branch[key] = {"$gt": value}
+        else:
+            # and last in descending order, `$lt` never matches null or missing values
+            branch["$or"] = [{key: {"$lt": value}}, {key: None}]
+        branches.append(branch)
+    if len(branches) == 1:
+        return branches[0]
+    return {"$or": branches}
+
+
+def paginate_by_cursor(
+    collection: Collection,
+    match_pipeline: Optional[Dict[str, Any]] = None,
+    sort: Optional[Dict[str, int]] = None,
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    count_mode: CountMode = CountMode.NONE,
+    projection: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Dict[str, Any]], int | None, str | None]:
+    """
+    Keyset pagination: instead of skipping the previous pages, seek to the position of the
+    cursor with a range filter on the sort keys, so that deep pages cost the same as the first
+    one when an index matches `sort`.
+
+    :param collection: pymongo collection
+    :param match_pipeline: `$match` filter
+    :param sort: `$sort` specification, `_id` is appended as tie breaker
+    :param page_size: documents per page
+    :param cursor: `next_cursor` of the previous page, None or empty for the first page
+    :param count_mode: how the total of matched documents is computed
+    :param projection: `$project` specification of the returned documents, the sort keys are
+        kept until the next cursor is built
+    :return: (documents, total, next_cursor), next_cursor is None on the last page
+    """
+    sort = keyset_sort(sort)
+
+    seek: Optional[Dict[str, Any]] = None
+    if cursor:
+        seek = keyset_match(sort, decode_cursor(cursor, sort))
+
+    pipeline: List[Dict[str, Any]] = []
+    conditions = [cond for cond in (match_pipeline, seek) if cond]
+    if len(conditions) == 1:
+        pipeline.append({"$match": conditions[0]})
+    elif conditions:
+        pipeline.append({"$match": {"$and": conditions}})
+    # fetch one more document to know whether there is a next page
+    pipeline.extend([{"$sort": sort}, {"$limit": page_size + 1}])
+    hidden: List[str] = []
+    if projection:
+        projection, hidden = _keep_sort_keys(projection, sort)
+        if projection:
+            pipeline.append({"$project": projection})
+
+    docs = list(collection.aggregate(pipeline))
+    next_cursor = None
+    if len(docs) > page_size:
+        docs = docs[:page_size]
+        next_cursor = encode_cursor(docs[-1], sort)
+    for doc in docs:
+        for key in hidden:
+            _pop_value(doc, key)
+
+    total: int | None = None
+    if count_mode is CountMode.ESTIMATED and not match_pipeline:
+        total = collection.estimated_document_count()
+    elif count_mode is not CountMode.NONE:
+        total = collection.count_documents(match_pipeline or {})
+    return docs, total, next_cursor
+
+
+def _keep_sort_keys(
+    projection: Dict[str, Any], sort: Dict[str, int]
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Projection that keeps the sort keys the cursor is built from
+    :return: (projection, fields to remove from the documents once the cursor is built)
+    """
+    kept = dict(projection)
+    hidden: List[str] = []
+    exclusion = any(value == 0 for key, value in projection.items() if key != "_id")
+    for key in sort:
+        covering = [field for field in kept if key == field or key.startswith(field + ".")]
+        if exclusion or key == "_id":
+            # drop the exclusions hiding the key
+            for field in covering:
+                if kept[field] == 0:
+                    del kept[field]
+                    hidden.append(field)
+        elif not covering:
+            kept[key] = 1
+            hidden.append(key)
+    return kept, hidden
+
+
+def _pop_value(doc: Dict[str, Any], key: str) -> None:
+    *parents, name = key.split(".")
+    for parent in parents:
+        doc = doc.get(parent)
+        if not isinstance(doc, dict):
+            return
+    doc.pop(name, None)
+
+
+def _get_value(doc: Dict[str, Any], key: str) -> Any:
+    value: Any = doc
+    for name in key.split("."):
+        value = value.get(name) if isinstance(value, dict) else None
+    return value
@@ -0,0 +1,37 @@
+"""Raw documents of the read only queries"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+from mongoengine import Document
+
+# raw mongo document, `_id` is kept and references are ids until dereferenced
+Record = Dict[str, Any]
+
+
+@lru_cache(maxsize=None)
+def _defaults(model: Type[Document]) -> Tuple[Tuple[str, Any], ...]:
+    return tuple(
+        (name, field.default)
+        for name, field in model._fields.items()
+        if name != "id" and field.default is not None
+    )
+
+
+def to_records(model: Type[Document], sons: Iterable[Record]) -> List[Record]:
+    """
+    Raw documents of `model` as returned by pymongo, without building mongoengine documents
+    (no field conversion, change tracking or lazy references). Only missing fields with a
+    default (list fields are `[]`) are filled in, like `Document._from_son` would.
+
+    Build the response entities from them with `assemble`, and hydrate their references with
+    `BulkDereferencer.dereference_records`.
+    """
+    defaults = _defaults(model)
+    records = []
+    for son in sons:
+        for name, default in defaults:
+            if name not in son:
+                son[name] = default() if callable(default) else default
+        records.append(son)
+    return records
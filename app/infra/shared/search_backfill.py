@@ -0,0 +1,82 @@
+"""
+Fill `search_key` / `search_tokens` of the documents written before they existed, or after a
+change of `search_fields`.
+
+Run from the project root (settings are read from .env):
+    python -m app.infra.shared.search_backfill [--batch-size 500] [students lecturers admins]
+"""
+
+import argparse
+import logging
+from typing import Dict, List, Type
+
+from pymongo import UpdateOne
+
+from app.config import database
+from app.models.admin import AdminModel
+from app.models.lecturer import LecturerModel
+from app.models.searchable import SearchableMixin
+from app.models.student import StudentModel
+from app.shared.search import search_keys
+
+logger = logging.getLogger(__name__)
+
+SEARCHABLE_MODELS: Dict[str, Type[SearchableMixin]] = {
+    "students": StudentModel,
+    "lecturers": LecturerModel,
+    "admins": AdminModel,
+}
+
+
+def backfill(model: Type[SearchableMixin], batch_size: int = 500) -> int:
+    """
+    Update the documents whose search keys are missing or stale
+    :return: number of updated documents
+    """
+    collection = model._get_collection()
+    projection = {field: 1 for field in (*model.search_fields, "search_key", "search_tokens")}
+    operations: List[UpdateOne] = []
+    updated = 0
+    for doc in collection.find({}, projection, batch_size=batch_size):
+        search_key, search_tokens = search_keys(doc.get(field) for field in model.search_fields)
+        if doc.get("search_key") == search_key and doc.get("search_tokens") == search_tokens:
+            continue
+        operations.append(
+            UpdateOne(
+                {"_id": doc["_id"]},
+                {"$set": {"search_key": search_key, "search_tokens": search_tokens}},
+            )
+        )
+        if len(operations) >= batch_size:
+            updated += collection.bulk_write(operations, ordered=False).modified_count
+            operations = []
+    if operations:
+        updated += collection.bulk_write(operations, ordered=False).modified_count
+    # the index of the search tokens, when the collection predates it
+    model.ensure_indexes()
+    return updated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "collections",
+        nargs="*",
+        choices=sorted(SEARCHABLE_MODELS),
+        default=sorted(SEARCHABLE_MODELS),
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    database.connect()
+    try:
+        for name in args.collections:
+            updated = backfill(SEARCHABLE_MODELS[name], batch_size=args.batch_size)
+            logger.info(f"{name}: {updated} documents updated")
+    finally:
+        database.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""In-memory caches shared by the api and celery processes through a version document"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, MutableMapping, Optional
+
+from pymongo import ReturnDocument
+
+from app.infra.shared.async_collection import get_async_collection
+from app.models.cache_version import CacheVersionModel
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class VersionedCache:
+    """
+    Keep values in memory and drop them as soon as any process changes the cached data.
+
+    Every process remembers the version of the `name` document in `CacheVersions` its values
+    were loaded with. At most once every `poll_interval` seconds a read of that document (by _id)
+    tells whether another process bumped the version, in which case the local values are dropped
+    and loaded again on next use. Requests in between are served from memory.
+    """
+
+    name: str
+
+    def __init__(self, poll_interval: float):
+        self.poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._values: MutableMapping[Any, Any] = {}
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        # bumped every time the values are dropped
+        self._generation = 0
+
+    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            if self._must_check():
+                self._sync(self._read_version())
+            # read once, the values of a subclass may expire between two reads
+            value = self._values.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            generation = self._generation
+
+        # loaded outside of the lock, a slow query must not block the other threads
+        value = loader()
+        self._set(key, value, generation)
+        return value
+
+    async def get_async(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """`get` of the async endpoints, the version is read through motor"""
+        with self._lock:
+            must_check = self._must_check()
+        if must_check:
+            version = await self._read_version_async()
+            with self._lock:
+                self._sync(version)
+        with self._lock:
+            value = self._values.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            generation = self._generation
+
+        value = await loader()
+        self._set(key, value, generation)
+        return value
+
+    def invalidate(self) -> None:
+        """
+        Drop the values of every process, call it once the change is saved
+        """
+        try:
+            doc = CacheVersionModel._get_collection().find_one_and_update(
+                {"_id": self.name},
+                {"$inc": {"version": 1}, "$set": {"updated_at": datetime.now(timezone.utc)}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+            version = doc["version"]
+        except Exception as e:
+            logger.error(f"Failed to bump the {self.name} cache version: {e}")
+            version = None
+
+        with self._lock:
+            self._drop()
+            self._version = version
+            self._checked_at = time.monotonic()
+
+    def clear(self) -> None:
+        """
+        Drop the values of this process only
+        """
+        with self._lock:
+            self._drop()
+            self._version = None
+            self._checked_at = 0.0
+
+    def _set(self, key: str, value: Any, generation: int) -> None:
+        with self._lock:
+            # dropped meanwhile, the value may already be stale
+            if generation == self._generation:
+                self._values[key] = value
+
+    def _drop(self) -> None:
+        self._values.clear()
+        self._generation += 1
+
+    def _must_check(self) -> bool:
+        return not self._values or time.monotonic() - self._checked_at >= self.poll_interval
+
+    def _read_version(self) -> Optional[int]:
+        try:
+            doc = CacheVersionModel._get_collection().find_one(
+                {"_id": self.name}, {"version": True}
+            )
+        except Exception as e:
+            # keep serving what we have, mongo is checked again on next poll
+            logger.error(f"Failed to read the {self.name} cache version: {e}")
+            return self._version
+        return doc["version"] if doc else 0
+
+    async def _read_version_async(self) -> Optional[int]:
+        try:
+            doc = await get_async_collection(CacheVersionModel).find_one(
+                {"_id": self.name}, {"version": True}
+            )
+        except Exception as e:
+            logger.error(f"Failed to read the {self.name} cache version: {e}")
+            return self._version
+        return doc["version"] if doc else 0
+
+    def _sync(self, version: Optional[int]) -> None:
+        if version != self._version:
+            self._drop()
+            self._version = version
+        self._checked_at = time.monotonic()
@@ -0,0 +1,40 @@
+"""Async student repository module"""
+
+from typing import Optional, Union
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.infra.shared.async_collection import get_async_collection
+from app.models.student import StudentModel
+from app.infra.metrics import instrument_repository
+
+
+@instrument_repository
+class AsyncStudentRepository:
+    """
+    `StudentRepository` of the async endpoints, reads go through motor
+    """
+
+    def __init__(self):
+        pass
+
+    async def get_by_id(self, student_id: Union[str, ObjectId]) -> Optional[StudentModel]:
+        """
+        Get student in db from id
+        :param student_id:
+        :return:
+        """
+        try:
+            doc = await get_async_collection(StudentModel).find_one({"_id": ObjectId(student_id)})
+        except (InvalidId, TypeError):
+            return None
+        return StudentModel._from_son(doc) if doc else None
+
+    async def get_by_email(self, email: str) -> Optional[StudentModel]:
+        """
+        Get student in db from email
+        :param student_email:
+        :return:
+        """
+        doc = await get_async_collection(StudentModel).find_one({"email": email})
+        return StudentModel._from_son(doc) if doc else None
@@ -0,0 +1,44 @@
+"""Import job repository module"""
+
+from typing import Any, Dict, Optional, Union
+from bson import ObjectId
+from datetime import datetime, timezone
+from mongoengine import DoesNotExist, ValidationError
+
+from app.models.import_job import ImportJobModel
+from app.domain.student.entity import ImportJobInDB
+from app.infra.metrics import instrument_repository
+
+
+@instrument_repository
+class ImportJobRepository:
+    def __init__(self):
+        pass
+
+    def create(self, job: ImportJobInDB) -> ImportJobModel:
+        """
+        Create new import job in db
+        :param job:
+        :return:
+        """
+        new_job = ImportJobModel(**job.model_dump(exclude_none=True))
+        new_job.save()
+        return new_job
+
+    def get_by_id(self, job_id: Union[str, ObjectId]) -> Optional[ImportJobModel]:
+        try:
+            return ImportJobModel.objects(id=job_id).get()
+        except (DoesNotExist, ValidationError):
+            return None
+
+    def update(self, id: ObjectId, data: Dict[str, Any]) -> bool:
+        """
+        Cheap partial update, used to report the progress of a running job
+        """
+        try:
+            ImportJobModel.objects(id=id).update_one(
+                **data, updated_at=datetime.now(timezone.utc), upsert=False
+            )
+            return True
+        except Exception:
+            return False
@@ -1,9 +1,17 @@
 """Student repository module"""
 
-from typing import Optional, Dict, Union, List, Any
+from typing import Optional, Dict, Union, List, Any, Tuple
 from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
+from pymongo.errors import BulkWriteError
 
+from app.infra.shared.records import Record, to_records
+from app.infra.shared.pagination import (
+    CountMode,
+    InvalidCursorError,
+    paginate,
+    paginate_by_cursor,
+)
 from app.models.student import StudentModel
 from app.domain.student.entity import StudentInDB, StudentInUpdate
 from app.domain.subject.entity import (
@@ -12,8 +20,11 @@ from app.domain.subject.entity import (
     StudentInSubject,
 )
 from app.domain.shared.entity import Pagination
+from app.shared.assembler import assemble, projection_of
+from app.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class StudentRepository:
     def __init__(self):
         pass
@@ -64,7 +75,9 @@ class StudentRepository:
     def update(self, id: ObjectId, data: Union[StudentInUpdate, Dict[str, Any]]) -> bool:
         try:
             data = data.model_dump(exclude_none=True) if isinstance(data, StudentInUpdate) else data
-            StudentModel.objects(id=id).update_one(**data, upsert=False)
+            StudentModel.objects(id=id).update_one(
+                **data, **StudentModel.search_update(id, data), upsert=False
+            )
             return True
         except Exception:
             return False
@@ -81,6 +94,7 @@ class StudentRepository:
         page_size: int | None = None,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[StudentModel]:
         pipeline = []
         if match_pipeline is not None:
@@ -96,6 +110,8 @@ class StudentRepository:
                 ]
             )
 
+        if projection:
+            pipeline.append({"$project": projection})
         try:
             docs = StudentModel.objects().aggregate(pipeline)
             return [StudentModel.from_mongo(doc) for doc in docs] if docs else []
@@ -118,6 +134,103 @@ class StudentRepository:
         except Exception:
             return 0
 
+    def list_paginated(
+        self,
+        page_index: int = 1,
+        page_size: int | None = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None]:
+        """
+        Page of students and total of matched students in one round trip
+        :param projection: `$project` specification of the returned documents
+        :return: (raw students, total)
+        """
+        try:
+            docs, total = paginate(
+                StudentModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"created_at": -1},
+                page_index=page_index,
+                page_size=page_size,
+                count_mode=count_mode,
+                projection=projection,
+            )
+            return to_records(StudentModel, docs), total
+        except Exception:
+            return [], 0
+
+    def list_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None, str | None]:
+        """
+        Page of students after `cursor` (keyset pagination)
+        :param projection: `$project` specification of the returned documents
+        :return: (raw students, total, next_cursor)
+        :raises InvalidCursorError: cursor is malformed or was built for another sort
+        """
+        try:
+            docs, total, next_cursor = paginate_by_cursor(
+                StudentModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"created_at": -1},
+                page_size=page_size,
+                cursor=cursor,
+                count_mode=count_mode,
+                projection=projection,
+            )
+            return to_records(StudentModel, docs), total, next_cursor
+        except InvalidCursorError:
+            raise
+        except Exception:
+            return [], 0, None
+
+    def find_by_emails(self, emails: List[str]) -> Dict[str, StudentModel]:
+        """
+        Students of the given emails with one query
+        :return: student by email
+        """
+        if not emails:
+            return {}
+        cursor = StudentModel._get_collection().find({"email": {"$in": list(set(emails))}})
+        return {doc["email"]: StudentModel._from_son(doc) for doc in cursor}
+
+    def get_numerical_orders(self, season: int) -> Dict[int, ObjectId]:
+        """
+        :return: id of the student of every numerical order of the season
+        """
+        cursor = StudentModel._get_collection().find(
+            {"seasons_info.season": season}, {"seasons_info": 1}
+        )
+        numerical_orders: Dict[int, ObjectId] = {}
+        for doc in cursor:
+            for info in doc.get("seasons_info", []):
+                if info.get("season") == season:
+                    numerical_orders[info.get("numerical_order")] = doc["_id"]
+        return numerical_orders
+
+    def bulk_write(self, operations: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Unordered bulk write, a failed operation doesn't prevent the others
+        :param operations: pymongo InsertOne / ReplaceOne / UpdateOne
+        :return: write errors, `index` is the position of the failed operation
+        """
+        if not operations:
+            return []
+        try:
+            StudentModel._get_collection().bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            return e.details.get("writeErrors", [])
+        return []
+
     def delete(self, id: ObjectId) -> bool:
         try:
             StudentModel.objects(id=id).delete()
@@ -125,9 +238,13 @@ class StudentRepository:
         except Exception:
             return False
 
-    def find_one(self, conditions: Dict[str, Union[str, bool, ObjectId]]) -> Optional[StudentModel]:
+    def find_one(
+        self,
+        conditions: Dict[str, Union[str, bool, ObjectId]],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Optional[StudentModel]:
         try:
-            doc = StudentModel._get_collection().find_one(conditions)
+            doc = StudentModel._get_collection().find_one(conditions, projection)
             return StudentModel.from_mongo(doc) if doc else None
         except Exception:
             return None
@@ -139,36 +256,40 @@ class StudentRepository:
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
     ):
-        total = self.count_list(match_pipeline=match_pipeline)
         resp = ListSubjectRegistrationInResponse(
-            data=[], pagination=Pagination(total_pages=0, total=total)
+            data=[], pagination=Pagination(total_pages=0, total=0)
         )
         total_pages = 0
 
-        pipeline = []
-        if match_pipeline:
-            pipeline.append({"$match": match_pipeline})
-
-        pipeline.extend(
-            [
-                {
-                    "$lookup": {
-                        "from": "SubjectRegistration",
-                        "localField": "_id",
-                        "foreignField": "student",
-                        "as": "subject_registrations",
+        # the registrations are only looked up for the students of the page
+        try:
+            records, total = paginate(
+                StudentModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"seasons_info.numerical_order": 1},
+                page_index=page_index,
+                page_size=page_size,
+                page_stages=[
+                    {
+                        "$lookup": {
+                            "from": "SubjectRegistration",
+                            "localField": "_id",
+                            "foreignField": "student",
+                            "as": "subject_registrations",
+                        },
                     },
-                },
-                {"$sort": sort if sort else {"seasons_info.numerical_order": 1}},
-                {"$skip": page_size * (page_index - 1)},
-                {"$limit": page_size},
-            ]
-        )
-
-        cursor = StudentModel.objects().aggregate(pipeline)
-        if not cursor.alive:
+                    {
+                        "$project": {
+                            **projection_of(StudentInSubject),
+                            "subject_registrations.subject": 1,
+                        }
+                    },
+                ],
+            )
+        except Exception:
             return resp
-        for record in cursor:
+
+        for record in records:
             total_pages = total_pages + 1
             total_regis = len(record.get("subject_registrations"))
             subject_registrations = (
@@ -177,9 +298,7 @@ class StudentRepository:
                 else []
             )
             record.pop("subject_registrations")
-            student = StudentInSubject(
-                **StudentInDB.model_validate(StudentModel.from_mongo(record)).model_dump()
-            )
+            student = assemble(StudentInSubject, record)
             resp.data.append(
                 _SubjectRegistrationInResponse(
                     student=student, subject_registrations=subject_registrations, total=total_regis
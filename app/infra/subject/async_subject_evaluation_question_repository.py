@@ -0,0 +1,40 @@
+"""Async subject evaluation question repository module"""
+
+from typing import Optional, Union
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.infra.shared.async_collection import get_async_collection
+from app.infra.shared.entity_cache import entity_cache
+from app.models.subject_evaluation import SubjectEvaluationQuestionModel
+from app.infra.metrics import instrument_repository
+
+
+@instrument_repository
+class AsyncSubjectEvaluationQuestionRepository:
+    """
+    `SubjectEvaluationQuestionRepository` of the async endpoints, reads go through motor and
+    the questions of a subject are read through the entity cache
+    """
+
+    def __init__(self):
+        pass
+
+    async def get_by_subject_id(
+        self, subject_id: Union[str, ObjectId]
+    ) -> Optional[SubjectEvaluationQuestionModel]:
+        """
+        Get doc in db from subject_id
+        :param subject_id:
+        :return:
+        """
+        try:
+            id = ObjectId(subject_id)
+        except (InvalidId, TypeError):
+            return None
+        # keyed by subject, the writes drop every cached question
+        return await entity_cache.get_async(
+            SubjectEvaluationQuestionModel,
+            id,
+            lambda: get_async_collection(SubjectEvaluationQuestionModel).find_one({"subject": id}),
+        )
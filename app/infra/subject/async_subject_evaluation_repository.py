@@ -0,0 +1,59 @@
+"""Async subject evaluation repository module"""
+
+from typing import Any, Dict, Union
+from bson import ObjectId
+
+from app.domain.subject.subject_evaluation.entity import (
+    SubjectEvaluationInDB,
+    SubjectEvaluationInUpdateTime,
+)
+from app.infra.shared.async_collection import get_async_collection, insert_document
+from app.models.subject_evaluation import SubjectEvaluationModel
+from app.infra.metrics import instrument_repository
+
+
+@instrument_repository
+class AsyncSubjectEvaluationRepository:
+    """
+    `SubjectEvaluationRepository` of the async endpoints, reads and writes go through motor
+    """
+
+    def __init__(self):
+        pass
+
+    async def create(self, doc: SubjectEvaluationInDB) -> SubjectEvaluationModel:
+        """
+        Create new doc in db
+        :param doc:
+        :return:
+        """
+        return await insert_document(SubjectEvaluationModel(**doc.model_dump()))
+
+    async def find_one(
+        self,
+        conditions: list[str, str | bool | ObjectId],
+        projection: Dict[str, Any] | None = None,
+    ) -> SubjectEvaluationModel | None:
+        try:
+            doc = await get_async_collection(SubjectEvaluationModel).find_one(
+                conditions, projection
+            )
+            return SubjectEvaluationModel.from_mongo(doc) if doc else None
+        except Exception:
+            return None
+
+    async def update(
+        self, id: ObjectId, data: Union[SubjectEvaluationInUpdateTime, Dict[str, Any]]
+    ) -> bool:
+        try:
+            data = (
+                data.model_dump(exclude_none=True)
+                if isinstance(data, SubjectEvaluationInUpdateTime)
+                else data
+            )
+            await get_async_collection(SubjectEvaluationModel).update_one(
+                {"_id": id}, {"$set": data}
+            )
+            return True
+        except Exception:
+            return False
@@ -0,0 +1,64 @@
+"""Async subject repository module"""
+
+from typing import Any, Dict, List, Optional, Union
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.infra.shared.async_collection import get_async_collection
+from app.infra.shared.entity_cache import entity_cache
+from app.models.subject import SubjectModel
+from app.infra.metrics import instrument_repository
+
+
+@instrument_repository
+class AsyncSubjectRepository:
+    """
+    `SubjectRepository` of the async endpoints, reads go through motor and subjects are read
+    through the entity cache
+    """
+
+    def __init__(self):
+        pass
+
+    async def get_by_id(self, subject_id: Union[str, ObjectId]) -> Optional[SubjectModel]:
+        """
+        Get subject in db from id
+        :param subject_id:
+        :return:
+        """
+        try:
+            id = ObjectId(subject_id)
+        except (InvalidId, TypeError):
+            return None
+        return await entity_cache.get_async(
+            SubjectModel, id, lambda: get_async_collection(SubjectModel).find_one({"_id": id})
+        )
+
+    async def list(
+        self,
+        page_index: int | None = 1,
+        page_size: int | None = None,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> List[SubjectModel]:
+        pipeline = []
+        if match_pipeline is not None:
+            pipeline.append({"$match": match_pipeline})
+        pipeline.append(
+            {"$sort": sort if sort else {"created_at": -1}},
+        )
+        if page_size:
+            pipeline.extend(
+                [
+                    {"$skip": page_size * (page_index - 1)},
+                    {"$limit": page_size},
+                ]
+            )
+        if projection:
+            pipeline.append({"$project": projection})
+        try:
+            docs = await get_async_collection(SubjectModel).aggregate(pipeline).to_list(length=None)
+            return [SubjectModel.from_mongo(doc) for doc in docs] if docs else []
+        except Exception:
+            return []
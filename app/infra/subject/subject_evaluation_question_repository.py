@@ -4,13 +4,16 @@ from typing import Optional, Dict, Union, List, Any
 from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
 
+from app.infra.shared.entity_cache import entity_cache
 from app.models.subject_evaluation import SubjectEvaluationQuestionModel
 from app.domain.subject.subject_evaluation.entity import (
     SubjectEvaluationQuestionInDB,
     SubjectEvaluationQuestionInUpdateTime,
 )
+from app.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class SubjectEvaluationQuestionRepository:
     def __init__(self):
         pass
@@ -25,6 +28,7 @@ class SubjectEvaluationQuestionRepository:
         new_doc = SubjectEvaluationQuestionModel(**doc.model_dump())
         # and save it to db
         new_doc.save()
+        entity_cache.invalidate(SubjectEvaluationQuestionModel)
 
         return new_doc
 
@@ -55,6 +59,7 @@ class SubjectEvaluationQuestionRepository:
                 else data
             )
             SubjectEvaluationQuestionModel.objects(id=id).update_one(**data, upsert=False)
+            entity_cache.invalidate(SubjectEvaluationQuestionModel)
             return True
         except Exception:
             return False
@@ -69,6 +74,7 @@ class SubjectEvaluationQuestionRepository:
         self,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[SubjectEvaluationQuestionModel]:
         pipeline = []
         if match_pipeline is not None:
@@ -78,6 +84,8 @@ class SubjectEvaluationQuestionRepository:
             {"$sort": sort if sort else {"created_at": -1}},
         )
 
+        if projection:
+            pipeline.append({"$project": projection})
         try:
             docs = SubjectEvaluationQuestionModel.objects().aggregate(pipeline)
             return [SubjectEvaluationQuestionModel.from_mongo(doc) for doc in docs] if docs else []
@@ -103,6 +111,7 @@ class SubjectEvaluationQuestionRepository:
     def delete(self, id: ObjectId) -> bool:
         try:
             SubjectEvaluationQuestionModel.objects(id=id).delete()
+            entity_cache.invalidate(SubjectEvaluationQuestionModel)
             return True
         except Exception:
             return False
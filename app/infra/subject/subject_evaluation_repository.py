@@ -1,15 +1,24 @@
 """SubjectEvaluation repository module"""
 
-from typing import Optional, Dict, Union, List, Any
+from typing import Optional, Dict, Union, List, Any, Tuple
 from bson import ObjectId
 
+from app.infra.shared.records import Record, to_records
+from app.infra.shared.pagination import (
+    CountMode,
+    InvalidCursorError,
+    paginate,
+    paginate_by_cursor,
+)
 from app.models.subject_evaluation import SubjectEvaluationModel
 from app.domain.subject.subject_evaluation.entity import (
     SubjectEvaluationInDB,
     SubjectEvaluationInUpdateTime,
 )
+from app.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class SubjectEvaluationRepository:
     def __init__(self):
         pass
@@ -28,10 +37,12 @@ class SubjectEvaluationRepository:
         return new_doc
 
     def find_one(
-        self, conditions: list[str, str | bool | ObjectId]
+        self,
+        conditions: list[str, str | bool | ObjectId],
+        projection: Optional[Dict[str, Any]] = None,
     ) -> SubjectEvaluationModel | None:
         try:
-            doc = SubjectEvaluationModel._get_collection().find_one(conditions)
+            doc = SubjectEvaluationModel._get_collection().find_one(conditions, projection)
             return SubjectEvaluationModel.from_mongo(doc) if doc else None
         except Exception:
             return None
@@ -62,6 +73,7 @@ class SubjectEvaluationRepository:
         page_size: int | None = None,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[SubjectEvaluationModel]:
 
         pipeline = []
@@ -78,6 +90,8 @@ class SubjectEvaluationRepository:
                 ]
             )
 
+        if projection:
+            pipeline.append({"$project": projection})
         try:
             docs = SubjectEvaluationModel.objects().aggregate(pipeline)
             return [SubjectEvaluationModel.from_mongo(doc) for doc in docs] if docs else []
@@ -100,6 +114,65 @@ class SubjectEvaluationRepository:
         except Exception:
             return 0
 
+    def list_paginated(
+        self,
+        page_index: int = 1,
+        page_size: int | None = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None]:
+        """
+        Page of subject evaluations and total of matched subject evaluations in one round trip
+        :param projection: `$project` specification of the returned documents
+        :return: (raw subject evaluations, total)
+        """
+        try:
+            docs, total = paginate(
+                SubjectEvaluationModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"subject": -1},
+                page_index=page_index,
+                page_size=page_size,
+                count_mode=count_mode,
+                projection=projection,
+            )
+            return to_records(SubjectEvaluationModel, docs), total
+        except Exception:
+            return [], 0
+
+    def list_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None, str | None]:
+        """
+        Page of subject evaluations after `cursor` (keyset pagination)
+        :param projection: `$project` specification of the returned documents
+        :return: (raw subject_evaluations, total, next_cursor)
+        :raises InvalidCursorError: cursor is malformed or was built for another sort
+        """
+        try:
+            docs, total, next_cursor = paginate_by_cursor(
+                SubjectEvaluationModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"subject": -1},
+                page_size=page_size,
+                cursor=cursor,
+                count_mode=count_mode,
+                projection=projection,
+            )
+            return to_records(SubjectEvaluationModel, docs), total, next_cursor
+        except InvalidCursorError:
+            raise
+        except Exception:
+            return [], 0, None
+
     def delete(self, id: ObjectId) -> bool:
         try:
             SubjectEvaluationModel.objects(id=id).delete()
@@ -1,10 +1,13 @@
 """Subject repository module"""
 
+from typing import Any
 from bson import ObjectId
 from app.models.subject_registration import SubjectRegistrationModel
 from app.domain.subject.entity import SubjectRegistrationInResponse
+from app.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class SubjectRegistrationRepository:
     def __init__(self):
         pass
@@ -57,10 +60,10 @@ class SubjectRegistrationRepository:
             return []
 
     def find_one(
-        self, conditions: list[str, str | bool | ObjectId]
+        self, conditions: list[str, str | bool | ObjectId], projection: dict[str, Any] | None = None
     ) -> SubjectRegistrationModel | None:
         try:
-            doc = SubjectRegistrationModel._get_collection().find_one(conditions)
+            doc = SubjectRegistrationModel._get_collection().find_one(conditions, projection)
             return SubjectRegistrationModel.from_mongo(doc) if doc else None
         except Exception:
             return None
@@ -1,14 +1,20 @@
 """Subject repository module"""
 
-from typing import Optional, Dict, Union, List, Any
+from typing import Optional, Dict, Union, List, Any, Tuple
 from mongoengine import QuerySet, DoesNotExist
 from bson import ObjectId
+from bson.errors import InvalidId
 import pymongo
 
+from app.infra.shared.entity_cache import entity_cache
+from app.infra.shared.records import Record, to_records
+from app.infra.shared.pagination import CountMode, paginate
 from app.models.subject import SubjectModel
 from app.domain.subject.entity import SubjectInDB, SubjectInUpdateTime
+from app.infra.metrics import instrument_repository
 
 
+@instrument_repository
 class SubjectRepository:
     def __init__(self):
         pass
@@ -41,6 +47,18 @@ class SubjectRepository:
         except DoesNotExist:
             return None
 
+    def get_by_id_cached(self, subject_id: Union[str, ObjectId]) -> Optional[SubjectModel]:
+        """
+        `get_by_id` read through the entity cache, for the student endpoints
+        """
+        try:
+            id = ObjectId(subject_id)
+        except (InvalidId, TypeError):
+            return None
+        return entity_cache.get(
+            SubjectModel, id, lambda: SubjectModel._get_collection().find_one({"_id": id})
+        )
+
     def update(self, id: ObjectId, data: Union[SubjectInUpdateTime, Dict[str, Any]]) -> bool:
         try:
             data = (
@@ -49,6 +67,7 @@ class SubjectRepository:
                 else data
             )
             SubjectModel.objects(id=id).update_one(**data, upsert=False)
+            entity_cache.invalidate(SubjectModel, id)
             return True
         except Exception:
             return False
@@ -65,6 +84,7 @@ class SubjectRepository:
         page_size: int | None = None,
         match_pipeline: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, int]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[SubjectModel]:
         pipeline = []
         if match_pipeline is not None:
@@ -79,6 +99,8 @@ class SubjectRepository:
                     {"$limit": page_size},
                 ]
             )
+        if projection:
+            pipeline.append({"$project": projection})
         try:
             docs = SubjectModel.objects().aggregate(pipeline)
             return [SubjectModel.from_mongo(doc) for doc in docs] if docs else []
@@ -101,25 +123,60 @@ class SubjectRepository:
         except Exception:
             return 0
 
+    def list_paginated(
+        self,
+        page_index: int = 1,
+        page_size: int | None = 20,
+        match_pipeline: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, int]] = None,
+        count_mode: CountMode = CountMode.EXACT,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Record], int | None]:
+        """
+        Page of subjects and total of matched subjects in one round trip
+        :param projection: `$project` specification of the returned documents
+        :return: (raw subjects, total)
+        """
+        try:
+            docs, total = paginate(
+                SubjectModel._get_collection(),
+                match_pipeline=match_pipeline,
+                sort=sort if sort else {"created_at": -1},
+                page_index=page_index,
+                page_size=page_size,
+                count_mode=count_mode,
+                projection=projection,
+            )
+            return to_records(SubjectModel, docs), total
+        except Exception:
+            return [], 0
+
     def delete(self, id: ObjectId) -> bool:
         try:
             SubjectModel.objects(id=id).delete()
+            entity_cache.invalidate(SubjectModel, id)
             return True
         except Exception:
             return False
 
-    def find_one(self, conditions: Dict[str, Union[str, bool, ObjectId]]) -> Optional[SubjectModel]:
+    def find_one(
+        self,
+        conditions: Dict[str, Union[str, bool, ObjectId]],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Optional[SubjectModel]:
         try:
-            doc = SubjectModel._get_collection().find_one(conditions)
+            doc = SubjectModel._get_collection().find_one(conditions, projection)
             return SubjectModel.from_mongo(doc) if doc else None
         except Exception:
             return None
 
     def find(
-        self, conditions: Dict[str, Union[str, bool, ObjectId]]
+        self,
+        conditions: Dict[str, Union[str, bool, ObjectId]],
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[Optional[SubjectModel]]:
         try:
-            docs = SubjectModel._get_collection().find(conditions)
+            docs = SubjectModel._get_collection().find(conditions, projection)
             return [SubjectModel.from_mongo(doc) for doc in docs] if docs else []
         except Exception:
             return []
@@ -145,6 +202,7 @@ class SubjectRepository:
                 for season in entities
             ]
             SubjectModel._get_collection().bulk_write(operations)
+            entity_cache.invalidate(SubjectModel, *[subject.id for subject in entities])
             return True
         except Exception:
             return False
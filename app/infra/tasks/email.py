@@ -10,7 +10,8 @@ from bson import ObjectId
 from app.infra.subject.subject_repository import SubjectRepository
 from app.infra.admin.admin_repository import AdminRepository
 from app.models.admin import AdminModel
-from app.infra.email.brevo_service import BrevoService
+from app.infra.email.brevo_service import BrevoService, is_retryable_error
+from app.infra.email.email_delivery_repository import EmailDeliveryRepository
 from celery import group
 from datetime import timedelta
 
@@ -54,7 +55,7 @@ def send_email_notification_subject_task(subject_id: str):
 
         current_season = get_current_season_value()
         admins: list[AdminModel] = admin_repository.list(
-            match_pipeline={"latest_season": current_season}
+            match_pipeline={"latest_season": current_season}, projection={"email": 1}
         )
         emails_admin = [admin.email for admin in admins]
 
@@ -102,18 +103,9 @@ def send_email_notification_subject_task(subject_id: str):
         emails_to: list[str] = [doc.student.email for doc in docs]
         emails_to.extend(emails_admin)
 
-        job = group(
-            [send_email_notification_subject_to_user_task.s(email, params) for email in emails_to]
+        send_bulk_email(
+            template_id=settings.STUDENT_NOTIFICATION_SUBJECT, emails_to=emails_to, params=params
         )
-        job.apply_async()
-    except Exception as ex:
-        logger.exception(ex)
-
-
-@celery_app.task
-def send_email_notification_subject_to_user_task(email: str, params: dict):
-    try:
-        brevo_service.send_student_notification_subject(email_to=email, params=params)
     except Exception as ex:
         logger.exception(ex)
 
@@ -128,7 +120,7 @@ def send_student_evaluation_subject_task(subject_id: str):
 
         current_season = get_current_season_value()
         admins: list[AdminModel] = admin_repository.list(
-            match_pipeline={"latest_season": current_season}
+            match_pipeline={"latest_season": current_season}, projection={"email": 1}
         )
         emails_admin = [admin.email for admin in admins]
 
@@ -155,17 +147,70 @@ def send_student_evaluation_subject_task(subject_id: str):
         emails_to: list[str] = [doc.student.email for doc in docs]
         emails_to.extend(emails_admin)
 
-        job = group(
-            [send_student_evaluation_subject_to_user_task.s(email, params) for email in emails_to]
+        send_bulk_email(
+            template_id=settings.STUDENT_SUBJECT_EVALUATION_TEMPLATE,
+            emails_to=emails_to,
+            params=params,
         )
-        job.apply_async()
     except Exception as ex:
         logger.exception(ex)
 
 
-@celery_app.task
-def send_student_evaluation_subject_to_user_task(email: str, params: dict):
+def send_bulk_email(template_id: int, emails_to: list[str], params: dict):
+    """Queue one `send_email_batch_task` per BREVO_BATCH_SIZE recipients"""
+    # an admin may also be registered as a student
+    emails_to = list(dict.fromkeys(emails_to))
+    size = settings.BREVO_BATCH_SIZE
+    batches = [emails_to[i : i + size] for i in range(0, len(emails_to), size)]
+    logger.info(f"[send_bulk_email template:{template_id}] {len(emails_to)} recipients")
+
+    job = group([send_email_batch_task.s(template_id, batch, params) for batch in batches])
+    job.apply_async()
+
+
+@celery_app.task(bind=True, max_retries=settings.BREVO_BATCH_MAX_RETRIES)
+def send_email_batch_task(self, template_id: int, emails_to: list[str], params: dict) -> dict:
+    """
+    Send a template to a batch of recipients with one Brevo API call. Only this batch is retried
+    when it fails, with an exponential backoff. The final status of every recipient is saved in
+    `EmailDeliveries`.
+    :return: {"sent": {email: message_id}, "failed": [email]}
+    """
+    email_delivery_repository = EmailDeliveryRepository()
     try:
-        brevo_service.send_student_evaluation_subject(email_to=email, params=params)
+        message_ids = brevo_service.send_batch(
+            emails_to=emails_to, template_id=template_id, params=params
+        )
     except Exception as ex:
+        if is_retryable_error(ex) and self.request.retries < self.max_retries:
+            countdown = settings.BREVO_BATCH_RETRY_BACKOFF * 2**self.request.retries
+            logger.warning(
+                f"[send_email_batch_task template:{template_id}] {len(emails_to)} recipients "
+                f"failed: {ex}, retry in {countdown}s"
+            )
+            raise self.retry(exc=ex, countdown=countdown)
+
         logger.exception(ex)
+        logger.error(
+            f"[send_email_batch_task template:{template_id}] not delivered to: "
+            + ", ".join(emails_to)
+        )
+        email_delivery_repository.record(
+            template_id=template_id,
+            sent={},
+            failed=emails_to,
+            error=str(ex),
+            attempts=self.request.retries + 1,
+            task_id=self.request.id,
+        )
+        return {"sent": {}, "failed": emails_to}
+
+    logger.info(f"[send_email_batch_task template:{template_id}] sent to {len(message_ids)}")
+    email_delivery_repository.record(
+        template_id=template_id,
+        sent=message_ids,
+        failed=[],
+        attempts=self.request.retries + 1,
+        task_id=self.request.id,
+    )
+    return {"sent": message_ids, "failed": []}
@@ -0,0 +1,81 @@
+from datetime import datetime, timezone
+from fastapi import HTTPException
+
+from celery_worker import celery_app, logger
+from app.domain.student.enum import ImportJobStatus
+from app.infra.audit_log.audit_log_repository import AuditLogRepository
+from app.infra.lecturer.lecturer_repository import LecturerRepository
+from app.infra.services.google_drive_api import GoogleDriveAPIService
+from app.infra.student.import_job_repository import ImportJobRepository
+from app.infra.student.student_repository import StudentRepository
+from app.models.import_job import ImportJobModel
+from app.shared.response_object import ResponseFailure
+from app.use_cases.student_admin.import_from_spreadsheets import ImportSpreadsheetsStudentUseCase
+
+
+@celery_app.task
+def import_students_from_spreadsheet_task(job_id: str):
+    logger.info(f"[import_students_from_spreadsheet_task job_id:{job_id}] running...")
+    import_job_repository = ImportJobRepository()
+    job: ImportJobModel | None = import_job_repository.get_by_id(job_id)
+    if not job:
+        logger.error(f"[import_students_from_spreadsheet_task job_id:{job_id}] not found")
+        return
+
+    started_at = datetime.now(timezone.utc)
+    import_job_repository.update(
+        id=job.id,
+        data={
+            "status": ImportJobStatus.RUNNING,
+            "started_at": started_at,
+            "heartbeat_at": started_at,
+        },
+    )
+
+    def on_progress(progress: dict[str, int]):
+        import_job_repository.update(
+            id=job.id,
+            data={
+                "heartbeat_at": datetime.now(timezone.utc),
+                "total_rows": progress["total"],
+                "processed": progress["processed"],
+                "inserted": progress["inserted"],
+                "updated": progress["updated"],
+                "errors": progress["errors"],
+            },
+        )
+
+    try:
+        import_use_case = ImportSpreadsheetsStudentUseCase(
+            student_repository=StudentRepository(),
+            lecturer_repository=LecturerRepository(),
+            audit_log_repository=AuditLogRepository(),
+            google_drive_service=GoogleDriveAPIService(),
+        )
+        response = import_use_case.import_spreadsheet(
+            url=job.url, sheet_name=job.sheet_name, season=job.season, on_progress=on_progress
+        )
+    except HTTPException as e:
+        response = ResponseFailure.build_parameters_error(e.detail)
+    except Exception as e:
+        logger.exception(e)
+        response = ResponseFailure.build_system_error(e)
+
+    if isinstance(response, ResponseFailure):
+        import_job_repository.update(
+            id=job.id, data={"status": ImportJobStatus.FAILED, "detail": response.message}
+        )
+        return
+
+    import_job_repository.update(
+        id=job.id, data={"status": ImportJobStatus.DONE, "result": response.model_dump()}
+    )
+    if (response.inserteds or response.attentions) and job.author:
+        import_use_case.audit_log_repository.create(
+            import_use_case.build_audit_log(response, job.author, job.season)
+        )
+    logger.info(
+        f"[import_students_from_spreadsheet_task job_id:{job_id}] done: "
+        f"{len(response.inserteds)} inserted, {len(response.updated)} updated, "
+        f"{len(response.errors)} errors"
+    )
@@ -0,0 +1,26 @@
+from celery_worker import celery_app, logger
+from datetime import datetime, timedelta, timezone
+from app.config import settings
+from app.infra.audit_log.audit_log_archive_repository import AuditLogArchiveRepository
+
+
+@celery_app.task
+def archive_audit_logs_task():
+    logger.info("[archive_audit_logs_task] running...")
+    if settings.AUDIT_LOG_HOT_DAYS <= 0:
+        return
+    try:
+        now = datetime.now(timezone.utc)
+        repository = AuditLogArchiveRepository()
+        archived = repository.archive(
+            before=now - timedelta(days=settings.AUDIT_LOG_HOT_DAYS),
+            batch_size=settings.AUDIT_LOG_ARCHIVE_BATCH_SIZE,
+        )
+        logger.info(f"[archive_audit_logs_task] {archived} audit logs archived")
+        if settings.AUDIT_LOG_RETENTION_DAYS > 0:
+            expired = repository.expire(
+                before=now - timedelta(days=settings.AUDIT_LOG_RETENTION_DAYS)
+            )
+            logger.info(f"[archive_audit_logs_task] {expired} archived audit logs deleted")
+    except Exception as ex:
+        logger.exception(ex)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from fastapi import APIRouter, Depends, Query, HTTPException
 from typing import Annotated, Optional
 
@@ -25,11 +26,29 @@ def get_list_audit_logs(
     list_audit_logs_use_case: ListAuditLogsUseCase = Depends(ListAuditLogsUseCase),
     page_index: Annotated[int, Query(title="Page Index")] = 1,
     page_size: Annotated[int, Query(title="Page size", le=300)] = 100,
-    search: Optional[str] = Query(None, title="Search"),
+    cursor: Optional[str] = Query(
+        None,
+        title="Cursor",
+        description="Keyset pagination instead of page_index: empty for the first page, "
+        "then the `next_cursor` of the previous page",
+    ),
+    search: Optional[str] = Query(
+        None,
+        title="Search",
+        description="Case-insensitive substring of the description or of the author, refused "
+        "when the other filters leave too many logs to scan",
+    ),
+    words: Optional[str] = Query(
+        None, title="Words", description="Words of the description or of the author, indexed"
+    ),
     sort: Optional[Sort] = Sort.DESC,
     sort_by: Optional[str] = "created_at",
     type: Optional[AuditLogType] = None,
     endpoint: Optional[Endpoint] = None,
+    author: Optional[str] = Query(None, title="Author", description="Id of the admin"),
+    season: Optional[int] = Query(None, title="Season"),
+    created_from: Optional[datetime] = Query(None, title="Created from"),
+    created_to: Optional[datetime] = Query(None, title="Created to"),
     current_admin: AdminModel = Depends(get_current_admin),
 ):
     authorization(current_admin, [AdminRole.ADMIN])
@@ -43,9 +62,15 @@ def get_list_audit_logs(
     req_object = ListAuditLogsRequestObject.builder(
         page_index=page_index,
         page_size=page_size,
+        cursor=cursor,
         search=search,
+        words=words,
         endpoint=endpoint,
         type=type,
+        author=author,
+        season=season,
+        created_from=created_from,
+        created_to=created_to,
         sort=sort_query,
     )
     response = list_audit_logs_use_case.execute(request_object=req_object)
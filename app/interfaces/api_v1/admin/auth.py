@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Request
 
 from app.domain.auth.entity import AuthAdminInfoInResponse, LoginRequest, UpdatePassword
 from app.shared.decorator import response_decorator
@@ -15,8 +15,14 @@ router = APIRouter()
 
 @router.post("/login", response_model=AuthAdminInfoInResponse)
 @response_decorator()
-def login(payload: LoginRequest = Body(...), login_use_case: LoginUseCase = Depends(LoginUseCase)):
-    req_object = LoginRequestObject.builder(login_payload=payload)
+def login(
+    request: Request,
+    payload: LoginRequest = Body(...),
+    login_use_case: LoginUseCase = Depends(LoginUseCase),
+):
+    req_object = LoginRequestObject.builder(
+        login_payload=payload, client_ip=request.client.host if request.client else None
+    )
     response = login_use_case.execute(req_object)
     return response
 
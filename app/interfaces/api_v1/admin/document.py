@@ -148,6 +148,12 @@ def get_list_documents(
     list_documents_use_case: ListDocumentsUseCase = Depends(ListDocumentsUseCase),
     page_index: Annotated[int, Query(title="Page Index")] = 1,
     page_size: Annotated[int, Query(title="Page size", le=300)] = 20,
+    cursor: Optional[str] = Query(
+        None,
+        title="Cursor",
+        description="Keyset pagination instead of page_index: empty for the first page, "
+        "then the `next_cursor` of the previous page",
+    ),
     search: Optional[str] = Query(None, title="Search"),
     label: Optional[list[str]] = Query(None, title="Labels"),
     roles: Optional[list[str]] = Query(None, title="Roles"),
@@ -168,6 +174,7 @@ def get_list_documents(
         current_admin=current_admin,
         page_index=page_index,
         page_size=page_size,
+        cursor=cursor,
         search=search,
         label=label,
         roles=roles,
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, Query
+from typing import Annotated, Optional
+
+from app.domain.profiler.entity import SlowQueriesReport
+from app.domain.shared.enum import AdminRole
+from app.infra.security.security_service import authorization, get_current_active_admin
+from app.shared.decorator import response_decorator
+from app.models.admin import AdminModel
+from app.use_cases.profiler.list_slow_queries import (
+    ListSlowQueriesRequestObject,
+    ListSlowQueriesUseCase,
+)
+from app.use_cases.profiler.clear_slow_queries import ClearSlowQueriesUseCase
+
+router = APIRouter()
+
+
+@router.get(
+    "/slow-queries",
+    response_model=SlowQueriesReport,
+)
+@response_decorator()
+def get_slow_queries(
+    list_slow_queries_use_case: ListSlowQueriesUseCase = Depends(ListSlowQueriesUseCase),
+    limit: Annotated[Optional[int], Query(title="Limit", ge=1, le=500)] = 50,
+    current_admin: AdminModel = Depends(get_current_active_admin),
+):
+    authorization(current_admin, [AdminRole.ADMIN])
+    req_object = ListSlowQueriesRequestObject.builder(limit=limit)
+    response = list_slow_queries_use_case.execute(request_object=req_object)
+    return response
+
+
+@router.delete("/slow-queries")
+@response_decorator()
+def clear_slow_queries(
+    clear_slow_queries_use_case: ClearSlowQueriesUseCase = Depends(ClearSlowQueriesUseCase),
+    current_admin: AdminModel = Depends(get_current_active_admin),
+):
+    authorization(current_admin, [AdminRole.ADMIN])
+    response = clear_slow_queries_use_case.process_request()
+    return response
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Body, Depends, Query, Path
 from typing import Optional, Annotated
 
 from app.domain.student.entity import (
+    ImportJob,
     ImportSpreadsheetsInResponse,
     ImportSpreadsheetsPayload,
     ManyStudentsInResponse,
@@ -30,6 +31,12 @@ from app.use_cases.student_admin.import_from_spreadsheets import (
     ImportSpreadsheetsStudentRequestObject,
     ImportSpreadsheetsStudentUseCase,
 )
+from app.use_cases.student_admin.import_job import (
+    CreateImportJobRequestObject,
+    CreateImportJobUseCase,
+    GetImportJobRequestObject,
+    GetImportJobUseCase,
+)
 from app.use_cases.student_admin.reset_password import (
     ResetPasswordStudentRequestObject,
     ResetPasswordStudentUseCase,
@@ -79,12 +86,24 @@ def get_list_students(
     list_students_use_case: ListStudentsUseCase = Depends(ListStudentsUseCase),
     page_index: Annotated[int, Query(title="Page Index")] = 1,
     page_size: Annotated[int, Query(title="Page size", le=500)] = 300,
+    cursor: Optional[str] = Query(
+        None,
+        title="Cursor",
+        description="Keyset pagination instead of page_index: empty for the first page, "
+        "then the `next_cursor` of the previous page",
+    ),
     search: Optional[str] = Query(None, title="Search"),
     sort: Optional[Sort] = Sort.ASCE,
-    sort_by: Optional[str] = "numerical_order",
+    sort_by: Optional[str] = Query(
+        None,
+        title="Sort by",
+        description="numerical_order by default, created_at (the only key) with a cursor",
+    ),
     group: Optional[int] = None,
     season: int | None = None,
 ):
+    if sort_by is None:
+        sort_by = "created_at" if cursor is not None else "numerical_order"
     if sort_by in ["numerical_order", "season", "group"]:
         sort_by = f"seasons_info.{sort_by}"
     sort_query = {sort_by: 1 if sort is sort.ASCE else -1}
@@ -92,6 +111,7 @@ def get_list_students(
     req_object = ListStudentsRequestObject.builder(
         page_index=page_index,
         page_size=page_size,
+        cursor=cursor,
         search=search,
         sort=sort_query,
         group=group,
@@ -150,6 +170,36 @@ def import_student_from_spreadsheets(
     return response
 
 
+@router.post("/import-jobs", response_model=ImportJob)
+@response_decorator()
+def create_import_student_job(
+    payload: ImportSpreadsheetsPayload = Body(..., title="Url spreadsheets"),
+    create_import_job_use_case: CreateImportJobUseCase = Depends(CreateImportJobUseCase),
+    current_admin: AdminModel = Depends(get_current_active_admin),
+):
+    """
+    Import students from a spreadsheet in background, poll `GET /import-jobs/{job_id}` for the
+    progress and the result
+    """
+    authorization(current_admin, [*SUPER_ADMIN, AdminRole.BKL])
+    req_object = CreateImportJobRequestObject.builder(payload=payload, current_admin=current_admin)
+    response = create_import_job_use_case.execute(request_object=req_object)
+    return response
+
+
+@router.get("/import-jobs/{job_id}", response_model=ImportJob)
+@response_decorator()
+def get_import_student_job(
+    job_id: str = Path(..., title="Import job id"),
+    get_import_job_use_case: GetImportJobUseCase = Depends(GetImportJobUseCase),
+    current_admin: AdminModel = Depends(get_current_active_admin),
+):
+    authorization(current_admin, [*SUPER_ADMIN, AdminRole.BKL])
+    req_object = GetImportJobRequestObject.builder(job_id=job_id)
+    response = get_import_job_use_case.execute(request_object=req_object)
+    return response
+
+
 @router.patch("/reset-password/{id}", response_model=ResetPasswordResponse)
 @response_decorator()
 def reset_password_student(
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, Query, Path
-from typing import Annotated
+from typing import Annotated, Optional
 from app.infra.security.security_service import get_current_active_admin
 from app.shared.decorator import response_decorator
 from app.domain.subject.subject_evaluation.entity import (
@@ -70,6 +70,12 @@ def get_all_subject_evaluation(
     subject_id: str,
     page_index: Annotated[int, Query(title="Page Index")] = 1,
     page_size: Annotated[int, Query(title="Page size", le=500)] = 300,
+    cursor: Optional[str] = Query(
+        None,
+        title="Cursor",
+        description="Keyset pagination instead of page_index: empty for the first page, "
+        "then the `next_cursor` of the previous page",
+    ),
     search: str | None = Query(None, title="Search"),
     sort: Sort = Sort.ASCE,
     sort_by: str = "numerical_order",
@@ -81,6 +87,7 @@ def get_all_subject_evaluation(
     req_object = ListSubjectEvaluationRequestObject.builder(
         page_index=page_index,
         page_size=page_size,
+        cursor=cursor,
         search=search,
         sort=sort_query,
         subject_id=subject_id,
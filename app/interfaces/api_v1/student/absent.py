@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, Body, Path
 
-from app.infra.security.security_service import get_current_student
+from app.infra.security.security_service import get_current_student, get_current_student_async
 from app.shared.decorator import response_decorator
 from app.models.student import StudentModel
 from app.domain.absent.entity import (
@@ -8,7 +8,8 @@ from app.domain.absent.entity import (
     StudentAbsentInResponse,
     StudentAbsentInUpdate,
 )
-from app.use_cases.absent.create import CreateAbsentRequestObject, CreateAbsentUseCase
+from app.use_cases.absent.create import CreateAbsentRequestObject
+from app.use_cases.student_endpoint.absent.create import CreateAbsentStudentUseCase
 from app.use_cases.absent.get import GetAbsentRequestObject, GetAbsentUseCase
 from app.use_cases.absent.update import UpdateAbsentRequestObject, UpdateAbsentUseCase
 from app.use_cases.absent.delete import DeleteAbsentRequestObject, DeleteAbsentUseCase
@@ -18,16 +19,16 @@ router = APIRouter()
 
 @router.post("/{subject_id}", response_model=StudentAbsentInResponse)
 @response_decorator()
-def create_absent(
+async def create_absent(
     subject_id: str = Path(..., title="Subject id"),
     payload: StudentAbsentInCreate = Body(..., title="Subject evaluation In Create payload"),
-    create_absent_use_case: CreateAbsentUseCase = Depends(CreateAbsentUseCase),
-    current_student: StudentModel = Depends(get_current_student),
+    create_absent_use_case: CreateAbsentStudentUseCase = Depends(CreateAbsentStudentUseCase),
+    current_student: StudentModel = Depends(get_current_student_async),
 ):
     req_object = CreateAbsentRequestObject.builder(
         subject_id=subject_id, current_student=current_student, reason=payload.reason
     )
-    response = create_absent_use_case.execute(request_object=req_object)
+    response = await create_absent_use_case.execute(request_object=req_object)
     return response
 
 
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Request
 
 from app.domain.auth.entity import AuthStudentInfoInResponse, LoginRequest, UpdatePassword
 from app.shared.decorator import response_decorator
@@ -18,12 +18,15 @@ router = APIRouter()
 
 @router.post("/login", response_model=AuthStudentInfoInResponse)
 @response_decorator()
-def login(
+async def login(
+    request: Request,
     payload: LoginRequest = Body(...),
     login_use_case: LoginStudentUseCase = Depends(LoginStudentUseCase),
 ):
-    req_object = LoginStudentRequestObject.builder(login_payload=payload)
-    response = login_use_case.execute(req_object)
+    req_object = LoginStudentRequestObject.builder(
+        login_payload=payload, client_ip=request.client.host if request.client else None
+    )
+    response = await login_use_case.execute(req_object)
     return response
 
 
@@ -3,7 +3,7 @@ from typing import Optional
 
 from app.domain.subject.entity import Subject, SubjectInStudent
 from app.domain.shared.enum import Sort
-from app.infra.security.security_service import get_current_student
+from app.infra.security.security_service import get_current_student, get_current_student_async
 from app.shared.decorator import response_decorator
 from app.use_cases.student_endpoint.subject.get import (
     GetSubjectStudentCase,
@@ -36,14 +36,14 @@ def get_subject_by_id(
 
 @router.get("", response_model=list[SubjectInStudent])
 @response_decorator()
-def get_list_subjects(
+async def get_list_subjects(
     list_subjects_use_case: ListSubjectsStudentUseCase = Depends(ListSubjectsStudentUseCase),
     search: Optional[str] = Query(None, title="Search"),
     sort: Optional[Sort] = Sort.ASCE,
     sort_by: Optional[str] = "start_at",
     status: Optional[list[StatusSubjectEnum]] = Query(None, title="Status"),
     subdivision: Optional[str] = None,
-    current_student: StudentModel = Depends(get_current_student),
+    current_student: StudentModel = Depends(get_current_student_async),
     season: Optional[int] = None,
 ):
     annotations = {}
@@ -61,5 +61,5 @@ def get_list_subjects(
         status=status,
         season=season,
     )
-    response = list_subjects_use_case.execute(request_object=req_object)
+    response = await list_subjects_use_case.execute(request_object=req_object)
     return response
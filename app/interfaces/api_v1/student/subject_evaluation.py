@@ -1,6 +1,10 @@
 from fastapi import APIRouter, Depends, Body, Path
 
-from app.infra.security.security_service import get_current_active_student, get_current_student
+from app.infra.security.security_service import (
+    get_current_active_student_async,
+    get_current_student,
+    get_current_student_async,
+)
 from app.shared.decorator import response_decorator
 from app.models.student import StudentModel
 from app.domain.subject.subject_evaluation.entity import (
@@ -31,35 +35,35 @@ router = APIRouter()
 
 @router.post("/{subject_id}", response_model=SubjectEvaluationStudent)
 @response_decorator()
-def create_subject_evaluation(
+async def create_subject_evaluation(
     subject_id: str = Path(..., title="Subject id"),
     payload: SubjectEvaluationInCreate = Body(..., title="Subject evaluation In Create payload"),
     create_subject_evaluation_use_case: CreateSubjectEvaluationUseCase = Depends(
         CreateSubjectEvaluationUseCase
     ),
-    current_student: StudentModel = Depends(get_current_active_student),
+    current_student: StudentModel = Depends(get_current_active_student_async),
 ):
     req_object = CreateSubjectEvaluationRequestObject.builder(
         subject_id=subject_id, payload=payload, current_student=current_student
     )
-    response = create_subject_evaluation_use_case.execute(request_object=req_object)
+    response = await create_subject_evaluation_use_case.execute(request_object=req_object)
     return response
 
 
 @router.patch("/{subject_id}", response_model=SubjectEvaluationStudent)
 @response_decorator()
-def update_subject_evaluation(
+async def update_subject_evaluation(
     subject_id: str = Path(..., title="Subject id"),
     payload: SubjectEvaluationInUpdate = Body(..., title="Subject evaluation In update payload"),
     update_subject_evaluation_use_case: UpdateSubjectEvaluationUseCase = Depends(
         UpdateSubjectEvaluationUseCase
     ),
-    current_student: StudentModel = Depends(get_current_student),
+    current_student: StudentModel = Depends(get_current_student_async),
 ):
     req_object = UpdateSubjectEvaluationRequestObject.builder(
         subject_id=subject_id, payload=payload, current_student=current_student
     )
-    response = update_subject_evaluation_use_case.execute(request_object=req_object)
+    response = await update_subject_evaluation_use_case.execute(request_object=req_object)
     return response
 
 
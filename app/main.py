@@ -1,10 +1,20 @@
 # import logging
+import secrets
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.cors import CORSMiddleware
 from app.interfaces.api import api_router
 from app.config import settings, database
+from app.infra.audit_log.audit_log_repository import audit_log_buffer
+from app.infra.manage_form.manage_form_cache import manage_form_cache
+from app.infra.logging import get_logger, shutdown_logging
+from app.infra.logging.context import RequestContextMiddleware
+from app.infra.metrics import latest_metrics
+from app.infra.metrics.middleware import PrometheusMiddleware
+from app.infra.security.security_service import password_hasher
+from app.infra.services.google_client_registry import google_api_client_registry
 from app.interfaces.error_handler import (
     ApplicationLevelException,
 )
@@ -23,10 +33,19 @@ docs_paths = (
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup logic
+    get_logger()
     database.connect()
+    audit_log_buffer.start()
+    password_hasher.start()
+    await run_in_threadpool(manage_form_cache.warm_up)
+    if settings.ENVIRONMENT != "testing":
+        await run_in_threadpool(google_api_client_registry.warm_up)
     yield
     # Shutdown logic
+    await run_in_threadpool(audit_log_buffer.stop)
+    await run_in_threadpool(password_hasher.stop)
     database.disconnect()
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -61,5 +80,23 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
+# latency and in flight requests by route, see /metrics
+app.add_middleware(PrometheusMiddleware)
+
+# request id / trace id of the log records
+app.add_middleware(RequestContextMiddleware)
+
 # set app router
 app.include_router(api_router, prefix=settings.API_V1_STR)
+
+
+# prometheus scrape endpoint, with the METRICS_TOKEN bearer token
+@app.get("/metrics", include_in_schema=False)
+def metrics(authorization: str | None = Header(None)) -> Response:
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=404)
+    expected = f"Bearer {settings.METRICS_TOKEN}".encode()
+    if not secrets.compare_digest((authorization or "").encode(), expected):
+        raise HTTPException(status_code=401, headers={"WWW-Authenticate": "Bearer"})
+    content, content_type = latest_metrics()
+    return Response(content=content, media_type=content_type)
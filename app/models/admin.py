@@ -11,6 +11,8 @@ from mongoengine import (
     DateField,
 )
 
+from app.models.searchable import SearchableMixin
+
 
 class Address(EmbeddedDocument):
     current = StringField()
@@ -18,7 +20,9 @@ class Address(EmbeddedDocument):
     diocese = StringField()
 
 
-class AdminModel(Document):
+class AdminModel(SearchableMixin, Document):
+    search_fields = ("full_name", "holy_name", "email")
+
     email = EmailField(required=True)
     status = StringField(required=True)
     roles = ListField(StringField(), required=True)
@@ -60,6 +64,7 @@ class AdminModel(Document):
             "latest_season",
             "full_name",
             "holy_name",
+            "search_tokens",
         ],
         "allow_inheritance": True,
         "index_cls": False,
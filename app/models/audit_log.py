@@ -1,5 +1,8 @@
+import zlib
 from datetime import datetime, timezone
+from typing import Any, Dict, Optional
 from mongoengine import (
+    BinaryField,
     Document,
     StringField,
     DateTimeField,
@@ -38,7 +41,72 @@ class AuditLogModel(Document):
 
     meta = {
         "collection": "Logs",
-        "indexes": ["endpoint", "type", "author_name", "season"],
+        "indexes": [
+            # default sort + keyset tie breaker, alone and after each equality filter
+            ("-created_at", "-id"),
+            ("endpoint", "-created_at", "-id"),
+            ("type", "-created_at", "-id"),
+            ("season", "-created_at", "-id"),
+            ("author", "-created_at", "-id"),
+            "author_email",
+            # `words`, diacritic and case insensitive, without stemming (mostly Vietnamese)
+            {
+                "fields": ("$description", "$author_name", "$author_email"),
+                "default_language": "none",
+                "weights": {"author_name": 5, "author_email": 5, "description": 1},
+            },
+        ],
         "allow_inheritance": True,
         "index_cls": False,
     }
+
+
+class AuditLogArchiveModel(Document):
+    """
+    Audit logs older than the hot window of `Logs` (settings.AUDIT_LOG_HOT_DAYS), moved by the
+    archive_audit_logs_task, which deletes them once older than settings.AUDIT_LOG_RETENTION_DAYS.
+    The description is zlib compressed, it can't be searched.
+    """
+
+    type = StringField(required=True)
+    endpoint = StringField(required=True)
+    author = ReferenceField("AdminModel", reverse_delete_rule=NULLIFY)
+    author_name = StringField(required=True)
+    author_email = StringField(required=True)
+    author_roles = ListField(StringField(), required=True)
+    description_z = BinaryField()
+
+    season = IntField(required=True)
+    created_at = DateTimeField()
+
+    @staticmethod
+    def compress(description: Optional[str]) -> Optional[bytes]:
+        return zlib.compress(description.encode(), 9) if description is not None else None
+
+    @staticmethod
+    def decompress(description_z: Optional[bytes]) -> Optional[str]:
+        return zlib.decompress(description_z).decode() if description_z is not None else None
+
+    @classmethod
+    def from_audit_log(cls, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """archived raw document of a raw `Logs` document, same `_id`"""
+        archived = {key: value for key, value in doc.items() if key not in ("_cls", "description")}
+        archived["description_z"] = cls.compress(doc.get("description"))
+        return archived
+
+    meta = {
+        "collection": "LogsArchive",
+        "indexes": [
+            # the season leads, archived logs are mostly read one season at a time
+            ("season", "-created_at", "-id"),
+            ("-created_at", "-id"),
+            ("endpoint", "-created_at", "-id"),
+            ("type", "-created_at", "-id"),
+            ("author", "-created_at", "-id"),
+            {
+                "fields": ("$author_name", "$author_email"),
+                "default_language": "none",
+            },
+        ],
+        "index_cls": False,
+    }
@@ -0,0 +1,14 @@
+from mongoengine import Document, StringField, IntField, DateTimeField
+
+
+class CacheVersionModel(Document):
+    """Version of a cached dataset, bumped by the process that changed it"""
+
+    name = StringField(primary_key=True)
+    version = IntField(default=0)
+
+    updated_at = DateTimeField()
+
+    meta = {
+        "collection": "CacheVersions",
+    }
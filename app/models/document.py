@@ -36,7 +36,7 @@ class DocumentModel(Document):
 
     meta = {
         "collection": "Documents",
-        "indexes": ["file_id", "type", "season"],
+        "indexes": ["file_id", "type", "season", ("season", "-created_at", "-id")],
         "allow_inheritance": True,
         "index_cls": False,
     }
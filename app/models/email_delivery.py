@@ -0,0 +1,24 @@
+from mongoengine import Document, StringField, DateTimeField, IntField
+
+
+class EmailDeliveryModel(Document):
+    """Delivery of a template to one recipient of a Brevo batch"""
+
+    template_id = IntField(required=True)
+    email = StringField(required=True)
+    status = StringField(required=True)
+    # Brevo message id, once sent
+    message_id = StringField()
+    error = StringField()
+    attempts = IntField(default=1)
+    # Celery task of the batch
+    task_id = StringField()
+
+    created_at = DateTimeField()
+
+    meta = {
+        "collection": "EmailDeliveries",
+        "indexes": [("email", "-created_at"), ("template_id", "status", "-created_at")],
+        "allow_inheritance": True,
+        "index_cls": False,
+    }
@@ -46,7 +46,7 @@ class GeneralTaskModel(Document):
 
     meta = {
         "collection": "GeneralTasks",
-        "indexes": ["title", "short_desc", "end_at"],
+        "indexes": ["title", "short_desc", "end_at", ("season", "-created_at", "-id")],
         "allow_inheritance": True,
         "index_cls": False,
     }
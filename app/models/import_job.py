@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+from mongoengine import (
+    Document,
+    StringField,
+    DateTimeField,
+    IntField,
+    DictField,
+    ReferenceField,
+    NULLIFY,
+)
+
+
+class ImportJobModel(Document):
+    url = StringField(required=True)
+    sheet_name = StringField()
+    season = IntField(required=True)
+    status = StringField(required=True)
+
+    total_rows = IntField(default=0)
+    processed = IntField(default=0)
+    inserted = IntField(default=0)
+    updated = IntField(default=0)
+    errors = IntField(default=0)
+    detail = StringField()
+    # ImportSpreadsheetsInResponse, once done
+    result = DictField(default=None)
+
+    author = ReferenceField("AdminModel", reverse_delete_rule=NULLIFY)
+
+    started_at = DateTimeField()
+    # last progress of the worker, a running job without one for a while is dead
+    heartbeat_at = DateTimeField()
+
+    created_at = DateTimeField()
+    updated_at = DateTimeField()
+
+    @classmethod
+    def from_mongo(cls, data: dict, id_str=False):
+        """We must convert _id into "id"."""
+        if not data:
+            return data
+        id = data.pop("_id", None) if not id_str else str(data.pop("_id", None))
+        if "_cls" in data:
+            data.pop("_cls", None)
+        return cls(**dict(data, id=id))
+
+    def save(self, *args, **kwargs):
+        if not self.created_at:
+            self.created_at = datetime.now(timezone.utc)
+        self.updated_at = datetime.now(timezone.utc)
+        return super(ImportJobModel, self).save(*args, **kwargs)
+
+    meta = {
+        "collection": "ImportJobs",
+        "indexes": ["status", "-created_at"],
+        "allow_inheritance": True,
+        "index_cls": False,
+    }
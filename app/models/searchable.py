@@ -0,0 +1,41 @@
+from typing import Any, ClassVar, Dict, Tuple
+
+from mongoengine import ListField, StringField
+
+from app.shared.search import search_keys
+
+
+class SearchableMixin:
+    """
+    Keep the accent-insensitive `search_key` / `search_tokens` of the document in sync with
+    its `search_fields` on every write of the whole document (`save`, `to_mongo` for the bulk
+    and async writes). Partial updates add `search_update` to their update.
+    """
+
+    # order of the lines of `search_key`, see app.shared.search
+    search_fields: ClassVar[Tuple[str, ...]] = ()
+
+    search_key = StringField()
+    search_tokens = ListField(StringField())
+
+    def to_mongo(self, *args, **kwargs):
+        self.search_key, self.search_tokens = search_keys(
+            getattr(self, field) for field in self.search_fields
+        )
+        return super().to_mongo(*args, **kwargs)
+
+    @classmethod
+    def search_update(cls, id: Any, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        `search_key` / `search_tokens` to set along a partial update of the document
+        :param data: updated fields
+        :return: empty if no searchable field is updated
+        """
+        if not any(field in data for field in cls.search_fields):
+            return {}
+        current = cls._get_collection().find_one(
+            {"_id": cls._fields["id"].to_mongo(id)}, {field: 1 for field in cls.search_fields}
+        )
+        values = {**(current or {}), **data}
+        search_key, search_tokens = search_keys(values.get(field) for field in cls.search_fields)
+        return {"search_key": search_key, "search_tokens": search_tokens}
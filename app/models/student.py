@@ -11,6 +11,7 @@ from mongoengine import (
     Q,
 )
 
+from app.models.searchable import SearchableMixin
 from app.shared.common_exception import CustomException
 
 
@@ -22,7 +23,9 @@ class SeasonInfo(EmbeddedDocument):
     meta = {"indexes": [{"fields": ("numerical_order", "season"), "unique": True}]}
 
 
-class StudentModel(Document):
+class StudentModel(SearchableMixin, Document):
+    search_fields = ("full_name", "holy_name", "diocese", "email")
+
     seasons_info = EmbeddedDocumentListField(SeasonInfo)
     email = EmailField(required=True, unique=True)
 
@@ -99,7 +102,9 @@ class StudentModel(Document):
         "indexes": [
             "email",
             "status",
+            "search_tokens",
             {"fields": ("seasons_info.numerical_order", "seasons_info.season"), "unique": True},
+            ("seasons_info.season", "-created_at", "-id"),
         ],
         "allow_inheritance": True,
         "index_cls": False,
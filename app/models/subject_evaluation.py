@@ -55,7 +55,10 @@ class SubjectEvaluationModel(Document):
 
     meta = {
         "collection": "SubjectEvaluation",
-        "indexes": [{"fields": ["student", "subject"], "unique": True}],
+        "indexes": [
+            {"fields": ["student", "subject"], "unique": True},
+            ("subject", "numerical_order", "id"),
+        ],
         "allow_inheritance": True,
         "index_cls": False,
     }
@@ -0,0 +1,74 @@
+"""Assembly of response entities straight from mongo documents"""
+
+from functools import lru_cache
+from typing import Any, Mapping, Type, TypeVar
+
+from mongoengine import Document
+from pydantic import BaseModel, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    """one adapter per type, building it is much slower than using it"""
+    return TypeAdapter(tp)
+
+
+@lru_cache(maxsize=None)
+def _field_names(entity: Type[BaseModel]) -> tuple[str, ...]:
+    return tuple(entity.model_fields)
+
+
+def projection_of(entity: Type[BaseModel], *fields: str) -> dict[str, int]:
+    """
+    `$project` specification of the stored fields `entity` is built from, so that a query only
+    returns what the response shows (never the password hash of a student or an admin).
+    `id` is always returned as `_id`, fields the collection doesn't have are ignored.
+
+    :param entity: response entity, e.g. `StudentInStudentRequestResponse`
+    :param fields: other fields the use case reads, e.g. "seasons_info"
+    :return: projection
+
+    Example:
+    >>> projection_of(AdminInDocument, *ADMIN_ACTIVE_FIELDS)
+    """
+    return {name: 1 for name in (*_field_names(entity), *fields) if name != "id"}
+
+
+def assemble(entity: Type[M], source: Document | Mapping[str, Any], **values: Any) -> M:
+    """
+    Validate the response entity once, from the fields of `source` it declares, instead of
+    validating an `...InDB` entity, dumping it and validating the dump again.
+
+    :param entity: response entity, e.g. `Student`
+    :param source: mongoengine document (references are not dereferenced, hydrate them first
+        with `BulkDereferencer`) or raw mongo document
+    :param values: fields computed by the caller, e.g. nested entities, override `source`
+    :return: entity
+
+    Example:
+    >>> assemble(SubjectInEvaluation, subject, lecturer=assemble(LecturerInEvaluation, lecturer))
+    """
+    data: dict[str, Any] = {}
+    if isinstance(source, Document):
+        fields = source._data
+        for name in _field_names(entity):
+            if name in values:
+                continue
+            if name == "id":
+                data["id"] = str(source.pk) if source.pk is not None else None
+            elif name in fields:
+                data[name] = fields[name]
+    else:
+        for name in _field_names(entity):
+            if name in values:
+                continue
+            if name == "id":
+                id = source.get("_id", source.get("id"))
+                data["id"] = str(id) if id is not None else None
+            elif name in source:
+                data[name] = source[name]
+    data.update(values)
+    # embedded documents (seasons_info, quality...) are read by attribute
+    return type_adapter(entity).validate_python(data, from_attributes=True)
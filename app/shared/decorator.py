@@ -1,13 +1,14 @@
 import functools
+import inspect
 import time
 import random
 import logging
 from fastapi import HTTPException
-from fastapi.encoders import jsonable_encoder
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
 from app.interfaces.error_handler import ApplicationLevelException
 from app.shared.response_object import ResponseSuccess, ResponseFailure
+from app.shared.serialization import render_json
 
 
 def response_decorator():
@@ -20,49 +21,65 @@ def response_decorator():
     """
 
     def decorator(f):
+        if inspect.iscoroutinefunction(f):
+            # async endpoints stay coroutines, FastAPI runs them on the event loop
+            @functools.wraps(f)
+            async def async_wrapper(*args, **kwargs):
+                return _build_response(await f(*args, **kwargs))
+
+            return async_wrapper
+
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
-            response = f(*args, **kwargs)
-
-            if isinstance(response, ResponseSuccess):
-                # handle response success object
-                val = response.value
-                return JSONResponse(content=jsonable_encoder(val, by_alias=True))
-                # return response.value
-            elif isinstance(response, ResponseFailure):
-                # handle response failure error
-                if response.type == ResponseFailure.RESOURCE_ERROR:
-                    # Client / resource error
-                    raise ApplicationLevelException(msg=response.message)
-                if response.type == ResponseFailure.PARAMETERS_ERROR:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=response.message,
-                    )
-                elif response.type == ResponseFailure.RESOURCE_NOT_FOUND:
-                    # Item not found
-                    raise HTTPException(
-                        status_code=404,
-                        detail=response.message,
-                    )
-                elif response.type == ResponseFailure.AUTH_ERROR:
-                    # Authentication error status code
-                    raise HTTPException(
-                        status_code=401,
-                        detail=response.message,
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
-                else:
-                    # System error http status code
-                    raise HTTPException(status_code=500, detail=response.message)
-            else:
-                return JSONResponse(content=jsonable_encoder(response))
+            return _build_response(f(*args, **kwargs))
 
         return wrapper
 
     return decorator
 
 
+def _build_response(response):
+    if isinstance(response, ResponseSuccess):
+        # handle response success object
+        val = response.value
+        return Response(content=render_json(val), media_type="application/json")
+        # return response.value
+    elif isinstance(response, ResponseFailure):
+        # handle response failure error
+        if response.type == ResponseFailure.RESOURCE_ERROR:
+            # Client / resource error
+            raise ApplicationLevelException(msg=response.message)
+        if response.type == ResponseFailure.PARAMETERS_ERROR:
+            raise HTTPException(
+                status_code=400,
+                detail=response.message,
+            )
+        elif response.type == ResponseFailure.RESOURCE_NOT_FOUND:
+            # Item not found
+            raise HTTPException(
+                status_code=404,
+                detail=response.message,
+            )
+        elif response.type == ResponseFailure.TOO_MANY_REQUESTS:
+            # Throttled
+            raise HTTPException(
+                status_code=429,
+                detail=response.message,
+            )
+        elif response.type == ResponseFailure.AUTH_ERROR:
+            # Authentication error status code
+            raise HTTPException(
+                status_code=401,
+                detail=response.message,
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        else:
+            # System error http status code
+            raise HTTPException(status_code=500, detail=response.message)
+    else:
+        return Response(content=render_json(response), media_type="application/json")
+
+
 def _deco_retry(
     f,
     exc=Exception,
@@ -43,6 +43,7 @@ class ResponseFailure:
     SYSTEM_ERROR = "SystemError"
     AUTH_ERROR = "AuthError"
     RESOURCE_NOT_FOUND = "ResourceNotFound"
+    TOO_MANY_REQUESTS = "TooManyRequests"
 
     def __init__(self, type_: str, message: "FailureMessage"):
         self.type = type_
@@ -113,6 +114,10 @@ class ResponseFailure:
     def build_not_found_error(cls, message=None) -> "ResponseFailure":
         return cls(cls.RESOURCE_NOT_FOUND, message)
 
+    @classmethod
+    def build_too_many_requests_error(cls, message=None) -> "ResponseFailure":
+        return cls(cls.TOO_MANY_REQUESTS, message)
+
 
 # Typing
 FailureMessage = Union[Exception, str]
@@ -0,0 +1,86 @@
+"""
+Accent-insensitive search keys.
+
+A searchable document stores `search_key`, its searchable fields folded (no diacritics,
+lowercase) one per line, and `search_tokens`, the trigrams of every word of these fields plus
+the first one and two letters of each word. `search_tokens` is indexed: a search selects the
+documents having every token of the query through the index, then checks the query is a
+substring of one of the searched fields of `search_key`.
+
+Query words of 3 letters or more match anywhere in a word, shorter words match the beginning
+of a word.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+_WORD = re.compile(r"[a-z0-9]+")
+_SPACES = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fold(text: str) -> str:
+    """`Nguyễn  Văn Đức` -> `nguyen van duc`"""
+    text = unicodedata.normalize("NFD", text.replace("đ", "d").replace("Đ", "D"))
+    text = "".join(char for char in text if unicodedata.category(char) != "Mn")
+    return _SPACES.sub(" ", text).strip().lower()
+
+
+def _word_tokens(word: str) -> List[str]:
+    tokens = [word[:1], word[:2]] if len(word) > 1 else [word]
+    tokens.extend(word[i : i + 3] for i in range(len(word) - 2))
+    return tokens
+
+
+def search_keys(values: Iterable[Optional[str]]) -> Tuple[str, List[str]]:
+    """:return: (`search_key`, `search_tokens`) of the values of the searchable fields"""
+    lines = [fold(value) if value else "" for value in values]
+    tokens: Dict[str, None] = {}
+    for line in lines:
+        for word in _WORD.findall(line):
+            tokens.update(dict.fromkeys(_word_tokens(word)))
+    return "\n".join(lines), list(tokens)
+
+
+def query_tokens(query: str) -> List[str]:
+    """tokens a document must have to match the folded query, the most selective first"""
+    words = sorted(set(_WORD.findall(query)), key=len, reverse=True)
+    if not words:
+        return []
+    if len(words[0]) < 3:
+        # only short words, they match the beginning of a word
+        return words
+    tokens: Dict[str, None] = {}
+    for word in words:
+        if len(word) >= 3:
+            tokens.update(dict.fromkeys(word[i : i + 3] for i in range(len(word) - 2)))
+    return list(tokens)
+
+
+def search_filter(
+    search: str, search_fields: Sequence[str], fields: Optional[Sequence[str]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Mongo filter of the documents with `search` in one of `fields`
+    :param search_fields: searchable fields of the model, in the order of `search_key`
+    :param fields: searched fields, all the searchable fields by default
+    :return: None when there is nothing to search once folded
+    """
+    query = fold(search)
+    if not query:
+        return None
+    escaped = re.escape(query)
+    if fields is None or set(fields) == set(search_fields):
+        pattern = escaped
+    else:
+        # the query must be in one of the lines of the searched fields
+        pattern = "|".join(
+            f"^(?:[^\\n]*\\n){{{search_fields.index(field)}}}[^\\n]*{escaped}" for field in fields
+        )
+    conditions: Dict[str, Any] = {"search_key": {"$regex": pattern}}
+    tokens = query_tokens(query)
+    if tokens:
+        conditions = {"search_tokens": {"$all": tokens}, **conditions}
+    return conditions
@@ -0,0 +1,41 @@
+"""JSON rendering of the use case responses"""
+
+from typing import Any
+
+import orjson
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError
+
+from app.shared.assembler import type_adapter
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError
+
+
+def render_json(content: Any) -> bytes:
+    """
+    Same JSON as `json.dumps(jsonable_encoder(content, by_alias=True))`, without walking the
+    response in python: pydantic models (and lists of the same model) are serialized by
+    pydantic-core straight to bytes, anything else by orjson.
+
+    Values neither of them knows (sets, custom classes...) go through `jsonable_encoder`.
+    """
+    try:
+        if isinstance(content, BaseModel):
+            return type_adapter(type(content)).dump_json(content, by_alias=True)
+        if isinstance(content, list) and content and isinstance(content[0], BaseModel):
+            item_type = type(content[0])
+            if all(type(item) is item_type for item in content):
+                return type_adapter(list[item_type]).dump_json(content, by_alias=True)
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+    except (PydanticSerializationError, TypeError):
+        return orjson.dumps(jsonable_encoder(content, by_alias=True), option=ORJSON_OPTIONS)
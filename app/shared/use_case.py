@@ -53,3 +53,32 @@ class UseCase:
     def process_request(self, request_object):
         """abstract process_request method"""
         raise NotImplementedError("process_request() not implemented by UseCase class")
+
+
+class AsyncUseCase(UseCase):
+    """
+    Base class of the use cases of async endpoints, `process_request` is a coroutine
+    """
+
+    async def execute(self, request_object: req.RequestObject) -> res.ResponseObject:
+        if not request_object:
+            return res.ResponseFailure.build_from_invalid_request_object(request_object)
+        try:
+            result = await self.process_request(request_object)
+
+            # ensure return response success / failure object
+            if not (result or isinstance(result, res.ResponseSuccess)):
+                return result
+            return res.ResponseSuccess(result)
+        except Exception as exc:
+            print(traceback.format_exc())
+            if IS_PRODUCTION:
+                logger.exception("Usecase error: {error}", error=exc, payload=exc)
+            if isinstance(exc, HTTPException):
+                raise exc
+
+            return res.ResponseFailure.build_system_error("{}".format(exc))
+
+    async def process_request(self, request_object):
+        """abstract process_request method"""
+        raise NotImplementedError("process_request() not implemented by AsyncUseCase class")
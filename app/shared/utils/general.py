@@ -4,10 +4,8 @@ from fastapi import HTTPException
 from typing import Optional, Union, Tuple
 import calendar
 import re
+from app.infra.season.season_cache import season_cache
 from app.infra.season.season_repository import SeasonRepository
-from cachetools import TTLCache
-
-cache = TTLCache(maxsize=1, ttl=60 * 60 * 24 * 30)  # Cache 1 item for 30 days
 
 
 class ExtendedEnum(Enum):
@@ -99,14 +97,14 @@ def extract_id_spreadsheet_from_url(url: str) -> str:
 
 
 def get_current_season_value() -> int:
-    if "season" not in cache:
-        season: int = SeasonRepository().get_current_season().season
-        cache["season"] = season
-    return cache["season"]
+    return season_cache.get("season", lambda: SeasonRepository().get_current_season().season)
 
 
 def clear_all_cache():
-    cache.clear()
+    """
+    Drop the current season cached by every api and celery process
+    """
+    season_cache.invalidate()
 
 
 def mask_email(email: str | None = None) -> str | None:
@@ -1,4 +1,4 @@
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 import json
 from mongoengine import NotUniqueError
 from app.shared import request_object, response_object, use_case
@@ -67,10 +67,37 @@ class CreateAbsentRequestObject(request_object.ValidRequestObject):
         )
 
 
+def check_absent_form(
+    form_absent: ManageFormModel | None, subject_id: str
+) -> response_object.ResponseFailure | None:
+    """
+    A student can only send an absent through the absent form, open for the subject
+    :return: the failure, None when the form is open for `subject_id`
+    """
+    if not form_absent or form_absent.status == FormStatus.INACTIVE:
+        return response_object.ResponseFailure.build_parameters_error(message="Form chưa được mở.")
+    if form_absent.status == FormStatus.CLOSED:
+        return response_object.ResponseFailure.build_parameters_error(message="Form đã được đóng.")
+    form: ManageFormEvaluationOrAbsent = ManageFormEvaluationOrAbsent.model_validate(form_absent)
+    if subject_id != form.data.subject_id:
+        return response_object.ResponseFailure.build_parameters_error(
+            message="Form hiện tại không mở cho môn học này."
+        )
+    return None
+
+
+def create_absent_failure(ex: Exception) -> response_object.ResponseFailure:
+    """Failure of an absent that couldn't be saved, the student has one for the subject already"""
+    if isinstance(ex, NotUniqueError):
+        return response_object.ResponseFailure.build_parameters_error(
+            "Đơn nghỉ phép đã được tạo trước đây."
+        )
+    return response_object.ResponseFailure.build_system_error("Something went wrong")
+
+
 class CreateAbsentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         manage_form_repository: ManageFormRepository = Depends(ManageFormRepository),
         subject_repository: SubjectRepository = Depends(SubjectRepository),
         student_repository: StudentRepository = Depends(StudentRepository),
@@ -81,7 +108,6 @@ class CreateAbsentUseCase(use_case.UseCase):
         self.subject_repository = subject_repository
         self.manage_form_repository = manage_form_repository
         self.student_repository = student_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: CreateAbsentRequestObject):
@@ -103,24 +129,12 @@ class CreateAbsentUseCase(use_case.UseCase):
             )
 
         if is_student_request:
-            form_absent: ManageFormModel | None = self.manage_form_repository.find_one(
-                {"type": FormType.SUBJECT_ABSENT}
+            form_absent: ManageFormModel | None = self.manage_form_repository.find_by_type(
+                FormType.SUBJECT_ABSENT
             )
-            if not form_absent or form_absent.status == FormStatus.INACTIVE:
-                return response_object.ResponseFailure.build_parameters_error(
-                    message="Form chưa được mở."
-                )
-            if form_absent.status == FormStatus.CLOSED:
-                return response_object.ResponseFailure.build_parameters_error(
-                    message="Form đã được đóng."
-                )
-            form_absent: ManageFormEvaluationOrAbsent = ManageFormEvaluationOrAbsent.model_validate(
-                form_absent
-            )
-            if req_object.subject_id != form_absent.data.subject_id:
-                return response_object.ResponseFailure.build_parameters_error(
-                    message="Form hiện tại không mở cho môn học này."
-                )
+            failure = check_absent_form(form_absent, req_object.subject_id)
+            if failure is not None:
+                return failure
 
         try:
             absent: AbsentModel = self.absent_repository.create(
@@ -132,8 +146,7 @@ class CreateAbsentUseCase(use_case.UseCase):
                 )
             )
             if not is_student_request:
-                self.background_tasks.add_task(
-                    self.audit_log_repository.create,
+                self.audit_log_repository.enqueue(
                     AuditLogInDB(
                         type=AuditLogType.CREATE,
                         endpoint=Endpoint.ABSENT,
@@ -154,12 +167,8 @@ class CreateAbsentUseCase(use_case.UseCase):
                         ),
                     ),
                 )
-        except NotUniqueError:
-            return response_object.ResponseFailure.build_parameters_error(
-                "Đơn nghỉ phép đã được tạo trước đây."
-            )
-        except Exception:
-            return response_object.ResponseFailure.build_system_error("Something went wrong")
+        except Exception as ex:
+            return create_absent_failure(ex)
 
         return (
             StudentAbsentInResponse(
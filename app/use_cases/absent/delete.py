@@ -1,4 +1,4 @@
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from bson import ObjectId
 from app.shared import request_object, response_object, use_case
 from app.infra.absent.absent_repository import AbsentRepository
@@ -55,7 +55,6 @@ class DeleteAbsentRequestObject(request_object.ValidRequestObject):
 class DeleteAbsentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
         manage_form_repository: ManageFormRepository = Depends(ManageFormRepository),
         subject_repository: SubjectRepository = Depends(SubjectRepository),
@@ -66,7 +65,6 @@ class DeleteAbsentUseCase(use_case.UseCase):
         self.manage_form_repository = manage_form_repository
         self.subject_repository = subject_repository
         self.student_repository = student_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: DeleteAbsentRequestObject):
@@ -96,8 +94,8 @@ class DeleteAbsentUseCase(use_case.UseCase):
             )
 
         if is_student_request:
-            form_absent: ManageFormModel | None = self.manage_form_repository.find_one(
-                {"type": FormType.SUBJECT_ABSENT}
+            form_absent: ManageFormModel | None = self.manage_form_repository.find_by_type(
+                FormType.SUBJECT_ABSENT
             )
             if not form_absent or form_absent.status == FormStatus.INACTIVE:
                 return response_object.ResponseFailure.build_parameters_error(
@@ -118,8 +116,7 @@ class DeleteAbsentUseCase(use_case.UseCase):
         try:
             self.absent_repository.delete(id=absent.id)
             if not is_student_request:
-                self.background_tasks.add_task(
-                    self.audit_log_repository.create,
+                self.audit_log_repository.enqueue(
                     AuditLogInDB(
                         type=AuditLogType.DELETE,
                         endpoint=Endpoint.ABSENT,
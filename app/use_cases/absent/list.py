@@ -1,14 +1,14 @@
 from bson import ObjectId
 from fastapi import Depends
 from app.shared import request_object, use_case
-from app.domain.subject.entity import SubjectInDB
-from app.domain.lecturer.entity import LecturerInDB
 from app.infra.absent.absent_repository import AbsentRepository
+from app.infra.shared.bulk_dereference import BulkDereferencer
 from app.models.absent import AbsentModel
-from app.domain.absent.entity import AbsentInDB, AdminAbsentInResponse
-from app.domain.student.entity import Student, StudentInDB
+from app.domain.absent.entity import AdminAbsentInResponse
+from app.domain.student.entity import Student
 from app.infra.subject.subject_repository import SubjectRepository
 from app.domain.subject.subject_evaluation.entity import LecturerInEvaluation, SubjectInEvaluation
+from app.shared.assembler import assemble
 
 
 class ListAbsentRequestObject(request_object.ValidRequestObject):
@@ -32,25 +32,28 @@ class ListAbsentUseCase(use_case.UseCase):
         self,
         subject_repository: SubjectRepository = Depends(SubjectRepository),
         absent_repository: AbsentRepository = Depends(AbsentRepository),
+        dereferencer: BulkDereferencer = Depends(BulkDereferencer),
     ):
         self.absent_repository = absent_repository
+        self.dereferencer = dereferencer
         self.subject_repository = subject_repository
 
     def process_request(self, req_object: ListAbsentRequestObject):
         absents: list[AbsentModel] = self.absent_repository.list(
             match_pipeline={"subject": ObjectId(req_object.subject_id)}
         )
+        self.dereferencer.dereference(absents, "student", "subject.lecturer")
 
         return [
-            AdminAbsentInResponse(
-                **AbsentInDB.model_validate(absent).model_dump(exclude={"student", "subject"}),
-                subject=SubjectInEvaluation(
-                    **SubjectInDB.model_validate(absent.subject).model_dump(exclude=({"lecturer"})),
-                    lecturer=LecturerInEvaluation(
-                        **LecturerInDB.model_validate(absent.subject.lecturer).model_dump()
-                    ),
+            assemble(
+                AdminAbsentInResponse,
+                absent,
+                subject=assemble(
+                    SubjectInEvaluation,
+                    absent.subject,
+                    lecturer=assemble(LecturerInEvaluation, absent.subject.lecturer),
                 ),
-                student=Student(**StudentInDB.model_validate(absent.student).model_dump()),
+                student=assemble(Student, absent.student),
             )
             for absent in absents
         ]
@@ -1,4 +1,4 @@
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from bson import ObjectId
 from app.shared import request_object, response_object, use_case
 from app.domain.subject.entity import SubjectInDB
@@ -72,7 +72,6 @@ class UpdateAbsentRequestObject(request_object.ValidRequestObject):
 class UpdateAbsentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
         manage_form_repository: ManageFormRepository = Depends(ManageFormRepository),
         subject_repository: SubjectRepository = Depends(SubjectRepository),
@@ -83,7 +82,6 @@ class UpdateAbsentUseCase(use_case.UseCase):
         self.subject_repository = subject_repository
         self.manage_form_repository = manage_form_repository
         self.student_repository = student_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: UpdateAbsentRequestObject):
@@ -113,8 +111,8 @@ class UpdateAbsentUseCase(use_case.UseCase):
             )
 
         if is_student_request:
-            form_absent: ManageFormModel | None = self.manage_form_repository.find_one(
-                {"type": FormType.SUBJECT_ABSENT}
+            form_absent: ManageFormModel | None = self.manage_form_repository.find_by_type(
+                FormType.SUBJECT_ABSENT
             )
             if not form_absent or form_absent.status == FormStatus.INACTIVE:
                 return response_object.ResponseFailure.build_system_error(
@@ -137,8 +135,7 @@ class UpdateAbsentUseCase(use_case.UseCase):
         )
         absent.reload()
         if not is_student_request:
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.UPDATE,
                     endpoint=Endpoint.ABSENT,
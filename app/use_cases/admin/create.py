@@ -1,12 +1,13 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 
 from app.infra.security.security_service import get_password_hash
 from app.shared import request_object, use_case, response_object
 
 from app.domain.admin.entity import Admin, AdminInCreate, AdminInDB, AdminInUpdateTime
 from app.infra.admin.admin_repository import AdminRepository
+from app.infra.security.principal_cache import principal_cache
 from app.models.admin import AdminModel
 from app.infra.audit_log.audit_log_repository import AuditLogRepository
 from app.domain.audit_log.entity import AuditLogInDB
@@ -43,13 +44,11 @@ class CreateAdminRequestObject(request_object.ValidRequestObject):
 class CreateAdminUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         admin_repository: AdminRepository = Depends(AdminRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.admin_repository = admin_repository
         self.audit_log_repository = audit_log_repository
-        self.background_tasks = background_tasks
 
     def process_request(self, req_object: CreateAdminRequestObject):
         admin_in: AdminInCreate = req_object.admin_in
@@ -70,6 +69,7 @@ class CreateAdminUseCase(use_case.UseCase):
                     latest_season=current_season, seasons=seasons, roles=admin_in.roles
                 ),
             )
+            principal_cache.invalidate(AdminModel, existing_admin.email)
             existing_admin.reload()
             send_email_welcome_with_exist_account_task.delay(
                 email=existing_admin.email,
@@ -96,8 +96,7 @@ class CreateAdminUseCase(use_case.UseCase):
             is_admin=True,
         )
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.CREATE,
                 endpoint=Endpoint.ADMIN,
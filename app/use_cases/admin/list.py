@@ -1,14 +1,16 @@
 import math
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any
 from fastapi import Depends
 from app.shared import request_object, use_case, response_object
-from app.domain.admin.entity import Admin, AdminInDB, ManyAdminsInResponse
+from app.domain.admin.entity import Admin, ManyAdminsInResponse
 from app.domain.shared.entity import Pagination
 from app.models.admin import AdminModel
 from app.infra.admin.admin_repository import AdminRepository
+from app.shared.assembler import assemble, projection_of
 from app.shared.constant import SUPER_ADMIN
 from app.shared.utils.general import get_current_season_value
 from app.domain.shared.enum import AdminRole
+from app.shared.search import search_filter
 
 
 class ListAdminsRequestObject(request_object.ValidRequestObject):
@@ -56,13 +58,7 @@ class ListAdminsUseCase(use_case.UseCase):
         match_pipeline: Optional[Dict[str, Any]] = {}
 
         if isinstance(req_object.search, str):
-            match_pipeline = {
-                "$or": [
-                    {"email": {"$regex": req_object.search, "$options": "i"}},
-                    {"full_name": {"$regex": req_object.search, "$options": "i"}},
-                    {"holy_name": {"$regex": req_object.search, "$options": "i"}},
-                ]
-            }
+            match_pipeline = search_filter(req_object.search, AdminModel.search_fields) or {}
 
         current_season = get_current_season_value()
         is_super_admin = any(role in req_object.current_admin.roles for role in SUPER_ADMIN)
@@ -89,15 +85,14 @@ class ListAdminsUseCase(use_case.UseCase):
                 ),
             }
 
-        admins: List[AdminModel] = self.admin_repository.list(
+        admins, total = self.admin_repository.list_paginated(
             page_size=req_object.page_size,
             page_index=req_object.page_index,
             sort=req_object.sort,
             match_pipeline=match_pipeline,
+            projection=projection_of(Admin),
         )
-
-        total = self.admin_repository.count_list(match_pipeline=match_pipeline)
-        data = [Admin(**AdminInDB.model_validate(model).model_dump()) for model in admins]
+        data = [assemble(Admin, model) for model in admins]
         return ManyAdminsInResponse(
             pagination=Pagination(
                 total=total,
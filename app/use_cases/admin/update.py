@@ -1,11 +1,12 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.models.admin import AdminModel
 from app.shared import request_object, use_case, response_object
 
 from app.domain.admin.entity import Admin, AdminInDB, AdminInUpdate, AdminInUpdateTime
 from app.infra.admin.admin_repository import AdminRepository
+from app.infra.security.principal_cache import principal_cache
 from app.infra.audit_log.audit_log_repository import AuditLogRepository
 from app.domain.audit_log.entity import AuditLogInDB
 from app.domain.audit_log.enum import AuditLogType, Endpoint
@@ -38,11 +39,9 @@ class UpdateAdminRequestObject(request_object.ValidRequestObject):
 class UpdateAdminUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         admin_repository: AdminRepository = Depends(AdminRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
-        self.background_tasks = background_tasks
         self.admin_repository = admin_repository
         self.audit_log_repository = audit_log_repository
 
@@ -54,11 +53,11 @@ class UpdateAdminUseCase(use_case.UseCase):
         self.admin_repository.update(
             id=admin.id, data=AdminInUpdateTime(**req_object.obj_in.model_dump())
         )
+        principal_cache.invalidate(AdminModel, admin.email)
         admin.reload()
 
         current_season = get_current_season_value()
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE,
                 endpoint=Endpoint.ADMIN,
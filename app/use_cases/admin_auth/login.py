@@ -1,19 +1,22 @@
+from typing import Optional
 from fastapi import Depends
 
 from app.domain.auth.entity import LoginRequest, TokenData, AuthAdminInfoInResponse
 from app.domain.admin.entity import Admin, AdminInDB
 from app.models.admin import AdminModel
+from app.infra.security.login_throttle import login_throttle
 from app.infra.security.security_service import verify_password, create_access_token
 from app.infra.admin.admin_repository import AdminRepository
 from app.shared import request_object, use_case, response_object
 
 
 class LoginRequestObject(request_object.ValidRequestObject):
-    def __init__(self, login_payload: LoginRequest):
+    def __init__(self, login_payload: LoginRequest, client_ip: Optional[str] = None):
         self.login_payload = login_payload
+        self.client_ip = client_ip
 
     @classmethod
-    def builder(cls, login_payload: LoginRequest):
+    def builder(cls, login_payload: LoginRequest, client_ip: Optional[str] = None):
         invalid_req = request_object.InvalidRequestObject()
         if not login_payload:
             invalid_req.add_error("login_payload", "Invalid")
@@ -21,7 +24,7 @@ class LoginRequestObject(request_object.ValidRequestObject):
         if invalid_req.has_errors():
             return invalid_req
 
-        return LoginRequestObject(login_payload=login_payload)
+        return LoginRequestObject(login_payload=login_payload, client_ip=client_ip)
 
 
 class LoginUseCase(use_case.UseCase):
@@ -32,11 +35,16 @@ class LoginUseCase(use_case.UseCase):
         self.admin_repository = admin_repository
 
     def process_request(self, req_object: LoginRequestObject):
+        if login_throttle.blocked(req_object.login_payload.email, req_object.client_ip):
+            return response_object.ResponseFailure.build_too_many_requests_error(
+                message="Bạn đã đăng nhập sai quá nhiều lần, vui lòng thử lại sau"
+            )
         admin: AdminModel = self.admin_repository.get_by_email(req_object.login_payload.email)
         checker = False
         if admin:
             checker = verify_password(req_object.login_payload.password, admin.password)
         if not admin or not checker:
+            login_throttle.failed(req_object.login_payload.email, req_object.client_ip)
             return response_object.ResponseFailure.build_parameters_error(
                 message="Sai email hoặc mật khẩu"
             )
@@ -47,6 +55,7 @@ class LoginUseCase(use_case.UseCase):
                 message="Tài khoản của bạn đã bị khóa"
             )
 
+        login_throttle.succeeded(req_object.login_payload.email)
         access_token = create_access_token(data=TokenData(email=admin.email, id=str(admin.id)))
         return AuthAdminInfoInResponse(
             access_token=access_token, user=Admin(**admin_in_db.model_dump())
@@ -1,13 +1,22 @@
 import math
-from typing import Optional, List, Any
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Any, List, Tuple, Union
+from bson import ObjectId
 from fastapi import Depends
-from app.shared import request_object, use_case
-from app.domain.audit_log.entity import AuditLog, AuditLogInDB, ManyAuditLogsInResponse
+from app.config import settings
+from app.shared import request_object, use_case, response_object
+from app.domain.audit_log.entity import AuditLog, ManyAuditLogsInResponse
 from app.domain.shared.entity import Pagination
-from app.models.audit_log import AuditLogModel
+from app.infra.audit_log.audit_log_archive_repository import AuditLogArchiveRepository
 from app.infra.audit_log.audit_log_repository import AuditLogRepository
+from app.infra.shared.pagination import CountMode, InvalidCursorError, encode_cursor, keyset_sort
+from app.infra.shared.records import Record
+from app.infra.shared.bulk_dereference import BulkDereferencer
 from app.domain.audit_log.enum import AuditLogType, Endpoint
-from app.domain.admin.entity import Admin, AdminInDB
+from app.domain.admin.entity import Admin
+from app.models.audit_log import AuditLogModel
+from app.shared.assembler import assemble, projection_of
 
 
 class ListAuditLogsRequestObject(request_object.ValidRequestObject):
@@ -19,6 +28,12 @@ class ListAuditLogsRequestObject(request_object.ValidRequestObject):
         sort: Optional[dict[str, int]] = None,
         type: Optional[AuditLogType] = None,
         endpoint: Optional[Endpoint] = None,
+        cursor: Optional[str] = None,
+        words: Optional[str] = None,
+        author: Optional[str] = None,
+        season: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
     ):
         self.page_index = page_index
         self.page_size = page_size
@@ -26,6 +41,12 @@ class ListAuditLogsRequestObject(request_object.ValidRequestObject):
         self.sort = sort
         self.endpoint = endpoint
         self.type = type
+        self.cursor = cursor
+        self.words = words
+        self.author = author
+        self.season = season
+        self.created_from = created_from
+        self.created_to = created_to
 
     @classmethod
     def builder(
@@ -36,7 +57,22 @@ class ListAuditLogsRequestObject(request_object.ValidRequestObject):
         sort: Optional[dict[str, int]] = None,
         type: Optional[AuditLogType] = None,
         endpoint: Optional[Endpoint] = None,
-    ):
+        cursor: Optional[str] = None,
+        words: Optional[str] = None,
+        author: Optional[str] = None,
+        season: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> request_object.RequestObject:
+        invalid_req = request_object.InvalidRequestObject()
+        if author is not None and not ObjectId.is_valid(author):
+            invalid_req.add_error("author", "Invalid author id")
+        if created_from and created_to and created_from > created_to:
+            invalid_req.add_error("created_from", "created_from must be before created_to")
+
+        if invalid_req.has_errors():
+            return invalid_req
+
         return ListAuditLogsRequestObject(
             page_index=page_index,
             page_size=page_size,
@@ -44,6 +80,12 @@ class ListAuditLogsRequestObject(request_object.ValidRequestObject):
             sort=sort,
             type=type,
             endpoint=endpoint,
+            cursor=cursor,
+            words=words,
+            author=author,
+            season=season,
+            created_from=created_from,
+            created_to=created_to,
         )
 
 
@@ -51,56 +93,167 @@ class ListAuditLogsUseCase(use_case.UseCase):
     def __init__(
         self,
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
+        audit_log_archive_repository: AuditLogArchiveRepository = Depends(
+            AuditLogArchiveRepository
+        ),
+        dereferencer: BulkDereferencer = Depends(BulkDereferencer),
     ):
         self.audit_log_repository = audit_log_repository
+        self.audit_log_archive_repository = audit_log_archive_repository
+        self.dereferencer = dereferencer
+
+    def tiers(
+        self, req_object: ListAuditLogsRequestObject
+    ) -> List[Union[AuditLogRepository, AuditLogArchiveRepository]]:
+        """
+        Repositories to read, in the order of the requested sort. The archive is only read when
+        the range reaches before the hot window, every archived log being older than the logs
+        of `Logs`, its pages follow the ones of `Logs` for a `created_at` sort.
+        """
+        hot_since = datetime.now(timezone.utc) - timedelta(days=settings.AUDIT_LOG_HOT_DAYS)
+        created_from = req_object.created_from
+        if created_from is not None and created_from.tzinfo is None:
+            created_from = created_from.replace(tzinfo=timezone.utc)
+        sort = req_object.sort or {"created_at": -1}
+        if list(sort) != ["created_at"] or (created_from and created_from >= hot_since):
+            return [self.audit_log_repository]
+        if sort["created_at"] > 0:
+            return [self.audit_log_archive_repository, self.audit_log_repository]
+        return [self.audit_log_repository, self.audit_log_archive_repository]
+
+    @staticmethod
+    def list_page(
+        tiers, req_object: ListAuditLogsRequestObject, match_pipeline: dict[str, Any]
+    ) -> Tuple[List[Record], int]:
+        """page `page_index` of the audit logs of the tiers, one after the other"""
+        offset = req_object.page_size * (req_object.page_index - 1)
+        audit_logs: List[Record] = []
+        total = 0
+        for repository in tiers:
+            remaining = req_object.page_size - len(audit_logs)
+            docs, tier_total = repository.list_paginated(
+                # the page is full, only count the audit logs of the tier
+                page_size=remaining if remaining > 0 else 1,
+                skip=max(0, offset - total),
+                sort=req_object.sort,
+                match_pipeline=match_pipeline,
+                projection=projection_of(AuditLog),
+                count_mode=CountMode.ESTIMATED,
+            )
+            if remaining > 0:
+                audit_logs.extend(docs)
+            total += tier_total or 0
+        return audit_logs, total
+
+    @staticmethod
+    def list_after_cursor(
+        tiers, req_object: ListAuditLogsRequestObject, match_pipeline: dict[str, Any]
+    ) -> Tuple[List[Record], int, str | None]:
+        """
+        audit logs of the tiers after the cursor, one tier after the other
+        :raises InvalidCursorError:
+        """
+        audit_logs: List[Record] = []
+        total = 0
+        next_cursor: str | None = None
+        for repository in tiers:
+            remaining = req_object.page_size - len(audit_logs)
+            docs, tier_total, tier_next_cursor = repository.list_by_cursor(
+                # the page is full, only look for a next page and count the audit logs
+                cursor=req_object.cursor,
+                page_size=remaining if remaining > 0 else 1,
+                sort=req_object.sort,
+                match_pipeline=match_pipeline,
+                projection=projection_of(AuditLog),
+                count_mode=CountMode.ESTIMATED,
+            )
+            if remaining > 0:
+                audit_logs.extend(docs)
+                next_cursor = tier_next_cursor
+            elif docs and next_cursor is None:
+                next_cursor = encode_cursor(
+                    audit_logs[-1], keyset_sort(req_object.sort or {"created_at": -1})
+                )
+            total += tier_total or 0
+        return audit_logs, total, next_cursor
 
     def process_request(self, req_object: ListAuditLogsRequestObject):
+        # indexed filters, see the indexes of AuditLogModel
         match_pipeline: dict[str, Any] | None = {}
 
-        if isinstance(req_object.search, str):
+        if isinstance(req_object.words, str) and req_object.words.strip():
+            match_pipeline = {**match_pipeline, "$text": {"$search": req_object.words}}
+        if isinstance(req_object.type, AuditLogType):
+            match_pipeline = {**match_pipeline, "type": req_object.type}
+        if isinstance(req_object.endpoint, Endpoint):
+            match_pipeline = {**match_pipeline, "endpoint": req_object.endpoint}
+        if req_object.author is not None:
+            match_pipeline = {**match_pipeline, "author": ObjectId(req_object.author)}
+        if req_object.season is not None:
+            match_pipeline = {**match_pipeline, "season": req_object.season}
+        if req_object.created_from or req_object.created_to:
+            created_at: dict[str, datetime] = {}
+            if req_object.created_from:
+                created_at["$gte"] = req_object.created_from
+            if req_object.created_to:
+                created_at["$lte"] = req_object.created_to
+            match_pipeline = {**match_pipeline, "created_at": created_at}
+
+        tiers = self.tiers(req_object)
+        if isinstance(req_object.search, str) and req_object.search:
+            # substring search can't use an index, only scan the logs left by the filters
+            scanned = sum(
+                repository.count_up_to(match_pipeline, limit=settings.AUDIT_LOG_SCAN_LIMIT)
+                for repository in tiers
+            )
+            if scanned > settings.AUDIT_LOG_SCAN_LIMIT:
+                return response_object.ResponseFailure.build_parameters_error(
+                    "Quá nhiều nhật ký để tìm kiếm theo chuỗi con, "
+                    "vui lòng thu hẹp khoảng thời gian hoặc bộ lọc."
+                )
+            # archived descriptions are compressed, only the author of archived logs matches
+            pattern = {"$regex": re.escape(req_object.search), "$options": "i"}
             match_pipeline = {
                 **match_pipeline,
                 "$or": [
-                    {"author_name": {"$regex": req_object.search, "$options": "i"}},
-                    {"author_email": {"$regex": req_object.search, "$options": "i"}},
-                    {"description": {"$regex": req_object.search, "$options": "i"}},
+                    {"author_name": pattern},
+                    {"author_email": pattern},
+                    {"description": pattern},
                 ],
             }
-        if isinstance(req_object.type, AuditLogType):
-            match_pipeline = {**match_pipeline, "type": req_object.type}
-        if isinstance(req_object.endpoint, Endpoint):
-            match_pipeline = {**match_pipeline, "endpoint": req_object.endpoint}
 
-        audit_logs: List[AuditLogModel] = self.audit_log_repository.list(
-            page_size=req_object.page_size,
-            page_index=req_object.page_index,
-            sort=req_object.sort,
-            match_pipeline=match_pipeline,
+        next_cursor: str | None = None
+        if req_object.cursor is not None:
+            try:
+                audit_logs, total, next_cursor = self.list_after_cursor(
+                    tiers, req_object, match_pipeline
+                )
+            except InvalidCursorError:
+                return response_object.ResponseFailure.build_parameters_error(
+                    "Cursor không hợp lệ."
+                )
+        else:
+            audit_logs, total = self.list_page(tiers, req_object, match_pipeline)
+        self.dereferencer.dereference_records(
+            AuditLogModel, audit_logs, "author", projections={"author": projection_of(Admin)}
         )
 
-        total = self.audit_log_repository.count_list(match_pipeline=match_pipeline)
-
         data: Optional[list[AuditLog]] = []
         for log in audit_logs:
-            author: AdminInDB | None = None
+            author: Admin | None = None
             try:
-                author = AdminInDB.model_validate(log.author) if log.author else None
+                author = assemble(Admin, log["author"]) if log.get("author") else None
             except Exception:
-                log.author = None
-            data.append(
-                AuditLog(
-                    **AuditLogInDB.model_validate(log).model_dump(exclude=({"author"})),
-                    author=(
-                        Admin(**author.model_dump(), active=author.active()) if author else author
-                    ),
-                )
-            )
+                # invalid admin, the log is listed without author
+                pass
+            data.append(assemble(AuditLog, log, author=author))
 
         return ManyAuditLogsInResponse(
             pagination=Pagination(
                 total=total,
-                page_index=req_object.page_index,
+                page_index=req_object.page_index if req_object.cursor is None else None,
                 total_pages=math.ceil(total / req_object.page_size),
+                next_cursor=next_cursor,
             ),
             data=data,
         )
@@ -82,8 +82,7 @@ class DeleteDocumentUseCase(use_case.UseCase):
             self.background_tasks.add_task(self.google_drive_api_service.delete, document.file_id)
 
             current_season = get_current_season_value()
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.DELETE,
                     endpoint=Endpoint.DOCUMENT,
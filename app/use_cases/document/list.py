@@ -1,22 +1,24 @@
 import math
-from typing import Optional, List, Any
+from typing import Optional, Any
 from fastapi import Depends
 from app.shared import request_object, use_case, response_object
 from app.domain.document.entity import (
     AdminInDocument,
     Document,
-    DocumentInDB,
     ManyDocumentsInResponse,
 )
 from app.domain.shared.entity import Pagination
-from app.models.document import DocumentModel
 from app.infra.document.document_repository import DocumentRepository
+from app.infra.shared.bulk_dereference import BulkDereferencer
+from app.infra.shared.pagination import InvalidCursorError
 from app.models.admin import AdminModel
+from app.models.document import DocumentModel
 from app.domain.document.enum import DocumentType
-from app.domain.admin.entity import AdminInDB
+from app.domain.admin.entity import ADMIN_ACTIVE_FIELDS, AdminInDB, is_admin_active
 from app.shared.constant import SUPER_ADMIN
 from app.domain.shared.enum import AdminRole
 from app.shared.utils.general import get_current_season_value
+from app.shared.assembler import assemble, projection_of
 
 
 class ListDocumentsRequestObject(request_object.ValidRequestObject):
@@ -31,9 +33,11 @@ class ListDocumentsRequestObject(request_object.ValidRequestObject):
         season: int | None = None,
         type: Optional[DocumentType] = None,
         roles: Optional[list[str]] = None,
+        cursor: Optional[str] = None,
     ):
         self.page_index = page_index
         self.page_size = page_size
+        self.cursor = cursor
         self.search = search
         self.sort = sort
         self.label = label
@@ -54,12 +58,14 @@ class ListDocumentsRequestObject(request_object.ValidRequestObject):
         season: int | None = None,
         type: Optional[DocumentType] = None,
         roles: Optional[list[str]] = None,
+        cursor: Optional[str] = None,
     ):
         return ListDocumentsRequestObject(
             current_admin=current_admin,
             page_index=page_index,
             label=label,
             page_size=page_size,
+            cursor=cursor,
             search=search,
             sort=sort,
             season=season,
@@ -69,8 +75,13 @@ class ListDocumentsRequestObject(request_object.ValidRequestObject):
 
 
 class ListDocumentsUseCase(use_case.UseCase):
-    def __init__(self, document_repository: DocumentRepository = Depends(DocumentRepository)):
+    def __init__(
+        self,
+        document_repository: DocumentRepository = Depends(DocumentRepository),
+        dereferencer: BulkDereferencer = Depends(BulkDereferencer),
+    ):
         self.document_repository = document_repository
+        self.dereferencer = dereferencer
 
     def match_pipeline_helper(
         self,
@@ -235,30 +246,52 @@ class ListDocumentsUseCase(use_case.UseCase):
         if isinstance(req_object.roles, list) and len(req_object.roles) > 0:
             match_pipeline = {**match_pipeline, "role": {"$in": req_object.roles}}
 
-        documents: List[DocumentModel] = self.document_repository.list(
-            page_size=req_object.page_size,
-            page_index=req_object.page_index,
-            sort=req_object.sort,
-            match_pipeline=match_pipeline,
+        next_cursor: str | None = None
+        if req_object.cursor is not None:
+            try:
+                documents, total, next_cursor = self.document_repository.list_by_cursor(
+                    cursor=req_object.cursor,
+                    page_size=req_object.page_size,
+                    sort=req_object.sort,
+                    match_pipeline=match_pipeline,
+                    projection=projection_of(Document),
+                )
+            except InvalidCursorError:
+                return response_object.ResponseFailure.build_parameters_error(
+                    "Cursor không hợp lệ."
+                )
+        else:
+            documents, total = self.document_repository.list_paginated(
+                page_size=req_object.page_size,
+                page_index=req_object.page_index,
+                sort=req_object.sort,
+                match_pipeline=match_pipeline,
+                projection=projection_of(Document),
+            )
+        self.dereferencer.dereference_records(
+            DocumentModel,
+            documents,
+            "author",
+            projections={"author": projection_of(AdminInDocument, *ADMIN_ACTIVE_FIELDS)},
         )
 
-        total = self.document_repository.count_list(match_pipeline=match_pipeline)
-
-        data: Optional[list[Document]] = []
-        for doc in documents:
-            author: AdminInDB = AdminInDB.model_validate(doc.author)
-            data.append(
-                Document(
-                    **DocumentInDB.model_validate(doc).model_dump(exclude=({"author"})),
-                    author=AdminInDocument(**author.model_dump(), active=author.active()),
-                )
+        data: Optional[list[Document]] = [
+            assemble(
+                Document,
+                doc,
+                author=assemble(
+                    AdminInDocument, doc["author"], active=is_admin_active(doc["author"])
+                ),
             )
+            for doc in documents
+        ]
 
         return ManyDocumentsInResponse(
             pagination=Pagination(
                 total=total,
-                page_index=req_object.page_index,
+                page_index=req_object.page_index if req_object.cursor is None else None,
                 total_pages=math.ceil(total / req_object.page_size),
+                next_cursor=next_cursor,
             ),
             data=data,
         )
@@ -84,8 +84,7 @@ class UpdateDocumentUseCase(use_case.UseCase):
         document.reload()
 
         current_season = get_current_season_value()
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE,
                 endpoint=Endpoint.DOCUMENT,
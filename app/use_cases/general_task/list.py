@@ -1,23 +1,25 @@
 import math
-from typing import Optional, List, Any
+from typing import Optional, Any
 from fastapi import Depends
 from app.shared import request_object, use_case, response_object
 from app.domain.general_task.entity import (
     AdminInGeneralTask,
     GeneralTask,
-    GeneralTaskInDB,
     ManyGeneralTasksInResponse,
 )
 from app.domain.shared.entity import Pagination
-from app.models.general_task import GeneralTaskModel
 from app.infra.general_task.general_task_repository import GeneralTaskRepository
+from app.infra.shared.bulk_dereference import BulkDereferencer
+from app.infra.shared.pagination import InvalidCursorError
 from app.models.admin import AdminModel
+from app.models.general_task import GeneralTaskModel
 from app.domain.general_task.enum import GeneralTaskType
-from app.domain.admin.entity import AdminInDB
+from app.domain.admin.entity import ADMIN_ACTIVE_FIELDS, AdminInDB, is_admin_active
 from app.shared.constant import SUPER_ADMIN
-from app.domain.document.entity import AdminInDocument, Document, DocumentInDB
+from app.domain.document.entity import AdminInDocument, Document
 from app.domain.shared.enum import AdminRole
 from app.shared.utils.general import get_current_season_value
+from app.shared.assembler import assemble, projection_of
 
 
 class ListGeneralTasksRequestObject(request_object.ValidRequestObject):
@@ -32,9 +34,11 @@ class ListGeneralTasksRequestObject(request_object.ValidRequestObject):
         season: int | None = None,
         type: Optional[GeneralTaskType] = None,
         roles: Optional[list[str]] = None,
+        cursor: Optional[str] = None,
     ):
         self.page_index = page_index
         self.page_size = page_size
+        self.cursor = cursor
         self.search = search
         self.sort = sort
         self.label = label
@@ -55,12 +59,14 @@ class ListGeneralTasksRequestObject(request_object.ValidRequestObject):
         season: int | None = None,
         type: Optional[GeneralTaskType] = None,
         roles: Optional[list[str]] = None,
+        cursor: Optional[str] = None,
     ):
         return ListGeneralTasksRequestObject(
             current_admin=current_admin,
             page_index=page_index,
             label=label,
             page_size=page_size,
+            cursor=cursor,
             search=search,
             sort=sort,
             season=season,
@@ -73,8 +79,10 @@ class ListGeneralTasksUseCase(use_case.UseCase):
     def __init__(
         self,
         general_task_repository: GeneralTaskRepository = Depends(GeneralTaskRepository),
+        dereferencer: BulkDereferencer = Depends(BulkDereferencer),
     ):
         self.general_task_repository = general_task_repository
+        self.dereferencer = dereferencer
 
     def match_pipeline_helper(
         self,
@@ -183,33 +191,55 @@ class ListGeneralTasksUseCase(use_case.UseCase):
         if isinstance(req_object.roles, list) and len(req_object.roles) > 0:
             match_pipeline = {**match_pipeline, "role": {"$in": req_object.roles}}
 
-        general_tasks: List[GeneralTaskModel] = self.general_task_repository.list(
-            page_size=req_object.page_size,
-            page_index=req_object.page_index,
-            sort=req_object.sort,
-            match_pipeline=match_pipeline,
+        next_cursor: str | None = None
+        if req_object.cursor is not None:
+            try:
+                general_tasks, total, next_cursor = self.general_task_repository.list_by_cursor(
+                    cursor=req_object.cursor,
+                    page_size=req_object.page_size,
+                    sort=req_object.sort,
+                    match_pipeline=match_pipeline,
+                    projection=projection_of(GeneralTask),
+                )
+            except InvalidCursorError:
+                return response_object.ResponseFailure.build_parameters_error(
+                    "Cursor không hợp lệ."
+                )
+        else:
+            general_tasks, total = self.general_task_repository.list_paginated(
+                page_size=req_object.page_size,
+                page_index=req_object.page_index,
+                sort=req_object.sort,
+                match_pipeline=match_pipeline,
+                projection=projection_of(GeneralTask),
+            )
+        self.dereferencer.dereference_records(
+            GeneralTaskModel,
+            general_tasks,
+            "author",
+            "attachments.author",
+            projections={
+                "author": projection_of(AdminInGeneralTask, *ADMIN_ACTIVE_FIELDS),
+                "attachments": projection_of(Document),
+                "attachments.author": projection_of(AdminInDocument),
+            },
         )
 
-        total = self.general_task_repository.count_list(match_pipeline=match_pipeline)
-
         data: Optional[list[GeneralTask]] = []
         for task in general_tasks:
-            author: AdminInDB = AdminInDB.model_validate(task.author)
+            active = is_admin_active(task["author"])
             data.append(
-                GeneralTask(
-                    **GeneralTaskInDB.model_validate(task).model_dump(
-                        exclude=({"author", "attachments"})
-                    ),
-                    author=AdminInGeneralTask(**author.model_dump(), active=author.active()),
+                assemble(
+                    GeneralTask,
+                    task,
+                    author=assemble(AdminInGeneralTask, task["author"], active=active),
                     attachments=[
-                        Document(
-                            **DocumentInDB.model_validate(doc).model_dump(exclude=({"author"})),
-                            author=AdminInDocument(
-                                **AdminInDB.model_validate(doc.author).model_dump(),
-                                active=author.active(),
-                            ),
+                        assemble(
+                            Document,
+                            doc,
+                            author=assemble(AdminInDocument, doc["author"], active=active),
                         )
-                        for doc in task.attachments
+                        for doc in task["attachments"]
                     ],
                 )
             )
@@ -217,8 +247,9 @@ class ListGeneralTasksUseCase(use_case.UseCase):
         return ManyGeneralTasksInResponse(
             pagination=Pagination(
                 total=total,
-                page_index=req_object.page_index,
+                page_index=req_object.page_index if req_object.cursor is None else None,
                 total_pages=math.ceil(total / req_object.page_size),
+                next_cursor=next_cursor,
             ),
             data=data,
         )
@@ -1,6 +1,6 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.models.general_task import GeneralTaskModel
 from app.shared import request_object, use_case, response_object
 
@@ -49,14 +49,12 @@ class UpdateGeneralTaskRequestObject(request_object.ValidRequestObject):
 class UpdateGeneralTaskUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         document_repository: DocumentRepository = Depends(DocumentRepository),
         general_task_repository: GeneralTaskRepository = Depends(GeneralTaskRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.general_task_repository = general_task_repository
         self.document_repository = document_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: UpdateGeneralTaskRequestObject):
@@ -84,8 +82,7 @@ class UpdateGeneralTaskUseCase(use_case.UseCase):
         general_task.reload()
 
         current_season = get_current_season_value()
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE,
                 endpoint=Endpoint.GENERAL_TASK,
@@ -1,11 +1,13 @@
 import math
-from typing import Optional, List
+from typing import Optional
 from fastapi import Depends
 from app.shared import request_object, use_case
-from app.domain.lecturer.entity import Lecturer, LecturerInDB, ManyLecturersInResponse
+from app.domain.lecturer.entity import Lecturer, ManyLecturersInResponse
 from app.domain.shared.entity import Pagination
-from app.models.lecturer import LecturerModel
 from app.infra.lecturer.lecturer_repository import LecturerRepository
+from app.shared.assembler import assemble, projection_of
+from app.models.lecturer import LecturerModel
+from app.shared.search import search_filter
 
 
 class ListLecturersRequestObject(request_object.ValidRequestObject):
@@ -41,28 +43,21 @@ class ListLecturersUseCase(use_case.UseCase):
     def process_request(self, req_object: ListLecturersRequestObject):
         match_pipeline = None
         if isinstance(req_object.search, str):
-            match_pipeline = {
-                "$match": {
-                    "$or": [
-                        {"full_name": {"$regex": req_object.search, "$options": "i"}},
-                        {"holy_name": {"$regex": req_object.search, "$options": "i"}},
-                    ]
-                }
-            }
-        lecturers: List[LecturerModel] = self.lecturer_repository.list(
+            conditions = search_filter(req_object.search, LecturerModel.search_fields)
+            match_pipeline = {"$match": conditions} if conditions else None
+        lecturers, total = self.lecturer_repository.list_paginated(
             page_size=req_object.page_size,
             page_index=req_object.page_index,
             sort=req_object.sort,
             match_pipeline=match_pipeline,
+            projection=projection_of(Lecturer),
         )
 
-        total = self.lecturer_repository.count_list(match_pipeline=match_pipeline)
-
         return ManyLecturersInResponse(
             pagination=Pagination(
                 total=total,
                 page_index=req_object.page_index,
                 total_pages=math.ceil(total / req_object.page_size),
             ),
-            data=[Lecturer(**LecturerInDB.model_validate(doc).model_dump()) for doc in lecturers],
+            data=[assemble(Lecturer, doc) for doc in lecturers],
         )
@@ -1,6 +1,6 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.models.lecturer import LecturerModel
 from app.shared import request_object, use_case, response_object
 
@@ -45,14 +45,12 @@ class UpdateLecturerRequestObject(request_object.ValidRequestObject):
 class UpdateLecturerUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         document_repository: DocumentRepository = Depends(DocumentRepository),
         lecturer_repository: LecturerRepository = Depends(LecturerRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.lecturer_repository = lecturer_repository
         self.document_repository = document_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: UpdateLecturerRequestObject):
@@ -66,8 +64,7 @@ class UpdateLecturerUseCase(use_case.UseCase):
         lecturer.reload()
 
         current_season = get_current_season_value()
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE,
                 endpoint=Endpoint.LECTURER,
@@ -1,5 +1,5 @@
 from datetime import timezone, datetime
-from fastapi import Depends, BackgroundTasks, HTTPException
+from fastapi import Depends, HTTPException
 from pydantic import ValidationError
 from app.shared import request_object, use_case, response_object
 from app.domain.manage_form.entity import (
@@ -43,13 +43,11 @@ class UpdateManageFormCommonRequestObject(request_object.ValidRequestObject):
 class UpdateManageFormCommonUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         subject_repository: SubjectRepository = Depends(SubjectRepository),
         manage_form_repository: ManageFormRepository = Depends(ManageFormRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.manage_form_repository = manage_form_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
         self.subject_repository = subject_repository
 
@@ -98,8 +96,7 @@ class UpdateManageFormCommonUseCase(use_case.UseCase):
             )
             if res:
                 doc.reload()
-                self.background_tasks.add_task(
-                    self.audit_log_repository.create,
+                self.audit_log_repository.enqueue(
                     AuditLogInDB(
                         type=AuditLogType.UPDATE,
                         endpoint=Endpoint.MANAGE_FORM,
@@ -157,8 +154,7 @@ class UpdateManageFormCommonUseCase(use_case.UseCase):
             doc = self.manage_form_repository.create(
                 ManageFormInDB(**req_object.payload.model_dump())
             )
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.CREATE,
                     endpoint=Endpoint.MANAGE_FORM,
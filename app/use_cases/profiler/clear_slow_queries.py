@@ -0,0 +1,8 @@
+from app.infra.metrics.slow_queries import slow_query_profiler
+from app.shared import use_case
+
+
+class ClearSlowQueriesUseCase(use_case.UseCase):
+    def process_request(self):
+        slow_query_profiler.clear()
+        return {"success": True}
@@ -0,0 +1,23 @@
+from typing import Optional
+
+from app.domain.profiler.entity import SlowQueriesReport, SlowQuery
+from app.infra.metrics.slow_queries import slow_query_profiler
+from app.shared import request_object, use_case
+
+
+class ListSlowQueriesRequestObject(request_object.ValidRequestObject):
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = limit
+
+    @classmethod
+    def builder(cls, limit: Optional[int] = None) -> request_object.RequestObject:
+        return ListSlowQueriesRequestObject(limit=limit)
+
+
+class ListSlowQueriesUseCase(use_case.UseCase):
+    def process_request(self, req_object: ListSlowQueriesRequestObject):
+        return SlowQueriesReport(
+            threshold_ms=slow_query_profiler.threshold_ms,
+            dropped=slow_query_profiler.dropped,
+            data=[SlowQuery(**entry) for entry in slow_query_profiler.report(req_object.limit)],
+        )
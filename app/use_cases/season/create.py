@@ -37,7 +37,6 @@ class CreateSeasonUseCase(use_case.UseCase):
             return response_object.ResponseFailure.build_parameters_error(
                 message="Năm học đã tồn tại"
             )
-        clear_all_cache()
         current_seasons: list[SeasonModel] = self.season_repository.list(
             match_pipeline={"$match": {"is_current": True}}
         )
@@ -49,5 +48,6 @@ class CreateSeasonUseCase(use_case.UseCase):
             is_current=True,
         )
         season: SeasonModel = self.season_repository.create(season=obj_in)
+        clear_all_cache()
 
         return Season(**SeasonInDB.model_validate(season).model_dump())
@@ -5,7 +5,7 @@ from app.shared import response_object, use_case
 from app.domain.season.entity import Season, SeasonInDB
 from app.infra.season.season_repository import SeasonRepository
 from app.models.season import SeasonModel
-from app.shared.utils.general import cache
+from app.infra.season.season_cache import season_cache
 
 
 class GetCurrentSeasonCase(use_case.UseCase):
@@ -13,14 +13,15 @@ class GetCurrentSeasonCase(use_case.UseCase):
         self.season_repository = season_repository
 
     def process_request(self):
-        if "season-detail" not in cache:
-            season: Optional[SeasonModel] = self.season_repository.get_current_season()
-            if not season:
-                return response_object.ResponseFailure.build_not_found_error(
-                    message="Không tồn tại"
-                )
+        season_detail: Optional[str] = season_cache.get("season-detail", self.load_season_detail)
+        if not season_detail:
+            return response_object.ResponseFailure.build_not_found_error(message="Không tồn tại")
+        return Season(**json.loads(season_detail))
 
-            cache["season-detail"] = json.dumps(
-                Season(**SeasonInDB.model_validate(season).model_dump()).model_dump(), default=str
-            )
-        return Season(**json.loads(cache["season-detail"]))
+    def load_season_detail(self) -> Optional[str]:
+        season: Optional[SeasonModel] = self.season_repository.get_current_season()
+        if not season:
+            return None
+        return json.dumps(
+            Season(**SeasonInDB.model_validate(season).model_dump()).model_dump(), default=str
+        )
@@ -1,9 +1,10 @@
 from typing import Optional, List
 from fastapi import Depends
 from app.shared import request_object, use_case
-from app.domain.season.entity import Season, SeasonInDB
+from app.domain.season.entity import Season
 from app.models.season import SeasonModel
 from app.infra.season.season_repository import SeasonRepository
+from app.shared.assembler import assemble
 
 
 class ListSeasonsRequestObject(request_object.ValidRequestObject):
@@ -35,4 +36,4 @@ class ListSeasonsUseCase(use_case.UseCase):
 
         seasons: List[SeasonModel] = self.season_repository.list(sort=req_object.sort)
 
-        return [Season(**SeasonInDB.model_validate(season).model_dump()) for season in seasons]
+        return [assemble(Season, season) for season in seasons]
@@ -26,7 +26,6 @@ class MarkCurrentSeasonUseCase(use_case.UseCase):
         self.season_repository = season_repository
 
     def process_request(self, req_object: MarkCurrentSeasonRequestObject):
-        clear_all_cache()
         season: Optional[SeasonModel] = self.season_repository.get_by_id(req_object.id)
         if not season:
             return response_object.ResponseFailure.build_not_found_error("Năm học không tồn tại")
@@ -38,6 +37,7 @@ class MarkCurrentSeasonUseCase(use_case.UseCase):
             self.season_repository.bulk_update(data={"is_current": False}, entities=current_seasons)
 
         self.season_repository.update(id=season.id, data=SeasonInUpdateTime(is_current=True))
+        clear_all_cache()
         season.reload()
 
         return Season(**SeasonInDB.model_validate(season).model_dump())
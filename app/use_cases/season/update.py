@@ -5,6 +5,7 @@ from app.shared import request_object, use_case, response_object
 
 from app.domain.season.entity import Season, SeasonInDB, SeasonInUpdate, SeasonInUpdateTime
 from app.infra.season.season_repository import SeasonRepository
+from app.shared.utils.general import clear_all_cache
 
 
 class UpdateSeasonRequestObject(request_object.ValidRequestObject):
@@ -41,6 +42,8 @@ class UpdateSeasonUseCase(use_case.UseCase):
         self.season_repository.update(
             id=season.id, data=SeasonInUpdateTime(**req_object.obj_in.model_dump())
         )
+        if season.is_current:
+            clear_all_cache()
         season.reload()
 
         return Season(**SeasonInDB.model_validate(season).model_dump())
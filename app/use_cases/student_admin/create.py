@@ -1,6 +1,6 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 
 from app.domain.shared.enum import AccountStatus
 from app.models.student import SeasonInfo, StudentModel
@@ -8,6 +8,7 @@ from app.shared import request_object, use_case, response_object
 
 from app.domain.student.entity import Student, StudentInCreate, StudentInDB, StudentSeason
 from app.infra.student.student_repository import StudentRepository
+from app.infra.security.principal_cache import principal_cache
 from app.infra.lecturer.lecturer_repository import LecturerRepository
 from app.models.admin import AdminModel
 from app.infra.audit_log.audit_log_repository import AuditLogRepository
@@ -40,14 +41,12 @@ class CreateStudentRequestObject(request_object.ValidRequestObject):
 class CreateStudentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         student_repository: StudentRepository = Depends(StudentRepository),
         lecturer_repository: LecturerRepository = Depends(LecturerRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.student_repository = student_repository
         self.lecturer_repository = lecturer_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: CreateStudentRequestObject):
@@ -81,6 +80,7 @@ class CreateStudentUseCase(use_case.UseCase):
 
             try:
                 existing_student.save()
+                principal_cache.invalidate(StudentModel, existing_student.email)
                 student = StudentInDB.model_validate(existing_student)
             except CustomException as e:
                 return response_object.ResponseFailure.build_parameters_error(message=str(e))
@@ -112,8 +112,7 @@ class CreateStudentUseCase(use_case.UseCase):
             #     email=student.email, password=password, full_name=student.full_name
             # )
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE if existing_student else AuditLogType.CREATE,
                 endpoint=Endpoint.STUDENT,
@@ -1,8 +1,9 @@
 import json
 from typing import Optional
 
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.infra.student.student_repository import StudentRepository
+from app.infra.security.principal_cache import principal_cache
 from app.shared import request_object, response_object, use_case
 from app.models.student import StudentModel
 from app.models.admin import AdminModel
@@ -33,12 +34,10 @@ class DeleteStudentRequestObject(request_object.ValidRequestObject):
 class DeleteStudentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         student_repository: StudentRepository = Depends(StudentRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.student_repository = student_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: DeleteStudentRequestObject):
@@ -49,8 +48,8 @@ class DeleteStudentUseCase(use_case.UseCase):
         current_season = get_current_season_value()
         try:
             self.student_repository.delete(id=req_object.id)
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            principal_cache.invalidate(StudentModel, student.email)
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.DELETE,
                     endpoint=Endpoint.STUDENT,
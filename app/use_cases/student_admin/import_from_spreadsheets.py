@@ -1,7 +1,9 @@
-from fastapi import Depends, BackgroundTasks, HTTPException
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+from fastapi import Depends, HTTPException
 import json
-from mongoengine import NotUniqueError
-from googleapiclient.discovery import build
+from bson import ObjectId
+from pymongo import InsertOne, ReplaceOne
 from googleapiclient.errors import HttpError
 from pydantic import ValidationError
 
@@ -17,6 +19,7 @@ from app.domain.student.entity import (
     StudentSeason,
 )
 from app.infra.student.student_repository import StudentRepository
+from app.infra.security.principal_cache import principal_cache
 from app.infra.lecturer.lecturer_repository import LecturerRepository
 from app.models.admin import AdminModel
 from app.infra.audit_log.audit_log_repository import AuditLogRepository
@@ -24,6 +27,7 @@ from app.domain.audit_log.entity import AuditLogInDB
 from app.domain.audit_log.enum import AuditLogType, Endpoint
 from app.infra.security.security_service import get_password_hash
 from app.infra.services.google_drive_api import GoogleDriveAPIService
+from app.infra.services.google_client_registry import google_api_client_registry
 from app.shared.utils.general import (
     convert_valid_date,
     copy_dict,
@@ -31,6 +35,7 @@ from app.shared.utils.general import (
     get_current_season_value,
 )
 from app.shared.constant import HEADER_IMPORT_STUDENT
+from app.shared.common_exception import CustomException
 from app.domain.student.enum import FieldStudentEnum
 from app.models.student import SeasonInfo, StudentModel
 from app.infra.tasks.email import (
@@ -39,6 +44,237 @@ from app.infra.tasks.email import (
 )
 
 LEN_HEADER_IMPORT_STUDENT = len(HEADER_IMPORT_STUDENT)
+DEFAULT_PASSWORD = "12345678"
+
+
+class StudentSpreadsheetImporter:
+    """
+    Import the rows of a spreadsheet with a constant number of round trips, whatever the number
+    of rows: existing students and the numerical orders of the season are fetched once, every
+    row is checked in memory, then the valid rows are written with unordered bulk writes.
+
+    Errors and attentions are reported per row exactly like a row by row import would.
+    Rows are written by batches of `batch_size`. `on_progress` is called once every row is
+    validated, then every `progress_interval` checked rows and after each batch, with the number
+    of rows processed, inserted, updated and in error so far.
+    """
+
+    def __init__(
+        self,
+        student_repository: StudentRepository,
+        batch_size: int = 500,
+        progress_interval: int = 50,
+        on_progress: Optional[Callable[[dict[str, int]], None]] = None,
+    ):
+        self.student_repository = student_repository
+        self.batch_size = batch_size
+        self.progress_interval = progress_interval
+        self.on_progress = on_progress
+
+    def import_rows(self, rows: list[dict], season: int) -> ImportSpreadsheetsInResponse:
+        """
+        :param rows: rows of the spreadsheet without the header, by HEADER_IMPORT_STUDENT key
+        :param season: season the students are imported in
+        """
+        errors: dict[int, str] = {}
+        attentions: dict[int, str] = {}
+        # row -> (email, is_update, operation)
+        writes: dict[int, tuple[str, bool, Any]] = {}
+
+        # the same default password for every new student: hash it once
+        # password = generate_random_password()
+        hashed_password = get_password_hash(DEFAULT_PASSWORD)
+
+        validated: list[tuple[int, dict, StudentInDB]] = []
+        for idx, data in enumerate(rows):
+            row = idx + 2
+            try:
+                data_copy = copy_dict(data)
+                seasons_info = StudentSeason(
+                    season=season,
+                    numerical_order=data_copy["numerical_order"],
+                    group=data_copy["group"],
+                )
+                del data_copy["numerical_order"]
+                del data_copy["group"]
+                student_in_db = StudentInDB(
+                    **data_copy,
+                    seasons_info=[seasons_info],
+                    password=hashed_password,
+                )
+                validated.append((row, data_copy, student_in_db))
+            except ValidationError as e:
+                errs = e.errors()
+                message = [
+                    (FieldStudentEnum[err["loc"][0]].value + ": " + err["msg"]) for err in errs
+                ]
+                errors[row] = "\n".join(message)
+            except Exception as e:
+                errors[row] = str(e)
+
+        students = self.student_repository.find_by_emails(
+            [student_in_db.email for _, _, student_in_db in validated]
+        )
+        numerical_orders = self.student_repository.get_numerical_orders(season)
+
+        progress = {"total": len(rows), "processed": 0, "inserted": 0, "updated": 0, "errors": 0}
+        # the invalid rows are already processed
+        processed = len(rows) - len(validated)
+        self.report_progress(progress, processed, errors)
+        pending: dict[int, tuple[str, bool, Any]] = {}
+        for i, (row, data_copy, student_in_db) in enumerate(validated):
+            try:
+                exist_std: StudentModel | None = students.get(student_in_db.email)
+                season_info = student_in_db.seasons_info[0]
+                new_season_info = SeasonInfo(
+                    numerical_order=season_info.numerical_order,
+                    group=season_info.group,
+                    season=season_info.season,
+                )
+
+                if exist_std:
+                    self.check_season_info(exist_std, new_season_info, numerical_orders)
+                    attentions_message = self.attentions_message(exist_std, student_in_db)
+
+                    exist_std.status = AccountStatus.ACTIVE
+                    exist_std.seasons_info.append(new_season_info)
+                    del data_copy["email"]
+                    for key in data_copy:
+                        value = getattr(student_in_db, key, None)
+                        if data_copy[key] is not None and value is not None:
+                            if hasattr(exist_std, key):
+                                setattr(exist_std, key, value)
+                    exist_std.updated_at = datetime.now(timezone.utc)
+                    exist_std.validate(clean=False)
+
+                    operation = ReplaceOne({"_id": exist_std.id}, exist_std.to_mongo())
+                    writes[row] = (exist_std.email, True, operation)
+                    numerical_orders[new_season_info.numerical_order] = exist_std.id
+                    if attentions_message:
+                        attentions[row] = attentions_message
+
+                    # send_email_welcome_with_exist_account_task.delay(
+                    #     email=exist_std.email, season=season, full_name=exist_std.full_name
+                    # )
+                else:
+                    new_std = StudentModel(**student_in_db.model_dump(exclude={"id"}))
+                    new_std.id = ObjectId()
+                    self.check_season_info(new_std, None, numerical_orders)
+                    new_std.validate(clean=False)
+
+                    writes[row] = (new_std.email, False, InsertOne(new_std.to_mongo()))
+                    numerical_orders[new_season_info.numerical_order] = new_std.id
+                    # a later row with the same email updates this student
+                    students[new_std.email] = new_std
+
+                    # send_email_welcome_task.delay(
+                    #     email=student_in_db.email,
+                    #     password=DEFAULT_PASSWORD,
+                    #     full_name=student_in_db.full_name,
+                    # )
+            except Exception as e:
+                errors[row] = str(e)
+
+            if row in writes:
+                pending[row] = writes[row]
+            if len(pending) >= self.batch_size or i == len(validated) - 1:
+                self.write(pending, errors)
+                for written_row, (_, is_update, _) in pending.items():
+                    if written_row not in errors:
+                        progress["updated" if is_update else "inserted"] += 1
+                pending = {}
+                self.report_progress(progress, processed + i + 1, errors)
+            elif (i + 1) % self.progress_interval == 0:
+                self.report_progress(progress, processed + i + 1, errors)
+
+        inserteds: list[str] = []
+        updated: list[str] = []
+        for row, (email, is_update, _) in sorted(writes.items()):
+            if row in errors:
+                attentions.pop(row, None)
+                continue
+            if is_update:
+                updated.append(email)
+            else:
+                inserteds.append(email)
+        # bumps the accounts version, the api processes drop their cached students too
+        principal_cache.invalidate(StudentModel, *updated)
+
+        return ImportSpreadsheetsInResponse(
+            errors=[ErrorImport(row=row, detail=detail) for row, detail in sorted(errors.items())],
+            inserteds=inserteds,
+            updated=updated,
+            attentions=[
+                AttentionImport(row=row, detail=detail)
+                for row, detail in sorted(attentions.items())
+            ],
+        )
+
+    def report_progress(self, progress: dict[str, int], processed: int, errors: dict) -> None:
+        if self.on_progress is None:
+            return
+        progress["processed"] = processed
+        progress["errors"] = len(errors)
+        self.on_progress(dict(progress))
+
+    def write(self, writes: dict[int, tuple[str, bool, Any]], errors: dict[int, str]) -> None:
+        """Bulk write every valid row, the rows of failed operations are moved to errors"""
+        rows = list(writes.keys())
+        try:
+            write_errors = self.student_repository.bulk_write([op for _, _, op in writes.values()])
+        except Exception as e:
+            for row in rows:
+                errors[row] = str(e)
+            return
+
+        for write_error in write_errors:
+            row = rows[write_error["index"]]
+            email = writes[row][0]
+            if write_error.get("code") == 11000 and "email" in write_error.get("errmsg", ""):
+                errors[row] = f"Email đã tồn tại. ({email})"
+            else:
+                errors[row] = write_error.get("errmsg", "")
+
+    def check_season_info(
+        self,
+        student: StudentModel,
+        season_info: SeasonInfo | None,
+        numerical_orders: dict[int, ObjectId],
+    ) -> None:
+        """
+        Same rules as StudentModel.clean, checked in memory against the prefetched numerical
+        orders of the season instead of one query per season
+        """
+        seasons_info = [*student.seasons_info, *([season_info] if season_info else [])]
+        seen_seasons = set()
+        for info in seasons_info:
+            if info.season in seen_seasons:
+                raise CustomException(
+                    f"Học viên này ({student.email}) đã đăng ký mùa {info.season}."
+                )
+            seen_seasons.add(info.season)
+
+        info = season_info if season_info else student.seasons_info[0]
+        owner = numerical_orders.get(info.numerical_order)
+        if owner is not None and owner != student.id:
+            raise CustomException(
+                f"Đã tồn tại một học viên khác có MSHV {info.numerical_order} "
+                f"ở mùa {info.season}."
+            )
+
+    def attentions_message(self, exist_std: StudentModel, student_in_db: StudentInDB) -> str:
+        attentions_message = ""
+        if exist_std.full_name != student_in_db.full_name:
+            attentions_message += (
+                f"Họ tên từ {exist_std.full_name} đã thay đổi " + f"thành {student_in_db.full_name}"
+            )
+        if convert_valid_date(exist_std.date_of_birth) != student_in_db.date_of_birth:
+            attentions_message += ". " if attentions_message else ""
+            attentions_message += (
+                f"Ngày sinh từ {convert_valid_date(exist_std.date_of_birth)} "
+                + f"đã thay đổi thành {student_in_db.date_of_birth}"
+            )
+        return attentions_message
 
 
 class ImportSpreadsheetsStudentRequestObject(request_object.ValidRequestObject):
@@ -63,7 +299,6 @@ class ImportSpreadsheetsStudentRequestObject(request_object.ValidRequestObject):
 class ImportSpreadsheetsStudentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         student_repository: StudentRepository = Depends(StudentRepository),
         lecturer_repository: LecturerRepository = Depends(LecturerRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
@@ -71,7 +306,6 @@ class ImportSpreadsheetsStudentUseCase(use_case.UseCase):
     ):
         self.student_repository = student_repository
         self.lecturer_repository = lecturer_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
         self.google_drive_service = google_drive_service
 
@@ -81,9 +315,8 @@ class ImportSpreadsheetsStudentUseCase(use_case.UseCase):
         sheet_name: str,
     ) -> list[str]:
         id = extract_id_spreadsheet_from_url(url)
-        creds = self.google_drive_service._creds
         try:
-            service = build("sheets", "v4", credentials=creds)
+            service = google_api_client_registry.get_service("sheets", "v4")
             data = service.spreadsheets().values().get(spreadsheetId=id, range=sheet_name).execute()
         except HttpError as e:
             if e.resp.status == 404:
@@ -103,125 +336,55 @@ class ImportSpreadsheetsStudentUseCase(use_case.UseCase):
             for i in range(LEN_HEADER_IMPORT_STUDENT)
         }
 
-    def process_request(self, req_object: ImportSpreadsheetsStudentRequestObject):
-        data_import = self.get_data_from_spreadsheet(
-            url=req_object.payload.url, sheet_name=req_object.payload.sheet_name
-        )
+    def import_spreadsheet(
+        self,
+        url: str,
+        sheet_name: str,
+        season: int,
+        on_progress: Optional[Callable[[dict[str, int]], None]] = None,
+    ) -> ImportSpreadsheetsInResponse | response_object.ResponseFailure:
+        data_import = self.get_data_from_spreadsheet(url=url, sheet_name=sheet_name)
 
         if HEADER_IMPORT_STUDENT != data_import.pop(0):
             return response_object.ResponseFailure.build_parameters_error(
                 "Header của file import không hợp lệ"
             )
 
-        updated: list[str] = []
-        inserteds: list[str] = []
-        errors: list[ErrorImport] = []
-        attentions: list[AttentionImport] = []
-
-        current_season = get_current_season_value()
-        for idx, row in enumerate(data_import):
-            data = self.convert_value_spreadsheet_to_dict(row)
-            try:
-                data_copy = copy_dict(data)
-                seasons_info = StudentSeason(
-                    season=current_season,
-                    numerical_order=data_copy["numerical_order"],
-                    group=data_copy["group"],
-                )
-                del data_copy["numerical_order"]
-                del data_copy["group"]
-                password = "12345678"
-                # password = generate_random_password()
-                student_in_db = StudentInDB(
-                    **data_copy,
-                    seasons_info=[seasons_info],
-                    password=get_password_hash(password),
-                )
-
-                exist_std: StudentModel | None = self.student_repository.find_one(
-                    {"email": student_in_db.email}
-                )
-                if exist_std:
-                    attentions_message = ""
-                    if exist_std.full_name != student_in_db.full_name:
-                        attentions_message += (
-                            f"Họ tên từ {exist_std.full_name} đã thay đổi "
-                            + f"thành {student_in_db.full_name}"
-                        )
-                    if convert_valid_date(exist_std.date_of_birth) != student_in_db.date_of_birth:
-                        attentions_message += ". " if attentions_message else ""
-                        attentions_message += (
-                            f"Ngày sinh từ {convert_valid_date(exist_std.date_of_birth)} "
-                            + f"đã thay đổi thành {student_in_db.date_of_birth}"
-                        )
-
-                    exist_std.status = AccountStatus.ACTIVE
-
-                    exist_std.seasons_info.append(
-                        SeasonInfo(
-                            numerical_order=seasons_info.numerical_order,
-                            group=seasons_info.group,
-                            season=seasons_info.season,
-                        )
-                    )
-
-                    del data_copy["email"]
-                    for key, value in data_copy.items():
-                        if value is not None:
-                            if hasattr(exist_std, key):
-                                setattr(exist_std, key, value)
-
-                    exist_std.save()
-                    updated.append(exist_std.email)
-                    if attentions_message:
-                        attentions.append(AttentionImport(row=idx + 2, detail=attentions_message))
-
-                    # send_email_welcome_with_exist_account_task.delay(
-                    #     email=exist_std.email, season=current_season, full_name=exist_std.full_name
-                    # )
-
-                else:
-                    inserted: StudentInDB = self.student_repository.create(student_in_db)
-                    inserteds.append(inserted.email)
+        importer = StudentSpreadsheetImporter(
+            student_repository=self.student_repository, on_progress=on_progress
+        )
+        return importer.import_rows(
+            rows=[self.convert_value_spreadsheet_to_dict(row) for row in data_import],
+            season=season,
+        )
 
-                    # send_email_welcome_task.delay(
-                    #     email=student_in_db.email,
-                    #     password=password,
-                    #     full_name=student_in_db.full_name,
-                    # )
-            except NotUniqueError:
-                errors.append(
-                    ErrorImport(
-                        row=idx + 2,
-                        detail=f"Email đã tồn tại. ({data.get('email')})",
-                    )
-                )
-            except ValidationError as e:
-                errs = e.errors()
-                message = [
-                    (FieldStudentEnum[err["loc"][0]].value + ": " + err["msg"]) for err in errs
-                ]
-                message = "\n".join(message)
-                errors.append(ErrorImport(row=idx + 2, detail=message))
-            except Exception as e:
-                errors.append(ErrorImport(row=idx + 2, detail=str(e)))
+    def build_audit_log(
+        self, response: ImportSpreadsheetsInResponse, current_admin: AdminModel, season: int
+    ) -> AuditLogInDB:
+        return AuditLogInDB(
+            type=AuditLogType.IMPORT,
+            endpoint=Endpoint.STUDENT,
+            season=season,
+            author=current_admin,
+            author_email=current_admin.email,
+            author_name=current_admin.full_name,
+            author_roles=current_admin.roles,
+            description=json.dumps(response, default=str, ensure_ascii=False),
+        )
 
-        response = ImportSpreadsheetsInResponse(
-            errors=errors, inserteds=inserteds, updated=updated, attentions=attentions
+    def process_request(self, req_object: ImportSpreadsheetsStudentRequestObject):
+        current_season = get_current_season_value()
+        response = self.import_spreadsheet(
+            url=req_object.payload.url,
+            sheet_name=req_object.payload.sheet_name,
+            season=current_season,
         )
-        if inserteds or attentions:
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
-                AuditLogInDB(
-                    type=AuditLogType.IMPORT,
-                    endpoint=Endpoint.STUDENT,
-                    season=current_season,
-                    author=req_object.current_admin,
-                    author_email=req_object.current_admin.email,
-                    author_name=req_object.current_admin.full_name,
-                    author_roles=req_object.current_admin.roles,
-                    description=json.dumps(response, default=str, ensure_ascii=False),
-                ),
+        if isinstance(response, response_object.ResponseFailure):
+            return response
+
+        if response.inserteds or response.attentions:
+            self.audit_log_repository.enqueue(
+                self.build_audit_log(response, req_object.current_admin, current_season),
             )
 
         return response
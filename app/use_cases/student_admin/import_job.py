@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+from fastapi import Depends
+from typing import Optional
+from app.config import settings
+from app.shared import request_object, response_object, use_case
+from app.domain.student.entity import ImportJob, ImportJobInDB, ImportSpreadsheetsPayload
+from app.domain.student.enum import ImportJobStatus
+from app.infra.student.import_job_repository import ImportJobRepository
+from app.infra.tasks.import_student import import_students_from_spreadsheet_task
+from app.models.admin import AdminModel
+from app.models.import_job import ImportJobModel
+from app.shared.utils.general import get_current_season_value
+
+
+class CreateImportJobRequestObject(request_object.ValidRequestObject):
+    def __init__(self, current_admin: AdminModel, payload: ImportSpreadsheetsPayload) -> None:
+        self.payload = payload
+        self.current_admin = current_admin
+
+    @classmethod
+    def builder(
+        cls, current_admin: AdminModel, payload: ImportSpreadsheetsPayload
+    ) -> request_object.RequestObject:
+        invalid_req = request_object.InvalidRequestObject()
+        if not isinstance(payload.url, str):
+            invalid_req.add_error("url", "Invalid url")
+
+        if invalid_req.has_errors():
+            return invalid_req
+
+        return CreateImportJobRequestObject(payload=payload, current_admin=current_admin)
+
+
+class CreateImportJobUseCase(use_case.UseCase):
+    def __init__(
+        self,
+        import_job_repository: ImportJobRepository = Depends(ImportJobRepository),
+    ):
+        self.import_job_repository = import_job_repository
+
+    def process_request(self, req_object: CreateImportJobRequestObject):
+        job: ImportJobModel = self.import_job_repository.create(
+            ImportJobInDB(
+                url=req_object.payload.url,
+                sheet_name=req_object.payload.sheet_name,
+                season=get_current_season_value(),
+                author=req_object.current_admin,
+            )
+        )
+        import_students_from_spreadsheet_task.delay(job_id=str(job.id))
+
+        return ImportJob(**ImportJobInDB.model_validate(job).model_dump(exclude={"author"}))
+
+
+class GetImportJobRequestObject(request_object.ValidRequestObject):
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+
+    @classmethod
+    def builder(cls, job_id: str) -> request_object.RequestObject:
+        return GetImportJobRequestObject(job_id=job_id)
+
+
+class GetImportJobUseCase(use_case.UseCase):
+    def __init__(
+        self,
+        import_job_repository: ImportJobRepository = Depends(ImportJobRepository),
+    ):
+        self.import_job_repository = import_job_repository
+
+    def process_request(self, req_object: GetImportJobRequestObject):
+        job: Optional[ImportJobModel] = self.import_job_repository.get_by_id(req_object.job_id)
+        if not job:
+            return response_object.ResponseFailure.build_not_found_error(
+                message="Tiến trình import không tồn tại"
+            )
+
+        import_job = ImportJob(**ImportJobInDB.model_validate(job).model_dump(exclude={"author"}))
+        if self.is_stale(import_job):
+            # the worker died or was killed, the job will never be done
+            import_job.status = ImportJobStatus.FAILED
+            import_job.detail = "Tiến trình import bị gián đoạn, vui lòng import lại"
+        return import_job
+
+    @staticmethod
+    def is_stale(job: ImportJob) -> bool:
+        if job.status != ImportJobStatus.RUNNING:
+            return False
+        heartbeat_at = job.heartbeat_at or job.started_at or job.updated_at
+        if heartbeat_at is None:
+            return False
+        if heartbeat_at.tzinfo is None:
+            heartbeat_at = heartbeat_at.replace(tzinfo=timezone.utc)
+        stale_after = timedelta(seconds=settings.IMPORT_JOB_STALE_AFTER)
+        return datetime.now(timezone.utc) - heartbeat_at > stale_after
@@ -1,16 +1,20 @@
 import math
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any
 from fastapi import Depends
-from app.shared import request_object, use_case
-from app.domain.student.entity import (
-    ManyStudentsInResponse,
-    Student,
-    StudentInDB,
-)
+from app.shared import request_object, use_case, response_object
+from app.domain.student.entity import ManyStudentsInResponse, Student
 from app.domain.shared.entity import Pagination
-from app.models.student import StudentModel
+from app.infra.shared.pagination import InvalidCursorError
 from app.infra.student.student_repository import StudentRepository
+from app.shared.assembler import assemble, projection_of
 from app.shared.utils.general import get_current_season_value
+from app.models.student import StudentModel
+from app.shared.search import search_filter
+
+# cursor pages seek on the ("seasons_info.season", "-created_at", "-id") index. The numerical
+# order and group of the listed season are one element of the seasons_info array: mongo sorts an
+# array by its smallest or largest element, whatever the season, so no index can back them
+CURSOR_SORT_KEYS = ("created_at",)
 
 
 class ListStudentsRequestObject(request_object.ValidRequestObject):
@@ -22,9 +26,11 @@ class ListStudentsRequestObject(request_object.ValidRequestObject):
         group: int | None = None,
         sort: Optional[dict[str, int]] = None,
         season: int | None = None,
+        cursor: Optional[str] = None,
     ):
         self.page_index = page_index
         self.page_size = page_size
+        self.cursor = cursor
         self.search = search
         self.sort = sort
         self.group = group
@@ -39,10 +45,12 @@ class ListStudentsRequestObject(request_object.ValidRequestObject):
         sort: Optional[dict[str, int]] = None,
         group: int | None = None,
         season: int | None = None,
+        cursor: Optional[str] = None,
     ):
         return ListStudentsRequestObject(
             page_index=page_index,
             page_size=page_size,
+            cursor=cursor,
             search=search,
             group=group,
             sort=sort,
@@ -59,17 +67,13 @@ class ListStudentsUseCase(use_case.UseCase):
 
     def process_request(self, req_object: ListStudentsRequestObject):
         current_season = get_current_season_value()
+        season = current_season if not req_object.season else req_object.season
 
-        match_pipeline: Optional[Dict[str, Any]] = {
-            "seasons_info.season": current_season if not req_object.season else req_object.season
-        }
+        match_pipeline: Optional[Dict[str, Any]] = {"seasons_info.season": season}
 
         if isinstance(req_object.search, str):
             pipeline_search = [
-                {"email": {"$regex": req_object.search, "$options": "i"}},
-                {"full_name": {"$regex": req_object.search, "$options": "i"}},
-                {"holy_name": {"$regex": req_object.search, "$options": "i"}},
-                {"diocese": {"$regex": req_object.search, "$options": "i"}},
+                search_filter(req_object.search, StudentModel.search_fields) or {},
             ]
             num = None
             try:
@@ -86,20 +90,39 @@ class ListStudentsUseCase(use_case.UseCase):
         if isinstance(req_object.group, int):
             match_pipeline = {**match_pipeline, "seasons_info.group": req_object.group}
 
-        students: List[StudentModel] = self.student_repository.list(
-            page_size=req_object.page_size,
-            page_index=req_object.page_index,
-            sort=req_object.sort,
-            match_pipeline=match_pipeline,
-        )
-
-        total = self.student_repository.count_list(match_pipeline=match_pipeline)
+        next_cursor: str | None = None
+        if req_object.cursor is not None:
+            if req_object.sort and not set(req_object.sort) <= set(CURSOR_SORT_KEYS):
+                return response_object.ResponseFailure.build_parameters_error(
+                    "Phân trang bằng cursor chỉ hỗ trợ sắp xếp theo created_at."
+                )
+            try:
+                students, total, next_cursor = self.student_repository.list_by_cursor(
+                    cursor=req_object.cursor,
+                    page_size=req_object.page_size,
+                    sort=req_object.sort,
+                    match_pipeline=match_pipeline,
+                    projection=projection_of(Student),
+                )
+            except InvalidCursorError:
+                return response_object.ResponseFailure.build_parameters_error(
+                    "Cursor không hợp lệ."
+                )
+        else:
+            students, total = self.student_repository.list_paginated(
+                page_size=req_object.page_size,
+                page_index=req_object.page_index,
+                sort=req_object.sort,
+                match_pipeline=match_pipeline,
+                projection=projection_of(Student),
+            )
 
         return ManyStudentsInResponse(
             pagination=Pagination(
                 total=total,
-                page_index=req_object.page_index,
+                page_index=req_object.page_index if req_object.cursor is None else None,
                 total_pages=math.ceil(total / req_object.page_size),
+                next_cursor=next_cursor,
             ),
-            data=[Student(**StudentInDB.model_validate(model).model_dump()) for model in students],
+            data=[assemble(Student, model) for model in students],
         )
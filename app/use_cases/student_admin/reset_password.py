@@ -1,9 +1,10 @@
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 import json
 from typing import Optional
 from app.shared import request_object, response_object, use_case
 from app.domain.student.entity import ResetPasswordResponse
 from app.infra.student.student_repository import StudentRepository
+from app.infra.security.principal_cache import principal_cache
 from app.models.student import StudentModel
 from app.infra.audit_log.audit_log_repository import AuditLogRepository
 from app.domain.audit_log.entity import AuditLogInDB
@@ -33,12 +34,10 @@ class ResetPasswordStudentRequestObject(request_object.ValidRequestObject):
 class ResetPasswordStudentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         student_repository: StudentRepository = Depends(StudentRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.student_repository = student_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: ResetPasswordStudentRequestObject):
@@ -55,9 +54,9 @@ class ResetPasswordStudentUseCase(use_case.UseCase):
         self.student_repository.update(
             id=student.id, data={"password": get_password_hash(password)}
         )
+        principal_cache.invalidate(StudentModel, student.email)
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE,
                 endpoint=Endpoint.STUDENT,
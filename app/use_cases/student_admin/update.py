@@ -1,12 +1,13 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.models.student import StudentModel
 from app.shared import request_object, use_case, response_object
 from mongoengine import NotUniqueError
 
 from app.domain.student.entity import Student, StudentInDB, StudentInUpdate
 from app.infra.student.student_repository import StudentRepository
+from app.infra.security.principal_cache import principal_cache
 from app.models.admin import AdminModel
 from app.infra.audit_log.audit_log_repository import AuditLogRepository
 from app.domain.audit_log.entity import AuditLogInDB
@@ -40,18 +41,17 @@ class UpdateStudentRequestObject(request_object.ValidRequestObject):
 class UpdateStudentUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         student_repository: StudentRepository = Depends(StudentRepository),
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.student_repository = student_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: UpdateStudentRequestObject):
         student: Optional[StudentModel] = self.student_repository.get_by_id(req_object.id)
         if not student:
             return response_object.ResponseFailure.build_not_found_error("Học viên không tồn tại")
+        email = student.email
 
         current_season = get_current_season_value()
 
@@ -77,9 +77,9 @@ class UpdateStudentUseCase(use_case.UseCase):
             return response_object.ResponseFailure.build_parameters_error(message=e)
         except Exception as e:
             raise e
+        principal_cache.invalidate(StudentModel, email, student.email)
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE,
                 endpoint=Endpoint.STUDENT,
@@ -0,0 +1,81 @@
+from fastapi import Depends
+from starlette.concurrency import run_in_threadpool
+
+from app.shared import response_object, use_case
+from app.domain.subject.entity import SubjectInDB
+from app.infra.subject.async_subject_repository import AsyncSubjectRepository
+from app.models.subject import SubjectModel
+from app.shared.utils.general import get_current_season_value
+from app.infra.manage_form.async_manage_form_repository import AsyncManageFormRepository
+from app.models.manage_form import ManageFormModel
+from app.domain.manage_form.enum import FormType
+from app.domain.absent.entity import AbsentInDB, StudentAbsentInResponse
+from app.infra.absent.async_absent_repository import AsyncAbsentRepository
+from app.infra.shared.bulk_dereference import AsyncBulkDereferencer
+from app.domain.lecturer.entity import LecturerInDB
+from app.models.absent import AbsentModel
+from app.domain.subject.subject_evaluation.entity import LecturerInEvaluation, SubjectInEvaluation
+from app.use_cases.absent.create import (
+    CreateAbsentRequestObject,
+    check_absent_form,
+    create_absent_failure,
+)
+
+
+class CreateAbsentStudentUseCase(use_case.AsyncUseCase):
+    """
+    Async `CreateAbsentUseCase` of the student endpoint, the student sends the absent
+    through the absent form
+    """
+
+    def __init__(
+        self,
+        manage_form_repository: AsyncManageFormRepository = Depends(AsyncManageFormRepository),
+        subject_repository: AsyncSubjectRepository = Depends(AsyncSubjectRepository),
+        absent_repository: AsyncAbsentRepository = Depends(AsyncAbsentRepository),
+        dereferencer: AsyncBulkDereferencer = Depends(AsyncBulkDereferencer),
+    ):
+        self.absent_repository = absent_repository
+        self.subject_repository = subject_repository
+        self.manage_form_repository = manage_form_repository
+        self.dereferencer = dereferencer
+
+    async def process_request(self, req_object: CreateAbsentRequestObject):
+        current_season: int = await run_in_threadpool(get_current_season_value)
+        subject: SubjectModel | None = await self.subject_repository.get_by_id(
+            req_object.subject_id
+        )
+        if subject is None or subject.season != current_season:
+            return response_object.ResponseFailure.build_not_found_error(
+                message="Môn học không tồn tại hoặc thuộc mùa cũ."
+            )
+
+        form_absent: ManageFormModel | None = await self.manage_form_repository.find_by_type(
+            FormType.SUBJECT_ABSENT
+        )
+        failure = check_absent_form(form_absent, req_object.subject_id)
+        if failure is not None:
+            return failure
+
+        try:
+            absent: AbsentModel = await self.absent_repository.create(
+                AbsentInDB(
+                    student=req_object.current_student,
+                    subject=subject,
+                    reason=req_object.reason,
+                    note=req_object.note,
+                )
+            )
+        except Exception as ex:
+            return create_absent_failure(ex)
+        await self.dereferencer.dereference([subject], "lecturer")
+
+        return StudentAbsentInResponse(
+            **AbsentInDB.model_validate(absent).model_dump(exclude={"student", "subject"}),
+            subject=SubjectInEvaluation(
+                **SubjectInDB.model_validate(absent.subject).model_dump(exclude=({"lecturer"})),
+                lecturer=LecturerInEvaluation(
+                    **LecturerInDB.model_validate(absent.subject.lecturer).model_dump()
+                ),
+            ),
+        )
@@ -1,15 +1,16 @@
 import math
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any
 from fastapi import Depends
 from app.shared import request_object, response_object, use_case
 from app.domain.student.entity import (
     ManyStudentsInStudentRequestResponse,
-    StudentInDB,
     StudentInStudentRequestResponse,
 )
 from app.domain.shared.entity import Pagination
 from app.models.student import StudentModel
 from app.infra.student.student_repository import StudentRepository
+from app.shared.assembler import assemble, projection_of
+from app.shared.search import search_filter
 
 
 class ListStudentsInStudentRequestObject(request_object.ValidRequestObject):
@@ -89,9 +90,12 @@ class ListStudentsInStudentRequestUseCase(use_case.UseCase):
 
         if isinstance(req_object.search, str):
             pipeline_search = [
-                {"full_name": {"$regex": req_object.search, "$options": "i"}},
-                {"holy_name": {"$regex": req_object.search, "$options": "i"}},
-                {"diocese": {"$regex": req_object.search, "$options": "i"}},
+                search_filter(
+                    req_object.search,
+                    StudentModel.search_fields,
+                    fields=("full_name", "holy_name", "diocese"),
+                )
+                or {},
             ]
             num = None
             try:
@@ -108,15 +112,14 @@ class ListStudentsInStudentRequestUseCase(use_case.UseCase):
         if isinstance(req_object.group, int):
             match_pipeline = {**match_pipeline, "seasons_info.group": req_object.group}
 
-        students: List[StudentModel] = self.student_repository.list(
+        students, total = self.student_repository.list_paginated(
             page_size=req_object.page_size,
             page_index=req_object.page_index,
             sort=req_object.sort,
             match_pipeline=match_pipeline,
+            projection=projection_of(StudentInStudentRequestResponse, "seasons_info"),
         )
 
-        total = self.student_repository.count_list(match_pipeline=match_pipeline)
-
         return ManyStudentsInStudentRequestResponse(
             pagination=Pagination(
                 total=total,
@@ -124,12 +127,18 @@ class ListStudentsInStudentRequestUseCase(use_case.UseCase):
                 total_pages=math.ceil(total / req_object.page_size),
             ),
             data=[
-                StudentInStudentRequestResponse(
-                    **StudentInDB.model_validate(model).model_dump(exclude={"seasons_info"}),
+                assemble(
+                    StudentInStudentRequestResponse,
+                    student,
                     season_info=next(
-                        (item for item in model.seasons_info if item.season == select_season), None
+                        (
+                            item
+                            for item in student["seasons_info"]
+                            if item["season"] == select_season
+                        ),
+                        None,
                     ),
                 )
-                for model in students
+                for student in students
             ],
         )
@@ -1,19 +1,22 @@
+from typing import Optional
 from fastapi import Depends
 
 from app.domain.auth.entity import LoginRequest, TokenData, AuthStudentInfoInResponse
 from app.domain.student.entity import StudentGetMeResponse, StudentInDB
 from app.models.student import StudentModel
-from app.infra.security.security_service import verify_password, create_access_token
-from app.infra.student.student_repository import StudentRepository
+from app.infra.security.login_throttle import login_throttle
+from app.infra.security.security_service import verify_password_async, create_access_token
+from app.infra.student.async_student_repository import AsyncStudentRepository
 from app.shared import request_object, use_case, response_object
 
 
 class LoginStudentRequestObject(request_object.ValidRequestObject):
-    def __init__(self, login_payload: LoginRequest):
+    def __init__(self, login_payload: LoginRequest, client_ip: Optional[str] = None):
         self.login_payload = login_payload
+        self.client_ip = client_ip
 
     @classmethod
-    def builder(cls, login_payload: LoginRequest):
+    def builder(cls, login_payload: LoginRequest, client_ip: Optional[str] = None):
         invalid_req = request_object.InvalidRequestObject()
         if not login_payload:
             invalid_req.add_error("login_payload", "Invalid")
@@ -21,22 +24,32 @@ class LoginStudentRequestObject(request_object.ValidRequestObject):
         if invalid_req.has_errors():
             return invalid_req
 
-        return LoginStudentRequestObject(login_payload=login_payload)
+        return LoginStudentRequestObject(login_payload=login_payload, client_ip=client_ip)
 
 
-class LoginStudentUseCase(use_case.UseCase):
+class LoginStudentUseCase(use_case.AsyncUseCase):
     def __init__(
         self,
-        student_repository: StudentRepository = Depends(StudentRepository),
+        student_repository: AsyncStudentRepository = Depends(AsyncStudentRepository),
     ):
         self.student_repository = student_repository
 
-    def process_request(self, req_object: LoginStudentRequestObject):
-        student: StudentModel = self.student_repository.get_by_email(req_object.login_payload.email)
+    async def process_request(self, req_object: LoginStudentRequestObject):
+        if login_throttle.blocked(req_object.login_payload.email, req_object.client_ip):
+            return response_object.ResponseFailure.build_too_many_requests_error(
+                message="Bạn đã đăng nhập sai quá nhiều lần, vui lòng thử lại sau"
+            )
+        student: StudentModel = await self.student_repository.get_by_email(
+            req_object.login_payload.email
+        )
         checker = False
         if student:
-            checker = verify_password(req_object.login_payload.password, student.password)
+            # bcrypt is cpu bound, hashed by the password hasher processes
+            checker = await verify_password_async(
+                req_object.login_payload.password, student.password
+            )
         if not student or not checker:
+            login_throttle.failed(req_object.login_payload.email, req_object.client_ip)
             return response_object.ResponseFailure.build_parameters_error(
                 message="Sai email hoặc mật khẩu"
             )
@@ -47,6 +60,7 @@ class LoginStudentUseCase(use_case.UseCase):
                 message="Tài khoản của bạn đã bị khóa"
             )
 
+        login_throttle.succeeded(req_object.login_payload.email)
         access_token = create_access_token(data=TokenData(email=student.email, id=str(student.id)))
         return AuthStudentInfoInResponse(
             access_token=access_token, user=StudentGetMeResponse(**student_in_db.model_dump())
@@ -5,6 +5,7 @@ from app.domain.auth.entity import UpdatePassword
 from app.models.student import StudentModel
 from app.infra.security.security_service import get_password_hash, verify_password
 from app.infra.student.student_repository import StudentRepository
+from app.infra.security.principal_cache import principal_cache
 from app.shared import request_object, use_case, response_object
 
 
@@ -47,6 +48,7 @@ class UpdateStudentPasswordUseCase(use_case.UseCase):
             },
         )
         if res:
+            principal_cache.invalidate(StudentModel, req_object.current_student.email)
             return {"success": True}
         else:
             return response_object.ResponseFailure.build_system_error(
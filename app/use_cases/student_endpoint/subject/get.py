@@ -3,6 +3,7 @@ from typing import Optional
 from app.shared import request_object, response_object, use_case
 from app.domain.subject.entity import SubjectInDB, SubjectInStudent
 from app.infra.subject.subject_repository import SubjectRepository
+from app.infra.shared.bulk_dereference import CachedBulkDereferencer
 from app.models.subject import SubjectModel
 from app.domain.lecturer.entity import LecturerInDB, LecturerInStudent
 from app.domain.document.entity import DocumentInDB, DocumentInStudent
@@ -25,17 +26,23 @@ class GetSubjectStudentRequestObject(request_object.ValidRequestObject):
 
 
 class GetSubjectStudentCase(use_case.UseCase):
-    def __init__(self, subject_repository: SubjectRepository = Depends(SubjectRepository)):
+    def __init__(
+        self,
+        subject_repository: SubjectRepository = Depends(SubjectRepository),
+        dereferencer: CachedBulkDereferencer = Depends(CachedBulkDereferencer),
+    ):
         self.subject_repository = subject_repository
+        self.dereferencer = dereferencer
 
     def process_request(self, req_object: GetSubjectStudentRequestObject):
-        subject: Optional[SubjectModel] = self.subject_repository.get_by_id(
+        subject: Optional[SubjectModel] = self.subject_repository.get_by_id_cached(
             subject_id=req_object.subject_id
         )
         if not subject:
             return response_object.ResponseFailure.build_not_found_error(
                 message="Môn học không tồn tại"
             )
+        self.dereferencer.dereference([subject], "lecturer", "attachments")
 
         return SubjectInStudent(
             **SubjectInDB.model_validate(subject).model_dump(exclude=({"lecturer", "attachments"})),
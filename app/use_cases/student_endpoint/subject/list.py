@@ -3,7 +3,8 @@ from fastapi import Depends
 from app.shared import request_object, response_object, use_case
 from app.domain.subject.entity import SubjectInDB, SubjectInStudent
 from app.models.subject import SubjectModel
-from app.infra.subject.subject_repository import SubjectRepository
+from app.infra.subject.async_subject_repository import AsyncSubjectRepository
+from app.infra.shared.bulk_dereference import AsyncBulkDereferencer
 from app.domain.lecturer.entity import LecturerInDB, LecturerInStudent
 from app.models.student import StudentModel
 from app.domain.document.entity import DocumentInDB, DocumentInStudent
@@ -47,11 +48,16 @@ class ListSubjectsStudentRequestObject(request_object.ValidRequestObject):
         )
 
 
-class ListSubjectsStudentUseCase(use_case.UseCase):
-    def __init__(self, subject_repository: SubjectRepository = Depends(SubjectRepository)):
+class ListSubjectsStudentUseCase(use_case.AsyncUseCase):
+    def __init__(
+        self,
+        subject_repository: AsyncSubjectRepository = Depends(AsyncSubjectRepository),
+        dereferencer: AsyncBulkDereferencer = Depends(AsyncBulkDereferencer),
+    ):
         self.subject_repository = subject_repository
+        self.dereferencer = dereferencer
 
-    def process_request(self, req_object: ListSubjectsStudentRequestObject):
+    async def process_request(self, req_object: ListSubjectsStudentRequestObject):
         if req_object.season:
             exists = any(
                 season.season == req_object.season
@@ -80,9 +86,10 @@ class ListSubjectsStudentUseCase(use_case.UseCase):
         if isinstance(req_object.status, list):
             match_pipeline = {**match_pipeline, "status": {"$in": req_object.status}}
 
-        subjects: List[SubjectModel] = self.subject_repository.list(
+        subjects: List[SubjectModel] = await self.subject_repository.list(
             sort=req_object.sort, match_pipeline=match_pipeline
         )
+        await self.dereferencer.dereference(subjects, "lecturer", "attachments")
 
         return [
             SubjectInStudent(
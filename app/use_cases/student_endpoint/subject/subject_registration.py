@@ -46,8 +46,8 @@ class SubjectRegistrationStudentCase(use_case.UseCase):
         self.manage_form_repository = manage_form_repository
 
     def process_request(self, req_object: SubjectRegistrationStudentRequestObject):
-        form_subject_registration: ManageFormModel | None = self.manage_form_repository.find_one(
-            {"type": FormType.SUBJECT_REGISTRATION}
+        form_subject_registration: ManageFormModel | None = (
+            self.manage_form_repository.find_by_type(FormType.SUBJECT_REGISTRATION)
         )
 
         if not form_subject_registration or form_subject_registration.status == FormStatus.INACTIVE:
@@ -1,12 +1,13 @@
 from fastapi import Depends
+from starlette.concurrency import run_in_threadpool
 from bson import ObjectId
 from app.shared import request_object, response_object, use_case
 from app.domain.subject.entity import SubjectInDB
-from app.infra.subject.subject_repository import SubjectRepository
+from app.infra.subject.async_subject_repository import AsyncSubjectRepository
 from app.models.subject import SubjectModel
 from app.models.student import StudentModel
 from app.shared.utils.general import get_current_season_value
-from app.infra.manage_form.manage_form_repository import ManageFormRepository
+from app.infra.manage_form.async_manage_form_repository import AsyncManageFormRepository
 from app.models.manage_form import ManageFormModel
 from app.domain.manage_form.enum import FormStatus, FormType
 from app.domain.subject.subject_evaluation.entity import (
@@ -17,12 +18,15 @@ from app.domain.subject.subject_evaluation.entity import (
     SubjectEvaluationStudent,
     SubjectInEvaluation,
 )
-from app.infra.subject.subject_evaluation_repository import SubjectEvaluationRepository
+from app.infra.subject.async_subject_evaluation_repository import (
+    AsyncSubjectEvaluationRepository,
+)
+from app.infra.shared.bulk_dereference import AsyncBulkDereferencer
 from app.domain.manage_form.entity import ManageFormEvaluationOrAbsent
 from app.domain.lecturer.entity import LecturerInDB
 from app.models.subject_evaluation import SubjectEvaluationModel, SubjectEvaluationQuestionModel
-from app.infra.subject.subject_evaluation_question_repository import (
-    SubjectEvaluationQuestionRepository,
+from app.infra.subject.async_subject_evaluation_question_repository import (
+    AsyncSubjectEvaluationQuestionRepository,
 )
 
 
@@ -50,42 +54,51 @@ class UpdateSubjectEvaluationRequestObject(request_object.ValidRequestObject):
         )
 
 
-class UpdateSubjectEvaluationUseCase(use_case.UseCase):
+class UpdateSubjectEvaluationUseCase(use_case.AsyncUseCase):
     def __init__(
         self,
-        manage_form_repository: ManageFormRepository = Depends(ManageFormRepository),
-        subject_repository: SubjectRepository = Depends(SubjectRepository),
-        subject_evaluation_question_repository: SubjectEvaluationQuestionRepository = Depends(
-            SubjectEvaluationQuestionRepository
+        manage_form_repository: AsyncManageFormRepository = Depends(AsyncManageFormRepository),
+        subject_repository: AsyncSubjectRepository = Depends(AsyncSubjectRepository),
+        subject_evaluation_question_repository: AsyncSubjectEvaluationQuestionRepository = Depends(
+            AsyncSubjectEvaluationQuestionRepository
         ),
-        subject_evaluation_repository: SubjectEvaluationRepository = Depends(
-            SubjectEvaluationRepository
+        subject_evaluation_repository: AsyncSubjectEvaluationRepository = Depends(
+            AsyncSubjectEvaluationRepository
         ),
+        dereferencer: AsyncBulkDereferencer = Depends(AsyncBulkDereferencer),
     ):
         self.subject_evaluation_repository = subject_evaluation_repository
         self.subject_repository = subject_repository
         self.manage_form_repository = manage_form_repository
         self.subject_evaluation_question_repository = subject_evaluation_question_repository
+        self.dereferencer = dereferencer
 
-    def process_request(self, req_object: UpdateSubjectEvaluationRequestObject):
-        current_season: int = get_current_season_value()
-        subject: SubjectModel | None = self.subject_repository.get_by_id(req_object.subject_id)
+    async def process_request(self, req_object: UpdateSubjectEvaluationRequestObject):
+        current_season: int = await run_in_threadpool(get_current_season_value)
+        subject: SubjectModel | None = await self.subject_repository.get_by_id(
+            req_object.subject_id
+        )
         if subject is None or subject.season != current_season:
             return response_object.ResponseFailure.build_not_found_error(
                 message="Môn học không tồn tại hoặc thuộc mùa cũ."
             )
 
-        subject_evaluation: SubjectEvaluationModel = self.subject_evaluation_repository.find_one(
-            {"student": req_object.current_student.id, "subject": ObjectId(req_object.subject_id)}
+        subject_evaluation: SubjectEvaluationModel = (
+            await self.subject_evaluation_repository.find_one(
+                {
+                    "student": req_object.current_student.id,
+                    "subject": ObjectId(req_object.subject_id),
+                }
+            )
         )
         if not subject_evaluation:
             return response_object.ResponseFailure.build_not_found_error(
                 message="Lượng giá không tồn tại"
             )
 
-        form_subject_evaluation: ManageFormModel | None = self.manage_form_repository.find_one(
-            {"type": FormType.SUBJECT_EVALUATION}
-        )
+        form_subject_evaluation: (
+            ManageFormModel | None
+        ) = await self.manage_form_repository.find_by_type(FormType.SUBJECT_EVALUATION)
         if not form_subject_evaluation or form_subject_evaluation.status == FormStatus.INACTIVE:
             return response_object.ResponseFailure.build_system_error(message="Form chưa được mở.")
         if form_subject_evaluation.status == FormStatus.CLOSED:
@@ -101,7 +114,7 @@ class UpdateSubjectEvaluationUseCase(use_case.UseCase):
 
         if req_object.payload.answers:
             subject_evaluation_question: SubjectEvaluationQuestionModel = (
-                self.subject_evaluation_question_repository.get_by_subject_id(
+                await self.subject_evaluation_question_repository.get_by_subject_id(
                     subject_id=req_object.subject_id
                 )
             )
@@ -115,11 +128,14 @@ class UpdateSubjectEvaluationUseCase(use_case.UseCase):
                     "Câu trả lời không hợp lệ."
                 )
 
-        self.subject_evaluation_repository.update(
+        await self.subject_evaluation_repository.update(
             id=subject_evaluation.id,
             data=SubjectEvaluationInUpdateTime(**req_object.payload.model_dump()),
         )
-        subject_evaluation.reload()
+        subject_evaluation = await self.subject_evaluation_repository.find_one(
+            {"_id": subject_evaluation.id}
+        )
+        await self.dereferencer.dereference([subject_evaluation], "subject.lecturer")
 
         return SubjectEvaluationStudent(
             **SubjectEvaluationInDB.model_validate(subject_evaluation).model_dump(
@@ -1,7 +1,7 @@
 import json
 from typing import Optional
 
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.infra.subject.subject_repository import SubjectRepository
 from app.shared import request_object, response_object, use_case
 from app.models.subject import SubjectModel
@@ -36,7 +36,6 @@ class DeleteSubjectRequestObject(request_object.ValidRequestObject):
 class DeleteSubjectUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         subject_repository: SubjectRepository = Depends(SubjectRepository),
         subject_registration_repository: SubjectRegistrationRepository = Depends(
             SubjectRegistrationRepository
@@ -44,7 +43,6 @@ class DeleteSubjectUseCase(use_case.UseCase):
         audit_log_repository: AuditLogRepository = Depends(AuditLogRepository),
     ):
         self.subject_repository = subject_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
         self.subject_registration_repository = subject_registration_repository
 
@@ -69,8 +67,7 @@ class DeleteSubjectUseCase(use_case.UseCase):
 
         try:
             self.subject_repository.delete(id=subject.id)
-            self.background_tasks.add_task(
-                self.audit_log_repository.create,
+            self.audit_log_repository.enqueue(
                 AuditLogInDB(
                     type=AuditLogType.DELETE,
                     endpoint=Endpoint.SUBJECT,
@@ -1,14 +1,15 @@
 from typing import Optional, List
 from fastapi import Depends
 from app.shared import request_object, use_case, response_object
-from app.domain.subject.entity import Subject, SubjectInDB
+from app.domain.subject.entity import Subject
 from app.models.subject import SubjectModel
 from app.infra.subject.subject_repository import SubjectRepository
-from app.domain.lecturer.entity import Lecturer, LecturerInDB
+from app.infra.shared.bulk_dereference import BulkDereferencer
+from app.domain.lecturer.entity import Lecturer
 from app.shared.utils.general import get_current_season_value
+from app.shared.assembler import assemble
 from app.models.admin import AdminModel
-from app.domain.document.entity import AdminInDocument, Document, DocumentInDB
-from app.domain.admin.entity import AdminInDB
+from app.domain.document.entity import AdminInDocument, Document
 from app.domain.shared.enum import AdminRole
 from app.domain.subject.enum import StatusSubjectEnum
 
@@ -51,8 +52,13 @@ class ListSubjectsRequestObject(request_object.ValidRequestObject):
 
 
 class ListSubjectsUseCase(use_case.UseCase):
-    def __init__(self, subject_repository: SubjectRepository = Depends(SubjectRepository)):
+    def __init__(
+        self,
+        subject_repository: SubjectRepository = Depends(SubjectRepository),
+        dereferencer: BulkDereferencer = Depends(BulkDereferencer),
+    ):
         self.subject_repository = subject_repository
+        self.dereferencer = dereferencer
 
     def process_request(self, req_object: ListSubjectsRequestObject):
         current_season = get_current_season_value()
@@ -90,18 +96,15 @@ class ListSubjectsUseCase(use_case.UseCase):
         subjects: List[SubjectModel] = self.subject_repository.list(
             sort=req_object.sort, match_pipeline=match_pipeline
         )
+        self.dereferencer.dereference(subjects, "lecturer", "attachments.author")
 
         return [
-            Subject(
-                **SubjectInDB.model_validate(subject).model_dump(
-                    exclude=({"lecturer", "attachments"})
-                ),
-                lecturer=Lecturer(**LecturerInDB.model_validate(subject.lecturer).model_dump()),
+            assemble(
+                Subject,
+                subject,
+                lecturer=assemble(Lecturer, subject.lecturer),
                 attachments=[
-                    Document(
-                        **DocumentInDB.model_validate(doc).model_dump(exclude=({"author"})),
-                        author=AdminInDocument(**AdminInDB.model_validate(doc.author).model_dump()),
-                    )
+                    assemble(Document, doc, author=assemble(AdminInDocument, doc.author))
                     for doc in subject.attachments
                 ],
             )
@@ -1,6 +1,6 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 from app.models.subject import SubjectModel
 from app.shared import request_object, use_case, response_object
 
@@ -48,7 +48,6 @@ class UpdateSubjectRequestObject(request_object.ValidRequestObject):
 class UpdateSubjectUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         lecturer_repository: LecturerRepository = Depends(LecturerRepository),
         document_repository: DocumentRepository = Depends(DocumentRepository),
         subject_repository: SubjectRepository = Depends(SubjectRepository),
@@ -56,7 +55,6 @@ class UpdateSubjectUseCase(use_case.UseCase):
     ):
         self.lecturer_repository = lecturer_repository
         self.subject_repository = subject_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
         self.document_repository = document_repository
 
@@ -109,8 +107,7 @@ class UpdateSubjectUseCase(use_case.UseCase):
         )
         subject.reload()
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.UPDATE,
                 endpoint=Endpoint.SUBJECT,
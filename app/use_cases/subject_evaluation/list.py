@@ -1,25 +1,25 @@
 from fastapi import Depends
 from app.shared import request_object, use_case, response_object
-from app.domain.subject.entity import SubjectInDB
 from app.domain.subject.subject_evaluation.entity import (
     LecturerInEvaluation,
     ManySubjectEvaluationAdminInResponse,
     StudentInEvaluation,
     SubjectEvaluationAdmin,
-    SubjectEvaluationInDB,
     SubjectInEvaluation,
 )
 from app.infra.subject.subject_evaluation_repository import SubjectEvaluationRepository
-from app.domain.lecturer.entity import LecturerInDB
-from app.models.subject_evaluation import SubjectEvaluationModel
+from app.infra.shared.bulk_dereference import BulkDereferencer
+from app.infra.shared.pagination import InvalidCursorError
 from app.shared.utils.general import get_current_season_value
+from app.shared.assembler import assemble, projection_of
 from app.models.subject import SubjectModel
+from app.models.subject_evaluation import SubjectEvaluationModel
 from app.infra.subject.subject_repository import SubjectRepository
 from app.domain.shared.entity import Pagination
 import math
-from app.domain.student.entity import StudentInDB
 from app.infra.student.student_repository import StudentRepository
 from app.models.student import StudentModel
+from app.shared.search import search_filter
 
 
 class ListSubjectEvaluationRequestObject(request_object.ValidRequestObject):
@@ -30,9 +30,11 @@ class ListSubjectEvaluationRequestObject(request_object.ValidRequestObject):
         sort: str,
         subject_id: str,
         search: str | None = None,
+        cursor: str | None = None,
     ):
         self.page_index = page_index
         self.page_size = page_size
+        self.cursor = cursor
         self.sort = sort
         self.subject_id = subject_id
         self.search = search
@@ -45,10 +47,12 @@ class ListSubjectEvaluationRequestObject(request_object.ValidRequestObject):
         sort: str,
         subject_id: str,
         search: str | None = None,
+        cursor: str | None = None,
     ) -> request_object.RequestObject:
         return ListSubjectEvaluationRequestObject(
             page_index=page_index,
             page_size=page_size,
+            cursor=cursor,
             search=search,
             sort=sort,
             subject_id=subject_id,
@@ -63,7 +67,9 @@ class ListSubjectEvaluationUseCase(use_case.UseCase):
             SubjectEvaluationRepository
         ),
         subject_repository: SubjectRepository = Depends(SubjectRepository),
+        dereferencer: BulkDereferencer = Depends(BulkDereferencer),
     ):
+        self.dereferencer = dereferencer
         self.subject_evaluation_repository = subject_evaluation_repository
         self.subject_repository = subject_repository
         self.student_repository = student_repository
@@ -86,50 +92,74 @@ class ListSubjectEvaluationUseCase(use_case.UseCase):
             students: list[StudentModel] = self.student_repository.list(
                 match_pipeline={
                     "$or": [
-                        {"full_name": {"$regex": req_object.search, "$options": "i"}},
+                        search_filter(
+                            req_object.search, StudentModel.search_fields, fields=("full_name",)
+                        )
+                        or {},
                         {"numerical_order": numerical_order},
                     ]
                 },
                 page_size=100,
+                projection={"_id": 1},
             )
             match_pipeline = {
                 **match_pipeline,
                 "student": {"$in": [student.id for student in students]},
             }
 
-        docs: list[SubjectEvaluationModel] = self.subject_evaluation_repository.list(
-            match_pipeline=match_pipeline,
-            sort=req_object.sort,
-            page_size=req_object.page_size,
-            page_index=req_object.page_index,
+        next_cursor: str | None = None
+        if req_object.cursor is not None:
+            try:
+                docs, total, next_cursor = self.subject_evaluation_repository.list_by_cursor(
+                    cursor=req_object.cursor,
+                    match_pipeline=match_pipeline,
+                    projection=projection_of(SubjectEvaluationAdmin),
+                    sort=req_object.sort,
+                    page_size=req_object.page_size,
+                )
+            except InvalidCursorError:
+                return response_object.ResponseFailure.build_parameters_error(
+                    "Cursor không hợp lệ."
+                )
+        else:
+            docs, total = self.subject_evaluation_repository.list_paginated(
+                match_pipeline=match_pipeline,
+                projection=projection_of(SubjectEvaluationAdmin),
+                sort=req_object.sort,
+                page_size=req_object.page_size,
+                page_index=req_object.page_index,
+            )
+        self.dereferencer.dereference_records(
+            SubjectEvaluationModel,
+            docs,
+            "student",
+            "subject.lecturer",
+            projections={
+                "student": projection_of(StudentInEvaluation),
+                "subject": projection_of(SubjectInEvaluation),
+                "subject.lecturer": projection_of(LecturerInEvaluation),
+            },
         )
 
-        total = self.subject_evaluation_repository.count_list(match_pipeline=match_pipeline)
-
         return ManySubjectEvaluationAdminInResponse(
             pagination=Pagination(
                 total=total,
-                page_index=req_object.page_index,
+                page_index=req_object.page_index if req_object.cursor is None else None,
                 total_pages=math.ceil(total / req_object.page_size),
+                next_cursor=next_cursor,
             ),
             data=[
-                SubjectEvaluationAdmin(
-                    **SubjectEvaluationInDB.model_validate(subject_evaluation).model_dump(
-                        exclude={"student", "subject"}
-                    ),
-                    subject=SubjectInEvaluation(
-                        **SubjectInDB.model_validate(subject_evaluation.subject).model_dump(
-                            exclude=({"lecturer"})
-                        ),
-                        lecturer=LecturerInEvaluation(
-                            **LecturerInDB.model_validate(
-                                subject_evaluation.subject.lecturer
-                            ).model_dump()
+                assemble(
+                    SubjectEvaluationAdmin,
+                    subject_evaluation,
+                    subject=assemble(
+                        SubjectInEvaluation,
+                        subject_evaluation["subject"],
+                        lecturer=assemble(
+                            LecturerInEvaluation, subject_evaluation["subject"]["lecturer"]
                         ),
                     ),
-                    student=StudentInEvaluation(
-                        **StudentInDB.model_validate(subject_evaluation.student).model_dump()
-                    ),
+                    student=assemble(StudentInEvaluation, subject_evaluation["student"]),
                 )
                 for subject_evaluation in docs
             ],
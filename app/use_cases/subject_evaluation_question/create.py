@@ -1,6 +1,6 @@
 import json
 from typing import Optional
-from fastapi import Depends, BackgroundTasks
+from fastapi import Depends
 
 from app.shared import request_object, use_case, response_object
 
@@ -52,7 +52,6 @@ class CreateSubjectEvaluationQuestionRequestObject(request_object.ValidRequestOb
 class CreateSubjectEvaluationQuestionUseCase(use_case.UseCase):
     def __init__(
         self,
-        background_tasks: BackgroundTasks,
         subject_evaluation_question_repository: SubjectEvaluationQuestionRepository = Depends(
             SubjectEvaluationQuestionRepository
         ),
@@ -61,7 +60,6 @@ class CreateSubjectEvaluationQuestionUseCase(use_case.UseCase):
     ):
         self.subject_repository = subject_repository
         self.subject_evaluation_question_repository = subject_evaluation_question_repository
-        self.background_tasks = background_tasks
         self.audit_log_repository = audit_log_repository
 
     def process_request(self, req_object: CreateSubjectEvaluationQuestionRequestObject):
@@ -86,8 +84,7 @@ class CreateSubjectEvaluationQuestionUseCase(use_case.UseCase):
             self.subject_evaluation_question_repository.create(doc=obj_in)
         )
 
-        self.background_tasks.add_task(
-            self.audit_log_repository.create,
+        self.audit_log_repository.enqueue(
             AuditLogInDB(
                 type=AuditLogType.CREATE,
                 endpoint=Endpoint.SUBJECT_EVALUATION_QUESTION,
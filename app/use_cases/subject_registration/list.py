@@ -3,6 +3,8 @@ from typing import Optional, Any
 from app.shared import request_object, use_case
 from app.infra.student.student_repository import StudentRepository
 from app.shared.utils.general import get_current_season_value
+from app.models.student import StudentModel
+from app.shared.search import search_filter
 
 
 class ListSubjectRegistrationsRequestObject(request_object.ValidRequestObject):
@@ -47,10 +49,7 @@ class ListSubjectRegistrationsUseCase(use_case.UseCase):
             match_pipeline = {
                 **match_pipeline,
                 "$or": [
-                    {"email": {"$regex": req_object.search, "$options": "i"}},
-                    {"full_name": {"$regex": req_object.search, "$options": "i"}},
-                    {"holy_name": {"$regex": req_object.search, "$options": "i"}},
-                    {"diocese": {"$regex": req_object.search, "$options": "i"}},
+                    search_filter(req_object.search, StudentModel.search_fields) or {},
                     {"numerical_order": req_object.search},
                 ],
             }
@@ -0,0 +1,54 @@
+"""
+Compare the read path of the list endpoints, from the raw documents returned by pymongo to the
+response entities: `Model.from_mongo` + `assemble` against `to_records` + `assemble`.
+
+Run from the project root (settings are read from .env):
+    python -m benchmarks.read_path [rows] [repeat]
+"""
+
+import sys
+import timeit
+from typing import Any, Callable, Dict, List
+
+from app.domain.student.entity import Student
+from app.infra.shared.records import to_records
+from app.models.student import StudentModel
+from app.shared.assembler import assemble
+from benchmarks.response_assembly import student
+
+
+def sons(rows: int) -> List[Dict[str, Any]]:
+    return [student(i).to_mongo().to_dict() for i in range(rows)]
+
+
+def from_documents(docs: List[Dict[str, Any]]) -> List[Student]:
+    return [assemble(Student, StudentModel.from_mongo(dict(doc))) for doc in docs]
+
+
+def from_records(docs: List[Dict[str, Any]]) -> List[Student]:
+    return [assemble(Student, record) for record in to_records(StudentModel, map(dict, docs))]
+
+
+def bench(rows: int, repeat: int) -> None:
+    docs = sons(rows)
+    assert [s.model_dump() for s in from_documents(docs)] == [
+        s.model_dump() for s in from_records(docs)
+    ]
+
+    results = {}
+    convert: Callable[[List[Dict[str, Any]]], List[Student]]
+    for label, convert in (("from_mongo", from_documents), ("to_records", from_records)):
+        best = min(timeit.repeat(lambda: convert(docs), number=repeat, repeat=5))
+        results[label] = best / repeat * 1000
+    speedup = results["from_mongo"] / results["to_records"]
+    print(
+        f"{'Student':<24} {rows:>5} rows  "
+        f"from_mongo {results['from_mongo']:8.3f} ms  "
+        f"to_records {results['to_records']:8.3f} ms  x{speedup:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    bench(rows, repeat)
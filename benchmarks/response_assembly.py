@@ -0,0 +1,260 @@
+"""
+Compare the assembly of list responses from mongoengine documents: the former
+`X(**XInDB.model_validate(doc).model_dump())` path against `assemble`.
+
+Run from the project root (settings are read from .env):
+    python -m benchmarks.response_assembly [rows] [repeat]
+"""
+
+import sys
+import timeit
+from datetime import date, datetime, timezone
+from typing import Callable, List
+
+from bson import ObjectId
+from mongoengine import Document
+from pydantic import BaseModel
+
+from app.domain.admin.entity import AdminInDB
+from app.domain.document.entity import AdminInDocument, Document as DocumentEntity, DocumentInDB
+from app.domain.general_task.entity import AdminInGeneralTask, GeneralTask, GeneralTaskInDB
+from app.domain.lecturer.entity import LecturerInDB
+from app.domain.student.entity import Student, StudentInDB
+from app.domain.subject.entity import SubjectInDB
+from app.domain.subject.subject_evaluation.entity import (
+    LecturerInEvaluation,
+    StudentInEvaluation,
+    SubjectEvaluationAdmin,
+    SubjectEvaluationInDB,
+    SubjectInEvaluation,
+)
+from app.models.admin import AdminModel
+from app.models.document import DocumentModel
+from app.models.general_task import GeneralTaskModel
+from app.models.lecturer import LecturerModel
+from app.models.student import SeasonInfo, StudentModel
+from app.models.subject import SubjectModel
+from app.models.subject_evaluation import QualityDocument, SubjectEvaluationModel
+from app.shared.assembler import assemble
+
+NOW = datetime(2024, 5, 1, 8, 30, tzinfo=timezone.utc)
+
+
+def student(i: int) -> StudentModel:
+    return StudentModel(
+        id=ObjectId(),
+        seasons_info=[
+            SeasonInfo(numerical_order=i, group=i % 10, season=season) for season in (2, 3)
+        ],
+        email=f"student{i}@example.com",
+        holy_name="Phêrô",
+        full_name=f"nguyễn văn học viên {i}",
+        sex="Nam",
+        date_of_birth=date(1999, 1, 1),
+        origin_address="Huế",
+        diocese="Huế",
+        phone_number="0913741085",
+        password="$2b$12$PFWUkb1ot1Rv6jJ9YwGBi.Ln/RDVqpLfI9gKlPIJj5DTfDXWw5tbS",
+        education="Đại học",
+        job="Đang đi làm",
+        status="active",
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def students(rows: int) -> List[StudentModel]:
+    return [student(i) for i in range(rows)]
+
+
+def general_tasks(rows: int) -> List[GeneralTaskModel]:
+    # an admin role keeps `active` away from the current season lookup
+    author = AdminModel(
+        id=ObjectId(),
+        email="admin@example.com",
+        status="active",
+        roles=["admin"],
+        full_name="Nguyễn Thành Tâm",
+        holy_name="Phêrô",
+        password="$2b$12$PFWUkb1ot1Rv6jJ9YwGBi.Ln/RDVqpLfI9gKlPIJj5DTfDXWw5tbS",
+        latest_season=3,
+        seasons=[3],
+        created_at=NOW,
+        updated_at=NOW,
+    )
+    attachment = DocumentModel(
+        id=ObjectId(),
+        file_id="1CI0A9IUb5AzhJAiRzuFNsMXALT",
+        mimeType="application/vnd.google-apps.document",
+        name="Tài liệu",
+        role="bhv",
+        type="common",
+        season=3,
+        author=author,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+    return [
+        GeneralTaskModel(
+            id=ObjectId(),
+            title=f"Công việc {i}",
+            short_desc="Mô tả ngắn",
+            description="Mô tả chi tiết của công việc " * 10,
+            start_at=date(2024, 5, 1),
+            end_at=date(2024, 6, 1),
+            season=3,
+            role="bhv",
+            type="common",
+            label=["label1", "label2"],
+            author=author,
+            attachments=[attachment],
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        for i in range(rows)
+    ]
+
+
+def subject_evaluations(rows: int) -> List[SubjectEvaluationModel]:
+    lecturer = LecturerModel(
+        id=ObjectId(), title="Linh mục", holy_name="Phêrô", full_name="Nguyễn Văn A", seasons=[3]
+    )
+    subject = SubjectModel(
+        id=ObjectId(),
+        title="Kinh Thánh",
+        start_at=date(2024, 5, 1),
+        subdivision="Kinh Thánh",
+        lecturer=lecturer,
+        code="Y2.1",
+        status="init",
+        season=3,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+    return [
+        SubjectEvaluationModel(
+            id=ObjectId(),
+            student=student(i),
+            subject=subject,
+            quality=QualityDocument(
+                focused_right_topic="Đồng ý",
+                practical_content="Đồng ý",
+                benefit_in_life="Hoàn toàn đồng ý",
+                duration="Trung lập",
+                method="Đồng ý",
+            ),
+            most_resonated="Điều tâm đắc nhất " * 5,
+            invited="Lời mời gọi " * 5,
+            feedback_lecturer="Góp ý cho giảng viên " * 5,
+            satisfied=5,
+            answers=["Câu trả lời 1", ["Lựa chọn 1", "Lựa chọn 2"], "Câu trả lời 3"],
+            numerical_order=i,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        for i in range(rows)
+    ]
+
+
+def student_before(doc: StudentModel) -> Student:
+    return Student(**StudentInDB.model_validate(doc).model_dump())
+
+
+def student_after(doc: StudentModel) -> Student:
+    return assemble(Student, doc)
+
+
+def general_task_before(task: GeneralTaskModel) -> GeneralTask:
+    author: AdminInDB = AdminInDB.model_validate(task.author)
+    return GeneralTask(
+        **GeneralTaskInDB.model_validate(task).model_dump(exclude=({"author", "attachments"})),
+        author=AdminInGeneralTask(**author.model_dump(), active=author.active()),
+        attachments=[
+            DocumentEntity(
+                **DocumentInDB.model_validate(doc).model_dump(exclude=({"author"})),
+                author=AdminInDocument(
+                    **AdminInDB.model_validate(doc.author).model_dump(), active=author.active()
+                ),
+            )
+            for doc in task.attachments
+        ],
+    )
+
+
+def general_task_after(task: GeneralTaskModel) -> GeneralTask:
+    active = AdminInDB.model_validate(task.author).active()
+    return assemble(
+        GeneralTask,
+        task,
+        author=assemble(AdminInGeneralTask, task.author, active=active),
+        attachments=[
+            assemble(
+                DocumentEntity, doc, author=assemble(AdminInDocument, doc.author, active=active)
+            )
+            for doc in task.attachments
+        ],
+    )
+
+
+def subject_evaluation_before(ev: SubjectEvaluationModel) -> SubjectEvaluationAdmin:
+    return SubjectEvaluationAdmin(
+        **SubjectEvaluationInDB.model_validate(ev).model_dump(exclude={"student", "subject"}),
+        subject=SubjectInEvaluation(
+            **SubjectInDB.model_validate(ev.subject).model_dump(exclude=({"lecturer"})),
+            lecturer=LecturerInEvaluation(
+                **LecturerInDB.model_validate(ev.subject.lecturer).model_dump()
+            ),
+        ),
+        student=StudentInEvaluation(**StudentInDB.model_validate(ev.student).model_dump()),
+    )
+
+
+def subject_evaluation_after(ev: SubjectEvaluationModel) -> SubjectEvaluationAdmin:
+    return assemble(
+        SubjectEvaluationAdmin,
+        ev,
+        subject=assemble(
+            SubjectInEvaluation,
+            ev.subject,
+            lecturer=assemble(LecturerInEvaluation, ev.subject.lecturer),
+        ),
+        student=assemble(StudentInEvaluation, ev.student),
+    )
+
+
+def bench(
+    name: str,
+    build: Callable[[int], List[Document]],
+    before: Callable[[Document], BaseModel],
+    after: Callable[[Document], BaseModel],
+    rows: int,
+    repeat: int,
+) -> None:
+    docs = build(rows)
+    assert [before(doc).model_dump() for doc in docs] == [after(doc).model_dump() for doc in docs]
+
+    results = {}
+    for label, convert in (("model_dump", before), ("assemble", after)):
+        best = min(timeit.repeat(lambda: [convert(doc) for doc in docs], number=repeat, repeat=5))
+        results[label] = best / repeat * 1000
+    speedup = results["model_dump"] / results["assemble"]
+    print(
+        f"{name:<24} {rows:>5} rows  "
+        f"model_dump {results['model_dump']:8.3f} ms  "
+        f"assemble {results['assemble']:8.3f} ms  x{speedup:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    bench("Student", students, student_before, student_after, rows, repeat)
+    bench("GeneralTask", general_tasks, general_task_before, general_task_after, rows, repeat)
+    bench(
+        "SubjectEvaluationAdmin",
+        subject_evaluations,
+        subject_evaluation_before,
+        subject_evaluation_after,
+        rows,
+        repeat,
+    )
@@ -0,0 +1,182 @@
+"""
+Compare the rendering of list responses by `response_decorator`: the former
+`jsonable_encoder` + `JSONResponse` path against `render_json`.
+
+Run from the project root (settings are read from .env):
+    python -m benchmarks.response_rendering [rows] [repeat]
+"""
+
+import json
+import sys
+import timeit
+from datetime import date, datetime, timezone
+from typing import Callable
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+from app.domain.document.entity import AdminInDocument, Document
+from app.domain.general_task.entity import (
+    AdminInGeneralTask,
+    GeneralTask,
+    ManyGeneralTasksInResponse,
+)
+from app.domain.shared.entity import Pagination
+from app.domain.student.entity import ManyStudentsInResponse, Student, StudentSeason
+from app.shared.serialization import render_json
+from app.domain.subject.subject_evaluation.entity import (
+    LecturerInEvaluation,
+    ManySubjectEvaluationAdminInResponse,
+    Quality,
+    StudentInEvaluation,
+    SubjectEvaluationAdmin,
+    SubjectInEvaluation,
+)
+
+NOW = datetime(2024, 5, 1, 8, 30, tzinfo=timezone.utc)
+
+
+def many_students(rows: int) -> ManyStudentsInResponse:
+    return ManyStudentsInResponse(
+        pagination=Pagination(total=rows * 3, page_index=1, total_pages=3),
+        data=[
+            Student(
+                id=str(ObjectId()),
+                holy_name="Phêrô",
+                full_name=f"Nguyễn Văn Học Viên {i}",
+                email=f"student{i}@example.com",
+                sex="Nam",
+                date_of_birth=date(1999, 1, 1),
+                origin_address="Huế",
+                diocese="Huế",
+                phone_number="0913741085",
+                education="Đại học",
+                job="Đang đi làm",
+                seasons_info=[
+                    StudentSeason(numerical_order=i, group=i % 10, season=season)
+                    for season in (2, 3)
+                ],
+                created_at=NOW,
+                updated_at=NOW,
+            )
+            for i in range(rows)
+        ],
+    )
+
+
+def many_general_tasks(rows: int) -> ManyGeneralTasksInResponse:
+    author = {"id": str(ObjectId()), "full_name": "Nguyễn Thành Tâm", "active": True}
+    return ManyGeneralTasksInResponse(
+        pagination=Pagination(total=rows, page_index=1, total_pages=1),
+        data=[
+            GeneralTask(
+                id=str(ObjectId()),
+                title=f"Công việc {i}",
+                short_desc="Mô tả ngắn",
+                description="Mô tả chi tiết của công việc " * 10,
+                start_at=date(2024, 5, 1),
+                end_at=date(2024, 6, 1),
+                role="bhv",
+                label=["label1", "label2"],
+                type="common",
+                author=AdminInGeneralTask(**author),
+                season=3,
+                attachments=[
+                    Document(
+                        id=str(ObjectId()),
+                        file_id="1CI0A9IUb5AzhJAiRzuFNsMXALT",
+                        mimeType="application/vnd.google-apps.document",
+                        name="Tài liệu",
+                        role="bhv",
+                        type="common",
+                        author=AdminInDocument(**author),
+                        season=3,
+                        created_at=NOW,
+                        updated_at=NOW,
+                    )
+                ],
+                created_at=NOW,
+                updated_at=NOW,
+            )
+            for i in range(rows)
+        ],
+    )
+
+
+def many_subject_evaluations(rows: int) -> ManySubjectEvaluationAdminInResponse:
+    subject = SubjectInEvaluation(
+        id=str(ObjectId()),
+        title="Kinh Thánh",
+        code="Y2.1",
+        lecturer=LecturerInEvaluation(
+            id=str(ObjectId()), title="Linh mục", holy_name="Phêrô", full_name="Nguyễn Văn A"
+        ),
+    )
+    return ManySubjectEvaluationAdminInResponse(
+        pagination=Pagination(total=rows, page_index=1, total_pages=1),
+        data=[
+            SubjectEvaluationAdmin(
+                id=str(ObjectId()),
+                quality=Quality(
+                    focused_right_topic="Đồng ý",
+                    practical_content="Đồng ý",
+                    benefit_in_life="Hoàn toàn đồng ý",
+                    duration="Trung lập",
+                    method="Đồng ý",
+                ),
+                most_resonated="Điều tâm đắc nhất " * 5,
+                invited="Lời mời gọi " * 5,
+                feedback_lecturer="Góp ý cho giảng viên " * 5,
+                satisfied=5,
+                answers=["Câu trả lời 1", ["Lựa chọn 1", "Lựa chọn 2"], "Câu trả lời 3"],
+                subject=subject,
+                student=StudentInEvaluation(
+                    id=str(ObjectId()),
+                    seasons_info=[StudentSeason(numerical_order=i, group=1, season=3)],
+                    holy_name="Phêrô",
+                    full_name=f"Nguyễn Văn Học Viên {i}",
+                    email=f"student{i}@example.com",
+                ),
+                created_at=NOW,
+                updated_at=NOW,
+            )
+            for i in range(rows)
+        ],
+    )
+
+
+def render_jsonable_encoder(val: BaseModel) -> bytes:
+    return JSONResponse(content=jsonable_encoder(val, by_alias=True)).body
+
+
+def render_fast(val: BaseModel) -> bytes:
+    return Response(content=render_json(val), media_type="application/json").body
+
+
+def bench(name: str, build: Callable[[int], BaseModel], rows: int, repeat: int) -> None:
+    val = build(rows)
+    assert json.loads(render_jsonable_encoder(val)) == json.loads(render_fast(val))
+
+    results = {}
+    for label, render in (
+        ("jsonable_encoder", render_jsonable_encoder),
+        ("render_json", render_fast),
+    ):
+        best = min(timeit.repeat(lambda: render(val), number=repeat, repeat=5))
+        results[label] = best / repeat * 1000
+    speedup = results["jsonable_encoder"] / results["render_json"]
+    print(
+        f"{name:<40} {rows:>5} rows  "
+        f"jsonable_encoder {results['jsonable_encoder']:8.3f} ms  "
+        f"render_json {results['render_json']:8.3f} ms  x{speedup:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    bench("ManyStudentsInResponse", many_students, rows, repeat)
+    bench("ManyGeneralTasksInResponse", many_general_tasks, rows, repeat)
+    bench("ManySubjectEvaluationAdminInResponse", many_subject_evaluations, rows, repeat)
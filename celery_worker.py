@@ -2,10 +2,28 @@ from celery import Celery
 from celery.schedules import crontab
 import logging
 import os
-from celery.signals import after_setup_logger, worker_process_init, worker_process_shutdown
+import time
+from celery.signals import (
+    after_setup_logger,
+    before_task_publish,
+    task_postrun,
+    task_prerun,
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+)
 from logging.handlers import TimedRotatingFileHandler
+from prometheus_client import start_http_server
 from app.config import settings
 from app.config.database import connect, disconnect
+from app.infra.email.smtp_connection_manager import smtp_connection_manager
+from app.infra.logging import shutdown_logging
+from app.infra.metrics import (
+    CELERY_TASK_QUEUE_WAIT,
+    CELERY_TASK_RUNTIME,
+    mark_process_dead,
+    registry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +34,10 @@ celery_app = Celery(
         "app",
         "app.infra.tasks.periodic.test",
         "app.infra.tasks.email",
+        "app.infra.tasks.import_student",
         "app.infra.tasks.periodic.manage_form_absent",
         "app.infra.tasks.periodic.manage_form_evaluation",
+        "app.infra.tasks.periodic.archive_audit_logs",
     ],
 )
 celery_app.conf.timezone = settings.CELERY_TIMEZONE
@@ -44,6 +64,10 @@ celery_app.conf.beat_schedule = {
         "task": "app.infra.tasks.periodic.manage_form_evaluation.close_form_evaluation_task",
         "schedule": crontab(minute="59", hour=23, day_of_week=1, month_of_year="1-5,9-12"),
     },
+    "archive-audit-logs-every-night": {
+        "task": "app.infra.tasks.periodic.archive_audit_logs.archive_audit_logs_task",
+        "schedule": crontab(minute="30", hour=3),
+    },
 }
 
 
@@ -76,3 +100,55 @@ def connect_db(**kwargs):
 @worker_process_shutdown.connect
 def disconnect_db(**kwargs):
     disconnect()
+
+
+@worker_process_shutdown.connect
+def close_smtp_connection(**kwargs):
+    logger.info(f"SMTP connection stats: {smtp_connection_manager.stats()}")
+    smtp_connection_manager.close()
+
+
+# task id -> perf_counter at the start of the task, in the process running it
+_task_started_at: dict[str, float] = {}
+
+
+@worker_init.connect
+def start_metrics_server(**kwargs):
+    # with the prefork pool the tasks run in child processes, set PROMETHEUS_MULTIPROC_DIR
+    # to export their metrics from here
+    if settings.CELERY_METRICS_PORT:
+        start_http_server(settings.CELERY_METRICS_PORT, registry=registry())
+
+
+@worker_process_shutdown.connect
+def mark_metrics_process_dead(pid=None, **kwargs):
+    mark_process_dead(pid)
+
+
+@worker_process_shutdown.connect
+def flush_logs(**kwargs):
+    # the child exits without running atexit, write its queued records first
+    shutdown_logging()
+
+
+@before_task_publish.connect
+def stamp_published_at(headers=None, **kwargs):
+    if headers is not None:
+        headers["published_at"] = time.time()
+
+
+@task_prerun.connect
+def observe_task_start(task_id=None, task=None, **kwargs):
+    _task_started_at[task_id] = time.perf_counter()
+    published_at = task.request.get("published_at")
+    if published_at:
+        CELERY_TASK_QUEUE_WAIT.labels(task.name).observe(max(time.time() - published_at, 0))
+
+
+@task_postrun.connect
+def observe_task_runtime(task_id=None, task=None, state=None, **kwargs):
+    started_at = _task_started_at.pop(task_id, None)
+    if started_at is not None:
+        CELERY_TASK_RUNTIME.labels(task.name, state or "UNKNOWN").observe(
+            time.perf_counter() - started_at
+        )
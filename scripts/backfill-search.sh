@@ -0,0 +1,2 @@
+# Fill the search keys of the students, lecturers and admins (after a deploy adding them)
+python -m app.infra.shared.search_backfill "$@"
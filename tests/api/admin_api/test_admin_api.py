@@ -1,6 +1,7 @@
 import time
 import unittest
 from unittest.mock import patch
+from cachetools import TTLCache
 from mongoengine import connect, disconnect
 from fastapi.testclient import TestClient
 from app.main import app
@@ -12,6 +13,8 @@ from app.infra.security.security_service import (
     get_password_hash,
 )
 from app.models.season import SeasonModel
+from app.infra.admin.admin_repository import AdminRepository
+from app.infra.security.principal_cache import PrincipalCache, principal_cache
 from app.models.audit_log import AuditLogModel
 from app.domain.audit_log.enum import AuditLogType, Endpoint
 
@@ -192,3 +195,60 @@ class TestAdminApi(unittest.TestCase):
             )
             audit_logs = [AuditLogModel.from_mongo(doc) for doc in cursor] if cursor else []
             assert len(audit_logs) == 2
+
+    def test_principal_cache_invalidated_on_update(self):
+        def get_me() -> int:
+            return self.client.get(
+                "/api/v1/admins/me",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            ).status_code
+
+        admin = AdminModel(
+            status="active",
+            roles=["bhv"],
+            holy_name="Martin",
+            phone_number=["0123456789"],
+            latest_season=3,
+            seasons=[3],
+            email="cached@example.com",
+            full_name="Nguyen Thanh Tam",
+            password=get_password_hash(password="local@local"),
+        ).save()
+        with patch("app.infra.security.security_service.verify_token") as mock_token, patch.object(
+            principal_cache, "ttl", 60
+        ), patch.object(principal_cache, "_values", TTLCache(maxsize=100, ttl=60)), patch.object(
+            principal_cache, "poll_interval", 0
+        ), patch.object(
+            AdminRepository, "get_by_email", autospec=True, side_effect=AdminRepository.get_by_email
+        ) as mock_get_by_email:
+            principal_cache.clear()
+            mock_token.return_value = TokenData(email=admin.email)
+            assert get_me() == 200
+            assert get_me() == 200
+            # the second request is served from the cache
+            assert mock_get_by_email.call_count == 1
+
+            # another process changed the account
+            PrincipalCache(ttl=60, poll_interval=0).invalidate(AdminModel, admin.email)
+            assert get_me() == 200
+            assert mock_get_by_email.call_count == 2
+
+            mock_token.return_value = TokenData(email=self.user.email)
+            r = self.client.put(
+                f"/api/v1/admins/{admin.id}",
+                json={"status": "inactive"},
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+
+            # the deactivated account is refused right away
+            mock_token.return_value = TokenData(email=admin.email)
+            assert get_me() == 403
+        principal_cache.clear()
+        AuditLogModel.objects(
+            type=AuditLogType.UPDATE, endpoint=Endpoint.ADMIN, description__contains="inactive"
+        ).delete()
@@ -0,0 +1,290 @@
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from mongoengine import connect, disconnect
+from fastapi.testclient import TestClient
+
+from app.main import app
+import mongomock
+
+from app.config import settings
+from app.models.admin import AdminModel
+from app.models.audit_log import AuditLogArchiveModel, AuditLogModel
+from app.models.season import SeasonModel
+from app.domain.audit_log.entity import AuditLogInDB
+from app.domain.audit_log.enum import AuditLogType, Endpoint
+from app.infra.audit_log.audit_log_archive_repository import AuditLogArchiveRepository
+from app.infra.audit_log.audit_log_buffer import AuditLogBuffer
+from app.infra.audit_log.audit_log_repository import AuditLogRepository
+from app.infra.security.security_service import (
+    TokenData,
+    get_password_hash,
+)
+
+
+class TestAuditLogApi(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost:1234",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        cls.client = TestClient(app)
+        cls.season: SeasonModel = SeasonModel(
+            title="CÙNG GIÁO HỘI, NGƯỜI TRẺ BƯỚC ĐI TRONG HY VỌNG",
+            academic_year="2023-2024",
+            season=3,
+            is_current=True,
+        ).save()
+        cls.user: AdminModel = AdminModel(
+            status="active",
+            roles=["admin"],
+            holy_name="Martin",
+            phone_number=["0123456789"],
+            latest_season=3,
+            seasons=[3],
+            email="user@example.com",
+            full_name="Nguyen Thanh Tam",
+            password=get_password_hash(password="local@local"),
+        ).save()
+        AuditLogModel._get_collection().delete_many({})
+        AuditLogModel._get_collection().insert_many(
+            [
+                {
+                    "type": AuditLogType.CREATE.value,
+                    "endpoint": Endpoint.SUBJECT.value,
+                    "author": cls.user.id,
+                    "author_name": cls.user.full_name,
+                    "author_email": cls.user.email,
+                    "author_roles": cls.user.roles,
+                    "description": f"Tạo môn học {day}",
+                    "season": 3,
+                    "created_at": datetime(2024, 3, day, tzinfo=timezone.utc),
+                }
+                for day in range(1, 11)
+            ]
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        AuditLogModel._get_collection().delete_many({})
+        disconnect()
+
+    def test_get_audit_logs_by_created_at(self):
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.user.email)
+            r = self.client.get(
+                "/api/v1/audit-logs",
+                params={
+                    "created_from": "2024-03-03T00:00:00Z",
+                    "created_to": "2024-03-05T00:00:00Z",
+                    "author": str(self.user.id),
+                    "type": AuditLogType.CREATE.value,
+                },
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            resp = r.json()
+            assert resp["pagination"]["total"] == 3
+            assert [log["description"] for log in resp["data"]] == [
+                "Tạo môn học 5",
+                "Tạo môn học 4",
+                "Tạo môn học 3",
+            ]
+
+            r = self.client.get(
+                "/api/v1/audit-logs",
+                params={
+                    "created_from": "2024-03-05T00:00:00Z",
+                    "created_to": "2024-03-03T00:00:00Z",
+                },
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 400
+
+    def test_get_audit_logs_search(self):
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.user.email)
+            r = self.client.get(
+                "/api/v1/audit-logs",
+                params={"search": "Môn Học 1"},
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            assert r.json()["pagination"]["total"] == 2
+
+            # too many logs left to scan by the other filters
+            with patch.object(settings, "AUDIT_LOG_SCAN_LIMIT", 5):
+                r = self.client.get(
+                    "/api/v1/audit-logs",
+                    params={"search": "môn học 1"},
+                    headers={
+                        "Authorization": "Bearer {}".format("xxx"),
+                    },
+                )
+                assert r.status_code == 400
+
+                r = self.client.get(
+                    "/api/v1/audit-logs",
+                    params={
+                        "search": "môn học 1",
+                        "created_from": "2024-03-06T00:00:00Z",
+                    },
+                    headers={
+                        "Authorization": "Bearer {}".format("xxx"),
+                    },
+                )
+                assert r.status_code == 200
+                assert r.json()["pagination"]["total"] == 1
+
+    def test_audit_log_buffer(self):
+        buffer = AuditLogBuffer(
+            writer=AuditLogRepository().create_many, max_size=3, batch_size=2, flush_interval=60
+        )
+
+        def audit_log(description: str) -> AuditLogInDB:
+            return AuditLogInDB(
+                type=AuditLogType.UPDATE,
+                endpoint=Endpoint.LECTURER,
+                season=3,
+                author=self.user,
+                author_email=self.user.email,
+                author_name=self.user.full_name,
+                author_roles=self.user.roles,
+                description=description,
+            )
+
+        def count() -> int:
+            return AuditLogModel.objects(description__startswith="buffered").count()
+
+        # not started, written right away
+        assert buffer.put(audit_log("buffered 0"))
+        assert count() == 1
+
+        buffer.start()
+        try:
+            for i in range(1, 4):
+                assert buffer.put(audit_log(f"buffered {i}"))
+            # a full batch is written without waiting for the interval
+            for _ in range(50):
+                if count() == 3:
+                    break
+                time.sleep(0.05)
+            assert count() == 3
+            assert buffer.stats()["queued"] == 1
+        finally:
+            # drained on stop
+            buffer.stop()
+        assert count() == 4
+        assert buffer.stats() == {"queued": 0, "written": 4, "dropped": 0}
+        log: AuditLogModel = AuditLogModel.objects(description="buffered 3").get()
+        assert log.author.id == self.user.id
+        assert log.created_at is not None
+
+        AuditLogModel.objects(description__startswith="buffered").delete()
+
+    def test_get_archived_audit_logs(self):
+        AuditLogModel._get_collection().insert_many(
+            [
+                {
+                    "_cls": "AuditLogModel",
+                    "type": AuditLogType.DELETE.value,
+                    "endpoint": Endpoint.DOCUMENT.value,
+                    "author": self.user.id,
+                    "author_name": self.user.full_name,
+                    "author_email": self.user.email,
+                    "author_roles": self.user.roles,
+                    "description": f'{{"document": {day}}}',
+                    "season": 2,
+                    "created_at": datetime(2023, 1, day, tzinfo=timezone.utc),
+                }
+                for day in range(1, 7)
+            ]
+        )
+        try:
+            archived = AuditLogArchiveRepository().archive(
+                before=datetime(2023, 1, 4, tzinfo=timezone.utc), batch_size=2
+            )
+            assert archived == 3
+            assert AuditLogModel.objects(endpoint=Endpoint.DOCUMENT.value).count() == 3
+            doc = AuditLogArchiveModel._get_collection().find_one({"season": 2})
+            assert "description" not in doc
+            assert AuditLogArchiveModel.decompress(doc["description_z"]) == '{"document": 1}'
+
+            with patch("app.infra.security.security_service.verify_token") as mock_token:
+                mock_token.return_value = TokenData(email=self.user.email)
+                pages = []
+                for page_index in (1, 2):
+                    r = self.client.get(
+                        "/api/v1/audit-logs",
+                        params={
+                            "endpoint": Endpoint.DOCUMENT.value,
+                            "page_size": 4,
+                            "page_index": page_index,
+                        },
+                        headers={
+                            "Authorization": "Bearer {}".format("xxx"),
+                        },
+                    )
+                    assert r.status_code == 200
+                    assert r.json()["pagination"]["total"] == 6
+                    pages.append([log["description"] for log in r.json()["data"]])
+                assert pages == [
+                    [f'{{"document": {day}}}' for day in (6, 5, 4, 3)],
+                    [f'{{"document": {day}}}' for day in (2, 1)],
+                ]
+                assert r.json()["data"][0]["author"]["email"] == self.user.email
+
+                # the next page of a cursor continues in the archive
+                cursor, descriptions = "", []
+                while cursor is not None:
+                    r = self.client.get(
+                        "/api/v1/audit-logs",
+                        params={
+                            "endpoint": Endpoint.DOCUMENT.value,
+                            "page_size": 3,
+                            "cursor": cursor,
+                            "sort": "ascend",
+                        },
+                        headers={
+                            "Authorization": "Bearer {}".format("xxx"),
+                        },
+                    )
+                    assert r.status_code == 200
+                    descriptions.extend(log["description"] for log in r.json()["data"])
+                    cursor = r.json()["pagination"]["next_cursor"]
+                assert descriptions == [f'{{"document": {day}}}' for day in range(1, 7)]
+
+                # the range doesn't reach the archive
+                r = self.client.get(
+                    "/api/v1/audit-logs",
+                    params={
+                        "endpoint": Endpoint.DOCUMENT.value,
+                        "created_from": datetime.now(timezone.utc).date().isoformat(),
+                    },
+                    headers={
+                        "Authorization": "Bearer {}".format("xxx"),
+                    },
+                )
+                assert r.status_code == 200
+                assert r.json()["pagination"]["total"] == 0
+
+            # past the retention
+            expired = AuditLogArchiveRepository().expire(
+                before=datetime(2023, 1, 3, tzinfo=timezone.utc)
+            )
+            assert expired == 2
+            assert AuditLogArchiveModel.objects(endpoint=Endpoint.DOCUMENT.value).count() == 1
+        finally:
+            AuditLogModel.objects(endpoint=Endpoint.DOCUMENT.value).delete()
+            AuditLogArchiveModel.objects(endpoint=Endpoint.DOCUMENT.value).delete()
@@ -173,6 +173,11 @@ class TestGeneralTaskApi(unittest.TestCase):
             assert r.status_code == 200
             resp = r.json()
             assert resp["pagination"]["total"] == 2
+            for task in resp["data"]:
+                assert task["author"]["id"] == str(self.user.id)
+                assert task["author"]["active"]
+                assert task["attachments"][0]["id"] == str(self.document.id)
+                assert task["attachments"][0]["author"]["full_name"] == self.user.full_name
 
     def test_update_general_task_by_id(self):
         with patch("app.infra.security.security_service.verify_token") as mock_token:
@@ -18,6 +18,9 @@ from app.models.subject import SubjectModel
 from app.models.season import SeasonModel
 from app.models.audit_log import AuditLogModel
 from app.domain.audit_log.enum import AuditLogType, Endpoint
+from app.infra.lecturer.lecturer_repository import LecturerRepository
+from app.infra.shared.pagination import CountMode, paginate, paginate_by_cursor
+from app.infra.shared.search_backfill import backfill
 
 
 class TestLecturerApi(unittest.TestCase):
@@ -181,6 +184,48 @@ class TestLecturerApi(unittest.TestCase):
             assert doc.holy_name == self.lecturer.holy_name
             assert doc.full_name == self.lecturer.full_name
 
+    def test_search_lecturers(self):
+        lecturer = LecturerModel(title="Cha", holy_name="Giuse", full_name="Trần Văn Đức").save()
+        # written before the search keys existed
+        legacy_id = (
+            LecturerModel._get_collection()
+            .insert_one({"title": "Cha", "holy_name": "Phêrô", "full_name": "Lê Hoàng Nhân"})
+            .inserted_id
+        )
+        assert backfill(LecturerModel) == 1
+
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.user2.email)
+            for search, total in (
+                ("van duc", 1),
+                ("TRẦN", 1),
+                ("uc", 0),
+                ("hoang nh", 1),
+                ("phero", 1),
+                ("giu", 1),
+            ):
+                r = self.client.get(
+                    "/api/v1/lecturers",
+                    params={"search": search},
+                    headers={
+                        "Authorization": "Bearer {}".format("xxx"),
+                    },
+                )
+                assert r.status_code == 200
+                assert r.json()["pagination"]["total"] == total, search
+
+            assert LecturerRepository().update(lecturer.id, {"full_name": "Phạm Minh Quân"})
+            r = self.client.get(
+                "/api/v1/lecturers",
+                params={"search": "minh quan"},
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert [lecturer["id"] for lecturer in r.json()["data"]] == [str(lecturer.id)]
+
+        LecturerModel.objects(id__in=[lecturer.id, legacy_id]).delete()
+
     def test_update_lecturer_by_id(self):
         with patch("app.infra.security.security_service.verify_token") as mock_token:
             mock_token.return_value = TokenData(email=self.user1.email)
@@ -245,3 +290,85 @@ class TestLecturerApi(unittest.TestCase):
             )
             audit_logs = [AuditLogModel.from_mongo(doc) for doc in cursor] if cursor else []
             assert len(audit_logs) == 1
+
+    def test_paginate_page_and_total(self):
+        collection = LecturerModel._get_collection()
+        collection.insert_many(
+            [
+                {
+                    "title": "Cha",
+                    "holy_name": "Giuse",
+                    "full_name": f"Paginate {i}",
+                    "contact": "paginate",
+                }
+                for i in range(7)
+            ]
+        )
+        match = {"contact": "paginate"}
+        sort = {"full_name": -1}
+        try:
+            for page_index in range(1, 5):
+                docs, total = paginate(
+                    collection,
+                    match_pipeline=match,
+                    sort=sort,
+                    page_index=page_index,
+                    page_size=3,
+                )
+                expected = list(
+                    collection.find(match).sort("full_name", -1).skip(3 * (page_index - 1)).limit(3)
+                )
+                assert [doc["_id"] for doc in docs] == [doc["_id"] for doc in expected]
+                assert total == collection.count_documents(match) == 7
+            # the last page is past the matched documents
+            assert docs == []
+
+            docs, total = paginate(collection, match_pipeline={"contact": "none"}, page_size=3)
+            assert docs == [] and total == 0
+
+            docs, total = paginate(
+                collection, match_pipeline=match, page_size=3, count_mode=CountMode.NONE
+            )
+            assert len(docs) == 3 and total is None
+
+            docs, total = paginate(collection, page_size=3, count_mode=CountMode.ESTIMATED)
+            assert len(docs) == 3 and total == collection.estimated_document_count()
+        finally:
+            collection.delete_many(match)
+
+    def test_paginate_by_cursor_across_null_values(self):
+        collection = LecturerModel._get_collection()
+        collection.insert_many(
+            [
+                {"title": "Cha", "holy_name": "Giuse", "full_name": "Cursor", "contact": "cursor"},
+                {"title": "Cha", "full_name": "Cursor", "contact": "cursor", "holy_name": None},
+                *[
+                    {"title": "Cha", "holy_name": name, "full_name": "Cursor", "contact": "cursor"}
+                    for name in ["Phero", "Giuse", "Anre", None]
+                ],
+            ]
+        )
+        match = {"contact": "cursor"}
+        try:
+            for direction in (1, -1):
+                ids, cursor = [], ""
+                while cursor is not None:
+                    docs, total, cursor = paginate_by_cursor(
+                        collection,
+                        match_pipeline=match,
+                        sort={"holy_name": direction},
+                        page_size=2,
+                        cursor=cursor,
+                        count_mode=CountMode.EXACT,
+                    )
+                    assert total == 6
+                    ids.extend(doc["_id"] for doc in docs)
+
+                expected = collection.find(match).sort(
+                    [("holy_name", direction), ("_id", direction)]
+                )
+                assert ids == [doc["_id"] for doc in expected]
+                # null and missing values are reached in both orders
+                assert len(ids) == 6
+        finally:
+            collection.delete_many(match)
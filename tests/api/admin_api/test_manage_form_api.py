@@ -15,6 +15,8 @@ from app.infra.security.security_service import (
     get_password_hash,
 )
 from app.models.season import SeasonModel
+from app.models.manage_form import ManageFormModel
+from app.infra.manage_form.manage_form_cache import ManageFormCache
 from app.models.audit_log import AuditLogModel
 from app.domain.audit_log.enum import AuditLogType, Endpoint
 from app.domain.manage_form.enum import FormStatus, FormType
@@ -189,3 +191,35 @@ class TestManageFormApi(unittest.TestCase):
         resp = r.json()
         assert r.status_code == 200
         assert resp["status"] == FormStatus.ACTIVE
+
+    def test_manage_form_cache_invalidated_in_other_processes(self):
+        def load_form():
+            return ManageFormModel._get_collection().find_one(
+                {"type": FormType.SUBJECT_REGISTRATION}
+            )
+
+        # the cache of another api or celery process
+        other_process_cache = ManageFormCache(poll_interval=0)
+        form = other_process_cache.get(FormType.SUBJECT_REGISTRATION.value, load_form)
+        assert form["status"] == FormStatus.ACTIVE
+
+        # still served from memory while nobody bumped the version
+        ManageFormModel.objects(type=FormType.SUBJECT_REGISTRATION).update_one(
+            status=FormStatus.CLOSED
+        )
+        form = other_process_cache.get(FormType.SUBJECT_REGISTRATION.value, load_form)
+        assert form["status"] == FormStatus.ACTIVE
+
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.user.email)
+            for status in (FormStatus.INACTIVE, FormStatus.ACTIVE):
+                r = self.client.post(
+                    "/api/v1/manage-form",
+                    json={"status": status, "type": FormType.SUBJECT_REGISTRATION},
+                    headers={
+                        "Authorization": "Bearer {}".format("xxx"),
+                    },
+                )
+                assert r.status_code == 200
+                form = other_process_cache.get(FormType.SUBJECT_REGISTRATION.value, load_form)
+                assert form["status"] == status
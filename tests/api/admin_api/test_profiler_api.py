@@ -0,0 +1,136 @@
+import unittest
+from unittest.mock import patch
+
+from bson import Regex
+from mongoengine import connect, disconnect
+from fastapi.testclient import TestClient
+
+from app.main import app
+import mongomock
+
+from app.models.admin import AdminModel
+from app.models.season import SeasonModel
+from app.infra.metrics.slow_queries import slow_query_profiler
+from app.infra.security.security_service import (
+    TokenData,
+    get_password_hash,
+)
+
+
+class TestProfilerApi(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost:1234",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        cls.client = TestClient(app)
+        cls.season: SeasonModel = SeasonModel(
+            title="CÙNG GIÁO HỘI, NGƯỜI TRẺ BƯỚC ĐI TRONG HY VỌNG",
+            academic_year="2023-2024",
+            season=3,
+            is_current=True,
+        ).save()
+        cls.user: AdminModel = AdminModel(
+            status="active",
+            roles=["admin"],
+            holy_name="Martin",
+            phone_number=["0123456789"],
+            latest_season=3,
+            seasons=[3],
+            email="user@example.com",
+            full_name="Nguyen Thanh Tam",
+            password=get_password_hash(password="local@local"),
+        ).save()
+        cls.user2: AdminModel = AdminModel(
+            status="active",
+            roles=["bhv"],
+            holy_name="Martin",
+            phone_number=["0123456789"],
+            latest_season=3,
+            seasons=[3],
+            email="user2@example.com",
+            full_name="Nguyen Thanh Tam",
+            password=get_password_hash(password="local@local"),
+        ).save()
+
+    @classmethod
+    def tearDownClass(cls):
+        slow_query_profiler.clear()
+        disconnect()
+
+    def test_get_slow_queries(self):
+        slow_query_profiler.clear()
+        for search, duration_ms in (("an", 150), ("binh", 250)):
+            slow_query_profiler.record(
+                "aggregate",
+                {
+                    "aggregate": "StudentModel",
+                    "pipeline": [
+                        {"$match": {"full_name": Regex(search, "i"), "status": "active"}},
+                        {"$skip": 0},
+                        {"$limit": 20},
+                    ],
+                    "cursor": {},
+                    "lsid": {"id": "xxx"},
+                    "$db": "ysof",
+                },
+                "ysof",
+                "GET /api/v1/students",
+                "StudentRepository.list_paginated",
+                duration_ms,
+                {"cursor": {"firstBatch": [{}] * 20}},
+            )
+        slow_query_profiler.record(
+            "find",
+            {"find": "SeasonModel", "filter": {"is_current": True}, "$db": "ysof"},
+            "ysof",
+            "",
+            "SeasonRepository.get_current_season",
+            120,
+        )
+
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.user.email)
+            r = self.client.get(
+                "/api/v1/profiler/slow-queries",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            resp = r.json()
+            assert len(resp["data"]) == 2
+            slowest = resp["data"][0]
+            assert slowest["endpoint"] == "GET /api/v1/students"
+            assert slowest["collection"] == "StudentModel"
+            assert slowest["count"] == 2
+            assert slowest["total_ms"] == 400
+            assert slowest["max_ms"] == 250
+            assert slowest["docs_returned"] == 20
+            assert '"?regex"' in slowest["shape"]
+            assert "binh" not in slowest["shape"]
+            assert "lsid" not in slowest["shape"]
+            assert resp["data"][1]["operation"] == "SeasonRepository.get_current_season"
+
+            r = self.client.delete(
+                "/api/v1/profiler/slow-queries",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            assert slow_query_profiler.report() == []
+
+    def test_get_slow_queries_forbidden(self):
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.user2.email)
+            r = self.client.get(
+                "/api/v1/profiler/slow-queries",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 403
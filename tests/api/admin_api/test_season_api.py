@@ -14,6 +14,8 @@ from app.infra.security.security_service import (
     get_password_hash,
 )
 from app.models.season import SeasonModel
+from app.infra.season.season_cache import SeasonCache
+from app.shared.utils.general import get_current_season_value
 
 
 class TestSeasonApi(unittest.TestCase):
@@ -189,3 +191,42 @@ class TestSeasonApi(unittest.TestCase):
                 },
             )
             assert r.status_code == 404
+
+    def test_current_season_cache_invalidated_in_other_processes(self):
+        def load_season() -> int:
+            return SeasonModel.objects(is_current=True).get().season
+
+        # the cache of another api or celery process
+        other_process_cache = SeasonCache(poll_interval=0)
+        current_season: int = SeasonModel.objects(is_current=True).get().season
+        assert other_process_cache.get("season", load_season) == current_season
+
+        season5: SeasonModel = SeasonModel(
+            title="Mua 5", academic_year="2025-2026", season=5, is_current=False
+        ).save()
+        # still served from memory while nobody bumped the version
+        SeasonModel.objects(season=current_season).update_one(is_current=False)
+        season5.update(is_current=True)
+        assert other_process_cache.get("season", load_season) == current_season
+
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.user.email)
+            r = self.client.put(
+                f"/api/v1/seasons/{season5.id}/current",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            assert other_process_cache.get("season", load_season) == 5
+            assert get_current_season_value() == 5
+
+            r = self.client.put(
+                f"/api/v1/seasons/{self.season.id}/current",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            assert other_process_cache.get("season", load_season) == self.season.season
+            season5.delete()
@@ -1,6 +1,8 @@
+from datetime import datetime, timedelta, timezone
 import time
 import unittest
 from unittest.mock import patch
+from cachetools import TTLCache
 from mongoengine import connect, disconnect
 from fastapi.testclient import TestClient
 import pytest
@@ -14,6 +16,13 @@ from app.infra.security.security_service import get_password_hash, TokenData, ve
 from app.models.season import SeasonModel
 from app.models.audit_log import AuditLogModel
 from app.domain.audit_log.enum import AuditLogType, Endpoint
+from app.infra.tasks.import_student import import_students_from_spreadsheet_task
+from app.infra.security.principal_cache import principal_cache
+from app.models.cache_version import CacheVersionModel
+from app.models.import_job import ImportJobModel
+from app.infra.student.student_repository import StudentRepository
+from app.shared.constant import HEADER_IMPORT_STUDENT
+from app.use_cases.student_admin.import_from_spreadsheets import StudentSpreadsheetImporter
 
 mock_data_student_payload = {
     "numerical_order": 10,
@@ -161,6 +170,10 @@ class TestStudentAdminApi(unittest.TestCase):
     def tearDownClass(cls):
         disconnect()
 
+    def principal_version(self) -> int:
+        version = CacheVersionModel.objects(name=principal_cache.name).first()
+        return version.version if version else 0
+
     def test_create_student_with_admin_bkl_old_season(self):
         with patch("app.infra.security.security_service.verify_token") as mock_token, patch(
             "app.infra.tasks.email.send_email_welcome_task.delay"
@@ -325,6 +338,48 @@ class TestStudentAdminApi(unittest.TestCase):
             resp = r.json()
             assert resp["pagination"]["total"] == 2
 
+    @pytest.mark.order(6)
+    def test_get_all_students_with_cursor(self):
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.admin.email)
+            emails, cursor = [], ""
+            while cursor is not None:
+                r = self.client.get(
+                    "/api/v1/students",
+                    headers={
+                        "Authorization": "Bearer {}".format("xxx"),
+                    },
+                    params={"cursor": cursor, "page_size": 2},
+                )
+                assert r.status_code == 200
+                resp = r.json()
+                assert resp["pagination"]["total"] == 5
+                assert len(resp["data"]) <= 2
+                emails.extend(student["email"] for student in resp["data"])
+                cursor = resp["pagination"]["next_cursor"]
+
+            assert len(emails) == 5
+            assert len(set(emails)) == 5
+
+            r = self.client.get(
+                "/api/v1/students",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+                params={"cursor": "invalid"},
+            )
+            assert r.status_code == 400
+
+            # the numerical order of a season is not a stored sort key
+            r = self.client.get(
+                "/api/v1/students",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+                params={"cursor": "", "sort_by": "numerical_order"},
+            )
+            assert r.status_code == 400
+
     @pytest.mark.order(7)
     def test_update_student_by_id(self):
         with patch("app.infra.security.security_service.verify_token") as mock_token:
@@ -348,7 +403,20 @@ class TestStudentAdminApi(unittest.TestCase):
             assert len(audit_logs) == 2
 
     def test_delete_student_by_id(self):
-        with patch("app.infra.security.security_service.verify_token") as mock_token:
+        with patch("app.infra.security.security_service.verify_token") as mock_token, patch.object(
+            principal_cache, "ttl", 60
+        ), patch.object(principal_cache, "_values", TTLCache(maxsize=100, ttl=60)):
+            principal_cache.clear()
+            # the student is cached by its first request
+            mock_token.return_value = TokenData(email=self.student2.email)
+            r = self.client.get(
+                "/api/v1/student/students/me",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+
             mock_token.return_value = TokenData(email=self.admin.email)
             r = self.client.delete(
                 f"/api/v1/students/{self.student2.id}",
@@ -366,6 +434,16 @@ class TestStudentAdminApi(unittest.TestCase):
             )
             assert r.status_code == 404
 
+            # the deleted student is refused right away
+            mock_token.return_value = TokenData(email=self.student2.email)
+            r = self.client.get(
+                "/api/v1/student/students/me",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 401
+
             time.sleep(1)
             cursor = AuditLogModel._get_collection().find(
                 {"type": AuditLogType.DELETE, "endpoint": Endpoint.STUDENT}
@@ -380,7 +458,8 @@ class TestStudentAdminApi(unittest.TestCase):
             "app.infra.services.google_drive_api.GoogleDriveAPIService._get_oauth_token"
         ) as mock_get_oauth_token, patch(
             "app.infra.tasks.email.send_email_welcome_task.delay"
-        ):
+        ), patch.object(principal_cache, "ttl", 60):
+            principal_version = self.principal_version()
             mock_token.return_value = TokenData(email=self.admin.email)
             mock_get_oauth_token.return_value = Credentials(
                 token="<access_token>",
@@ -462,6 +541,20 @@ class TestStudentAdminApi(unittest.TestCase):
                     "Cấp 3",
                     "Đang đi làm",
                 ],
+                [
+                    "7",
+                    "1",
+                    "Maria",
+                    "Nguyễn Thị Lan",
+                    "Nữ",
+                    "01/01/2000",
+                    "Huế",
+                    "",
+                    "lan2000@gmail.com",
+                    "0954129823",
+                    "Cấp 3",
+                    "Đang đi làm",
+                ],
             ]
 
             r = self.client.post(
@@ -478,14 +571,19 @@ class TestStudentAdminApi(unittest.TestCase):
             assert r.status_code == 200
 
             # Check error unique numerical_order cause existed another student have numerical_order = 1
-            assert len(resp["errors"]) == 1
+            assert len(resp["errors"]) == 2
             assert resp["errors"][0]["row"] == 2
             assert resp["errors"][0]["detail"] == "Đã tồn tại một học viên khác có MSHV 1 ở mùa 3."
+            # numerical_order already taken by a previous row of the spreadsheet
+            assert resp["errors"][1]["row"] == 6
+            assert resp["errors"][1]["detail"] == "Đã tồn tại một học viên khác có MSHV 7 ở mùa 3."
 
             assert len(resp["inserteds"]) == 2
 
             # Updated 1 student from season 2
             assert len(resp["updated"]) == 1
+            # and dropped from the cached accounts of every process
+            assert self.principal_version() == principal_version + 1
 
             # Name and DOB of student updated change
             assert (
@@ -537,3 +635,131 @@ class TestStudentAdminApi(unittest.TestCase):
             )
             audit_logs = [AuditLogModel.from_mongo(doc) for doc in cursor] if cursor else []
             assert len(audit_logs) == 3
+
+    def test_import_student_job(self):
+        with patch("app.infra.security.security_service.verify_token") as mock_token, patch(
+            "app.use_cases.student_admin.import_from_spreadsheets.ImportSpreadsheetsStudentUseCase.get_data_from_spreadsheet"
+        ) as mock_get_data_spreadsheet, patch(
+            "app.infra.services.google_drive_api.GoogleDriveAPIService._get_oauth_token"
+        ), patch(
+            "app.infra.tasks.import_student.import_students_from_spreadsheet_task.delay"
+        ) as mock_delay:
+            mock_token.return_value = TokenData(email=self.admin.email)
+            mock_get_data_spreadsheet.return_value = [
+                [
+                    "numerical_order",
+                    "group",
+                    "holy_name",
+                    "full_name",
+                    "sex",
+                    "date_of_birth",
+                    "origin_address",
+                    "diocese",
+                    "email",
+                    "phone_number",
+                    "education",
+                    "job",
+                    "note",
+                ],
+                [
+                    "30",
+                    "2",
+                    "Phero",
+                    "Nguyễn Văn Bình",
+                    "Nam",
+                    "01/02/1999",
+                    "Huế",
+                    "Huế",
+                    "binh1999@gmail.com",
+                    "0913741085",
+                    "Đại học",
+                    "Đang đi làm",
+                ],
+            ]
+
+            r = self.client.post(
+                "/api/v1/students/import-jobs",
+                json={"url": "https://docs.google.com/spreadsheets/d/1CI0A9IUb5AzhJAiRzuFNsMXALT"},
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            job_id = r.json()["id"]
+            assert r.json()["status"] == "pending"
+            mock_delay.assert_called_once_with(job_id=job_id)
+
+            # run by the celery worker
+            import_students_from_spreadsheet_task(job_id=job_id)
+
+            r = self.client.get(
+                f"/api/v1/students/import-jobs/{job_id}",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            resp = r.json()
+            assert resp["status"] == "done"
+            assert resp["total_rows"] == 1
+            assert resp["processed"] == 1
+            assert resp["inserted"] == 1
+            assert resp["result"]["inserteds"] == ["binh1999@gmail.com"]
+            assert resp["result"]["errors"] == []
+            assert resp["started_at"] is not None
+            assert resp["heartbeat_at"] is not None
+
+            # a worker killed while running never reports again, the job is reported as failed
+            ImportJobModel.objects(id=job_id).update_one(
+                status="running", heartbeat_at=datetime.now(timezone.utc) - timedelta(hours=1)
+            )
+            r = self.client.get(
+                f"/api/v1/students/import-jobs/{job_id}",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.json()["status"] == "failed"
+            assert r.json()["detail"]
+
+            ImportJobModel.objects(id=job_id).update_one(heartbeat_at=datetime.now(timezone.utc))
+            r = self.client.get(
+                f"/api/v1/students/import-jobs/{job_id}",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.json()["status"] == "running"
+
+    def test_import_student_progress(self):
+        def row(numerical_order: int, email: str) -> dict:
+            return dict(
+                zip(
+                    HEADER_IMPORT_STUDENT,
+                    [str(numerical_order), "1", "Phero", "Nguyễn Văn Bình", "Nam", "01/02/1999"]
+                    + ["Huế", "Huế", email, "0913741085", "Đại học", "Đang đi làm", None],
+                )
+            )
+
+        progress = []
+        importer = StudentSpreadsheetImporter(
+            student_repository=StudentRepository(),
+            batch_size=500,
+            progress_interval=2,
+            on_progress=progress.append,
+        )
+        rows = [row(i, f"progress{i}@example.com") for i in range(1, 6)]
+        rows.append(row(6, "not an email"))
+        try:
+            response = importer.import_rows(rows, season=99)
+            assert len(response.inserteds) == 5
+
+            # reported once validated, every 2 checked rows, then after the only batch
+            assert [(p["processed"], p["inserted"], p["errors"]) for p in progress] == [
+                (1, 0, 1),
+                (3, 0, 1),
+                (5, 0, 1),
+                (6, 5, 1),
+            ]
+        finally:
+            StudentModel.objects(email__startswith="progress").delete()
@@ -5,6 +5,7 @@ import unittest
 from unittest.mock import patch
 import pytest
 
+from bson import DBRef, ObjectId
 from mongoengine import connect, disconnect
 from fastapi.testclient import TestClient
 
@@ -28,6 +29,9 @@ from app.domain.document.enum import DocumentType
 from app.models.manage_form import ManageFormModel
 from app.domain.manage_form.enum import FormStatus, FormType
 from app.domain.subject.enum import StatusSubjectEnum
+from app.infra.shared.bulk_dereference import BulkDereferencer, CachedBulkDereferencer
+from app.infra.shared.entity_cache import entity_cache
+from app.infra.shared.records import to_records
 
 
 today = date.today()
@@ -352,6 +356,24 @@ class TestSubjectApi(unittest.TestCase):
             assert "code" in resp[0]
             assert "title" in resp[0]
 
+    def test_get_subject_registrations(self):
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.user.email)
+            r = self.client.get(
+                "/api/v1/subjects/registration",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            resp = r.json()
+            assert len(resp["data"]) == 1
+            assert resp["data"][0]["student"]["id"] == str(self.student.id)
+            assert resp["data"][0]["student"]["email"] == self.student.email
+            assert "password" not in resp["data"][0]["student"]
+            assert resp["data"][0]["subject_registrations"] == [str(self.subject.id)]
+            assert resp["data"][0]["total"] == 1
+
     def test_get_subject_by_id(self):
         with patch("app.infra.security.security_service.verify_token") as mock_token:
             mock_token.return_value = TokenData(email=self.user2.email)
@@ -508,3 +530,100 @@ class TestSubjectApi(unittest.TestCase):
             assert resp["title"] == subject.title
             assert resp["start_at"] == str(subject.start_at)
             assert resp["code"] == subject.code
+
+    def test_bulk_dereference(self):
+        deleted_document = DocumentModel(
+            file_id="deleted",
+            mimeType="image/jpeg",
+            name="Tài liệu đã xóa",
+            role="bhv",
+            type=DocumentType.STUDENT,
+            season=99,
+            author=self.user,
+        ).save()
+        deleted_document.delete()
+        subject_ids = (
+            SubjectModel._get_collection()
+            .insert_many(
+                [
+                    {
+                        "title": f"Môn học {i}",
+                        "start_at": "2024-03-27",
+                        "subdivision": "string",
+                        "code": "string",
+                        "lecturer": self.lecturer.id,
+                        "attachments": [self.document.id, deleted_document.id],
+                        "status": "init",
+                        "season": 99,
+                    }
+                    for i in range(2)
+                ]
+            )
+            .inserted_ids
+        )
+        registration_ids = (
+            SubjectRegistrationModel._get_collection()
+            .insert_many([{"student": ObjectId(), "subject": id} for id in subject_ids])
+            .inserted_ids
+        )
+
+        def load(model, ids):
+            return [
+                model._from_son(doc) for doc in model._get_collection().find({"_id": {"$in": ids}})
+            ]
+
+        try:
+            dereferencer = BulkDereferencer()
+            with patch.object(
+                BulkDereferencer, "_load", autospec=True, side_effect=BulkDereferencer._load
+            ) as mock_load:
+                subjects = dereferencer.dereference(
+                    load(SubjectModel, subject_ids), "lecturer", "attachments"
+                )
+                # one query by referenced collection, whatever the number of documents
+                assert mock_load.call_count == 2
+                # the identity map shares the referenced documents
+                assert subjects[0]._data["lecturer"] is subjects[1]._data["lecturer"]
+                assert dereferencer.get(LecturerModel, self.lecturer.id).full_name == (
+                    self.lecturer.full_name
+                )
+
+                # nested path, the subjects and the lecturer are already loaded
+                registrations = dereferencer.dereference(
+                    load(SubjectRegistrationModel, registration_ids), "subject.lecturer"
+                )
+                assert mock_load.call_count == 3
+                subject = registrations[0]._data["subject"]
+                assert isinstance(subject, SubjectModel)
+                assert subject._data["lecturer"] is subjects[0]._data["lecturer"]
+
+            # a dangling reference is left in place, the list keeps its shape
+            attachments = subjects[0]._data["attachments"]
+            assert len(attachments) == 2
+            assert attachments[0].name == self.document.name
+            assert isinstance(attachments[1], DBRef)
+            assert attachments[1].id == deleted_document.id
+
+            records = dereferencer.dereference_records(
+                SubjectModel,
+                to_records(SubjectModel, SubjectModel._get_collection().find({"season": 99})),
+                "lecturer",
+                "attachments",
+            )
+            assert records[0]["lecturer"]["full_name"] == self.lecturer.full_name
+            assert [attachment["name"] for attachment in records[0]["attachments"][:1]] == [
+                self.document.name
+            ]
+            assert records[0]["attachments"][1] == deleted_document.id
+
+            # only the student endpoints read through the entity cache
+            with patch.object(entity_cache, "ttl", 60), patch.object(entity_cache, "_models", {}):
+                BulkDereferencer().dereference(load(SubjectModel, subject_ids), "lecturer")
+                assert entity_cache._models == {}
+
+                CachedBulkDereferencer().dereference(load(SubjectModel, subject_ids), "lecturer")
+                lecturers = entity_cache._models["LecturerModel"]._values
+                assert str(self.lecturer.id) in lecturers
+        finally:
+            SubjectModel.objects(season=99).delete()
+            SubjectRegistrationModel.objects(id__in=registration_ids).delete()
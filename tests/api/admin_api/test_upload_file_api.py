@@ -1,4 +1,6 @@
+import threading
 import unittest
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 from google.oauth2.credentials import Credentials
@@ -15,6 +17,7 @@ from app.infra.security.security_service import (
     get_password_hash,
 )
 from app.models.season import SeasonModel
+from app.infra.services.google_client_registry import GOOGLE_APIS, GoogleAPIClientRegistry
 
 
 class TestUploadFileApi(unittest.TestCase):
@@ -157,3 +160,53 @@ class TestUploadFileApi(unittest.TestCase):
                 },
             )
             assert r.status_code == 200
+
+    def test_google_api_clients_reused_per_thread(self):
+        registry = GoogleAPIClientRegistry()
+        credentials = Credentials(
+            token="<access_token>",
+            expiry=datetime.utcnow() + timedelta(hours=1),
+            scopes=["https://www.googleapis.com/auth/drive"],
+        )
+        with patch.object(
+            registry, "_load_credentials", return_value=credentials
+        ) as mock_load_credentials:
+            http, service = registry.http(), registry.get_service("drive", "v3")
+            # the same thread gets the same clients
+            assert registry.http() is http
+            assert registry.get_service("drive", "v3") is service
+
+            other = {}
+
+            def other_thread():
+                other["http"] = registry.http()
+                other["service"] = registry.get_service("drive", "v3")
+
+            thread = threading.Thread(target=other_thread)
+            thread.start()
+            thread.join()
+            # httplib2 is not thread-safe, another thread gets its own clients
+            assert other["http"] is not http
+            assert other["service"] is not service
+            # on top of the same credentials, loaded once
+            assert other["http"].credentials is credentials
+            assert mock_load_credentials.call_count == 1
+
+    def test_google_api_clients_warm_up(self):
+        registry = GoogleAPIClientRegistry()
+        credentials = Credentials(
+            token="<access_token>", expiry=datetime.utcnow() + timedelta(hours=1)
+        )
+        with patch.object(registry, "_load_credentials", return_value=credentials):
+            registry.warm_up()
+        assert registry.get_credentials() is credentials
+        assert set(registry._documents) == set(GOOGLE_APIS.items())
+
+        # a failed warm-up doesn't prevent the app from starting
+        registry.reset()
+        with patch.object(
+            registry, "_load_credentials", side_effect=Exception("invalid_grant")
+        ) as mock_load_credentials:
+            registry.warm_up()
+        mock_load_credentials.assert_called_once()
+        assert registry._creds is None
@@ -1,12 +1,15 @@
+import asyncio
 import unittest
 import pytest
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from mongoengine import connect, disconnect
 from fastapi.testclient import TestClient
 
 from app.main import app
 import mongomock
+from pymongo import MongoClient
 
 from app.models.admin import AdminModel
 from app.infra.security.security_service import (
@@ -19,7 +22,10 @@ from app.models.season import SeasonModel
 from app.models.student import SeasonInfo, StudentModel
 from app.models.absent import AbsentModel
 from app.models.manage_form import ManageFormModel
+from app.infra.manage_form.manage_form_cache import manage_form_cache
 from app.domain.manage_form.enum import FormStatus, FormType
+from app.config.database import AsyncIOMotorClient
+from app.infra.shared.async_collection import ThreadedCollection, get_async_collection
 
 
 class TestAbsentApi(unittest.TestCase):
@@ -32,6 +38,7 @@ class TestAbsentApi(unittest.TestCase):
             mongo_client_class=mongomock.MongoClient,
         )
         cls.client = TestClient(app)
+        manage_form_cache.clear()
         cls.season: SeasonModel = SeasonModel(
             title="CÙNG GIÁO HỘI, NGƯỜI TRẺ BƯỚC ĐI TRONG HY VỌNG",
             academic_year="2023-2024",
@@ -128,6 +135,7 @@ class TestAbsentApi(unittest.TestCase):
                 status=FormStatus.ACTIVE,
                 data={"subject_id": "65f253a7fd143b81c101a63c"},
             ).save()
+            manage_form_cache.invalidate()
             r = self.client.post(
                 f"/api/v1/student/absent/{self.subject.id}",
                 json={"reason": "Xin phép nghỉ"},
@@ -143,6 +151,7 @@ class TestAbsentApi(unittest.TestCase):
                 upsert=False,
             )
             manage_form.reload()
+            manage_form_cache.invalidate()
 
             r = self.client.post(
                 f"/api/v1/student/absent/{self.subject.id}",
@@ -157,6 +166,16 @@ class TestAbsentApi(unittest.TestCase):
             assert resp["subject"]
             assert "student" not in resp
 
+            r = self.client.post(
+                f"/api/v1/student/absent/{self.subject.id}",
+                json={"reason": "Xin phép nghỉ"},
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 400
+            assert r.json()["detail"] == "Đơn nghỉ phép đã được tạo trước đây."
+
     @pytest.mark.order(2)
     def test_update_absent(self):
         with patch("app.infra.security.security_service.verify_token") as mock_token:
@@ -207,3 +226,60 @@ class TestAbsentApi(unittest.TestCase):
                 },
             )
             assert r.status_code == 404
+
+
+class TestAsyncCollection(unittest.TestCase):
+    """Motor collections are used on a real MongoClient, the sync ones are wrapped on mongomock"""
+
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost:1234",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def motor_collections(self, motor_client_class):
+        """Collections of the absents, twice in a loop then in a new loop, on a real MongoClient"""
+
+        async def collections():
+            return get_async_collection(AbsentModel), get_async_collection(AbsentModel)
+
+        with (
+            patch("app.config.database.AsyncIOMotorClient", motor_client_class),
+            patch("app.config.database.get_connection", return_value=MongoClient(connect=False)),
+            patch("app.config.database.get_db", return_value=SimpleNamespace(name="ysof")),
+            patch("app.config.database._async_client", None),
+        ):
+            return [*asyncio.run(collections()), *asyncio.run(collections())]
+
+    def test_get_async_collection_on_mongomock(self):
+        async def collection():
+            return get_async_collection(AbsentModel)
+
+        assert isinstance(asyncio.run(collection()), ThreadedCollection)
+
+    def test_get_async_collection_with_motor(self):
+        motor_client_class = MagicMock()
+        collections = self.motor_collections(motor_client_class)
+
+        # one client per event loop
+        assert motor_client_class.call_count == 2
+        assert "maxPoolSize" in motor_client_class.call_args.kwargs
+        database = motor_client_class.return_value.__getitem__
+        database.assert_called_with("ysof")
+        database.return_value.__getitem__.assert_called_with(AbsentModel._get_collection().name)
+        assert all(c is database.return_value.__getitem__.return_value for c in collections)
+
+    @unittest.skipIf(AsyncIOMotorClient is None, "motor is not installed")
+    def test_get_async_collection_with_motor_client(self):
+        from motor.motor_asyncio import AsyncIOMotorCollection
+
+        collections = self.motor_collections(AsyncIOMotorClient)
+        assert all(isinstance(c, AsyncIOMotorCollection) for c in collections)
+        assert collections[0].name == AbsentModel._get_collection().name
@@ -1,9 +1,15 @@
+import os
+import signal
+import time
 import unittest
+from cachetools import TTLCache
 from mongoengine import connect, disconnect
 from fastapi.testclient import TestClient
 from app.main import app
 import mongomock
 from app.infra.security.security_service import get_password_hash, verify_password
+from app.infra.security.login_throttle import login_throttle
+from app.infra.security.password_hasher import PasswordHasher, _hash
 from app.models.student import SeasonInfo, StudentModel
 import pytest
 from unittest.mock import patch
@@ -77,3 +83,99 @@ class TestAuthStudentApi(unittest.TestCase):
             assert r.status_code == 200
             student: StudentModel = StudentModel.objects(id=self.student.id).get()
             assert verify_password(new_password, student.password)
+
+    @pytest.mark.order(3)
+    def test_login_throttled_after_failures(self):
+        def login(email: str, password: str, client: TestClient | None = None) -> int:
+            client = client or self.client
+            return client.post(
+                "/api/v1/student/auth/login",
+                json={"email": email, "password": password},
+            ).status_code
+
+        with patch.object(login_throttle, "_failures", TTLCache(maxsize=100, ttl=60)), patch.object(
+            login_throttle, "max_email_failures", 2
+        ), patch.object(login_throttle, "max_ip_failures", 3):
+            assert login(self.student.email, "dummy") == 400
+            assert login(self.student.email, "dummy") == 400
+            # refused before the password is checked
+            assert login(self.student.email, "new_password") == 429
+
+            assert login("other@example.com", "dummy") == 400
+
+            # every email of a client ip failing too often. This Starlette's TestClient sends
+            # no client address (newer ones send "testclient"), the address is set explicitly
+            login_throttle.clear()
+            client = TestClient(with_client_address(app, "10.0.0.1"))
+            for email in ("a@example.com", "b@example.com", "c@example.com"):
+                assert login(email, "dummy", client) == 400
+            assert login("d@example.com", "dummy", client) == 429
+            other_client = TestClient(with_client_address(app, "10.0.0.2"))
+            assert login("d@example.com", "dummy", other_client) == 400
+
+            login_throttle.clear()
+            assert login(self.student.email, "new_password") == 200
+
+    @pytest.mark.order(4)
+    def test_login_password_hasher_processes(self):
+        hasher = PasswordHasher(workers=1, queue_size=0, max_wait=30)
+        hasher.start()
+        try:
+            with patch("app.infra.security.security_service.password_hasher", hasher):
+                # the only slot is taken, the login is not admitted
+                pending = hasher._submit(_hash, "local@local")
+                r = self.client.post(
+                    "/api/v1/student/auth/login",
+                    json={"email": self.student.email, "password": "new_password"},
+                )
+                assert r.status_code == 429
+                assert r.headers["Retry-After"] == "1"
+                pending.result()
+                # the slot is freed by a done callback, run after the result is set
+                wait_until(lambda: hasher.stats()["pending"] == 0)
+
+                r = self.client.post(
+                    "/api/v1/student/auth/login",
+                    json={"email": self.student.email, "password": "new_password"},
+                )
+                assert r.status_code == 200
+                assert hasher.stats() == {"workers": 1, "pending": 0, "rejected": 1}
+        finally:
+            hasher.stop()
+
+    @pytest.mark.order(5)
+    def test_password_hasher_worker_killed(self):
+        hasher = PasswordHasher(workers=1, queue_size=4, max_wait=30)
+        hasher.start()
+        try:
+            hashed = hasher.hash("local@local")
+            executor = hasher._executor
+            for process in list(executor._processes.values()):
+                os.kill(process.pid, signal.SIGKILL)
+
+            # the broken pool is replaced, the hashes it failed run in the caller
+            assert hasher.verify("local@local", hashed)
+            wait_until(lambda: hasher._executor is not executor)
+            assert hasher.verify("local@local", hasher.hash("local@local"))
+            wait_until(lambda: hasher.stats()["pending"] == 0)
+            assert hasher.stats()["rejected"] == 0
+        finally:
+            hasher.stop()
+
+
+def with_client_address(app, host: str):
+    """ASGI app seeing the requests as sent from `host`"""
+
+    async def asgi(scope, receive, send):
+        if scope["type"] == "http":
+            scope = {**scope, "client": (host, 50000)}
+        await app(scope, receive, send)
+
+    return asgi
+
+
+def wait_until(condition, timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
@@ -28,6 +28,10 @@ from app.domain.document.enum import DocumentType
 from app.models.manage_form import ManageFormModel
 from app.domain.manage_form.enum import FormStatus, FormType
 from app.domain.subject.enum import StatusSubjectEnum
+from app.infra.lecturer.lecturer_repository import LecturerRepository
+from app.infra.metrics import ENTITY_CACHE_REQUESTS
+from app.infra.shared.entity_cache import EntityCache, entity_cache
+from app.infra.subject.subject_repository import SubjectRepository
 
 
 today = date.today()
@@ -167,3 +171,48 @@ class TestSubjectApi(unittest.TestCase):
 
             assert resp[0]["lecturer"]["full_name"] == self.subject.lecturer.full_name
             assert resp[0]["attachments"][0]["name"] == self.subject.attachments[0].name
+
+    def test_student_get_subject_through_entity_cache(self):
+        def requests(entity: str, result: str) -> float:
+            return ENTITY_CACHE_REQUESTS.labels(entity, result)._value.get()
+
+        def get_subject() -> dict:
+            r = self.client.get(
+                f"/api/v1/student/subjects/{self.subject.id}",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+            return r.json()
+
+        with patch("app.infra.security.security_service.verify_token") as mock_token, patch.object(
+            entity_cache, "ttl", 60
+        ), patch.object(entity_cache, "poll_interval", 0), patch.object(entity_cache, "_models", {}):
+            mock_token.return_value = TokenData(email=self.student.email)
+            hits = requests("SubjectModel", "hit")
+            misses = requests("LecturerModel", "miss")
+
+            get_subject()
+            resp = get_subject()
+            assert resp["title"] == self.subject.title
+            assert requests("SubjectModel", "hit") == hits + 1
+            assert requests("LecturerModel", "miss") == misses + 1
+
+            # served from memory, a write outside of the repositories is not seen
+            SubjectModel.objects(id=self.subject.id).update_one(title="Môn học cache")
+            assert get_subject()["title"] == self.subject.title
+
+            # until another process (its own cache) invalidates the subjects
+            EntityCache(ttl=60, poll_interval=0).invalidate(SubjectModel, self.subject.id)
+            assert get_subject()["title"] == "Môn học cache"
+
+            # the repositories drop what they write
+            SubjectRepository().update(self.subject.id, {"title": "Môn học cache 2"})
+            LecturerRepository().update(self.lecturer.id, {"full_name": "Nguyen Van B"})
+            resp = get_subject()
+            assert resp["title"] == "Môn học cache 2"
+            assert resp["lecturer"]["full_name"] == "Nguyen Van B"
+
+        SubjectRepository().update(self.subject.id, {"title": self.subject.title})
+        LecturerRepository().update(self.lecturer.id, {"full_name": self.lecturer.full_name})
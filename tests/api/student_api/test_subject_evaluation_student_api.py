@@ -18,6 +18,7 @@ from app.models.season import SeasonModel
 from app.models.student import SeasonInfo, StudentModel
 from app.models.subject_evaluation import SubjectEvaluationModel, SubjectEvaluationQuestionModel
 from app.models.manage_form import ManageFormModel
+from app.infra.manage_form.manage_form_cache import manage_form_cache
 from app.domain.manage_form.enum import FormStatus, FormType
 
 
@@ -31,6 +32,7 @@ class TestSubjectEvaluationStudentApi(unittest.TestCase):
             mongo_client_class=mongomock.MongoClient,
         )
         cls.client = TestClient(app)
+        manage_form_cache.clear()
         cls.season: SeasonModel = SeasonModel(
             title="CÙNG GIÁO HỘI, NGƯỜI TRẺ BƯỚC ĐI TRONG HY VỌNG",
             academic_year="2023-2024",
@@ -161,6 +163,7 @@ class TestSubjectEvaluationStudentApi(unittest.TestCase):
                 status=FormStatus.ACTIVE,
                 data={"subject_id": "65f253a7fd143b81c101a63c"},
             ).save()
+            manage_form_cache.invalidate()
             r = self.client.post(
                 f"/api/v1/student/subjects/evaluations/{self.subject.id}",
                 json={
@@ -192,6 +195,7 @@ class TestSubjectEvaluationStudentApi(unittest.TestCase):
                 upsert=False,
             )
             manage_form.reload()
+            manage_form_cache.invalidate()
 
             r = self.client.post(
                 f"/api/v1/student/subjects/evaluations/{self.subject.id}",
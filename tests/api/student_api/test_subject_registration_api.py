@@ -18,6 +18,7 @@ from app.models.student import SeasonInfo, StudentModel
 from app.models.subject import SubjectModel
 from app.models.lecturer import LecturerModel
 from app.models.manage_form import ManageFormModel
+from app.infra.manage_form.manage_form_cache import manage_form_cache
 from app.domain.manage_form.enum import FormStatus, FormType
 
 
@@ -31,6 +32,7 @@ class TestSubjectRegistrationApi(unittest.TestCase):
             mongo_client_class=mongomock.MongoClient,
         )
         cls.client = TestClient(app)
+        manage_form_cache.clear()
         cls.season: SeasonModel = SeasonModel(
             title="CÙNG GIÁO HỘI, NGƯỜI TRẺ BƯỚC ĐI TRONG HY VỌNG",
             academic_year="2023-2024",
@@ -117,6 +119,7 @@ class TestSubjectRegistrationApi(unittest.TestCase):
             assert r.json()["detail"].startswith("Form chưa được mở")
 
             ManageFormModel(type=FormType.SUBJECT_REGISTRATION, status=FormStatus.ACTIVE).save()
+            manage_form_cache.invalidate()
 
             r = self.client.post(
                 "/api/v1/student/subjects/registration",
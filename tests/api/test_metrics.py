@@ -0,0 +1,113 @@
+import secrets
+import unittest
+from unittest.mock import patch
+
+from mongoengine import connect, disconnect
+from fastapi.testclient import TestClient
+
+from app.main import app
+import mongomock
+
+from app.models.admin import AdminModel
+from app.infra.security.security_service import TokenData, get_password_hash
+from app.models.general_task import GeneralTaskModel
+from app.models.season import SeasonModel
+
+
+class TestMetrics(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost:1234",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        cls.client = TestClient(app)
+        cls.season: SeasonModel = SeasonModel(
+            title="CÙNG GIÁO HỘI, NGƯỜI TRẺ BƯỚC ĐI TRONG HY VỌNG",
+            academic_year="2023-2024",
+            season=3,
+            is_current=True,
+        ).save()
+        cls.user: AdminModel = AdminModel(
+            status="active",
+            roles=[
+                "admin",
+            ],
+            holy_name="Martin",
+            phone_number=["0123456789"],
+            latest_season=3,
+            seasons=[3],
+            email="metrics@example.com",
+            full_name="Nguyen Thanh Tam",
+            password=get_password_hash(password="local@local"),
+        ).save()
+        cls.general_task: GeneralTaskModel = GeneralTaskModel(
+            title="Cong viec dau nam",
+            short_desc="Cong viec",
+            description="Đoạn văn là một đơn vị văn bản nhỏ",
+            start_at="2024-03-22",
+            end_at="2024-03-22",
+            role="bhv",
+            type="common",
+            label=["string"],
+            season=3,
+            author=cls.user,
+        ).save()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.general_task.delete()
+        cls.user.delete()
+        cls.season.delete()
+        disconnect()
+
+    def test_metrics_token(self):
+        # disabled without a token
+        r = self.client.get("/metrics")
+        assert r.status_code == 404
+
+        with patch("app.main.settings.METRICS_TOKEN", "token"), patch(
+            "app.main.secrets.compare_digest", wraps=secrets.compare_digest
+        ) as mock_compare:
+            r = self.client.get("/metrics")
+            assert r.status_code == 401
+            assert r.headers["www-authenticate"] == "Bearer"
+            mock_compare.assert_called_with(b"", b"Bearer token")
+
+            for authorization in ["Bearer xxx", "Bearer tokens", "token", "Basic token"]:
+                r = self.client.get("/metrics", headers={"Authorization": authorization})
+                assert r.status_code == 401
+                mock_compare.assert_called_with(authorization.encode(), b"Bearer token")
+
+            r = self.client.get("/metrics", headers={"Authorization": "Bearer token"})
+            assert r.status_code == 200
+
+    def test_metrics_labels(self):
+        with patch("app.infra.security.security_service.verify_token") as mock_token:
+            mock_token.return_value = TokenData(email=self.user.email)
+            r = self.client.get(
+                f"/api/v1/general-tasks/{self.general_task.id}",
+                headers={
+                    "Authorization": "Bearer {}".format("xxx"),
+                },
+            )
+            assert r.status_code == 200
+
+        r = self.client.get(f"/api/v1/unknown/{self.general_task.id}")
+        assert r.status_code == 404
+
+        with patch("app.main.settings.METRICS_TOKEN", "token"):
+            r = self.client.get("/metrics", headers={"Authorization": "Bearer token"})
+        assert r.status_code == 200
+        # by route template, not by path
+        assert (
+            'http_request_duration_seconds_count{method="GET",'
+            'route="/api/v1/general-tasks/{general_task_id}",status="200"}'
+        ) in r.text
+        assert str(self.general_task.id) not in r.text
+        assert (
+            'http_request_duration_seconds_count{method="GET",route="unmatched",status="404"}'
+        ) in r.text
+        assert 'operation="GeneralTaskRepository.get_by_id"' in r.text
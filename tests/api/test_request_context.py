@@ -0,0 +1,100 @@
+import json
+import logging
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.infra.logging import AccessLogSampler
+from app.infra.logging.context import (
+    RequestContextMiddleware,
+    parse_traceparent,
+    request_id_var,
+    trace_id_var,
+)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+async def echo_context(scope, receive, send):
+    """context of the request as seen by the app"""
+    body = json.dumps({"request_id": request_id_var.get(), "trace_id": trace_id_var.get()})
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": body.encode()})
+
+
+def access_record(status_code: int) -> logging.LogRecord:
+    return logging.LogRecord(
+        "uvicorn.access",
+        logging.INFO,
+        __file__,
+        0,
+        '%s - "%s %s HTTP/%s" %d',
+        ("127.0.0.1:50000", "GET", "/api/v1/students", "1.1", status_code),
+        None,
+    )
+
+
+class TestRequestContext(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app)
+        cls.echo_client = TestClient(RequestContextMiddleware(echo_context))
+
+    def test_request_id_header(self):
+        r = self.client.get("/metrics", headers={"X-Request-ID": "request-1"})
+        assert r.headers["x-request-id"] == "request-1"
+
+        r = self.client.get("/metrics")
+        assert len(r.headers["x-request-id"]) == 32
+
+        resp = self.echo_client.get("/", headers={"X-Request-ID": "request-2"}).json()
+        assert resp["request_id"] == "request-2"
+        # reset once the request is done
+        assert request_id_var.get() is None
+
+    def test_traceparent(self):
+        resp = self.echo_client.get(
+            "/", headers={"traceparent": f"00-{TRACE_ID}-00f067aa0ba902b7-01"}
+        ).json()
+        assert resp["trace_id"] == TRACE_ID
+        assert self.echo_client.get("/").json()["trace_id"] is None
+
+        assert parse_traceparent(f" 00-{TRACE_ID.upper()}-00f067aa0ba902b7-01 ") == TRACE_ID
+        assert parse_traceparent(None) is None
+        assert parse_traceparent("") is None
+        assert parse_traceparent(f"00-{TRACE_ID}-00f067aa0ba902b7") is None
+        assert parse_traceparent(f"00-{TRACE_ID[:-1]}-00f067aa0ba902b7-01") is None
+        assert parse_traceparent(f"00-{TRACE_ID[:-1]}z-00f067aa0ba902b7-01") is None
+        # an all zero trace id is invalid
+        assert parse_traceparent(f"00-{'0' * 32}-00f067aa0ba902b7-01") is None
+
+
+class TestAccessLogSampler(unittest.TestCase):
+    def test_sample(self):
+        assert AccessLogSampler(1).filter(access_record(200))
+
+        sampler = AccessLogSampler(0.1)
+        with patch("app.infra.logging.random.random") as mock_random:
+            mock_random.return_value = 0.05
+            assert sampler.filter(access_record(200))
+
+            mock_random.return_value = 0.5
+            assert not sampler.filter(access_record(200))
+            assert not sampler.filter(access_record(302))
+            # errors are always kept
+            assert sampler.filter(access_record(404))
+            assert sampler.filter(access_record(500))
+
+    def test_other_records(self):
+        record = logging.LogRecord("uvicorn.access", logging.INFO, __file__, 0, "started", (), None)
+        # without the access log args, sampled like a success
+        assert not AccessLogSampler(0).filter(record)
+        assert AccessLogSampler(1).filter(record)
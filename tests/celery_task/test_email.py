@@ -0,0 +1,118 @@
+import smtplib
+import unittest
+from unittest.mock import patch
+
+import mongomock
+import sib_api_v3_sdk
+from mongoengine import connect, disconnect
+from sib_api_v3_sdk.rest import ApiException
+
+from app.config import settings
+from app.infra.email.email_smtp_service import EmailSMTPService
+from app.infra.email.smtp_connection_manager import SMTPConnectionManager
+from app.infra.metrics import track_external
+from app.infra.tasks.email import brevo_service, send_bulk_email, send_email_batch_task
+from app.models.email_delivery import EmailDeliveryModel
+
+
+class TestEmailTask(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        disconnect()
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost:1234",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        disconnect()
+
+    def setUp(self):
+        EmailDeliveryModel.objects.delete()
+
+    def test_send_bulk_email_in_batches(self):
+        emails = [f"student{i}@example.com" for i in range(settings.BREVO_BATCH_SIZE + 1)]
+        emails.append("student0@example.com")
+        with patch("app.infra.tasks.email.group") as mock_group:
+            send_bulk_email(template_id=1, emails_to=emails, params={"code": "1"})
+            signatures = mock_group.call_args.args[0]
+
+        assert len(signatures) == 2
+        assert len(signatures[0].args[1]) == settings.BREVO_BATCH_SIZE
+        assert signatures[1].args[1] == [f"student{settings.BREVO_BATCH_SIZE}@example.com"]
+
+    def test_send_email_batch_task(self):
+        emails = ["student1@example.com", "student2@example.com"]
+        with (
+            patch.object(brevo_service.api_instance, "send_transac_email") as mock_send,
+            patch(
+                "app.infra.email.brevo_service.track_external", wraps=track_external
+            ) as mock_track,
+        ):
+            mock_send.return_value = sib_api_v3_sdk.CreateSmtpEmail(message_ids=["<1>", "<2>"])
+            result = send_email_batch_task(1, emails, {"code": "1"})
+            mock_track.assert_called_once_with("brevo", "send_transac_email")
+
+            send_smtp_email = mock_send.call_args.args[0]
+            assert [v.to[0].email for v in send_smtp_email.message_versions] == emails
+
+        assert result == {
+            "sent": {"student1@example.com": "<1>", "student2@example.com": "<2>"},
+            "failed": [],
+        }
+        deliveries = EmailDeliveryModel.objects(template_id=1).order_by("email")
+        assert [(d.email, d.status, d.message_id) for d in deliveries] == [
+            ("student1@example.com", "sent", "<1>"),
+            ("student2@example.com", "sent", "<2>"),
+        ]
+
+    def test_send_email_batch_task_failed(self):
+        emails = ["student1@example.com"]
+        with patch.object(brevo_service.api_instance, "send_transac_email") as mock_send:
+            # bad request, not retried
+            mock_send.side_effect = ApiException(status=400)
+            with patch.object(send_email_batch_task, "retry") as mock_retry:
+                result = send_email_batch_task(1, emails, {})
+                mock_retry.assert_not_called()
+            assert result == {"sent": {}, "failed": emails}
+            delivery = EmailDeliveryModel.objects(email="student1@example.com").get()
+            assert delivery.status == "failed"
+            assert delivery.attempts == 1
+            assert delivery.error
+
+            # server error, retried
+            mock_send.side_effect = ApiException(status=503)
+            with patch.object(send_email_batch_task, "retry") as mock_retry:
+                mock_retry.return_value = Exception("retry")
+                with self.assertRaises(Exception):
+                    send_email_batch_task(1, emails, {})
+                countdown = mock_retry.call_args.kwargs["countdown"]
+                assert countdown == settings.BREVO_BATCH_RETRY_BACKOFF
+
+
+class TestSMTPConnectionManager(unittest.TestCase):
+    def test_reuse_and_reconnect(self):
+        manager = SMTPConnectionManager(host="localhost", port=587, user="x", password="x")
+        msg = EmailSMTPService(connection_manager=manager)._build_message(
+            emails_to="student1@example.com", subject="subject", plain_text="text"
+        )
+        with patch("smtplib.SMTP") as mock_smtp:
+            conn = mock_smtp.return_value
+            conn.send_message.return_value = {}
+
+            assert [manager.send(msg) for _ in range(3)] == [{}, {}, {}]
+            assert mock_smtp.call_count == 1
+            assert conn.login.call_count == 1
+
+            # dropped by the server, reconnect and send again
+            conn.send_message.side_effect = [smtplib.SMTPServerDisconnected(), {}]
+            assert manager.send(msg) == {}
+            assert mock_smtp.call_count == 2
+
+        stats = manager.stats()
+        assert stats["messages_sent"] == 4
+        assert stats["connections_opened"] == 2
+        assert stats["connections_reused"] == 3
+        assert stats["reconnects"] == 1
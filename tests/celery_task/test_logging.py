@@ -0,0 +1,43 @@
+import logging
+import os
+import tempfile
+import unittest
+
+from loguru import logger
+
+from app.infra.logging import QueueSink
+
+
+class TestQueueSink(unittest.TestCase):
+    def test_log_from_forked_child(self):
+        with tempfile.TemporaryDirectory() as log_dir:
+            path = f"{log_dir}/test.log"
+            handler = logging.FileHandler(path)
+            sink = QueueSink([handler])
+            sink.start()
+            sink_id = logger.add(sink, format="{message}")
+            try:
+                logger.info("from the parent")
+                pid = os.fork()
+                if pid == 0:
+                    # a prefork worker process
+                    code = 1
+                    try:
+                        logger.info("from the child")
+                        # as on worker_process_shutdown
+                        sink.stop()
+                        code = 0
+                    finally:
+                        os._exit(code)
+
+                _, status = os.waitpid(pid, 0)
+                assert os.waitstatus_to_exitcode(status) == 0
+                logger.info("from the parent again")
+            finally:
+                logger.remove(sink_id)
+                sink.stop()
+                handler.close()
+
+            with open(path) as log_file:
+                lines = log_file.read().splitlines()
+            assert sorted(lines) == ["from the child", "from the parent", "from the parent again"]